@@ -6,7 +6,8 @@ from flask import Flask
 
 from app.utils.logging_utils import get_logger, setup_logging
 
-from .core.db import close_db
+from .core.commands import register_commands
+from .core.db import close_db, init_db_pool
 from .exceptions.error_handlers import register_error_handlers
 from .routes.admin import admin_bp
 from .routes.api import api_bp
@@ -15,6 +16,15 @@ from .routes.common import image_bp
 from .routes.product import product_bp
 from .routes.purchase import purchase_bp
 from .routes.user import user_bp
+from .services.products.top_products_service import (
+    start_top_products_refresher
+)
+from .services.products.view_counter_service import (
+    start_view_counter_flusher
+)
+from .services.utils.scheduler_service import (
+    start_expired_order_reaper, start_stock_hold_reaper
+)
 from .utils.template_filters import register_template_filters
 
 load_dotenv()
@@ -57,6 +67,9 @@ def create_app(test_config: Optional[Dict[str, Any]] = None) -> Flask:
     register_error_handlers(app)
     logger.info("Handler error terdaftar.")
 
+    register_commands(app)
+    logger.info("Perintah CLI terdaftar.")
+
     app.register_blueprint(product_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(user_bp)
@@ -85,6 +98,20 @@ def create_app(test_config: Optional[Dict[str, Any]] = None) -> Flask:
             exc_info=True,
         )
 
+    init_db_pool(app)
+
+    if start_stock_hold_reaper(app) is not None:
+        logger.info("Reaper penahanan stok kedaluwarsa berjalan di latar belakang.")
+
+    if start_expired_order_reaper(app) is not None:
+        logger.info("Reaper pesanan kedaluwarsa berjalan di latar belakang.")
+
+    if start_top_products_refresher(app) is not None:
+        logger.info("Penyegar cache produk teratas berjalan di latar belakang.")
+
+    if start_view_counter_flusher(app) is not None:
+        logger.info("Flush penghitung tayangan produk berjalan di latar belakang.")
+
     app.teardown_appcontext(close_db)
     logger.debug("Fungsi teardown konteks aplikasi terdaftar.")
 
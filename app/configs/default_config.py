@@ -13,4 +13,82 @@ MYSQL_USER: Optional[str] = os.environ.get("MYSQL_USER")
 MYSQL_PASSWORD: Optional[str] = os.environ.get("MYSQL_PASSWORD")
 MYSQL_DB: Optional[str] = os.environ.get("MYSQL_DB")
 MYSQL_PORT: Optional[str] = os.environ.get("MYSQL_PORT")
+DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_POOL_MAX_OVERFLOW: int = int(os.environ.get("DB_POOL_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT: float = float(os.environ.get("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING: bool = (
+    os.environ.get("DB_POOL_PRE_PING", "True").lower() == "true"
+)
+DB_SHARE_REQUEST_CONNECTION: bool = (
+    os.environ.get("DB_SHARE_REQUEST_CONNECTION", "True").lower() == "true"
+)
+STOCK_HOLD_REAPER_INTERVAL: int = int(
+    os.environ.get("STOCK_HOLD_REAPER_INTERVAL", "60")
+)
+STOCK_HOLD_REAPER_BATCH_SIZE: int = int(
+    os.environ.get("STOCK_HOLD_REAPER_BATCH_SIZE", "500")
+)
+EXPIRED_ORDER_REAPER_INTERVAL: int = int(
+    os.environ.get("EXPIRED_ORDER_REAPER_INTERVAL", "0")
+)
+EXPIRED_ORDER_CANCEL_BATCH_SIZE: int = int(
+    os.environ.get("EXPIRED_ORDER_CANCEL_BATCH_SIZE", "500")
+)
+SITE_CONTENT_CACHE_TTL: int = int(os.environ.get("SITE_CONTENT_CACHE_TTL", "5"))
+TOP_PRODUCTS_CACHE_TTL: int = int(os.environ.get("TOP_PRODUCTS_CACHE_TTL", "60"))
+TOP_PRODUCTS_REFRESH_INTERVAL: int = int(
+    os.environ.get("TOP_PRODUCTS_REFRESH_INTERVAL", "30")
+)
+LANDING_FRAGMENT_CACHE: bool = (
+    os.environ.get("LANDING_FRAGMENT_CACHE", "True").lower() == "true"
+)
+VIEW_COUNTER_FLUSH_INTERVAL: int = int(
+    os.environ.get("VIEW_COUNTER_FLUSH_INTERVAL", "10")
+)
+VIEW_COUNTER_FLUSH_THRESHOLD: int = int(
+    os.environ.get("VIEW_COUNTER_FLUSH_THRESHOLD", "500")
+)
+CATALOG_PAGE_SIZE: int = int(os.environ.get("CATALOG_PAGE_SIZE", "24"))
+ADMIN_ORDERS_PAGE_SIZE: int = int(
+    os.environ.get("ADMIN_ORDERS_PAGE_SIZE", "50")
+)
+ADMIN_ORDER_COUNT_CACHE_TTL: int = int(
+    os.environ.get("ADMIN_ORDER_COUNT_CACHE_TTL", "30")
+)
+ADMIN_PRODUCTS_PAGE_SIZE: int = int(
+    os.environ.get("ADMIN_PRODUCTS_PAGE_SIZE", "50")
+)
+SUBSCRIPTION_CACHE_MAX_ENTRIES: int = int(
+    os.environ.get("SUBSCRIPTION_CACHE_MAX_ENTRIES", "10000")
+)
+SUBSCRIPTION_CACHE_MAX_TTL: int = int(
+    os.environ.get("SUBSCRIPTION_CACHE_MAX_TTL", "3600")
+)
+SUBSCRIPTION_CACHE_NEGATIVE_TTL: int = int(
+    os.environ.get("SUBSCRIPTION_CACHE_NEGATIVE_TTL", "300")
+)
+VOUCHER_CACHE_TTL: int = int(os.environ.get("VOUCHER_CACHE_TTL", "300"))
+VOUCHER_GRANT_SEGMENTS: str = os.environ.get(
+    "VOUCHER_GRANT_SEGMENTS", "TOP_SPENDER"
+)
+VOUCHER_GRANT_BATCH_SIZE: int = int(
+    os.environ.get("VOUCHER_GRANT_BATCH_SIZE", "1000")
+)
+SALES_ROLLUP_BACKFILL_CHUNK_DAYS: int = int(
+    os.environ.get("SALES_ROLLUP_BACKFILL_CHUNK_DAYS", "31")
+)
+REPORT_EXECUTOR_MAX_WORKERS: int = int(
+    os.environ.get("REPORT_EXECUTOR_MAX_WORKERS", "4")
+)
+REPORT_QUERY_TIMEOUT: float = float(os.environ.get("REPORT_QUERY_TIMEOUT", "5"))
+REPORT_CACHE_LIVE_TTL: int = int(os.environ.get("REPORT_CACHE_LIVE_TTL", "30"))
+REPORT_CACHE_HISTORICAL_TTL: int = int(
+    os.environ.get("REPORT_CACHE_HISTORICAL_TTL", "3600")
+)
+EXPORT_FETCH_SIZE: int = int(os.environ.get("EXPORT_FETCH_SIZE", "1000"))
+EXPORT_GZIP: bool = os.environ.get("EXPORT_GZIP", "True").lower() == "true"
+EXPORT_JOB_DIR: Optional[str] = os.environ.get("EXPORT_JOB_DIR")
+EXPORT_JOB_WORKERS: int = int(os.environ.get("EXPORT_JOB_WORKERS", "2"))
+EXPORT_JOB_RETENTION: int = int(os.environ.get("EXPORT_JOB_RETENTION", "3600"))
 DEBUG_LOGGING: bool = os.environ.get("DEBUG_LOGGING", "False").lower() == "true"
\ No newline at end of file
@@ -0,0 +1,104 @@
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+import click
+from flask import Flask
+
+from app.core.db import get_db_connection
+from app.core.migrations import migration_runner
+from app.core.query_plan import HOT_QUERIES, check_query_plans
+from app.exceptions.database_exceptions import (
+    DatabaseException, MigrationError
+)
+from app.exceptions.service_exceptions import ServiceLogicError
+from app.services.reports.sales_rollup_service import sales_rollup_service
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise click.BadParameter(
+            f"Format tanggal '{value}' tidak valid, gunakan YYYY-MM-DD."
+        )
+
+
+def register_commands(app: Flask) -> None:
+
+    @app.cli.command("rollup-backfill")
+    @click.option("--start", "start", default=None, help="Tanggal awal (YYYY-MM-DD).")
+    @click.option("--end", "end", default=None, help="Tanggal akhir (YYYY-MM-DD).")
+    def rollup_backfill(start: Optional[str], end: Optional[str]) -> None:
+        start_date = _parse_date(start)
+        end_date = _parse_date(end)
+        try:
+            result = sales_rollup_service.backfill(start_date, end_date)
+        except (DatabaseException, ServiceLogicError) as e:
+            raise click.ClickException(str(e))
+
+        click.echo(
+            f"Rollup penjualan dibangun ulang: {result['days']} hari "
+            f"dalam {result['chunks']} bagian."
+        )
+
+    @app.cli.command("db-migrate")
+    @click.option("--target", type=int, default=None, help="Versi tujuan.")
+    @click.option("--status", is_flag=True, help="Tampilkan migrasi tertunda.")
+    def db_migrate(target: Optional[int], status: bool) -> None:
+        conn = get_db_connection()
+        try:
+            if status:
+                pending = migration_runner.pending(conn, target)
+                for migration in pending:
+                    click.echo(
+                        f"Tertunda: {migration.version}_{migration.name}"
+                    )
+                click.echo(f"{len(pending)} migrasi tertunda.")
+                return
+
+            applied = migration_runner.migrate(conn, target)
+            for migration in applied:
+                click.echo(
+                    f"Diterapkan: {migration.version}_{migration.name}"
+                )
+            click.echo(f"{len(applied)} migrasi diterapkan.")
+        except MigrationError as e:
+            raise click.ClickException(str(e))
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+    @app.cli.command("check-query-plans")
+    @click.option(
+        "--query", "names", multiple=True,
+        help="Nama kueri yang diperiksa (bawaan: semua).",
+    )
+    def check_plans(names: Tuple[str, ...]) -> None:
+        unknown = [name for name in names if name not in HOT_QUERIES]
+        if unknown:
+            raise click.BadParameter(
+                f"Kueri tidak dikenal: {', '.join(unknown)}."
+            )
+
+        conn = get_db_connection()
+        try:
+            results = check_query_plans(conn, list(names) or None)
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+        failed = 0
+        for name, problems in results.items():
+            if problems:
+                failed += 1
+                for problem in problems:
+                    click.echo(f"GAGAL  {problem}")
+            else:
+                click.echo(f"OK     {name}")
+
+        if failed:
+            raise click.ClickException(
+                f"{failed} kueri utama kehilangan indeksnya."
+            )
\ No newline at end of file
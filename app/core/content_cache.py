@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import mysql.connector
+from mysql.connector.cursor import MySQLCursorDict
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_UNKNOWN_VERSION = object()
+
+
+class SiteContentCache:
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._version: Any = _UNKNOWN_VERSION
+        self._checked_at: float = 0.0
+        self.reload_count = 0
+
+
+    @property
+    def version(self) -> Optional[int]:
+        if self._version is _UNKNOWN_VERSION:
+            return None
+        return self._version
+
+
+    def get(self, cursor: MySQLCursorDict) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            snapshot = self._snapshot
+            fresh = (
+                snapshot is not None
+                and self.ttl > 0
+                and now - self._checked_at < self.ttl
+            )
+        if fresh:
+            return dict(snapshot)
+
+        version = self._read_version(cursor)
+        with self._lock:
+            if (
+                self._snapshot is not None
+                and version is not _UNKNOWN_VERSION
+                and version == self._version
+            ):
+                self._checked_at = now
+                logger.debug(
+                    f"Versi konten situs tidak berubah ({version}), "
+                    "snapshot dipakai ulang."
+                )
+                return dict(self._snapshot)
+
+        cursor.execute("SELECT `key`, `value` FROM content")
+        content_data = cursor.fetchall()
+        snapshot = {item["key"]: item["value"] for item in content_data}
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._version = version
+            self._checked_at = now
+            self.reload_count += 1
+        logger.info(
+            f"Berhasil memuat {len(snapshot)} item konten situs "
+            f"(versi: {self.version})."
+        )
+        return dict(snapshot)
+
+
+    def bump_version(self, cursor: Any) -> None:
+        cursor.execute(
+            "INSERT INTO content_version (id, version) VALUES (1, 1) "
+            "ON DUPLICATE KEY UPDATE version = version + 1"
+        )
+
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._version = _UNKNOWN_VERSION
+            self._checked_at = 0.0
+        logger.debug("Cache konten situs dikosongkan.")
+
+
+    def _read_version(self, cursor: MySQLCursorDict) -> Any:
+        try:
+            cursor.execute("SELECT version FROM content_version WHERE id = 1")
+            row = cursor.fetchone()
+
+        except mysql.connector.Error as e:
+            logger.warning(
+                f"Gagal membaca versi konten situs, memuat ulang penuh: {e}"
+            )
+            return _UNKNOWN_VERSION
+
+        return row["version"] if row else None
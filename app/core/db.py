@@ -1,30 +1,111 @@
-from typing import Any, Dict, List, Optional
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
 
 import mysql.connector
-from flask import current_app, g
+from flask import (
+    Flask, current_app, g, has_app_context, has_request_context
+)
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursorDict
 
-from app.exceptions.database_exceptions import DatabaseConnectionError
+from app.core.content_cache import SiteContentCache
+from app.core.db_pool import ConnectionPool
+from app.core.unit_of_work import UnitOfWork
+from app.exceptions.database_exceptions import (
+    DatabaseConnectionError, DeadlockError
+)
 from app.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+DEADLOCK_ERRNO = 1213
+
+T = TypeVar("T")
+
+
+def init_db_pool(app: Flask) -> ConnectionPool:
+    pool = ConnectionPool(
+        connect_args={
+            "host": app.config["MYSQL_HOST"],
+            "user": app.config["MYSQL_USER"],
+            "password": app.config["MYSQL_PASSWORD"],
+            "database": app.config["MYSQL_DB"],
+            "port": app.config["MYSQL_PORT"],
+        },
+        pool_size=app.config.get("DB_POOL_SIZE", 5),
+        max_overflow=app.config.get("DB_POOL_MAX_OVERFLOW", 10),
+        timeout=app.config.get("DB_POOL_TIMEOUT", 10.0),
+        recycle=app.config.get("DB_POOL_RECYCLE", 1800),
+        pre_ping=app.config.get("DB_POOL_PRE_PING", True),
+    )
+    app.extensions["db_pool"] = pool
+    logger.info(
+        f"Pool koneksi database diinisialisasi (ukuran: {pool.pool_size}, "
+        f"overflow: {pool.max_overflow})."
+    )
+    return pool
+
+
+def get_pool() -> ConnectionPool:
+    pool: Optional[ConnectionPool] = current_app.extensions.get("db_pool")
+    if pool is None:
+        pool = init_db_pool(current_app)
+    return pool
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    return get_pool().get_stats()
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    uow: Optional[UnitOfWork] = g.get("uow")
+    if uow is None:
+        if not (
+            has_request_context()
+            and current_app.config.get("DB_SHARE_REQUEST_CONNECTION", True)
+        ):
+            return None
+        uow = UnitOfWork(get_pool())
+        g.uow = uow
+        logger.debug("Unit of work dibuat untuk permintaan ini.")
+
+    if uow.thread_id != threading.get_ident():
+        return None
+    return uow
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    existing = current_unit_of_work()
+    if existing is not None:
+        yield existing
+        return
+
+    uow = UnitOfWork(get_pool())
+    g.uow = uow
+    try:
+        yield uow
+    finally:
+        g.pop("uow", None)
+        uow.close()
+
 
 def get_db() -> MySQLCursorDict:
     if "db" not in g:
-        logger.debug("Mencoba membangun koneksi database.")
+        logger.debug("Mengambil koneksi database dari pool.")
         
         try:
-            g.db = mysql.connector.connect(
-                host=current_app.config["MYSQL_HOST"],
-                user=current_app.config["MYSQL_USER"],
-                password=current_app.config["MYSQL_PASSWORD"],
-                database=current_app.config["MYSQL_DB"],
-                port=current_app.config["MYSQL_PORT"],
-            )
-            g.cursor = g.db.cursor(dictionary=True)
-            logger.info("Koneksi database berhasil dibuat.")
+            uow = current_unit_of_work()
+            if uow is not None:
+                g.cursor = uow.cursor(dictionary=True)
+                g.db = None
+            else:
+                g.db = get_pool().acquire()
+                g.cursor = g.db.cursor(dictionary=True)
+            logger.debug("Koneksi database berhasil diambil dari pool.")
 
         except mysql.connector.Error as err:
             logger.error(
@@ -56,44 +137,62 @@ def close_db(e: Optional[Exception] = None) -> None:
 
         try:
             db.close()
-            logger.info("Koneksi database ditutup.")
+            logger.debug("Koneksi database dikembalikan ke pool.")
 
         except mysql.connector.Error as err:
             logger.error(
                 f"Kesalahan saat menutup koneksi database: {err}", exc_info=True
             )
 
-    elif e:
+    uow: Optional[UnitOfWork] = g.pop("uow", None)
+    if uow is not None:
+
+        try:
+            uow.close()
+
+        except Exception as ex:
+            logger.error(
+                f"Kesalahan saat menutup unit of work: {ex}", exc_info=True
+            )
+
+    elif db is None and e:
         logger.debug(
             f"close_db dipanggil dengan pengecualian, tetapi "
             f"tidak ditemukan koneksi DB aktif: {e}"
         )
 
-    else:
+    elif db is None:
         logger.debug("close_db dipanggil, tetapi tidak ditemukan koneksi DB aktif.")
 
 
+def get_content_cache() -> SiteContentCache:
+    cache: Optional[SiteContentCache] = current_app.extensions.get(
+        "content_cache"
+    )
+    if cache is None:
+        cache = SiteContentCache(
+            ttl=current_app.config.get("SITE_CONTENT_CACHE_TTL", 5)
+        )
+        current_app.extensions["content_cache"] = cache
+    return cache
+
+
 def get_content() -> Dict[str, Any]:
-    logger.debug("Mengambil konten situs dari database.")
-    cursor: MySQLCursorDict = get_db()
-    cursor.execute("SELECT `key`, `value` FROM content")
-    content_data: List[Dict[str, Any]] = cursor.fetchall()
-    logger.info(f"Berhasil mengambil {len(content_data)} item konten.")
-    return {item["key"]: item["value"] for item in content_data}
+    logger.debug("Mengambil konten situs dari cache.")
+    return get_content_cache().get(get_db())
 
 
 def get_db_connection() -> MySQLConnection:
-    logger.debug("Mencoba membangun koneksi database independen baru.")
+    logger.debug("Mengambil koneksi database independen dari pool.")
 
     try:
-        conn: MySQLConnection = mysql.connector.connect(
-            host=current_app.config["MYSQL_HOST"],
-            user=current_app.config["MYSQL_USER"],
-            password=current_app.config["MYSQL_PASSWORD"],
-            database=current_app.config["MYSQL_DB"],
-            port=current_app.config["MYSQL_PORT"],
-        )
-        logger.info("Koneksi database independen berhasil dibuat.")
+        uow = current_unit_of_work()
+        if uow is not None:
+            logger.debug("Menggunakan koneksi unit of work permintaan ini.")
+            return uow.connection()
+
+        conn: MySQLConnection = get_pool().acquire()
+        logger.debug("Koneksi database independen berhasil diambil dari pool.")
         return conn
 
     except mysql.connector.Error as err:
@@ -103,4 +202,35 @@ def get_db_connection() -> MySQLConnection:
         )
         raise DatabaseConnectionError(
             f"Kesalahan saat mendapatkan koneksi MySQL independen: {err}"
-        )
\ No newline at end of file
+        )
+
+
+def is_deadlock(error: Exception) -> bool:
+    return (
+        isinstance(error, DeadlockError)
+        or getattr(error, "errno", None) == DEADLOCK_ERRNO
+    )
+
+
+def retry_on_deadlock(
+    operation: Callable[[], T], max_retries: int = 3
+) -> T:
+    if has_app_context():
+        uow = current_unit_of_work()
+        if uow is not None and uow.owner is not None:
+            return operation()
+
+    attempt = 0
+    while True:
+        try:
+            return operation()
+
+        except DeadlockError as e:
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            logger.warning(
+                "Deadlock terdeteksi, mengulang seluruh transaksi "
+                f"({attempt}/{max_retries}): {e}"
+            )
+            time.sleep(0.05 * attempt + random.uniform(0, 0.05))
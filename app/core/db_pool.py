@@ -0,0 +1,270 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import mysql.connector
+from mysql.connector.connection import MySQLConnection
+
+from app.exceptions.database_exceptions import DatabaseConnectionError
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class PooledConnection:
+
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        raw_conn: MySQLConnection,
+        created_at: float,
+    ) -> None:
+        self._pool = pool
+        self._conn: Optional[MySQLConnection] = raw_conn
+        self._created_at = created_at
+
+
+    def __getattr__(self, name: str) -> Any:
+        conn = self.__dict__.get("_conn")
+        if conn is None:
+            raise DatabaseConnectionError(
+                "Koneksi sudah dikembalikan ke pool."
+            )
+        return getattr(conn, name)
+
+
+    def is_connected(self) -> bool:
+        if self._conn is None:
+            return False
+        return self._conn.is_connected()
+
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        raw_conn, self._conn = self._conn, None
+        self._pool.release(raw_conn, self._created_at)
+
+
+class ConnectionPool:
+
+    def __init__(
+        self,
+        connect_args: Dict[str, Any],
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 10.0,
+        recycle: int = 1800,
+        pre_ping: bool = True,
+        connector: Optional[Callable[..., MySQLConnection]] = None,
+    ) -> None:
+        self.connect_args = connect_args
+        self.pool_size = max(1, pool_size)
+        self.max_overflow = max(0, max_overflow)
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self._connector = connector
+        self._idle: Deque[Tuple[MySQLConnection, float]] = deque()
+        self._checked_out = 0
+        self._cond = threading.Condition()
+        self._stats: Dict[str, float] = {
+            "acquired": 0,
+            "created": 0,
+            "recycled": 0,
+            "ping_failures": 0,
+            "discarded": 0,
+            "exhausted": 0,
+            "timeouts": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+        }
+
+
+    @property
+    def capacity(self) -> int:
+        return self.pool_size + self.max_overflow
+
+
+    def acquire(self) -> PooledConnection:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        idle_entry: Optional[Tuple[MySQLConnection, float]] = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    idle_entry = self._idle.pop()
+                    break
+
+                if self._checked_out + len(self._idle) < self.capacity:
+                    break
+
+                if not waited:
+                    waited = True
+                    self._stats["exhausted"] += 1
+                    logger.warning(
+                        "Pool koneksi database penuh "
+                        f"({self._checked_out}/{self.capacity}), "
+                        "menunggu koneksi dikembalikan."
+                    )
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    logger.error(
+                        "Waktu tunggu pool koneksi database habis setelah "
+                        f"{self.timeout} detik."
+                    )
+                    raise DatabaseConnectionError(
+                        "Pool koneksi database habis: tidak ada koneksi "
+                        f"tersedia dalam {self.timeout} detik."
+                    )
+                self._cond.wait(remaining)
+
+            self._checked_out += 1
+
+        try:
+            if idle_entry is not None:
+                raw_conn, created_at = self._validate(*idle_entry)
+            else:
+                raw_conn, created_at = self._create()
+
+        except Exception:
+            with self._cond:
+                self._checked_out -= 1
+                self._cond.notify()
+            raise
+
+        wait_ms = (time.monotonic() - started) * 1000
+        with self._cond:
+            self._stats["acquired"] += 1
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(
+                self._stats["max_wait_ms"], wait_ms
+            )
+
+        return PooledConnection(self, raw_conn, created_at)
+
+
+    def release(self, raw_conn: MySQLConnection, created_at: float) -> None:
+        reusable = True
+
+        try:
+            if raw_conn.in_transaction:
+                raw_conn.rollback()
+
+        except Exception as e:
+            reusable = False
+            logger.warning(
+                f"Gagal me-reset koneksi sebelum dikembalikan ke pool: {e}"
+            )
+
+        with self._cond:
+            self._checked_out -= 1
+            if reusable and len(self._idle) < self.pool_size:
+                self._idle.append((raw_conn, created_at))
+                raw_conn = None
+            self._cond.notify()
+
+        if raw_conn is not None:
+            self._discard(raw_conn)
+
+
+    def dispose(self) -> None:
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+
+        for raw_conn, _ in idle:
+            self._discard(raw_conn)
+        logger.info(f"{len(idle)} koneksi idle di pool ditutup.")
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            checked_out = self._checked_out
+            idle = len(self._idle)
+
+        acquired = stats["acquired"]
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "checked_out": checked_out,
+            "idle": idle,
+            "overflow_in_use": max(0, checked_out + idle - self.pool_size),
+            "acquired_count": int(acquired),
+            "created_count": int(stats["created"]),
+            "recycled_count": int(stats["recycled"]),
+            "ping_failure_count": int(stats["ping_failures"]),
+            "discarded_count": int(stats["discarded"]),
+            "exhausted_count": int(stats["exhausted"]),
+            "timeout_count": int(stats["timeouts"]),
+            "avg_wait_ms": (
+                round(stats["total_wait_ms"] / acquired, 3) if acquired else 0
+            ),
+            "max_wait_ms": round(stats["max_wait_ms"], 3),
+        }
+
+
+    def _create(self) -> Tuple[MySQLConnection, float]:
+        try:
+            connector = self._connector or mysql.connector.connect
+            raw_conn = connector(**self.connect_args)
+
+        except mysql.connector.Error as err:
+            logger.error(
+                f"Kesalahan saat membuat koneksi MySQL untuk pool: {err}",
+                exc_info=True,
+            )
+            raise DatabaseConnectionError(
+                f"Kesalahan saat menghubungkan ke MySQL: {err}"
+            )
+
+        with self._cond:
+            self._stats["created"] += 1
+        logger.debug("Koneksi database baru dibuat untuk pool.")
+        return raw_conn, time.monotonic()
+
+
+    def _validate(
+        self, raw_conn: MySQLConnection, created_at: float
+    ) -> Tuple[MySQLConnection, float]:
+        if self.recycle and time.monotonic() - created_at > self.recycle:
+            with self._cond:
+                self._stats["recycled"] += 1
+            logger.debug("Mendaur ulang koneksi pool yang sudah kedaluwarsa.")
+            self._discard(raw_conn, count=False)
+            return self._create()
+
+        if self.pre_ping:
+            try:
+                alive = raw_conn.is_connected()
+            except Exception:
+                alive = False
+
+            if not alive:
+                with self._cond:
+                    self._stats["ping_failures"] += 1
+                logger.warning(
+                    "Koneksi pool tidak responsif, membuat koneksi baru."
+                )
+                self._discard(raw_conn)
+                return self._create()
+
+        return raw_conn, created_at
+
+
+    def _discard(self, raw_conn: MySQLConnection, count: bool = True) -> None:
+        if count:
+            with self._cond:
+                self._stats["discarded"] += 1
+
+        try:
+            raw_conn.close()
+
+        except Exception as e:
+            logger.debug(f"Kesalahan saat menutup koneksi pool: {e}")
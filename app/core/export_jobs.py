@@ -0,0 +1,327 @@
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+)
+
+from flask import Flask, current_app
+
+from app.utils.export_utils import gzip_stream, iter_csv
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+ExportRowsLoader = Callable[[], Iterable[Iterable[Any]]]
+
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ExportJob:
+
+    def __init__(
+        self,
+        report_name: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        compress: bool,
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.report_name = report_name
+        self.start_date = start_date or None
+        self.end_date = end_date or None
+        self.compress = compress
+        self.status = "queued"
+        self.rows_processed = 0
+        self.path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], Optional[str], bool]:
+        return (
+            self.report_name, self.start_date, self.end_date, self.compress
+        )
+
+
+    @property
+    def suffix(self) -> str:
+        return ".csv.gz" if self.compress else ".csv"
+
+
+    @property
+    def filename(self) -> str:
+        stamp = time.strftime("%Y%m%d", time.localtime(self.created_at))
+        return f"{self.report_name}_report_{stamp}{self.suffix}"
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "report_name": self.report_name,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "compress": self.compress,
+            "status": self.status,
+            "rows_processed": self.rows_processed,
+            "error": self.error,
+            "filename": self.filename,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExportJob":
+        job = cls(
+            data["report_name"],
+            data.get("start_date"),
+            data.get("end_date"),
+            bool(data.get("compress")),
+        )
+        job.id = data["id"]
+        job.status = data.get("status", "queued")
+        job.rows_processed = data.get("rows_processed", 0)
+        job.path = data.get("path")
+        job.error = data.get("error")
+        job.created_at = data.get("created_at", job.created_at)
+        job.finished_at = data.get("finished_at")
+        return job
+
+
+class ExportJobManager:
+
+    def __init__(
+        self,
+        export_dir: str,
+        max_workers: int = 2,
+        retention: float = 3600.0,
+    ) -> None:
+        self.export_dir = export_dir
+        self.max_workers = max(1, max_workers)
+        self.retention = retention
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="report-export"
+        )
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ExportJob] = {}
+        self._active: Dict[Tuple[Any, ...], str] = {}
+        self.deduplicated = 0
+
+
+    def submit(
+        self,
+        report_name: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        headers: List[str],
+        loader: ExportRowsLoader,
+        compress: bool = False,
+    ) -> Tuple[ExportJob, bool]:
+        self.purge_expired()
+        job = ExportJob(report_name, start_date, end_date, compress)
+
+        with self._lock:
+            existing_id = self._active.get(job.key)
+            if existing_id is not None:
+                self.deduplicated += 1
+                logger.info(
+                    f"Ekspor {report_name} ({start_date} - {end_date}) "
+                    f"sedang berjalan, memakai job {existing_id}."
+                )
+                return self._jobs[existing_id], False
+
+            self._jobs[job.id] = job
+            self._active[job.key] = job.id
+
+        self._save(job)
+        app = current_app._get_current_object()
+        self._pool.submit(self._run, app, job, headers, loader)
+        logger.info(f"Job ekspor {job.id} untuk {report_name} dijadwalkan.")
+        return job, True
+
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return self._load(job_id)
+
+
+    def _metadata_path(self, job_id: str) -> str:
+        return os.path.join(self.export_dir, f"{job_id}.json")
+
+
+    def _save(self, job: ExportJob) -> None:
+        path = self._metadata_path(job.id)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.export_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({**job.to_dict(), "path": job.path}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(
+                f"Gagal menyimpan metadata job ekspor {job.id}: {e}"
+            )
+
+
+    def _load(self, job_id: str) -> Optional[ExportJob]:
+        if not JOB_ID_PATTERN.match(job_id):
+            return None
+
+        path = self._metadata_path(job_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return ExportJob.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(
+                f"Gagal membaca metadata job ekspor {job_id}: {e}"
+            )
+            return None
+
+
+    def _saved_jobs(self) -> List[ExportJob]:
+        if not os.path.isdir(self.export_dir):
+            return []
+
+        jobs: List[ExportJob] = []
+        for name in os.listdir(self.export_dir):
+            job_id, ext = os.path.splitext(name)
+            if ext != ".json":
+                continue
+            job = self._load(job_id)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+
+    def _run(
+        self,
+        app: Flask,
+        job: ExportJob,
+        headers: List[str],
+        loader: ExportRowsLoader,
+    ) -> None:
+        with app.app_context():
+            job.status = "running"
+            self._save(job)
+            started = time.monotonic()
+            path = os.path.join(self.export_dir, f"{job.id}{job.suffix}")
+            tmp_path = f"{path}.part"
+            rows: Optional[Iterable[Iterable[Any]]] = None
+
+            try:
+                os.makedirs(self.export_dir, exist_ok=True)
+                rows = loader()
+                chunks: Iterator[str] = iter_csv(
+                    self._count(job, rows), headers
+                )
+
+                if job.compress:
+                    with open(tmp_path, "wb") as f:
+                        for chunk in gzip_stream(chunks):
+                            f.write(chunk)
+                else:
+                    with open(
+                        tmp_path, "w", encoding="utf-8", newline=""
+                    ) as f:
+                        for chunk in chunks:
+                            f.write(chunk)
+
+                os.replace(tmp_path, path)
+                job.path = path
+                job.status = "done"
+                logger.info(
+                    f"Job ekspor {job.id} selesai: {job.rows_processed} baris "
+                    f"dalam {time.monotonic() - started:.2f} detik."
+                )
+
+            except Exception as e:
+                job.status = "failed"
+                job.error = "Gagal mengekspor laporan."
+                logger.error(f"Job ekspor {job.id} gagal: {e}", exc_info=True)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            finally:
+                close = getattr(rows, "close", None)
+                if close is not None:
+                    close()
+                job.finished_at = time.time()
+                with self._lock:
+                    if self._active.get(job.key) == job.id:
+                        del self._active[job.key]
+                self._save(job)
+
+
+    def _count(
+        self, job: ExportJob, rows: Iterable[Iterable[Any]]
+    ) -> Iterator[Iterable[Any]]:
+        for row in rows:
+            job.rows_processed += 1
+            yield row
+
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.retention
+        expired = [
+            job for job in self._saved_jobs()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        with self._lock:
+            for job in expired:
+                self._jobs.pop(job.id, None)
+
+        for job in expired:
+            for path in (job.path, self._metadata_path(job.id)):
+                if not path or not os.path.exists(path):
+                    continue
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(
+                        f"Gagal menghapus berkas ekspor {path}: {e}"
+                    )
+
+        if expired:
+            logger.debug(f"{len(expired)} job ekspor kedaluwarsa dibersihkan.")
+        return len(expired)
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "jobs": len(self._jobs),
+                "active": len(self._active),
+                "deduplicated": self.deduplicated,
+            }
+
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_export_job_manager() -> ExportJobManager:
+    manager: Optional[ExportJobManager] = current_app.extensions.get(
+        "export_jobs"
+    )
+    if manager is None:
+        manager = ExportJobManager(
+            export_dir=current_app.config.get("EXPORT_JOB_DIR")
+            or os.path.join(current_app.instance_path, "exports"),
+            max_workers=current_app.config.get("EXPORT_JOB_WORKERS", 2),
+            retention=current_app.config.get("EXPORT_JOB_RETENTION", 3600),
+        )
+        current_app.extensions["export_jobs"] = manager
+    return manager
@@ -0,0 +1,211 @@
+import hashlib
+import importlib.util
+import os
+import re
+from types import ModuleType
+from typing import Dict, List, Optional
+
+import mysql.connector
+from mysql.connector.connection import MySQLConnection
+from mysql.connector.cursor import MySQLCursor
+
+from app.exceptions.database_exceptions import MigrationError
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR: str = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "database", "migrations"
+    )
+)
+
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_([\w-]+)\.(sql|py)$")
+
+ER_TABLE_EXISTS = 1050
+ER_DUP_FIELDNAME = 1060
+ER_DUP_KEYNAME = 1061
+EXISTING_OBJECT_ERRNOS = {ER_TABLE_EXISTS, ER_DUP_FIELDNAME, ER_DUP_KEYNAME}
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class Migration:
+
+    def __init__(self, version: int, name: str, path: str) -> None:
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, "r", encoding="utf-8") as f:
+            self.sql = f.read()
+        self.checksum = hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+
+    @property
+    def is_python(self) -> bool:
+        return self.path.endswith(".py")
+
+
+    def load_module(self) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(
+            f"migration_{self.version:04d}_{self.name}", self.path
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not callable(getattr(module, "upgrade", None)):
+            raise MigrationError(
+                f"Migrasi {self.version}_{self.name} tidak memiliki "
+                "fungsi upgrade(conn)."
+            )
+        return module
+
+
+    @property
+    def statements(self) -> List[str]:
+        return [
+            statement.strip()
+            for statement in self.sql.split(";")
+            if statement.strip()
+        ]
+
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    migrations: Dict[int, Migration] = {}
+    if not os.path.isdir(directory):
+        return []
+
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE_PATTERN.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(
+                f"Versi migrasi {version} terdaftar lebih dari sekali."
+            )
+        migrations[version] = Migration(
+            version, match.group(2), os.path.join(directory, filename)
+        )
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+class MigrationRunner:
+
+    def __init__(self, directory: str = MIGRATIONS_DIR) -> None:
+        self.directory = directory
+
+
+    def _ensure_table(self, conn: MySQLConnection) -> None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SCHEMA_MIGRATIONS_DDL)
+        finally:
+            cursor.close()
+
+
+    def applied(self, conn: MySQLConnection) -> Dict[int, str]:
+        self._ensure_table(conn)
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("SELECT version, checksum FROM schema_migrations")
+            return {
+                row["version"]: row["checksum"] for row in cursor.fetchall()
+            }
+        finally:
+            cursor.close()
+
+
+    def pending(
+        self, conn: MySQLConnection, target: Optional[int] = None
+    ) -> List[Migration]:
+        applied = self.applied(conn)
+        pending: List[Migration] = []
+
+        for migration in discover_migrations(self.directory):
+            checksum = applied.get(migration.version)
+            if checksum is not None:
+                if checksum != migration.checksum:
+                    raise MigrationError(
+                        f"Migrasi {migration.version}_{migration.name} sudah "
+                        "diterapkan tetapi isinya berubah."
+                    )
+                continue
+            if target is not None and migration.version > target:
+                break
+            pending.append(migration)
+
+        return pending
+
+
+    def migrate(
+        self, conn: MySQLConnection, target: Optional[int] = None
+    ) -> List[Migration]:
+        migrations = self.pending(conn, target)
+        if not migrations:
+            logger.info("Skema database sudah terbaru.")
+            return []
+
+        for migration in migrations:
+            self._apply(conn, migration)
+        return migrations
+
+
+    def _apply(self, conn: MySQLConnection, migration: Migration) -> None:
+        logger.info(
+            f"Menerapkan migrasi {migration.version}_{migration.name}..."
+        )
+        cursor = conn.cursor()
+        try:
+            if migration.is_python:
+                migration.load_module().upgrade(conn)
+            else:
+                self._execute_statements(cursor, migration)
+
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name, checksum) "
+                "VALUES (%s, %s, %s)",
+                (migration.version, migration.name, migration.checksum),
+            )
+            conn.commit()
+
+        except MigrationError:
+            conn.rollback()
+            raise
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(
+                f"Migrasi {migration.version}_{migration.name} gagal: {e}",
+                exc_info=True,
+            )
+            raise MigrationError(
+                f"Migrasi {migration.version}_{migration.name} gagal: {e}"
+            )
+
+        finally:
+            cursor.close()
+
+
+    def _execute_statements(
+        self, cursor: MySQLCursor, migration: Migration
+    ) -> None:
+        for statement in migration.statements:
+            try:
+                cursor.execute(statement)
+            except mysql.connector.Error as e:
+                if e.errno not in EXISTING_OBJECT_ERRNOS:
+                    raise
+                logger.warning(
+                    f"Objek skema pada migrasi {migration.version} sudah "
+                    f"ada, dilewati: {e.msg}"
+                )
+
+migration_runner = MigrationRunner()
\ No newline at end of file
@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Optional
+
+from flask import Flask
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class PeriodicTask:
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Any],
+        app: Optional[Flask] = None,
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.app = app
+        self.run_count = 0
+        self.failure_count = 0
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._wake_event.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name=f"periodic-{self.name}", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Tugas berkala '{self.name}' dimulai "
+            f"(interval {self.interval} detik)."
+        )
+
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            logger.info(f"Tugas berkala '{self.name}' dihentikan.")
+
+
+    def trigger(self) -> None:
+        self._wake_event.set()
+
+
+    def run_once(self) -> Any:
+        try:
+            if self.app is not None:
+                with self.app.app_context():
+                    result = self.func()
+            else:
+                result = self.func()
+            self.run_count += 1
+            return result
+
+        except Exception as e:
+            self.failure_count += 1
+            logger.error(
+                f"Tugas berkala '{self.name}' gagal: {e}", exc_info=True
+            )
+            return None
+
+
+    def _loop(self) -> None:
+        while True:
+            self._wake_event.wait(self.interval)
+            if self._stop_event.is_set():
+                return
+            self._wake_event.clear()
+            self.run_once()
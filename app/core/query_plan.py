@@ -0,0 +1,148 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mysql.connector.connection import MySQLConnection
+
+from app.repository.order_repository import order_repository
+from app.repository.product_repository import product_repository
+from app.repository.review_repository import review_repository
+from app.repository.stock_repository import stock_repository
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class HotQuery:
+
+    def __init__(
+        self,
+        name: str,
+        sql: str,
+        params: Tuple[Any, ...] = (),
+        expected_index: Optional[str] = None,
+        allow_full_scan: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.sql = sql
+        self.params = params
+        self.expected_index = expected_index
+        self.allow_full_scan = set(allow_full_scan)
+
+
+HOT_QUERIES: Dict[str, HotQuery] = {}
+
+
+def register_hot_query(query: HotQuery) -> HotQuery:
+    HOT_QUERIES[query.name] = query
+    return query
+
+
+SAMPLE_DATE = datetime(2025, 1, 1)
+
+register_hot_query(HotQuery(
+    "expired_pending_orders",
+    *order_repository.build_expired_pending_query(SAMPLE_DATE, 500),
+    expected_index="idx_orders_status_date",
+))
+register_hot_query(HotQuery(
+    "user_pending_order",
+    *order_repository.build_pending_by_user_query(1),
+    expected_index="idx_orders_user_status",
+))
+register_hot_query(HotQuery(
+    "order_by_transaction_id",
+    *order_repository.build_by_transaction_id_for_update_query("TX-1"),
+    expected_index="idx_orders_payment_transaction",
+))
+register_hot_query(HotQuery(
+    "admin_orders_page",
+    *order_repository.build_filtered_admin_query(
+        None, None, None, None, 51, (SAMPLE_DATE, 1000)
+    ),
+    expected_index="idx_orders_order_date",
+))
+register_hot_query(HotQuery(
+    "user_purchased_product",
+    *review_repository.build_user_purchase_query(1, 1),
+    expected_index="idx_order_items_product",
+))
+register_hot_query(HotQuery(
+    "product_reviews",
+    *review_repository.build_by_product_id_with_user_query(1),
+    expected_index="idx_reviews_product_created",
+))
+register_hot_query(HotQuery(
+    "related_products_by_category",
+    *product_repository.build_related_query(1, 1),
+    expected_index="idx_products_category_popularity",
+))
+register_hot_query(HotQuery(
+    "admin_products_low_stock",
+    *product_repository.build_admin_page_query(None, None, "low_stock", 51),
+    expected_index="idx_products_stock",
+))
+register_hot_query(HotQuery(
+    "held_stock_for_variant",
+    *stock_repository.build_held_stock_sum_query(1, 1),
+    expected_index="idx_stock_holds_product_variant",
+))
+
+
+def _split_keys(value: Optional[str]) -> List[str]:
+    return [key.strip() for key in (value or "").split(",") if key.strip()]
+
+
+def find_plan_problems(
+    query: HotQuery, plan: List[Dict[str, Any]]
+) -> List[str]:
+    problems: List[str] = []
+    plan_keys: List[str] = []
+
+    for row in plan:
+        table = row.get("table") or ""
+        possible_keys = _split_keys(row.get("possible_keys"))
+        chosen_key = row.get("key")
+        plan_keys.extend(possible_keys)
+        if chosen_key:
+            plan_keys.append(chosen_key)
+
+        if table.startswith("<") or table in query.allow_full_scan:
+            continue
+        if row.get("type") == "ALL" and not possible_keys:
+            problems.append(
+                f"{query.name}: full scan pada tabel '{table}' tanpa indeks "
+                "yang dapat dipakai."
+            )
+
+    if query.expected_index and query.expected_index not in plan_keys:
+        problems.append(
+            f"{query.name}: indeks '{query.expected_index}' tidak tersedia "
+            "untuk kueri ini."
+        )
+    return problems
+
+
+def explain_query(
+    conn: MySQLConnection, query: HotQuery
+) -> List[Dict[str, Any]]:
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(f"EXPLAIN {query.sql}", query.params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def check_query_plans(
+    conn: MySQLConnection, names: Optional[Sequence[str]] = None
+) -> Dict[str, List[str]]:
+    selected = [
+        HOT_QUERIES[name] for name in (names or sorted(HOT_QUERIES))
+    ]
+    results: Dict[str, List[str]] = {}
+    for query in selected:
+        problems = find_plan_problems(query, explain_query(conn, query))
+        results[query.name] = problems
+        for problem in problems:
+            logger.warning(f"Regresi rencana kueri: {problem}")
+    return results
\ No newline at end of file
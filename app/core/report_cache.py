@@ -0,0 +1,148 @@
+import copy
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from flask import current_app
+
+from app.core.ttl_cache import TTLCache
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+ReportCacheKey = Tuple[str, Optional[date], Optional[date]]
+
+
+def normalize_report_date(value: Any) -> Optional[date]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).strip()[:10], "%Y-%m-%d").date()
+
+
+class ReportCache:
+
+    def __init__(self, live_ttl: float = 30.0, historical_ttl: float = 3600.0):
+        self.live_ttl = live_ttl
+        self.historical_ttl = historical_ttl
+        self._cache = TTLCache(ttl=historical_ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+
+    def ttl_for(self, end: Optional[date], live: bool = False) -> float:
+        if live or end is None or end >= date.today():
+            return self.live_ttl
+        return self.historical_ttl
+
+
+    def get_or_load(
+        self,
+        report: str,
+        start_date: Any,
+        end_date: Any,
+        loader: Callable[[], Any],
+        live: bool = False,
+    ) -> Any:
+        try:
+            start = normalize_report_date(start_date)
+            end = normalize_report_date(end_date)
+        except ValueError:
+            self._count(report, "misses")
+            return loader()
+
+        key: ReportCacheKey = (report, start, end)
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count(report, "hits")
+            logger.debug(f"Laporan {report} ({start} - {end}) dari cache.")
+            return copy.deepcopy(value)
+
+        self._count(report, "misses")
+        with self._lock:
+            generation = self._generation
+
+        value = loader()
+        if isinstance(value, dict) and value.get("failed_sections"):
+            logger.debug(
+                f"Laporan {report} ({start} - {end}) tidak lengkap, "
+                "tidak disimpan ke cache."
+            )
+            return value
+
+        ttl = self.ttl_for(end, live)
+        with self._lock:
+            if generation == self._generation:
+                self._cache.set(key, copy.deepcopy(value), ttl)
+        return value
+
+
+    def invalidate_dates(self, dates: Iterable[Any]) -> int:
+        days = {normalize_report_date(d) for d in dates if d}
+        if not days:
+            return 0
+
+        removed = 0
+        with self._lock:
+            self._generation += 1
+            for key in self._cache.keys():
+                _, start, end = key
+                if any(
+                    (start is None or start <= day)
+                    and (end is None or day <= end)
+                    for day in days
+                ):
+                    self._cache.invalidate(key)
+                    removed += 1
+
+        if removed:
+            logger.info(
+                f"{removed} entri cache laporan diinvalidasi untuk tanggal "
+                f"{', '.join(sorted(str(day) for day in days))}."
+            )
+        return removed
+
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cache.invalidate()
+        logger.info("Seluruh cache laporan dihapus.")
+
+
+    def _count(self, report: str, counter: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(report, {"hits": 0, "misses": 0})
+            stats[counter] += 1
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "live_ttl": self.live_ttl,
+                "historical_ttl": self.historical_ttl,
+                "reports": {
+                    report: dict(stats)
+                    for report, stats in self._stats.items()
+                },
+            }
+
+
+def get_report_cache() -> ReportCache:
+    cache: Optional[ReportCache] = current_app.extensions.get("report_cache")
+    if cache is None:
+        cache = ReportCache(
+            live_ttl=current_app.config.get("REPORT_CACHE_LIVE_TTL", 30),
+            historical_ttl=current_app.config.get(
+                "REPORT_CACHE_HISTORICAL_TTL", 3600
+            ),
+        )
+        current_app.extensions["report_cache"] = cache
+    return cache
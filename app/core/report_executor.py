@@ -0,0 +1,187 @@
+import copy
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import mysql.connector
+from flask import Flask, current_app
+from mysql.connector.connection import MySQLConnection
+
+from app.exceptions.database_exceptions import QueryTimeoutError
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+ReportTask = Callable[[MySQLConnection], Any]
+
+QUERY_TIMEOUT_ERRNO = 3024
+
+
+class ReportExecutor:
+
+    def __init__(self, max_workers: int = 4, timeout: float = 5.0):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="report-query"
+        )
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failures = 0
+        self.timeouts = 0
+
+
+    def run(
+        self,
+        tasks: Dict[str, ReportTask],
+        connect: Callable[[], MySQLConnection],
+        defaults: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        defaults = defaults or {}
+        timeout = self.timeout if timeout is None else timeout
+        app = current_app._get_current_object()
+
+        futures: Dict[str, Future] = {
+            name: self._pool.submit(
+                self._execute, app, name, task, connect, timeout
+            )
+            for name, task in tasks.items()
+        }
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        for name, future in futures.items():
+            remaining = (
+                None if deadline is None
+                else max(0.0, deadline - time.monotonic())
+            )
+            try:
+                results[name] = future.result(timeout=remaining)
+                self._count("completed")
+
+            except FutureTimeoutError:
+                future.cancel()
+                self._count("timeouts")
+                errors[name] = QueryTimeoutError(
+                    f"Kueri laporan '{name}' melebihi batas waktu {timeout} detik."
+                )
+                results[name] = copy.deepcopy(defaults.get(name))
+                logger.warning(
+                    f"Kueri laporan '{name}' melebihi batas waktu "
+                    f"{timeout} detik, memakai nilai bawaan."
+                )
+
+            except QueryTimeoutError as e:
+                self._count("timeouts")
+                errors[name] = e
+                results[name] = copy.deepcopy(defaults.get(name))
+                logger.warning(f"{e} Memakai nilai bawaan.")
+
+            except Exception as e:
+                self._count("failures")
+                errors[name] = e
+                results[name] = copy.deepcopy(defaults.get(name))
+                logger.error(
+                    f"Kueri laporan '{name}' gagal: {e}", exc_info=True
+                )
+
+        return results, errors
+
+
+    def _execute(
+        self,
+        app: Flask,
+        name: str,
+        task: ReportTask,
+        connect: Callable[[], MySQLConnection],
+        timeout: float,
+    ) -> Any:
+        with app.app_context():
+            conn: Optional[MySQLConnection] = None
+            limited = False
+            started = time.monotonic()
+            try:
+                conn = connect()
+                if timeout > 0:
+                    self._set_max_execution_time(
+                        conn, math.ceil(timeout * 1000)
+                    )
+                    limited = True
+                return task(conn)
+
+            except mysql.connector.Error as e:
+                if e.errno == QUERY_TIMEOUT_ERRNO:
+                    raise QueryTimeoutError(
+                        f"Kueri laporan '{name}' dihentikan server setelah "
+                        f"{timeout} detik."
+                    )
+                raise
+
+            finally:
+                if conn and conn.is_connected():
+                    if limited:
+                        self._reset_max_execution_time(conn)
+                    conn.close()
+                logger.debug(
+                    f"Kueri laporan '{name}' selesai dalam "
+                    f"{time.monotonic() - started:.3f} detik."
+                )
+
+
+    def _set_max_execution_time(
+        self, conn: MySQLConnection, value: Union[int, str]
+    ) -> None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"SET SESSION MAX_EXECUTION_TIME = {value}")
+        finally:
+            cursor.close()
+
+
+    def _reset_max_execution_time(self, conn: MySQLConnection) -> None:
+        try:
+            self._set_max_execution_time(conn, "DEFAULT")
+        except mysql.connector.Error as e:
+            logger.warning(
+                f"Gagal me-reset MAX_EXECUTION_TIME koneksi laporan: {e}"
+            )
+
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout": self.timeout,
+                "completed": self.completed,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+            }
+
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_report_executor() -> ReportExecutor:
+    executor: Optional[ReportExecutor] = current_app.extensions.get(
+        "report_executor"
+    )
+    if executor is None:
+        executor = ReportExecutor(
+            max_workers=current_app.config.get(
+                "REPORT_EXECUTOR_MAX_WORKERS", 4
+            ),
+            timeout=current_app.config.get("REPORT_QUERY_TIMEOUT", 5.0),
+        )
+        current_app.extensions["report_executor"] = executor
+    return executor
\ No newline at end of file
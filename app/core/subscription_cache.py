@@ -0,0 +1,141 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flask import current_app
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+CacheEntry = Tuple[float, Optional[Dict[str, Any]]]
+
+
+class SubscriptionCache:
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_ttl: float = 3600.0,
+        negative_ttl: float = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, CacheEntry]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def ttl_for(self, subscription: Optional[Dict[str, Any]]) -> float:
+        if subscription is None:
+            return self.negative_ttl
+
+        end_date = subscription.get("end_date")
+        if not isinstance(end_date, datetime):
+            return self.max_ttl
+        remaining = (end_date - datetime.now()).total_seconds()
+        return max(0.0, min(self.max_ttl, remaining))
+
+
+    def get(self, user_id: int, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, subscription = entry
+            if expires_at <= now:
+                del self._entries[user_id]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return copy.deepcopy(subscription)
+
+
+    def get_or_load(
+        self,
+        user_id: int,
+        loader: Callable[[], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        value = self.get(user_id, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            generation = self._generation
+
+        subscription = loader()
+        ttl = self.ttl_for(subscription)
+        if ttl <= 0 or self.max_entries <= 0:
+            return subscription
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[user_id] = (
+                    time.monotonic() + ttl, copy.deepcopy(subscription)
+                )
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return subscription
+
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+        logger.debug(
+            "Cache langganan diinvalidasi "
+            f"(pengguna: {user_id if user_id is not None else 'semua'})."
+        )
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def get_subscription_cache() -> SubscriptionCache:
+    cache: Optional[SubscriptionCache] = current_app.extensions.get(
+        "subscription_cache"
+    )
+    if cache is None:
+        cache = SubscriptionCache(
+            max_entries=current_app.config.get(
+                "SUBSCRIPTION_CACHE_MAX_ENTRIES", 10000
+            ),
+            max_ttl=current_app.config.get("SUBSCRIPTION_CACHE_MAX_TTL", 3600),
+            negative_ttl=current_app.config.get(
+                "SUBSCRIPTION_CACHE_NEGATIVE_TTL", 300
+            ),
+        )
+        current_app.extensions["subscription_cache"] = cache
+    return cache
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return value
+
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = loader()
+        self.set(key, value, ttl)
+        return value
+
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        logger.debug(f"Cache diinvalidasi (kunci: {key if key else 'semua'}).")
+
+
+    def keys(self) -> List[Hashable]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                key for key, (expires_at, _) in self._entries.items()
+                if expires_at > now
+            ]
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
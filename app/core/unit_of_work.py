@@ -0,0 +1,202 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Set
+
+from mysql.connector.cursor import MySQLCursorDict
+
+from app.core.db_pool import ConnectionPool, PooledConnection
+from app.exceptions.database_exceptions import DatabaseConnectionError
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class UnitOfWorkConnection:
+
+    def __init__(self, uow: "UnitOfWork") -> None:
+        self._uow = uow
+        self._closed = False
+        self._savepoint: Optional[str] = None
+
+
+    def __getattr__(self, name: str) -> Any:
+        if self.__dict__.get("_closed", True):
+            raise DatabaseConnectionError(
+                "Koneksi unit of work sudah ditutup."
+            )
+        return getattr(self._uow.raw, name)
+
+
+    def is_connected(self) -> bool:
+        if self._closed:
+            return False
+        return self._uow.raw.is_connected()
+
+
+    def start_transaction(self, *args: Any, **kwargs: Any) -> None:
+        owner = self._uow.owner
+        if owner is not None and owner is not self:
+            if self._savepoint is None:
+                self._savepoint = self._uow.create_savepoint()
+            return
+        self._uow.begin(self, *args, **kwargs)
+
+
+    def commit(self) -> None:
+        if self._savepoint is not None:
+            self._uow.release_savepoint(self._savepoint)
+            self._savepoint = None
+        elif self._uow.owner is self:
+            self._uow.end(commit=True)
+        elif self._uow.owner is None:
+            self._uow.raw.commit()
+
+
+    def rollback(self) -> None:
+        if self._savepoint is not None:
+            self._uow.rollback_to_savepoint(self._savepoint)
+            self._savepoint = None
+        elif self._uow.owner is self:
+            self._uow.end(commit=False)
+        elif self._uow.owner is None:
+            self._uow.raw.rollback()
+
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        try:
+            if self._savepoint is not None:
+                self._uow.rollback_to_savepoint(self._savepoint)
+                self._savepoint = None
+            elif self._uow.owner is self:
+                self._uow.end(commit=False)
+        finally:
+            self._closed = True
+            self._uow.detach()
+
+
+class UnitOfWork:
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self.pool = pool
+        self.owner: Optional[UnitOfWorkConnection] = None
+        self.thread_id = threading.get_ident()
+        self._raw: Optional[PooledConnection] = None
+        self._open_handles = 0
+        self._savepoint_seq = 0
+        self._active_savepoints: Set[str] = set()
+
+
+    @property
+    def raw(self) -> PooledConnection:
+        if self._raw is None:
+            self._raw = self.pool.acquire()
+            logger.debug("Unit of work mengambil koneksi dari pool.")
+        return self._raw
+
+
+    def connection(self) -> UnitOfWorkConnection:
+        self._open_handles += 1
+        handle = UnitOfWorkConnection(self)
+        if self.owner is not None:
+            handle.start_transaction()
+        return handle
+
+
+    def cursor(self, **kwargs: Any) -> MySQLCursorDict:
+        return self.raw.cursor(**kwargs)
+
+
+    @contextmanager
+    def transaction(self) -> Iterator[UnitOfWorkConnection]:
+        conn = self.connection()
+        try:
+            conn.start_transaction()
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+    def begin(
+        self, handle: UnitOfWorkConnection, *args: Any, **kwargs: Any
+    ) -> None:
+        raw = self.raw
+        if raw.in_transaction:
+            logger.warning(
+                "Transaksi implisit yang belum selesai di-rollback sebelum "
+                "memulai transaksi unit of work."
+            )
+            raw.rollback()
+        raw.start_transaction(*args, **kwargs)
+        self.owner = handle
+
+
+    def end(self, commit: bool) -> None:
+        try:
+            if commit:
+                self.raw.commit()
+            else:
+                self.raw.rollback()
+        finally:
+            self.owner = None
+            self._active_savepoints.clear()
+
+
+    def create_savepoint(self) -> str:
+        self._savepoint_seq += 1
+        name = f"uow_sp_{self._savepoint_seq}"
+        self._execute(f"SAVEPOINT {name}")
+        self._active_savepoints.add(name)
+        return name
+
+
+    def release_savepoint(self, name: str) -> None:
+        if name not in self._active_savepoints:
+            return
+        self._active_savepoints.discard(name)
+        self._execute(f"RELEASE SAVEPOINT {name}")
+
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        if name not in self._active_savepoints:
+            return
+        self._active_savepoints.discard(name)
+        self._execute(f"ROLLBACK TO SAVEPOINT {name}")
+        self._execute(f"RELEASE SAVEPOINT {name}")
+
+
+    def detach(self) -> None:
+        self._open_handles = max(0, self._open_handles - 1)
+        if self._open_handles or self.owner is not None or self._raw is None:
+            return
+
+        try:
+            if self._raw.is_connected() and self._raw.in_transaction:
+                self._raw.rollback()
+        except Exception as e:
+            logger.warning(
+                f"Gagal mengakhiri transaksi implisit unit of work: {e}"
+            )
+
+
+    def close(self) -> None:
+        raw, self._raw = self._raw, None
+        self.owner = None
+        self._active_savepoints.clear()
+        if raw is not None:
+            raw.close()
+            logger.debug("Unit of work mengembalikan koneksi ke pool.")
+
+
+    def _execute(self, statement: str) -> None:
+        cursor = self.raw.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
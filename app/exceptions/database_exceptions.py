@@ -10,5 +10,17 @@ class QueryExecutionError(DatabaseException):
     pass
 
 
+class QueryTimeoutError(QueryExecutionError):
+    pass
+
+
+class DeadlockError(QueryExecutionError):
+    pass
+
+
 class RecordNotFoundError(DatabaseException):
+    pass
+
+
+class MigrationError(DatabaseException):
     pass
\ No newline at end of file
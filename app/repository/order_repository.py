@@ -1,45 +1,54 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mysql.connector.connection import MySQLConnection
 
 
 class OrderRepository:
     
-    def find_pending_by_user_id(
-        self, conn: MySQLConnection, user_id: int
-    ) -> Optional[Dict[str, Any]]:
-        cursor = conn.cursor(dictionary=True)
-        try:
-            cursor.execute(
-                """
+    def build_pending_by_user_query(
+        self, user_id: int
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = """
                 SELECT id
                 FROM orders
                 WHERE user_id = %s
                 AND status = 'Menunggu Pembayaran'
                 ORDER BY order_date DESC
                 LIMIT 1
-                """,
-                (user_id,),
-            )
+                """
+        return query, (user_id,)
+
+
+    def find_pending_by_user_id(
+        self, conn: MySQLConnection, user_id: int
+    ) -> Optional[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(*self.build_pending_by_user_query(user_id))
             return cursor.fetchone()
         finally:
             cursor.close()
 
 
-    def find_by_transaction_id(
+    def build_by_transaction_id_for_update_query(
+        self, transaction_id: str
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = (
+            "SELECT * FROM orders "
+            "WHERE payment_transaction_id = %s FOR UPDATE"
+        )
+        return query, (transaction_id,)
+
+
+    def find_by_transaction_id_for_update(
         self, conn: MySQLConnection, transaction_id: str
     ) -> Optional[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
             cursor.execute(
-                """
-                SELECT *
-                FROM orders
-                WHERE payment_transaction_id = %s
-                """,
-                (transaction_id,),
+                *self.build_by_transaction_id_for_update_query(transaction_id)
             )
             return cursor.fetchone()
         finally:
@@ -102,42 +111,113 @@ class OrderRepository:
             cursor.close()
 
 
+    def _build_admin_filters(
+        self,
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        search: Optional[str],
+    ) -> Tuple[List[str], List[Any], bool]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        needs_users = False
+
+        if status:
+            clauses.append("o.status = %s")
+            params.append(status)
+        if start_date:
+            clauses.append("o.order_date >= %s")
+            params.append(start_date)
+        if end_date:
+            clauses.append("o.order_date < DATE_ADD(%s, INTERVAL 1 DAY)")
+            params.append(end_date)
+
+        search = (search or "").strip().lstrip("#")
+        if search.isdigit():
+            clauses.append("o.id = %s")
+            params.append(int(search))
+        elif search:
+            clauses.append("(u.username LIKE %s OR o.shipping_name LIKE %s)")
+            search_term = f"%{search}%"
+            params.extend([search_term, search_term])
+            needs_users = True
+
+        return clauses, params, needs_users
+
+
+    def build_filtered_admin_query(
+        self,
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        search: Optional[str],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        clauses, params, _ = self._build_admin_filters(
+            status, start_date, end_date, search
+        )
+        if after is not None:
+            clauses.append(
+                "(o.order_date < %s OR (o.order_date = %s AND o.id < %s))"
+            )
+            params.extend([after[0], after[0], after[1]])
+
+        query = (
+            "SELECT o.id, o.user_id, o.order_date, o.status, "
+            "o.total_amount, o.shipping_name, "
+            "u.username AS customer_name FROM orders o "
+            "LEFT JOIN users u ON o.user_id = u.id"
+        )
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY o.order_date DESC, o.id DESC"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        return query, tuple(params)
+
+
     def find_filtered_admin(
         self, conn: MySQLConnection,
         status: Optional[str],
         start_date: Optional[str],
         end_date: Optional[str],
         search: Optional[str],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
-            query = (
-                "SELECT o.*, u.username AS customer_name FROM orders o "
-                "LEFT JOIN users u ON o.user_id = u.id WHERE 1=1"
+            cursor.execute(*self.build_filtered_admin_query(
+                status, start_date, end_date, search, limit, after
+            ))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+    def count_filtered_admin(
+        self, conn: MySQLConnection,
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        search: Optional[str],
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            clauses, params, needs_users = self._build_admin_filters(
+                status, start_date, end_date, search
             )
-            params = []
-
-            if status:
-                query += " AND o.status = %s"
-                params.append(status)
-            if start_date:
-                query += " AND DATE(o.order_date) >= %s"
-                params.append(start_date)
-            if end_date:
-                query += " AND DATE(o.order_date) <= %s"
-                params.append(end_date)
-            if search:
-                query += (
-                    " AND (CAST(o.id AS CHAR) LIKE %s "
-                    "OR u.username LIKE %s "
-                    "OR o.shipping_name LIKE %s)"
-                )
-                search_term = f"%{search}%"
-                params.extend([search_term, search_term, search_term])
+            query = "SELECT COUNT(*) FROM orders o"
+            if needs_users:
+                query += " LEFT JOIN users u ON o.user_id = u.id"
+            if clauses:
+                query += " WHERE " + " AND ".join(clauses)
 
-            query += " ORDER BY o.order_date DESC"
             cursor.execute(query, tuple(params))
-            return cursor.fetchall()
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
         finally:
             cursor.close()
 
@@ -249,16 +329,37 @@ class OrderRepository:
             cursor.close()
 
 
+    def build_expired_pending_query(
+        self,
+        expiration_time: datetime,
+        limit: Optional[int] = None,
+        after_id: int = 0,
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = (
+            "SELECT id, user_id FROM orders "
+            "WHERE status = 'Menunggu Pembayaran' AND order_date < %s"
+        )
+        params: List[Any] = [expiration_time]
+        if limit is not None:
+            query += (
+                " AND id > %s ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+            )
+            params.extend([after_id, limit])
+        return query, tuple(params)
+
+
     def find_expired_pending_orders(
-        self, conn: MySQLConnection, expiration_time: datetime
+        self,
+        conn: MySQLConnection,
+        expiration_time: datetime,
+        limit: Optional[int] = None,
+        after_id: int = 0,
     ) -> List[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
-            query = (
-                "SELECT id FROM orders "
-                "WHERE status = 'Menunggu Pembayaran' AND order_date < %s"
-            )
-            cursor.execute(query, (expiration_time,))
+            cursor.execute(*self.build_expired_pending_query(
+                expiration_time, limit, after_id
+            ))
             return cursor.fetchall()
         finally:
             cursor.close()
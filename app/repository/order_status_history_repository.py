@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mysql.connector.connection import MySQLConnection
 
@@ -23,6 +23,22 @@ class OrderStatusHistoryRepository:
         finally:
             cursor.close()
 
+    def create_batch(
+        self, conn: MySQLConnection, history_data: List[Tuple]
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(
+                """
+                INSERT INTO order_status_history (order_id, status, notes)
+                VALUES (%s, %s, %s)
+                """,
+                history_data,
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
     def find_by_order_id(
         self, conn: MySQLConnection, order_id: int
     ) -> List[Dict[str, Any]]:
@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mysql.connector.connection import MySQLConnection
 
@@ -127,14 +127,24 @@ class ProductRepository:
             cursor.close()
 
 
-    def update_popularity(
-        self, conn: MySQLConnection, product_id: Any
+    def increment_popularity_batch(
+        self, conn: MySQLConnection, increments: Dict[int, int]
     ) -> int:
         cursor = conn.cursor()
         try:
+            if not increments:
+                return 0
+            sorted_ids = sorted(increments)
+            case_sql = " ".join(["WHEN %s THEN %s"] * len(sorted_ids))
+            case_params: List[Any] = []
+            for product_id in sorted_ids:
+                case_params.extend([product_id, increments[product_id]])
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
             cursor.execute(
-                "UPDATE products SET popularity = popularity + 1 WHERE id = %s",
-                (product_id,),
+                f"UPDATE products SET popularity = popularity + "
+                f"CASE id {case_sql} ELSE 0 END "
+                f"WHERE id IN ({placeholders})",
+                tuple(case_params + sorted_ids),
             )
             return cursor.rowcount
         finally:
@@ -188,7 +198,9 @@ class ProductRepository:
 
 
     def find_filtered(
-        self, conn: MySQLConnection, filters: Dict[str, Any]
+        self, conn: MySQLConnection, filters: Dict[str, Any],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[Any, int]] = None,
     ) -> List[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
@@ -198,71 +210,117 @@ class ProductRepository:
                     p.popularity, p.image_url, p.additional_image_urls,
                     p.stock, p.has_variants, p.weight_grams, p.sku,
                     c.name AS category_name,
+                    p.min_price AS price,
                     IF(
-                        p.has_variants,
-                        MIN(COALESCE(pv.price, p.price)),
-                        p.price
-                    ) AS price,
-                    IF(
-                        p.has_variants,
-                        MIN(COALESCE(pv.discount_price, p.discount_price)),
-                        p.discount_price
-                    ) AS discount_price
+                        p.min_effective_price < p.min_price,
+                        p.min_effective_price,
+                        NULL
+                    ) AS discount_price,
+                    p.min_effective_price
+            """
+            query_from = """
                 FROM products p
                 LEFT JOIN categories c ON p.category_id = c.id
-                LEFT JOIN product_variants pv ON p.id = pv.product_id
             """
             
             params = []
             where_clauses = ["1=1"]
-
-            if filters.get("search"):
+            match_expr = (
+                "MATCH(p.name, p.description, p.colors) "
+                "AGAINST (%s IN BOOLEAN MODE)"
+            )
+            search_query = filters.get("search_query")
+
+            if search_query:
+                query_base += f", {match_expr} AS relevance"
+                params.append(search_query)
+                where_clauses.append(match_expr)
+                params.append(search_query)
+            elif filters.get("search"):
                 search_term = f"%{filters['search']}%"
-                where_clauses.append(
-                    "(p.name LIKE %s OR p.description LIKE %s "
-                    "OR p.colors LIKE %s OR c.name LIKE %s)"
-                )
-                params.extend(
-                    [search_term, search_term, search_term, search_term]
-                )
+                where_clauses.append("(p.name LIKE %s OR p.colors LIKE %s)")
+                params.extend([search_term, search_term])
             if filters.get("category"):
                 where_clauses.append("p.category_id = %s")
                 params.append(filters["category"])
 
-            query_where = " WHERE " + " AND ".join(where_clauses)
-            query_group = (
-                " GROUP BY p.id, p.name, p.description, p.category_id, "
-                "p.colors, p.popularity, p.image_url, "
-                "p.additional_image_urls, p.stock, p.has_variants, "
-                "p.weight_grams, p.sku, c.name"
-            )
-            
             sort_by = filters.get("sort", "popularity")
-            order_query = ""
-            if sort_by == "price_asc":
-                order_query = """
-                    ORDER BY COALESCE(
-                        IF(p.has_variants, MIN(COALESCE(pv.discount_price, p.discount_price)), p.discount_price),
-                        IF(p.has_variants, MIN(COALESCE(pv.price, p.price)), p.price)
-                    ) ASC
-                """
+            if sort_by == "relevance" and search_query:
+                order_query = " ORDER BY relevance DESC, p.id DESC"
+                if after is not None:
+                    where_clauses.append(
+                        f"({match_expr} < %s OR "
+                        f"({match_expr} = %s AND p.id < %s))"
+                    )
+                    params.extend([
+                        search_query, after[0],
+                        search_query, after[0], after[1],
+                    ])
+            elif sort_by == "price_asc":
+                order_query = " ORDER BY p.min_effective_price ASC, p.id ASC"
+                if after is not None:
+                    where_clauses.append(
+                        "(p.min_effective_price > %s OR "
+                        "(p.min_effective_price = %s AND p.id > %s))"
+                    )
+                    params.extend([after[0], after[0], after[1]])
             elif sort_by == "price_desc":
-                order_query = """
-                    ORDER BY COALESCE(
-                        IF(p.has_variants, MIN(COALESCE(pv.discount_price, p.discount_price)), p.discount_price),
-                        IF(p.has_variants, MIN(COALESCE(pv.price, p.price)), p.price)
-                    ) DESC
-                """
+                order_query = " ORDER BY p.min_effective_price DESC, p.id DESC"
+                if after is not None:
+                    where_clauses.append(
+                        "(p.min_effective_price < %s OR "
+                        "(p.min_effective_price = %s AND p.id < %s))"
+                    )
+                    params.extend([after[0], after[0], after[1]])
             else:
-                order_query = " ORDER BY p.popularity DESC"
-            
-            final_query = query_base + query_where + query_group + order_query
+                order_query = " ORDER BY p.popularity DESC, p.id DESC"
+                if after is not None:
+                    where_clauses.append(
+                        "(p.popularity < %s OR (p.popularity = %s AND p.id < %s))"
+                    )
+                    params.extend([after[0], after[0], after[1]])
+
+            query_where = " WHERE " + " AND ".join(where_clauses)
+
+            query_limit = ""
+            if limit is not None:
+                query_limit = " LIMIT %s"
+                params.append(limit)
+
+            final_query = (
+                query_base + query_from + query_where + order_query
+                + query_limit
+            )
             cursor.execute(final_query, tuple(params))
             return cursor.fetchall()
         finally:
             cursor.close()
 
 
+    def _build_admin_list_filters(
+        self,
+        search: Optional[str],
+        category_id: Optional[Any],
+        stock_status: Optional[str],
+    ) -> Tuple[List[str], List[Any]]:
+        where_clauses: List[str] = []
+        params: List[Any] = []
+        if search:
+            search_term = f"%{search}%"
+            where_clauses.append("(p.name LIKE %s OR p.sku LIKE %s)")
+            params.extend([search_term, search_term])
+        if category_id:
+            where_clauses.append("p.category_id = %s")
+            params.append(category_id)
+        if stock_status == "in_stock":
+            where_clauses.append("p.stock > 5")
+        elif stock_status == "low_stock":
+            where_clauses.append("p.stock > 0 AND p.stock <= 5")
+        elif stock_status == "out_of_stock":
+            where_clauses.append("p.stock <= 0")
+        return where_clauses, params
+
+
     def find_all_with_category(
         self, conn: MySQLConnection,
         search: Optional[str],
@@ -277,62 +335,144 @@ class ProductRepository:
                     p.popularity, p.image_url, p.additional_image_urls,
                     p.stock, p.has_variants, p.weight_grams, p.sku,
                     c.name AS category_name,
+                    p.min_price AS price,
                     IF(
-                        p.has_variants,
-                        MIN(COALESCE(pv.price, p.price)),
-                        p.price
-                    ) AS price,
-                    IF(
-                        p.has_variants,
-                        MIN(COALESCE(pv.discount_price, p.discount_price)),
-                        p.discount_price
+                        p.min_effective_price < p.min_price,
+                        p.min_effective_price,
+                        NULL
                     ) AS discount_price
                 FROM products p
                 LEFT JOIN categories c ON p.category_id = c.id
-                LEFT JOIN product_variants pv ON p.id = pv.product_id
             """
             
-            params = []
-            where_clauses = []
-            if search:
-                search_term = f"%{search}%"
-                where_clauses.append("(p.name LIKE %s OR p.sku LIKE %s)")
-                params.extend([search_term, search_term])
-            if category_id:
-                where_clauses.append("p.category_id = %s")
-                params.append(category_id)
-            if stock_status == "in_stock":
-                where_clauses.append("p.stock > 5")
-            elif stock_status == "low_stock":
-                where_clauses.append("p.stock > 0 AND p.stock <= 5")
-            elif stock_status == "out_of_stock":
-                where_clauses.append("p.stock <= 0")
-            
+            where_clauses, params = self._build_admin_list_filters(
+                search, category_id, stock_status
+            )
+
             query_where = ""
             if where_clauses:
                 query_where = " WHERE " + " AND ".join(where_clauses)
             
-            query_group = (
-                " GROUP BY p.id, p.name, p.description, p.category_id, "
-                "p.colors, p.popularity, p.image_url, "
-                "p.additional_image_urls, p.stock, p.has_variants, "
-                "p.weight_grams, p.sku, c.name"
-            )
             query_order = " ORDER BY p.id DESC"
             
-            final_query = query_base + query_where + query_group + query_order
+            final_query = query_base + query_where + query_order
             cursor.execute(final_query, tuple(params))
             return cursor.fetchall()
         finally:
             cursor.close()
 
 
-    def find_related(
-        self, conn: MySQLConnection, product_id: Any, category_id: Any
+    def build_admin_page_query(
+        self,
+        search: Optional[str],
+        category_id: Optional[Any],
+        stock_status: Optional[str],
+        limit: int,
+        after_id: Optional[int] = None,
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        where_clauses, params = self._build_admin_list_filters(
+            search, category_id, stock_status
+        )
+        if after_id is not None:
+            where_clauses.append("p.id < %s")
+            params.append(after_id)
+
+        query = """
+                SELECT
+                    p.id, p.name, p.category_id, p.image_url, p.stock,
+                    p.has_variants, p.sku,
+                    c.name AS category_name,
+                    p.min_price AS price,
+                    IF(
+                        p.min_effective_price < p.min_price,
+                        p.min_effective_price,
+                        NULL
+                    ) AS discount_price
+                FROM products p
+                LEFT JOIN categories c ON p.category_id = c.id
+            """
+        if where_clauses:
+            query += " WHERE " + " AND ".join(where_clauses)
+        query += " ORDER BY p.id DESC LIMIT %s"
+        params.append(limit)
+        return query, tuple(params)
+
+
+    def find_admin_page(
+        self, conn: MySQLConnection,
+        search: Optional[str],
+        category_id: Optional[Any],
+        stock_status: Optional[str],
+        limit: int,
+        after_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
-            query = """
+            cursor.execute(*self.build_admin_page_query(
+                search, category_id, stock_status, limit, after_id
+            ))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+    def count_admin(
+        self, conn: MySQLConnection,
+        search: Optional[str],
+        category_id: Optional[Any],
+        stock_status: Optional[str],
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            where_clauses, params = self._build_admin_list_filters(
+                search, category_id, stock_status
+            )
+            query = "SELECT COUNT(*) FROM products p"
+            if where_clauses:
+                query += " WHERE " + " AND ".join(where_clauses)
+
+            cursor.execute(query, tuple(params))
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+        finally:
+            cursor.close()
+
+
+    def find_variant_summaries(
+        self, conn: MySQLConnection, product_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        if not product_ids:
+            return {}
+
+        cursor = conn.cursor(dictionary=True)
+        try:
+            placeholders = ", ".join(["%s"] * len(product_ids))
+            cursor.execute(
+                f"""
+                SELECT
+                    pv.product_id,
+                    COUNT(*) AS variant_count,
+                    SUM(pv.stock > 0) AS variants_in_stock,
+                    MAX(COALESCE(
+                        pv.discount_price, pp.discount_price,
+                        pv.price, pp.price
+                    )) AS max_effective_price
+                FROM product_variants pv
+                JOIN products pp ON pp.id = pv.product_id
+                WHERE pv.product_id IN ({placeholders})
+                GROUP BY pv.product_id
+                """,
+                tuple(product_ids),
+            )
+            return {row["product_id"]: row for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+
+    def build_related_query(
+        self, product_id: Any, category_id: Any
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = """
                 SELECT p.*, c.name AS category_name
                 FROM products p
                 LEFT JOIN categories c ON p.category_id = c.id
@@ -340,7 +480,35 @@ class ProductRepository:
                 ORDER BY p.popularity DESC
                 LIMIT 4
             """
-            cursor.execute(query, (category_id, product_id))
+        return query, (category_id, product_id)
+
+
+    def find_related(
+        self, conn: MySQLConnection, product_id: Any, category_id: Any
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(*self.build_related_query(product_id, category_id))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+    def find_top_by_popularity(
+        self, conn: MySQLConnection, limit: int
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT p.*, c.name AS category
+                FROM products p
+                LEFT JOIN categories c ON p.category_id = c.id
+                ORDER BY p.popularity DESC, p.id DESC
+                LIMIT %s
+                """,
+                (limit,),
+            )
             return cursor.fetchall()
         finally:
             cursor.close()
@@ -407,6 +575,23 @@ class ProductRepository:
             cursor.close()
 
 
+    def get_stock_batch(
+        self, conn: MySQLConnection, product_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            if not product_ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(product_ids))
+            cursor.execute(
+                f"SELECT id, stock FROM products WHERE id IN ({placeholders})",
+                tuple(product_ids),
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
     def increase_stock(
         self, conn: MySQLConnection, product_id: int, quantity: int
     ) -> int:
@@ -435,6 +620,49 @@ class ProductRepository:
             cursor.close()
 
 
+    def lock_stock_batch(
+        self, conn: MySQLConnection, ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            if not ids:
+                return []
+            sorted_ids = sorted(ids)
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
+            cursor.execute(
+                "SELECT id, stock FROM products "
+                f"WHERE id IN ({placeholders}) ORDER BY id FOR UPDATE",
+                tuple(sorted_ids),
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+    def decrease_stock_batch(
+        self, conn: MySQLConnection, quantities: Dict[int, int]
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            if not quantities:
+                return 0
+            sorted_ids = sorted(quantities)
+            case_sql = " ".join(["WHEN %s THEN %s"] * len(sorted_ids))
+            case_params: List[Any] = []
+            for item_id in sorted_ids:
+                case_params.extend([item_id, quantities[item_id]])
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
+            cursor.execute(
+                f"UPDATE products SET stock = stock - CASE id {case_sql} END "
+                f"WHERE id IN ({placeholders}) "
+                f"AND stock >= CASE id {case_sql} END",
+                tuple(case_params + sorted_ids + case_params),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
     def decrease_stock(
         self, conn: MySQLConnection, product_id: int, quantity: int
     ) -> int:
@@ -449,6 +677,84 @@ class ProductRepository:
             cursor.close()
 
 
+    def sync_stock_from_variants(
+        self, conn: MySQLConnection, product_ids: List[int]
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            if not product_ids:
+                return 0
+            sorted_ids = sorted(product_ids)
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
+            cursor.execute(
+                f"""
+                UPDATE products p
+                JOIN (
+                    SELECT product_id, SUM(stock) AS total
+                    FROM product_variants
+                    WHERE product_id IN ({placeholders})
+                    GROUP BY product_id
+                ) v ON v.product_id = p.id
+                SET p.stock = v.total
+                """,
+                tuple(sorted_ids),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+    def refresh_min_prices(
+        self, conn: MySQLConnection, product_ids: Optional[List[int]] = None
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            if product_ids is not None and not product_ids:
+                return 0
+            variant_filter = ""
+            product_filter = ""
+            params: List[Any] = []
+            if product_ids is not None:
+                sorted_ids = sorted(set(product_ids))
+                placeholders = ", ".join(["%s"] * len(sorted_ids))
+                variant_filter = f"WHERE pv.product_id IN ({placeholders})"
+                product_filter = f"WHERE p.id IN ({placeholders})"
+                params = sorted_ids + sorted_ids
+            cursor.execute(
+                f"""
+                UPDATE products p
+                LEFT JOIN (
+                    SELECT
+                        pv.product_id,
+                        MIN(COALESCE(pv.price, pp.price)) AS min_price,
+                        MIN(COALESCE(
+                            pv.discount_price, pp.discount_price,
+                            pv.price, pp.price
+                        )) AS min_effective_price
+                    FROM product_variants pv
+                    JOIN products pp ON pp.id = pv.product_id
+                    {variant_filter}
+                    GROUP BY pv.product_id
+                ) v ON v.product_id = p.id
+                SET
+                    p.min_price = IF(
+                        p.has_variants AND v.product_id IS NOT NULL,
+                        v.min_price, p.price
+                    ),
+                    p.min_effective_price = IF(
+                        p.has_variants AND v.product_id IS NOT NULL,
+                        v.min_effective_price,
+                        COALESCE(p.discount_price, p.price)
+                    )
+                {product_filter}
+                """,
+                tuple(params),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
     def find_batch_for_order(
         self, conn: MySQLConnection, product_ids: List[int]
     ) -> List[Dict[str, Any]]:
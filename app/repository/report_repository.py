@@ -1,7 +1,13 @@
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import mysql.connector
 from mysql.connector.connection import MySQLConnection
+from mysql.connector.cursor import MySQLCursor
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 
 class ReportRepository:
@@ -23,6 +29,83 @@ class ReportRepository:
         return date_filter, params
 
 
+    def _get_rollup_date_filter_clause(
+        self, start_date: Optional[str],
+        end_date: Optional[str],
+        table_alias: str = "d",
+    ) -> Tuple[str, List[str]]:
+        
+        date_filter = " WHERE 1=1"
+        params: List[str] = []
+        if start_date:
+            date_filter += f" AND {table_alias}.sale_date >= DATE(%s)"
+            params.append(start_date)
+        if end_date:
+            date_filter += f" AND {table_alias}.sale_date <= DATE(%s)"
+            params.append(end_date)
+        return date_filter, params
+
+
+    def _get_units_sold_join(
+        self, start_date: Optional[str],
+        end_date: Optional[str],
+        product_alias: str = "p",
+    ) -> Tuple[str, List[str]]:
+        
+        date_filter, params = self._get_rollup_date_filter_clause(
+            start_date, end_date
+        )
+        join = f"""
+            LEFT JOIN (
+                SELECT d.product_id, SUM(d.units_sold) AS units_sold
+                FROM daily_product_sales d
+                {date_filter}
+                GROUP BY d.product_id
+            ) s ON s.product_id = {product_alias}.id
+        """
+        return join, params
+
+
+    def _stream_query(
+        self, conn: MySQLConnection,
+        query: str,
+        params: Tuple[Any, ...],
+        chunk_size: int,
+    ) -> Iterator[Tuple[Any, ...]]:
+        
+        cursor = conn.cursor(buffered=False)
+        try:
+            cursor.execute(query, params)
+        except Exception:
+            cursor.close()
+            raise
+        return self._iter_cursor(cursor, chunk_size)
+
+
+    def _iter_cursor(
+        self, cursor: MySQLCursor, chunk_size: int
+    ) -> Iterator[Tuple[Any, ...]]:
+        
+        exhausted = False
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    exhausted = True
+                    break
+                yield from rows
+        finally:
+            if not exhausted:
+                try:
+                    while cursor.fetchmany(chunk_size):
+                        pass
+                except mysql.connector.Error as e:
+                    logger.warning(
+                        f"Gagal menguras sisa hasil ekspor yang dihentikan: {e}"
+                    )
+            cursor.close()
+
+
     def get_top_spenders(
         self, conn: MySQLConnection,
         start_date: Optional[str],
@@ -89,6 +172,48 @@ class ReportRepository:
             cursor.close()
 
 
+    def get_inactive_user_ids(
+        self, conn: MySQLConnection, inactive_since: str
+    ) -> List[int]:
+        
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT user_id
+                FROM orders
+                WHERE status = 'Selesai' AND user_id IS NOT NULL
+                GROUP BY user_id
+                HAVING MAX(order_date) < %s
+                """,
+                (inactive_since,),
+            )
+            return [row['user_id'] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+
+    def get_first_time_buyer_user_ids(
+        self, conn: MySQLConnection, start_date: str, end_date: str
+    ) -> List[int]:
+        
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT user_id
+                FROM orders
+                WHERE status = 'Selesai' AND user_id IS NOT NULL
+                GROUP BY user_id
+                HAVING COUNT(*) = 1 AND MIN(order_date) BETWEEN %s AND %s
+                """,
+                (start_date, end_date),
+            )
+            return [row['user_id'] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+
     def get_cart_analytics_created(self, conn: MySQLConnection) -> int:
         cursor = conn.cursor(dictionary=True)
         try:
@@ -127,30 +252,26 @@ class ReportRepository:
         self, conn: MySQLConnection,
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date
-            )
-            query = f"""
-                SELECT
-                    u.id,
-                    u.username,
-                    u.email,
-                    SUM(o.total_amount) AS total_spent,
-                    COUNT(o.id) AS order_count
-                FROM users u
-                JOIN orders o ON u.id = o.user_id
-                {date_filter}
-                GROUP BY u.id
-                ORDER BY total_spent DESC
-            """
-            cursor.execute(query, tuple(params))
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        date_filter, params = self._get_date_filter_clause(
+            start_date, end_date
+        )
+        query = f"""
+            SELECT
+                u.id,
+                u.username,
+                u.email,
+                SUM(o.total_amount) AS total_spent,
+                COUNT(o.id) AS order_count
+            FROM users u
+            JOIN orders o ON u.id = o.user_id
+            {date_filter}
+            GROUP BY u.id
+            ORDER BY total_spent DESC
+        """
+        return self._stream_query(conn, query, tuple(params), chunk_size)
 
 
     def get_dashboard_sales(
@@ -160,10 +281,9 @@ class ReportRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             query = """
-                SELECT SUM(total_amount) AS total
-                FROM orders
-                WHERE status != 'Dibatalkan'
-                AND order_date BETWEEN %s AND %s
+                SELECT SUM(revenue) AS total
+                FROM daily_sales
+                WHERE sale_date BETWEEN DATE(%s) AND DATE(%s)
             """
             cursor.execute(query, (start_date_str, end_date_str))
             result = cursor.fetchone()
@@ -179,13 +299,13 @@ class ReportRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             query = """
-                SELECT COUNT(id) AS count
-                FROM orders
-                WHERE order_date BETWEEN %s AND %s
+                SELECT SUM(order_count) AS count
+                FROM daily_sales
+                WHERE sale_date BETWEEN DATE(%s) AND DATE(%s)
             """
             cursor.execute(query, (start_date_str, end_date_str))
             result = cursor.fetchone()
-            return result["count"] or 0
+            return int(result["count"] or 0)
         finally:
             cursor.close()
 
@@ -262,26 +382,16 @@ class ReportRepository:
         
         cursor = conn.cursor(dictionary=True)
         try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date, "o"
-            )
-            date_filter_for_join = date_filter.replace(
-                "WHERE o.status != 'Dibatalkan'", ""
+            units_sold_join, params = self._get_units_sold_join(
+                start_date, end_date
             )
             query = f"""
                 SELECT
                     p.name,
                     p.stock,
-                    (
-                        SELECT COALESCE(SUM(oi.quantity), 0)
-                        FROM order_items oi
-                        JOIN orders o ON oi.order_id = o.id
-                        WHERE oi.product_id = p.id
-                        AND o.status != 'Dibatalkan'
-                        {date_filter_for_join}
-                    ) AS total_sold
+                    COALESCE(s.units_sold, 0) AS total_sold
                 FROM products p
-                GROUP BY p.id
+                {units_sold_join}
                 ORDER BY total_sold ASC, p.stock DESC
                 LIMIT 10
             """
@@ -361,78 +471,59 @@ class ReportRepository:
 
 
     def get_inventory_low_stock_for_export(
-        self, conn: MySQLConnection
-    ) -> List[Dict[str, Any]]:
+        self, conn: MySQLConnection, chunk_size: int = 1000
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            query = """
-                SELECT
-                    name,
-                    stock,
-                    'Produk Utama' AS type,
-                    id AS product_id,
-                    NULL AS variant_id,
-                    sku
-                FROM products
-                WHERE has_variants = 0
-                AND stock <= 5
-                AND stock > 0
-                UNION ALL
-                SELECT
-                    CONCAT(p.name, ' (', pv.color, ' / ', pv.size, ')') AS name,
-                    pv.stock,
-                    'Varian' AS type,
-                    p.id AS product_id,
-                    pv.id AS variant_id,
-                    pv.sku
-                FROM product_variants pv
-                JOIN products p ON pv.product_id = p.id
-                WHERE pv.stock <= 5
-                AND pv.stock > 0
-                ORDER BY stock ASC
-            """
-            cursor.execute(query)
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        query = """
+            SELECT
+                name,
+                stock,
+                'Produk Utama' AS type,
+                id AS product_id,
+                NULL AS variant_id,
+                sku
+            FROM products
+            WHERE has_variants = 0
+            AND stock <= 5
+            AND stock > 0
+            UNION ALL
+            SELECT
+                CONCAT(p.name, ' (', pv.color, ' / ', pv.size, ')') AS name,
+                pv.stock,
+                'Varian' AS type,
+                p.id AS product_id,
+                pv.id AS variant_id,
+                pv.sku
+            FROM product_variants pv
+            JOIN products p ON pv.product_id = p.id
+            WHERE pv.stock <= 5
+            AND pv.stock > 0
+            ORDER BY stock ASC
+        """
+        return self._stream_query(conn, query, (), chunk_size)
 
 
     def get_inventory_slow_moving_for_export(
         self, conn: MySQLConnection,
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date
-            )
-            date_filter_for_join = date_filter.replace(
-                "WHERE o.status != 'Dibatalkan'", ""
-            )
-            query = f"""
-                SELECT
-                    p.name,
-                    p.stock,
-                    (
-                        SELECT COALESCE(SUM(oi.quantity), 0)
-                        FROM order_items oi
-                        JOIN orders o ON oi.order_id = o.id
-                        WHERE oi.product_id = p.id
-                        AND o.status != 'Dibatalkan'
-                        {date_filter_for_join}
-                    ) AS total_sold
-                FROM products p
-                GROUP BY p.id
-                ORDER BY total_sold ASC, p.stock DESC
-                LIMIT 20
-            """
-            cursor.execute(query, tuple(params))
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        units_sold_join, params = self._get_units_sold_join(
+            start_date, end_date
+        )
+        query = f"""
+            SELECT
+                p.name,
+                p.stock,
+                COALESCE(s.units_sold, 0) AS total_sold
+            FROM products p
+            {units_sold_join}
+            ORDER BY total_sold ASC, p.stock DESC
+            LIMIT 20
+        """
+        return self._stream_query(conn, query, tuple(params), chunk_size)
 
 
     def get_top_selling_products(
@@ -443,16 +534,16 @@ class ReportRepository:
         
         cursor = conn.cursor(dictionary=True)
         try:
-            date_filter, params = self._get_date_filter_clause(
+            date_filter, params = self._get_rollup_date_filter_clause(
                 start_date, end_date
             )
             query = f"""
-                SELECT p.name, SUM(oi.quantity) AS total_sold
-                FROM products p
-                JOIN order_items oi ON p.id = oi.product_id
-                JOIN orders o ON oi.order_id = o.id
+                SELECT p.name, SUM(d.units_sold) AS total_sold
+                FROM daily_product_sales d
+                JOIN products p ON d.product_id = p.id
                 {date_filter}
                 GROUP BY p.id
+                HAVING total_sold > 0
                 ORDER BY total_sold DESC
                 LIMIT 10
             """
@@ -487,13 +578,12 @@ class ReportRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             query = """
-                SELECT p.name, SUM(oi.quantity) AS total_sold
-                FROM order_items oi
-                JOIN products p ON oi.product_id = p.id
-                JOIN orders o ON oi.order_id = o.id
-                WHERE o.status != 'Dibatalkan'
-                AND o.order_date BETWEEN %s AND %s
+                SELECT p.name, SUM(d.units_sold) AS total_sold
+                FROM daily_product_sales d
+                JOIN products p ON d.product_id = p.id
+                WHERE d.sale_date BETWEEN DATE(%s) AND DATE(%s)
                 GROUP BY p.id
+                HAVING total_sold > 0
                 ORDER BY total_sold DESC
                 LIMIT 5
             """
@@ -507,43 +597,29 @@ class ReportRepository:
         self, conn: MySQLConnection,
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date
-            )
-            date_filter_for_join = date_filter.replace(
-                "WHERE o.status != 'Dibatalkan'", ""
-            )
-            query = f"""
-                SELECT
-                    p.id,
-                    p.name,
-                    c.name AS category_name,
-                    p.sku,
-                    p.price,
-                    p.discount_price,
-                    p.stock,
-                    (
-                        SELECT COALESCE(SUM(oi.quantity), 0)
-                        FROM order_items oi
-                        JOIN orders o ON oi.order_id = o.id
-                        WHERE oi.product_id = p.id
-                        AND o.status != 'Dibatalkan'
-                        {date_filter_for_join}
-                    ) AS total_sold,
-                    p.popularity
-                FROM products p
-                LEFT JOIN categories c ON p.category_id = c.id
-                GROUP BY p.id
-                ORDER BY total_sold DESC
-            """
-            cursor.execute(query, tuple(params))
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        units_sold_join, params = self._get_units_sold_join(
+            start_date, end_date
+        )
+        query = f"""
+            SELECT
+                p.id,
+                p.name,
+                c.name AS category_name,
+                p.sku,
+                p.price,
+                p.discount_price,
+                p.stock,
+                COALESCE(s.units_sold, 0) AS total_sold,
+                p.popularity
+            FROM products p
+            LEFT JOIN categories c ON p.category_id = c.id
+            {units_sold_join}
+            ORDER BY total_sold DESC
+        """
+        return self._stream_query(conn, query, tuple(params), chunk_size)
 
 
     def get_sales_summary(
@@ -554,16 +630,17 @@ class ReportRepository:
         
         cursor = conn.cursor(dictionary=True)
         try:
-            date_filter, params = self._get_date_filter_clause(
+            date_filter, params = self._get_rollup_date_filter_clause(
                 start_date, end_date
             )
             query = f"""
                 SELECT
-                    COALESCE(SUM(o.total_amount), 0) AS total_revenue,
-                    COUNT(o.id) AS total_orders,
-                    COALESCE(SUM(oi.quantity), 0) AS total_items_sold
-                FROM orders o
-                LEFT JOIN order_items oi ON o.id = oi.order_id
+                    COALESCE(SUM(d.revenue), 0) AS total_revenue,
+                    COALESCE(
+                        SUM(d.order_count - d.cancelled_count), 0
+                    ) AS total_orders,
+                    COALESCE(SUM(d.items_sold), 0) AS total_items_sold
+                FROM daily_sales d
                 {date_filter}
             """
             cursor.execute(query, tuple(params))
@@ -580,19 +657,19 @@ class ReportRepository:
         
         cursor = conn.cursor(dictionary=True)
         try:
-            date_filter, params = self._get_date_filter_clause(
+            date_filter, params = self._get_rollup_date_filter_clause(
                 start_date, end_date
             )
-            date_filter_and = date_filter.replace("WHERE", "AND")
             query = f"""
                 SELECT
-                    voucher_code,
-                    COUNT(id) AS usage_count,
-                    SUM(discount_amount) AS total_discount
-                FROM orders o
-                WHERE voucher_code IS NOT NULL {date_filter_and}
-                GROUP BY voucher_code
-                ORDER BY usage_count DESC;
+                    d.voucher_code,
+                    SUM(d.usage_count) AS usage_count,
+                    SUM(d.discount_total) AS total_discount
+                FROM daily_voucher_usage d
+                {date_filter}
+                GROUP BY d.voucher_code
+                HAVING usage_count > 0
+                ORDER BY usage_count DESC
             """
             cursor.execute(query, tuple(params))
             return cursor.fetchall()
@@ -607,12 +684,9 @@ class ReportRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             query = """
-                SELECT
-                    DATE(order_date) AS sale_date,
-                    SUM(total_amount) AS daily_total
-                FROM orders
-                WHERE status != 'Dibatalkan' AND order_date BETWEEN %s AND %s
-                GROUP BY sale_date
+                SELECT sale_date, revenue AS daily_total
+                FROM daily_sales
+                WHERE sale_date BETWEEN DATE(%s) AND DATE(%s)
                 ORDER BY sale_date ASC
             """
             cursor.execute(query, (start_date_str, end_date_str))
@@ -625,74 +699,66 @@ class ReportRepository:
         self, conn: MySQLConnection,
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date
-            )
-            query = f"""
-                SELECT
-                    o.id,
-                    o.order_date,
-                    o.shipping_name,
-                    u.email,
-                    o.subtotal,
-                    o.discount_amount,
-                    o.shipping_cost,
-                    o.total_amount,
-                    o.status,
-                    o.payment_method,
-                    o.voucher_code
-                FROM orders o
-                LEFT JOIN users u ON o.user_id = u.id
-                {date_filter}
-                ORDER BY o.order_date DESC
-            """
-            cursor.execute(query, tuple(params))
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        date_filter, params = self._get_date_filter_clause(
+            start_date, end_date
+        )
+        query = f"""
+            SELECT
+                o.id,
+                o.order_date,
+                o.shipping_name,
+                u.email,
+                o.subtotal,
+                o.discount_amount,
+                o.shipping_cost,
+                o.total_amount,
+                o.status,
+                o.payment_method,
+                o.voucher_code
+            FROM orders o
+            LEFT JOIN users u ON o.user_id = u.id
+            {date_filter}
+            ORDER BY o.order_date DESC
+        """
+        return self._stream_query(conn, query, tuple(params), chunk_size)
 
 
     def get_full_vouchers_data_for_export(
         self, conn: MySQLConnection,
         start_date: Optional[str],
         end_date: Optional[str],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[Any, ...]]:
         
-        cursor = conn.cursor(dictionary=True)
-        try:
-            date_filter, params = self._get_date_filter_clause(
-                start_date, end_date
-            )
-            date_filter_voucher = date_filter.replace(
-                "WHERE o.status != 'Dibatalkan'", ""
-            )
-            query = f"""
-                SELECT
-                    v.code,
-                    v.type,
-                    v.value,
-                    (
-                        SELECT COUNT(o.id)
-                        FROM orders o
-                        WHERE o.voucher_code = v.code
-                        AND o.status != 'Dibatalkan' {date_filter_voucher}
-                    ) AS usage_count,
-                    (
-                        SELECT COALESCE(SUM(o.discount_amount), 0)
-                        FROM orders o
-                        WHERE o.voucher_code = v.code
-                        AND o.status != 'Dibatalkan' {date_filter_voucher}
-                    ) AS total_discount
-                FROM vouchers v
-                ORDER BY usage_count DESC
-            """
-            cursor.execute(query, tuple(params * 2))
-            return cursor.fetchall()
-        finally:
-            cursor.close()
+        date_filter, params = self._get_date_filter_clause(
+            start_date, end_date
+        )
+        date_filter_voucher = date_filter.replace(
+            "WHERE o.status != 'Dibatalkan'", ""
+        )
+        query = f"""
+            SELECT
+                v.code,
+                v.type,
+                v.value,
+                (
+                    SELECT COUNT(o.id)
+                    FROM orders o
+                    WHERE o.voucher_code = v.code
+                    AND o.status != 'Dibatalkan' {date_filter_voucher}
+                ) AS usage_count,
+                (
+                    SELECT COALESCE(SUM(o.discount_amount), 0)
+                    FROM orders o
+                    WHERE o.voucher_code = v.code
+                    AND o.status != 'Dibatalkan' {date_filter_voucher}
+                ) AS total_discount
+            FROM vouchers v
+            ORDER BY usage_count DESC
+        """
+        return self._stream_query(conn, query, tuple(params * 2), chunk_size)
 
 report_repository = ReportRepository()
\ No newline at end of file
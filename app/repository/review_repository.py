@@ -1,24 +1,30 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mysql.connector.connection import MySQLConnection
 
 
 class ReviewRepository:
     
+    def build_by_product_id_with_user_query(
+        self, product_id: Any
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = """
+                SELECT r.*, u.username
+                FROM reviews r
+                JOIN users u ON r.user_id = u.id
+                WHERE r.product_id = %s
+                ORDER BY r.created_at DESC
+                """
+        return query, (product_id,)
+
+
     def find_by_product_id_with_user(
         self, conn: MySQLConnection, product_id: Any
     ) -> List[Dict[str, Any]]:
         cursor = conn.cursor(dictionary=True)
         try:
             cursor.execute(
-                """
-                SELECT r.*, u.username
-                FROM reviews r
-                JOIN users u ON r.user_id = u.id
-                WHERE r.product_id = %s
-                ORDER BY r.created_at DESC
-                """,
-                (product_id,),
+                *self.build_by_product_id_with_user_query(product_id)
             )
             return cursor.fetchall()
         finally:
@@ -44,13 +50,10 @@ class ReviewRepository:
             cursor.close()
 
 
-    def check_user_purchase(
-        self, conn: MySQLConnection, user_id: Any, product_id: Any
-    ) -> bool:
-        cursor = conn.cursor(dictionary=True)
-        try:
-            cursor.execute(
-                """
+    def build_user_purchase_query(
+        self, user_id: Any, product_id: Any
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        query = """
                 SELECT 1
                 FROM orders o
                 JOIN order_items oi ON o.id = oi.order_id
@@ -58,8 +61,17 @@ class ReviewRepository:
                   AND oi.product_id = %s
                   AND o.status = 'Selesai'
                 LIMIT 1
-                """,
-                (user_id, product_id),
+                """
+        return query, (user_id, product_id)
+
+
+    def check_user_purchase(
+        self, conn: MySQLConnection, user_id: Any, product_id: Any
+    ) -> bool:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                *self.build_user_purchase_query(user_id, product_id)
             )
             return cursor.fetchone() is not None
         finally:
@@ -0,0 +1,301 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from mysql.connector.connection import MySQLConnection
+
+
+class SalesRollupRepository:
+
+    def _placeholders(self, order_ids: List[int]) -> str:
+        return ", ".join(["%s"] * len(order_ids))
+
+
+    def _order_range_clause(
+        self, start_date: Optional[date], end_date: Optional[date]
+    ) -> Tuple[str, List[Any]]:
+        clause = ""
+        params: List[Any] = []
+        if start_date:
+            clause += " AND o.order_date >= %s"
+            params.append(start_date)
+        if end_date:
+            clause += " AND o.order_date < %s + INTERVAL 1 DAY"
+            params.append(end_date)
+        return clause, params
+
+
+    def upsert_daily_sales(
+        self, conn: MySQLConnection,
+        order_ids: List[int],
+        placed: int,
+        cancelled: int,
+        sign: int,
+    ) -> int:
+        if not order_ids:
+            return 0
+
+        cursor = conn.cursor()
+        try:
+            placeholders = self._placeholders(order_ids)
+            query = f"""
+                INSERT INTO daily_sales (
+                    sale_date, order_count, cancelled_count, revenue,
+                    subtotal_total, discount_total, shipping_total,
+                    items_sold
+                )
+                SELECT
+                    DATE(o.order_date),
+                    %s * COUNT(o.id),
+                    %s * COUNT(o.id),
+                    %s * SUM(o.total_amount),
+                    %s * SUM(o.subtotal),
+                    %s * SUM(COALESCE(o.discount_amount, 0)),
+                    %s * SUM(COALESCE(o.shipping_cost, 0)),
+                    %s * COALESCE(SUM(items.quantity), 0)
+                FROM orders o
+                LEFT JOIN (
+                    SELECT order_id, SUM(quantity) AS quantity
+                    FROM order_items
+                    WHERE order_id IN ({placeholders})
+                    GROUP BY order_id
+                ) items ON items.order_id = o.id
+                WHERE o.id IN ({placeholders})
+                GROUP BY DATE(o.order_date)
+                ON DUPLICATE KEY UPDATE
+                    order_count = order_count + VALUES(order_count),
+                    cancelled_count = cancelled_count + VALUES(cancelled_count),
+                    revenue = revenue + VALUES(revenue),
+                    subtotal_total = subtotal_total + VALUES(subtotal_total),
+                    discount_total = discount_total + VALUES(discount_total),
+                    shipping_total = shipping_total + VALUES(shipping_total),
+                    items_sold = items_sold + VALUES(items_sold)
+            """
+            params = [placed, cancelled] + [sign] * 5
+            params += list(order_ids) + list(order_ids)
+            cursor.execute(query, tuple(params))
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+    def upsert_daily_product_sales(
+        self, conn: MySQLConnection, order_ids: List[int], sign: int
+    ) -> int:
+        if not order_ids:
+            return 0
+
+        cursor = conn.cursor()
+        try:
+            placeholders = self._placeholders(order_ids)
+            query = f"""
+                INSERT INTO daily_product_sales (
+                    sale_date, product_id, units_sold, revenue
+                )
+                SELECT
+                    DATE(o.order_date),
+                    oi.product_id,
+                    %s * SUM(oi.quantity),
+                    %s * SUM(oi.quantity * oi.price)
+                FROM order_items oi
+                JOIN orders o ON oi.order_id = o.id
+                WHERE oi.order_id IN ({placeholders})
+                GROUP BY DATE(o.order_date), oi.product_id
+                ON DUPLICATE KEY UPDATE
+                    units_sold = units_sold + VALUES(units_sold),
+                    revenue = revenue + VALUES(revenue)
+            """
+            params = [sign, sign] + list(order_ids)
+            cursor.execute(query, tuple(params))
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+    def upsert_daily_voucher_usage(
+        self, conn: MySQLConnection, order_ids: List[int], sign: int
+    ) -> int:
+        if not order_ids:
+            return 0
+
+        cursor = conn.cursor()
+        try:
+            placeholders = self._placeholders(order_ids)
+            query = f"""
+                INSERT INTO daily_voucher_usage (
+                    sale_date, voucher_code, usage_count, discount_total
+                )
+                SELECT
+                    DATE(o.order_date),
+                    o.voucher_code,
+                    %s * COUNT(o.id),
+                    %s * SUM(COALESCE(o.discount_amount, 0))
+                FROM orders o
+                WHERE o.id IN ({placeholders})
+                AND o.voucher_code IS NOT NULL
+                GROUP BY DATE(o.order_date), o.voucher_code
+                ON DUPLICATE KEY UPDATE
+                    usage_count = usage_count + VALUES(usage_count),
+                    discount_total = discount_total + VALUES(discount_total)
+            """
+            params = [sign, sign] + list(order_ids)
+            cursor.execute(query, tuple(params))
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+    def find_order_dates(
+        self, conn: MySQLConnection, order_ids: List[int]
+    ) -> List[date]:
+        if not order_ids:
+            return []
+
+        cursor = conn.cursor(dictionary=True)
+        try:
+            placeholders = self._placeholders(order_ids)
+            query = f"""
+                SELECT DISTINCT DATE(order_date) AS order_day
+                FROM orders
+                WHERE id IN ({placeholders})
+            """
+            cursor.execute(query, tuple(order_ids))
+            return [row["order_day"] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+
+    def find_order_date_bounds(
+        self, conn: MySQLConnection
+    ) -> Optional[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT
+                    DATE(MIN(order_date)) AS first_date,
+                    DATE(MAX(order_date)) AS last_date
+                FROM orders
+                """
+            )
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+
+
+    def delete_range(
+        self, conn: MySQLConnection,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            clause = " WHERE 1=1"
+            params: List[Any] = []
+            if start_date:
+                clause += " AND sale_date >= %s"
+                params.append(start_date)
+            if end_date:
+                clause += " AND sale_date <= %s"
+                params.append(end_date)
+
+            deleted = 0
+            for table in (
+                "daily_sales", "daily_product_sales", "daily_voucher_usage"
+            ):
+                cursor.execute(f"DELETE FROM {table}{clause}", tuple(params))
+                deleted += cursor.rowcount
+            return deleted
+        finally:
+            cursor.close()
+
+
+    def rebuild_range(
+        self, conn: MySQLConnection,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            range_clause, params = self._order_range_clause(
+                start_date, end_date
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO daily_sales (
+                    sale_date, order_count, cancelled_count, revenue,
+                    subtotal_total, discount_total, shipping_total,
+                    items_sold
+                )
+                SELECT
+                    DATE(o.order_date),
+                    COUNT(o.id),
+                    SUM(o.status = 'Dibatalkan'),
+                    SUM(IF(o.status != 'Dibatalkan', o.total_amount, 0)),
+                    SUM(IF(o.status != 'Dibatalkan', o.subtotal, 0)),
+                    SUM(IF(
+                        o.status != 'Dibatalkan',
+                        COALESCE(o.discount_amount, 0), 0
+                    )),
+                    SUM(IF(
+                        o.status != 'Dibatalkan',
+                        COALESCE(o.shipping_cost, 0), 0
+                    )),
+                    SUM(IF(
+                        o.status != 'Dibatalkan',
+                        COALESCE(items.quantity, 0), 0
+                    ))
+                FROM orders o
+                LEFT JOIN (
+                    SELECT oi.order_id, SUM(oi.quantity) AS quantity
+                    FROM order_items oi
+                    JOIN orders o ON oi.order_id = o.id
+                    WHERE 1=1{range_clause}
+                    GROUP BY oi.order_id
+                ) items ON items.order_id = o.id
+                WHERE 1=1{range_clause}
+                GROUP BY DATE(o.order_date)
+                """,
+                tuple(params * 2),
+            )
+            rebuilt = cursor.rowcount
+
+            cursor.execute(
+                f"""
+                INSERT INTO daily_product_sales (
+                    sale_date, product_id, units_sold, revenue
+                )
+                SELECT
+                    DATE(o.order_date),
+                    oi.product_id,
+                    SUM(oi.quantity),
+                    SUM(oi.quantity * oi.price)
+                FROM order_items oi
+                JOIN orders o ON oi.order_id = o.id
+                WHERE o.status != 'Dibatalkan'{range_clause}
+                GROUP BY DATE(o.order_date), oi.product_id
+                """,
+                tuple(params),
+            )
+
+            cursor.execute(
+                f"""
+                INSERT INTO daily_voucher_usage (
+                    sale_date, voucher_code, usage_count, discount_total
+                )
+                SELECT
+                    DATE(o.order_date),
+                    o.voucher_code,
+                    COUNT(o.id),
+                    SUM(COALESCE(o.discount_amount, 0))
+                FROM orders o
+                WHERE o.status != 'Dibatalkan'
+                AND o.voucher_code IS NOT NULL{range_clause}
+                GROUP BY DATE(o.order_date), o.voucher_code
+                """,
+                tuple(params),
+            )
+            return rebuilt
+        finally:
+            cursor.close()
+
+sales_rollup_repository = SalesRollupRepository()
\ No newline at end of file
@@ -5,37 +5,51 @@ from mysql.connector.connection import MySQLConnection
 
 class StockRepository:
 
-    def delete_expired(self, conn: MySQLConnection) -> int:
+    def delete_expired(
+        self, conn: MySQLConnection, limit: Optional[int] = None
+    ) -> int:
         cursor = conn.cursor()
         try:
-            cursor.execute(
+            query = (
                 "DELETE FROM stock_holds WHERE expires_at < CURRENT_TIMESTAMP"
             )
+            if limit is None:
+                cursor.execute(query)
+            else:
+                cursor.execute(f"{query} ORDER BY expires_at LIMIT %s", (limit,))
             return cursor.rowcount
         finally:
             cursor.close()
 
 
+    def build_held_stock_sum_query(
+        self, product_id: int, variant_id: Optional[int]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        if variant_id is None:
+            query = (
+                "SELECT SUM(quantity) as held FROM stock_holds "
+                "WHERE product_id = %s AND variant_id IS NULL "
+                "AND expires_at > CURRENT_TIMESTAMP"
+            )
+            return query, (product_id,)
+
+        query = (
+            "SELECT SUM(quantity) as held FROM stock_holds "
+            "WHERE product_id = %s AND variant_id = %s "
+            "AND expires_at > CURRENT_TIMESTAMP"
+        )
+        return query, (product_id, variant_id)
+
+
     def get_held_stock_sum(
         self, conn: MySQLConnection,
         product_id: int, variant_id: Optional[int],
     ) -> int:
         cursor = conn.cursor(dictionary=True)
         try:
-            if variant_id is None:
-                query = (
-                    "SELECT SUM(quantity) as held FROM stock_holds "
-                    "WHERE product_id = %s AND variant_id IS NULL"
-                )
-                params = (product_id,)
-            else:
-                query = (
-                    "SELECT SUM(quantity) as held FROM stock_holds "
-                    "WHERE product_id = %s AND variant_id = %s"
-                )
-                params = (product_id, variant_id)
-
-            cursor.execute(query, params)
+            cursor.execute(
+                *self.build_held_stock_sum_query(product_id, variant_id)
+            )
             held_stock_row = cursor.fetchone()
             return (
                 held_stock_row["held"]
@@ -46,6 +60,26 @@ class StockRepository:
             cursor.close()
 
 
+    def get_held_stock_sums(
+        self, conn: MySQLConnection, product_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            if not product_ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(product_ids))
+            cursor.execute(
+                "SELECT product_id, variant_id, SUM(quantity) AS held "
+                f"FROM stock_holds WHERE product_id IN ({placeholders}) "
+                "AND expires_at > CURRENT_TIMESTAMP "
+                "GROUP BY product_id, variant_id",
+                tuple(product_ids),
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
     def delete_by_user_id(self, conn: MySQLConnection, user_id: int) -> int:
         cursor = conn.cursor()
         try:
@@ -70,6 +104,24 @@ class StockRepository:
             cursor.close()
 
 
+    def delete_expired_by_user_ids(
+        self, conn: MySQLConnection, user_ids: List[int]
+    ) -> int:
+        if not user_ids:
+            return 0
+        cursor = conn.cursor()
+        try:
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            cursor.execute(
+                f"DELETE FROM stock_holds WHERE user_id IN ({placeholders}) "
+                "AND expires_at < CURRENT_TIMESTAMP",
+                tuple(user_ids),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
     def create_batch(
         self, conn: MySQLConnection, holds_data: List[Tuple]
     ) -> int:
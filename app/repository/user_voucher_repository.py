@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Optional
 
 from mysql.connector.connection import MySQLConnection
 
+from app.utils.voucher_utils import normalize_voucher_code
+
 
 class UserVoucherRepository:
 
@@ -67,7 +69,7 @@ class UserVoucherRepository:
                 JOIN vouchers v ON uv.voucher_id = v.id
                 WHERE uv.user_id = %s AND v.code = %s
                 """,
-                (user_id, code.upper()),
+                (user_id, normalize_voucher_code(code)),
             )
             return cursor.fetchone()
         finally:
@@ -89,6 +91,28 @@ class UserVoucherRepository:
         finally:
             cursor.close()
 
+    def bulk_create(
+        self, conn: MySQLConnection, user_ids: List[int], voucher_id: int
+    ) -> int:
+        if not user_ids:
+            return 0
+
+        placeholders = ", ".join(["(%s, %s, 'available')"] * len(user_ids))
+        params: List[int] = []
+        for user_id in user_ids:
+            params.extend((user_id, voucher_id))
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "INSERT IGNORE INTO user_vouchers "
+                f"(user_id, voucher_id, status) VALUES {placeholders}",
+                tuple(params),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
     def mark_as_used(
         self,
         conn: MySQLConnection,
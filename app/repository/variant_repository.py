@@ -188,6 +188,24 @@ class VariantRepository:
             cursor.close()
 
 
+    def get_stock_batch(
+        self, conn: MySQLConnection, variant_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            if not variant_ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(variant_ids))
+            cursor.execute(
+                "SELECT id, stock FROM product_variants "
+                f"WHERE id IN ({placeholders})",
+                tuple(variant_ids),
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
     def increase_stock(
         self, conn: MySQLConnection, variant_id: int, quantity: int
     ) -> int:
@@ -216,6 +234,49 @@ class VariantRepository:
             cursor.close()
 
 
+    def lock_stock_batch(
+        self, conn: MySQLConnection, ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            if not ids:
+                return []
+            sorted_ids = sorted(ids)
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
+            cursor.execute(
+                "SELECT id, stock FROM product_variants "
+                f"WHERE id IN ({placeholders}) ORDER BY id FOR UPDATE",
+                tuple(sorted_ids),
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+
+    def decrease_stock_batch(
+        self, conn: MySQLConnection, quantities: Dict[int, int]
+    ) -> int:
+        cursor = conn.cursor()
+        try:
+            if not quantities:
+                return 0
+            sorted_ids = sorted(quantities)
+            case_sql = " ".join(["WHEN %s THEN %s"] * len(sorted_ids))
+            case_params: List[Any] = []
+            for item_id in sorted_ids:
+                case_params.extend([item_id, quantities[item_id]])
+            placeholders = ", ".join(["%s"] * len(sorted_ids))
+            cursor.execute(
+                f"UPDATE product_variants SET stock = stock - CASE id {case_sql} END "
+                f"WHERE id IN ({placeholders}) "
+                f"AND stock >= CASE id {case_sql} END",
+                tuple(case_params + sorted_ids + case_params),
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
     def decrease_stock(
         self, conn: MySQLConnection, variant_id: int, quantity: int
     ) -> int:
@@ -2,6 +2,8 @@ from mysql.connector.connection import MySQLConnection
 from typing import Any, Dict, List, Optional
 from decimal import Decimal
 
+from app.utils.voucher_utils import normalize_voucher_code
+
 
 class VoucherRepository:
 
@@ -12,9 +14,8 @@ class VoucherRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             cursor.execute(
-                "SELECT * FROM vouchers WHERE UPPER(code) = %s "
-                "AND is_active = 1",
-                (code.upper().strip(),),
+                "SELECT * FROM vouchers WHERE code = %s AND is_active = 1",
+                (normalize_voucher_code(code),),
             )
             return cursor.fetchone()
         finally:
@@ -28,8 +29,23 @@ class VoucherRepository:
         cursor = conn.cursor(dictionary=True)
         try:
             cursor.execute(
-                "SELECT id FROM vouchers WHERE UPPER(code) = %s",
-                (code.upper().strip(),),
+                "SELECT id FROM vouchers WHERE code = %s",
+                (normalize_voucher_code(code),),
+            )
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+
+
+    def find_usage_by_id(
+        self, conn: MySQLConnection, voucher_id: int
+    ) -> Optional[Dict[str, Any]]:
+        
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                "SELECT use_count, is_active FROM vouchers WHERE id = %s",
+                (voucher_id,),
             )
             return cursor.fetchone()
         finally:
@@ -74,7 +90,10 @@ class VoucherRepository:
                 (code, type, value, min_purchase_amount, max_uses)
                 VALUES (%s, %s, %s, %s, %s)
                 """,
-                (code, voucher_type, value, min_purchase, max_uses),
+                (
+                    normalize_voucher_code(code), voucher_type, value,
+                    min_purchase, max_uses,
+                ),
             )
             return cursor.lastrowid
         finally:
@@ -107,12 +126,15 @@ class VoucherRepository:
             cursor.close()
 
 
-    def increment_use_count(self, conn: MySQLConnection, code: str) -> int:
+    def redeem(self, conn: MySQLConnection, voucher_id: int) -> int:
         cursor = conn.cursor()
         try:
             cursor.execute(
-                "UPDATE vouchers SET use_count = use_count + 1 WHERE code = %s",
-                (code.upper(),),
+                """
+                UPDATE vouchers SET use_count = use_count + 1
+                WHERE id = %s AND (max_uses IS NULL OR use_count < max_uses)
+                """,
+                (voucher_id,),
             )
             return cursor.rowcount
         finally:
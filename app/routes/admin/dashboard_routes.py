@@ -4,9 +4,11 @@ from typing import Any, Dict, Tuple, Union
 
 from flask import Response, flash, jsonify, render_template, request
 
-from app.core.db import get_content
+from app.core.db import get_content, get_pool_stats
+from app.core.report_cache import get_report_cache
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
+from app.services.products.view_counter_service import view_counter_service
 from app.services.reports.report_service import report_service
 from app.services.utils.scheduler_service import scheduler_service
 from app.utils.date_utils import get_date_range
@@ -62,6 +64,8 @@ def admin_dashboard() -> Union[str, Response, Tuple[Response, int]]:
             start_date_str, end_date_str
         )
         stats_converted: Dict[str, Any] = convert_decimals(stats)
+        if stats_converted.get("failed_sections") and not is_ajax:
+            flash("Sebagian data dashboard gagal dimuat.", "warning")
 
         page_title = "Dashboard - Admin"
         header_title = "Dashboard Ringkasan"
@@ -194,22 +198,24 @@ def admin_dashboard() -> Union[str, Response, Tuple[Response, int]]:
 def run_scheduler() -> Tuple[Response, int]:
     
     try:
-        cancel_result: Dict[str, Any] = (
-            scheduler_service.cancel_expired_pending_orders()
-        )
-        segment_result: Dict[str, Any] = (
-            scheduler_service.grant_segmented_vouchers()
-        )
+        result: Dict[str, Any] = scheduler_service.run_daily_jobs()
+        results: Dict[str, Dict[str, Any]] = result["results"]
         
-        cancel_count: int = cancel_result.get("cancelled_count", 0)
-        grant_count: int = segment_result.get("granted_count", 0)
+        cancel_count: int = results["cancel"].get("cancelled_count", 0)
+        grant_count: int = results["segments"].get("granted_count", 0)
+        skipped_count: int = results["segments"].get("skipped_count", 0)
+        purge_count: int = results["purge"].get("purged_count", 0)
         
-        final_success = cancel_result["success"] and segment_result["success"]
+        final_success: bool = result["success"]
         
         message = (
             f"Tugas harian selesai. {cancel_count} pesanan kedaluwarsa "
-            f"dibatalkan. {grant_count} voucher top spender diberikan."
+            f"dibatalkan. {grant_count} voucher segmen diberikan "
+            f"({skipped_count} sudah dimiliki). "
+            f"{purge_count} penahanan stok kedaluwarsa dihapus."
         )
+        if result["failed"]:
+            message += f" Tugas gagal: {', '.join(result['failed'])}."
 
         return (
             jsonify({"success": final_success, "message": message}),
@@ -238,4 +244,74 @@ def run_scheduler() -> Tuple[Response, int]:
                 }
             ),
             500,
+        )
+
+
+@admin_bp.route("/db-pool-stats")
+@admin_required
+def db_pool_stats() -> Tuple[Response, int]:
+
+    try:
+        stats: Dict[str, Any] = get_pool_stats()
+        return jsonify({"success": True, "stats": stats}), 200
+
+    except Exception as e:
+        logger.error(
+            f"Error mengambil statistik pool koneksi: {e}", exc_info=True
+        )
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": "Gagal mengambil statistik pool koneksi.",
+                }
+            ),
+            500,
+        )
+
+
+@admin_bp.route("/view-counter-stats")
+@admin_required
+def view_counter_stats() -> Tuple[Response, int]:
+
+    try:
+        stats: Dict[str, Any] = view_counter_service.get_stats()
+        return jsonify({"success": True, "stats": stats}), 200
+
+    except Exception as e:
+        logger.error(
+            f"Error mengambil statistik penghitung tayangan: {e}",
+            exc_info=True,
+        )
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": "Gagal mengambil statistik penghitung tayangan.",
+                }
+            ),
+            500,
+        )
+
+
+@admin_bp.route("/report-cache-stats")
+@admin_required
+def report_cache_stats() -> Tuple[Response, int]:
+
+    try:
+        stats: Dict[str, Any] = get_report_cache().get_stats()
+        return jsonify({"success": True, "stats": stats}), 200
+
+    except Exception as e:
+        logger.error(
+            f"Error mengambil statistik cache laporan: {e}", exc_info=True
+        )
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": "Gagal mengambil statistik cache laporan.",
+                }
+            ),
+            500,
         )
\ No newline at end of file
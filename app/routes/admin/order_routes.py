@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Tuple, Union
 
 from flask import (
-    Response, flash, jsonify, redirect,
+    Response, current_app, flash, jsonify, redirect,
     render_template, request, url_for
 )
 
@@ -15,6 +15,7 @@ from app.exceptions.service_exceptions import (
 from app.services.orders.order_query_service import order_query_service
 from app.services.orders.order_update_service import order_update_service
 from app.utils.logging_utils import get_logger
+from app.utils.pagination_utils import parse_page_size
 from app.utils.route_decorators import admin_required
 
 from . import admin_bp
@@ -34,27 +35,48 @@ def admin_orders() -> Union[str, Response, Tuple[Response, int]]:
         start_date: str = request.args.get("start_date")
         end_date: str = request.args.get("end_date")
         search_query: str = request.args.get("search")
+        cursor: str = request.args.get("cursor")
         is_filter_request: bool = request.args.get("is_filter_request") == "true"
+        limit: int = parse_page_size(
+            request.args.get("limit"),
+            current_app.config["ADMIN_ORDERS_PAGE_SIZE"],
+            maximum=200,
+        )
 
-        orders: List[Dict[str, Any]] = (
-            order_query_service.get_filtered_admin_orders(
+        page: Dict[str, Any] = (
+            order_query_service.get_filtered_admin_orders_page(
                 status=status_filter,
                 start_date=start_date,
                 end_date=end_date,
                 search=search_query,
+                limit=limit,
+                cursor=cursor,
             )
         )
+        orders: List[Dict[str, Any]] = page["orders"]
 
         if is_ajax:
-            if is_filter_request:
+            if is_filter_request or cursor:
                 html: str = render_template(
-                    "partials/admin/_order_table_body.html", orders=orders
+                    "partials/admin/_order_table_body.html",
+                    orders=orders,
+                    append=bool(cursor),
+                )
+                return jsonify(
+                    {
+                        "success": True,
+                        "html": html,
+                        "next_cursor": page["next_cursor"],
+                        "has_more": page["has_more"],
+                        "total": page["total"],
+                    }
                 )
-                return jsonify({"success": True, "html": html})
             else:
                 html: str = render_template(
                     "partials/admin/_manage_orders.html",
                     orders=orders,
+                    next_cursor=page["next_cursor"],
+                    total_orders=page["total"],
                     content=get_content(),
                 )
                 return jsonify(
@@ -67,7 +89,11 @@ def admin_orders() -> Union[str, Response, Tuple[Response, int]]:
                 )
 
         return render_template(
-            "admin/manage_orders.html", orders=orders, content=get_content()
+            "admin/manage_orders.html",
+            orders=orders,
+            next_cursor=page["next_cursor"],
+            total_orders=page["total"],
+            content=get_content(),
         )
 
     except (DatabaseException, ServiceLogicError):
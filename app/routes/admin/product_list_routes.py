@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Tuple, Union
 
 from flask import (
-    Response, flash, jsonify, render_template, request
+    Response, current_app, flash, jsonify, render_template, request
 )
 
 from app.core.db import get_content
@@ -14,6 +14,7 @@ from app.services.products.product_bulk_service import product_bulk_service
 from app.services.products.product_query_service import product_query_service
 from app.services.products.product_service import product_service
 from app.utils.logging_utils import get_logger
+from app.utils.pagination_utils import parse_page_size
 from app.utils.route_decorators import admin_required
 
 from . import admin_bp
@@ -157,6 +158,12 @@ def admin_products() -> Union[str, Response, Tuple[Response, int]]:
     category_filter: str = request.args.get("category")
     stock_status_filter: str = request.args.get("stock_status")
     is_filter_request: str = request.args.get("is_filter_request") == "true"
+    cursor: str = request.args.get("cursor")
+    limit: int = parse_page_size(
+        request.args.get("limit"),
+        current_app.config["ADMIN_PRODUCTS_PAGE_SIZE"],
+        maximum=200,
+    )
 
     page_title = "Manajemen Produk - Admin"
     header_title = "Manajemen Produk"
@@ -174,29 +181,43 @@ def admin_products() -> Union[str, Response, Tuple[Response, int]]:
         logger.debug(f"Berhasil mengambil {len(categories)} kategori.")
 
         logger.debug("Mencoba mengambil produk yang difilter...")
-        products: List[Dict[str, Any]] = (
-            product_query_service.get_all_products_with_category(
+        page: Dict[str, Any] = (
+            product_query_service.get_admin_products_page(
                 search=search_term,
                 category_id=category_filter,
                 stock_status=stock_status_filter,
+                limit=limit,
+                cursor=cursor,
             )
         )
+        products: List[Dict[str, Any]] = page["products"]
         logger.debug(f"Berhasil mengambil {len(products)} produk.")
 
         if is_ajax:
-            if is_filter_request:
+            if is_filter_request or cursor:
                 logger.debug("Merender _product_table_body.html untuk respons AJAX filter")
                 html: str = render_template(
                     "partials/admin/_product_table_body.html",
                     products=products,
+                    append=bool(cursor),
+                )
+                return jsonify(
+                    {
+                        "success": True,
+                        "html": html,
+                        "next_cursor": page["next_cursor"],
+                        "has_more": page["has_more"],
+                        "total": page["total"],
+                    }
                 )
-                return jsonify({"success": True, "html": html})
             else:
                 logger.debug("Merender _manage_products.html untuk respons AJAX load awal")
                 html: str = render_template(
                     "partials/admin/_manage_products.html",
                     products=products,
                     categories=categories,
+                    next_cursor=page["next_cursor"],
+                    total_products=page["total"],
                     content=get_content(),
                     search_term=search_term,
                 )
@@ -214,6 +235,8 @@ def admin_products() -> Union[str, Response, Tuple[Response, int]]:
             "admin/manage_products.html",
             products=products,
             categories=categories,
+            next_cursor=page["next_cursor"],
+            total_products=page["total"],
             content=get_content(),
             search_term=search_term,
         )
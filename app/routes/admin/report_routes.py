@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Tuple, Union
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from flask import Response, flash, jsonify, render_template, request
+from flask import (
+    Response, current_app, flash, jsonify, render_template, request,
+    send_file, url_for
+)
 
 from app.core.db import get_content
+from app.core.export_jobs import ExportJob, get_export_job_manager
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.services.reports.report_service import report_service
@@ -79,6 +84,11 @@ def admin_reports() -> Union[str, Response, Tuple[Response, int]]:
             "cart_analytics": cart_analytics,
             "inventory": inventory_reports,
         }
+        if (
+            product_reports.get("failed_sections")
+            or inventory_reports.get("failed_sections")
+        ) and not is_ajax:
+            flash("Sebagian data laporan gagal dimuat.", "warning")
 
         if is_ajax:
             html = render_template(
@@ -124,97 +134,195 @@ def admin_reports() -> Union[str, Response, Tuple[Response, int]]:
         )
 
 
-@admin_bp.route("/export/<report_name>")
-@admin_required
-def export_report(report_name: str) -> Union[Response, Tuple[str, int]]:
-    start_date: str = request.args.get("start_date")
-    end_date: str = request.args.get("end_date")
-    data: List[Dict[str, Any]] = []
-    headers: List[str] = []
+EXPORT_HEADERS: Dict[str, List[str]] = {
+    "sales": [
+        "ID Pesanan",
+        "Tanggal",
+        "Nama Pelanggan",
+        "Email Pelanggan",
+        "Subtotal",
+        "Diskon",
+        "Ongkir",
+        "Total",
+        "Status",
+        "Metode Pembayaran",
+        "Voucher",
+    ],
+    "products": [
+        "ID Produk",
+        "Nama Produk",
+        "Kategori",
+        "SKU",
+        "Harga Asli",
+        "Harga Diskon",
+        "Stok",
+        "Terjual (periode)",
+        "Dilihat (total)",
+    ],
+    "customers": [
+        "ID Pelanggan",
+        "Username",
+        "Email",
+        "Total Belanja (periode)",
+        "Jumlah Pesanan (periode)",
+    ],
+    "inventory_low_stock": [
+        "Nama Produk/Varian",
+        "Sisa Stok",
+        "Tipe",
+        "ID Produk",
+        "ID Varian",
+        "SKU",
+    ],
+    "inventory_slow_moving": [
+        "Nama Produk", "Stok Saat Ini", "Total Terjual (periode)"
+    ],
+    "vouchers": [
+        "Kode Voucher",
+        "Tipe",
+        "Nilai",
+        "Jumlah Penggunaan (periode)",
+        "Total Diskon (periode)",
+    ],
+}
 
-    try:
-        if report_name == "sales":
-            headers = [
-                "ID Pesanan",
-                "Tanggal",
-                "Nama Pelanggan",
-                "Email Pelanggan",
-                "Subtotal",
-                "Diskon",
-                "Ongkir",
-                "Total",
-                "Status",
-                "Metode Pembayaran",
-                "Voucher",
-            ]
-            data = report_service.get_full_sales_data_for_export(
-                start_date, end_date
-            )
 
-        elif report_name == "products":
-            headers = [
-                "ID Produk",
-                "Nama Produk",
-                "Kategori",
-                "SKU",
-                "Harga Asli",
-                "Harga Diskon",
-                "Stok",
-                "Terjual (periode)",
-                "Dilihat (total)",
-            ]
-            data = report_service.get_full_products_data_for_export(
-                start_date, end_date
-            )
+def load_export_rows(
+    report_name: str, start_date: Optional[str], end_date: Optional[str]
+) -> Iterable[List[Any]]:
+    if report_name == "sales":
+        return report_service.get_full_sales_data_for_export(
+            start_date, end_date
+        )
 
-        elif report_name == "customers":
-            headers = [
-                "ID Pelanggan",
-                "Username",
-                "Email",
-                "Total Belanja (periode)",
-                "Jumlah Pesanan (periode)",
-            ]
-            data = report_service.get_full_customers_data_for_export(
-                start_date, end_date
-            )
+    if report_name == "products":
+        return report_service.get_full_products_data_for_export(
+            start_date, end_date
+        )
 
-        elif report_name == "inventory_low_stock":
-            headers = [
-                "Nama Produk/Varian",
-                "Sisa Stok",
-                "Tipe",
-                "ID Produk",
-                "ID Varian",
-                "SKU",
-            ]
-            data = report_service.get_inventory_low_stock_for_export()
-
-        elif report_name == "inventory_slow_moving":
-            headers = ["Nama Produk", "Stok Saat Ini", "Total Terjual (periode)"]
-            data = report_service.get_inventory_slow_moving_for_export(
-                start_date, end_date
-            )
+    if report_name == "customers":
+        return report_service.get_full_customers_data_for_export(
+            start_date, end_date
+        )
 
-        elif report_name == "vouchers":
-            headers = [
-                "Kode Voucher",
-                "Tipe",
-                "Nilai",
-                "Jumlah Penggunaan (periode)",
-                "Total Diskon (periode)",
-            ]
-            data = report_service.get_full_vouchers_data_for_export(
-                start_date, end_date
-            )
+    if report_name == "inventory_low_stock":
+        return report_service.get_inventory_low_stock_for_export()
 
-        else:
-            return "Nama laporan tidak valid.", 404
+    if report_name == "inventory_slow_moving":
+        return report_service.get_inventory_slow_moving_for_export(
+            start_date, end_date
+        )
+
+    return report_service.get_full_vouchers_data_for_export(
+        start_date, end_date
+    )
+
+
+def wants_gzip() -> bool:
+    return bool(
+        current_app.config.get("EXPORT_GZIP", True)
+        and "gzip" in request.accept_encodings
+    )
+
+
+@admin_bp.route("/export/<report_name>")
+@admin_required
+def export_report(report_name: str) -> Union[Response, Tuple[str, int]]:
+    start_date: Optional[str] = request.args.get("start_date")
+    end_date: Optional[str] = request.args.get("end_date")
+
+    if report_name not in EXPORT_HEADERS:
+        return "Nama laporan tidak valid.", 404
 
-        return generate_csv_response(data, headers, report_name)
+    try:
+        data = load_export_rows(report_name, start_date, end_date)
+        return generate_csv_response(
+            data, EXPORT_HEADERS[report_name], report_name,
+            compress=wants_gzip(),
+        )
     
     except (DatabaseException, ServiceLogicError):
         return "Gagal mengekspor laporan.", 500
     
     except Exception:
-        return "Gagal mengekspor laporan.", 500
\ No newline at end of file
+        return "Gagal mengekspor laporan.", 500
+
+
+@admin_bp.route("/export/<report_name>/jobs", methods=["POST"])
+@admin_required
+def create_export_job(report_name: str) -> Tuple[Response, int]:
+    if report_name not in EXPORT_HEADERS:
+        return (
+            jsonify(
+                {"success": False, "message": "Nama laporan tidak valid."}
+            ),
+            404,
+        )
+
+    start_date: Optional[str] = (
+        request.form.get("start_date") or request.args.get("start_date")
+    )
+    end_date: Optional[str] = (
+        request.form.get("end_date") or request.args.get("end_date")
+    )
+    compress: bool = current_app.config.get("EXPORT_GZIP", True) and (
+        request.form.get("compress", request.args.get("compress", "1"))
+        not in ("0", "false")
+    )
+
+    job, created = get_export_job_manager().submit(
+        report_name,
+        start_date,
+        end_date,
+        EXPORT_HEADERS[report_name],
+        lambda: load_export_rows(report_name, start_date, end_date),
+        compress=compress,
+    )
+    return jsonify(_export_job_payload(job, created)), 202
+
+
+@admin_bp.route("/export/jobs/<job_id>")
+@admin_required
+def export_job_status(job_id: str) -> Tuple[Response, int]:
+    job = get_export_job_manager().get(job_id)
+    if job is None:
+        return (
+            jsonify(
+                {"success": False, "message": "Job ekspor tidak ditemukan."}
+            ),
+            404,
+        )
+    return jsonify(_export_job_payload(job)), 200
+
+
+@admin_bp.route("/export/jobs/<job_id>/download")
+@admin_required
+def download_export_job(job_id: str) -> Union[Response, Tuple[str, int]]:
+    job = get_export_job_manager().get(job_id)
+    if job is None:
+        return "Job ekspor tidak ditemukan.", 404
+
+    if job.status != "done" or not job.path or not os.path.exists(job.path):
+        return "Berkas ekspor belum tersedia.", 409
+
+    return send_file(
+        job.path,
+        mimetype="application/gzip" if job.compress else "text/csv",
+        as_attachment=True,
+        download_name=job.filename,
+        conditional=True,
+    )
+
+
+def _export_job_payload(
+    job: ExportJob, created: Optional[bool] = None
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"success": True, "job": job.to_dict()}
+    payload["status_url"] = url_for("admin.export_job_status", job_id=job.id)
+    if job.status == "done":
+        payload["download_url"] = url_for(
+            "admin.download_export_job", job_id=job.id
+        )
+    if created is not None:
+        payload["created"] = created
+    return payload
\ No newline at end of file
@@ -4,7 +4,7 @@ from flask import Response, flash, jsonify, render_template, request
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 
-from app.core.db import get_content, get_db_connection
+from app.core.db import get_content, get_content_cache, get_db_connection
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.utils.logging_utils import get_logger
@@ -35,7 +35,10 @@ def admin_settings() -> Union[str, Response, Tuple[Response, int]]:
                 )
                 updated_count += cursor.rowcount
 
+            content_cache = get_content_cache()
+            content_cache.bump_version(cursor)
             conn.commit()
+            content_cache.invalidate()
             return jsonify(
                 {
                     "success": True,
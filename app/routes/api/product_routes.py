@@ -1,11 +1,12 @@
 from typing import Any, Dict, List
 
-from flask import Response, jsonify, render_template, request
+from flask import Response, current_app, jsonify, render_template, request
 
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.services.products.product_query_service import product_query_service
 from app.utils.logging_utils import get_logger
+from app.utils.pagination_utils import parse_page_size
 
 from . import api_bp
 
@@ -19,17 +20,31 @@ def filter_products() -> Response:
         "category": request.args.get("category"),
         "sort": request.args.get("sort", "popularity"),
     }
+    cursor = request.args.get("cursor")
+    limit = parse_page_size(
+        request.args.get("limit"), current_app.config["CATALOG_PAGE_SIZE"]
+    )
 
     logger.debug(f"Menyaring produk dengan filter: {filters}")
     try:
-        products: List[Any] = product_query_service.get_filtered_products(
-            filters
+        page: Dict[str, Any] = (
+            product_query_service.get_filtered_products_page(
+                filters, limit, cursor
+            )
         )
+        products: List[Any] = page["products"]
         html: str = render_template(
             "partials/public/_product_card.html", products=products
         )
         logger.info(f"Produk berhasil difilter. Jumlah: {len(products)}")
-        return jsonify({"success": True, "html": html})
+        return jsonify(
+            {
+                "success": True,
+                "html": html,
+                "next_cursor": page["next_cursor"],
+                "has_more": page["has_more"],
+            }
+        )
     
     except (DatabaseException, ServiceLogicError) as e:
         logger.error(
@@ -26,27 +26,26 @@ def run_scheduler_jobs() -> Tuple[Response, int]:
         return jsonify({"success": False, "message": "Tidak diizinkan"}), 401
 
     try:
-        logger.info("Menjalankan layanan scheduler: cancel_expired_pending_orders")
-        cancel_result: Dict[str, Any] = (
-            scheduler_service.cancel_expired_pending_orders()
-        )
-        logger.info(f"Tugas pembatalan selesai. Hasil: {cancel_result}")
-        
-        logger.info("Menjalankan layanan scheduler: grant_segmented_vouchers")
-        segment_result: Dict[str, Any] = (
-            scheduler_service.grant_segmented_vouchers()
-        )
-        logger.info(f"Tugas voucher segmen selesai. Hasil: {segment_result}")
+        logger.info("Menjalankan tugas harian scheduler.")
+        result: Dict[str, Any] = scheduler_service.run_daily_jobs()
+        results: Dict[str, Dict[str, Any]] = result["results"]
+        logger.info(f"Tugas harian scheduler selesai. Hasil: {results}")
 
-        cancel_count = cancel_result.get("cancelled_count", 0)
-        grant_count = segment_result.get("granted_count", 0)
+        cancel_count = results["cancel"].get("cancelled_count", 0)
+        grant_count = results["segments"].get("granted_count", 0)
+        skipped_count = results["segments"].get("skipped_count", 0)
+        purge_count = results["purge"].get("purged_count", 0)
         
-        final_success = cancel_result["success"] and segment_result["success"]
+        final_success = result["success"]
         
         message = (
             f"Tugas selesai. {cancel_count} pesanan dibatalkan. "
-            f"{grant_count} voucher top spender diberikan."
+            f"{grant_count} voucher segmen diberikan "
+            f"({skipped_count} sudah dimiliki). "
+            f"{purge_count} penahanan stok kedaluwarsa dihapus."
         )
+        if result["failed"]:
+            message += f" Tugas gagal: {', '.join(result['failed'])}."
 
         return (
             jsonify({"success": final_success, "message": message}),
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from flask import flash, render_template, request, jsonify
+from flask import current_app, flash, render_template, request, jsonify
 
 from app.core.db import get_content
 from app.exceptions.database_exceptions import DatabaseException
@@ -29,9 +29,12 @@ def products_page() -> str:
     )
 
     try:
-        products: List[Dict[str, Any]] = (
-            product_query_service.get_filtered_products(filters)
+        page: Dict[str, Any] = (
+            product_query_service.get_filtered_products_page(
+                filters, current_app.config["CATALOG_PAGE_SIZE"]
+            )
         )
+        products: List[Dict[str, Any]] = page["products"]
         categories: List[Dict[str, Any]] = (
             category_service.get_all_categories()
         )
@@ -45,6 +48,7 @@ def products_page() -> str:
                 "partials/public/_product_catalog.html",
                 products=products,
                 categories=categories,
+                next_cursor=page["next_cursor"],
                 content=get_content(),
             )
             return jsonify(
@@ -55,6 +59,7 @@ def products_page() -> str:
                 "public/product_catalog.html",
                 products=products,
                 categories=categories,
+                next_cursor=page["next_cursor"],
                 content=get_content(),
             )
 
@@ -1,14 +1,14 @@
 from typing import Any, Dict, List, Optional
 
-import mysql.connector
 from flask import (
     Response, redirect, render_template, session,
     url_for, request, jsonify, flash
 )
-from mysql.connector.connection import MySQLConnection
-from mysql.connector.cursor import MySQLCursorDict
 
-from app.core.db import get_content, get_db_connection
+from app.core.db import get_content, get_content_cache
+from app.exceptions.database_exceptions import DatabaseException
+from app.exceptions.service_exceptions import ServiceLogicError
+from app.services.products.top_products_service import top_products_service
 from app.utils.logging_utils import get_logger
 from app.utils.route_decorators import login_required
 
@@ -29,51 +29,50 @@ def index() -> str | Response:
         )
         return redirect(url_for("product.products_page"))
 
-    conn: Optional[MySQLConnection] = None
-    cursor: Optional[MySQLCursorDict] = None
+    content: Dict[str, Any] = get_content()
     page_title = (
-        f"{get_content().get('app_name', 'App')} - "
-        f"{get_content().get('short_description', 'Tagline')}"
+        f"{content.get('app_name', 'App')} - "
+        f"{content.get('short_description', 'Tagline')}"
     )
 
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        query: str = """
-            SELECT p.*, c.name AS category
-            FROM products p
-            LEFT JOIN categories c ON p.category_id = c.id
-            ORDER BY popularity DESC
-            LIMIT 4
-        """
-        cursor.execute(query)
-        top_products: List[Dict[str, Any]] = cursor.fetchall()
-        logger.info(
-            f"Berhasil mengambil {len(top_products)} produk teratas "
-            "untuk halaman utama."
+        content_version = get_content_cache().version
+        html: Optional[str] = top_products_service.get_fragment(
+            content_version
         )
-
-        render_args = {
-            "products": top_products,
-            "content": get_content(),
-            "is_homepage": True,
-        }
-
-        if is_ajax:
+        if html is None:
+            top_products: List[Dict[str, Any]] = (
+                top_products_service.get_top_products(4)
+            )
+            logger.info(
+                f"Berhasil mengambil {len(top_products)} produk teratas "
+                "untuk halaman utama."
+            )
             html = render_template(
-                "partials/public/_landing.html", **render_args
+                "partials/public/_landing.html",
+                products=top_products,
+                content=content,
+                is_homepage=True,
             )
+            top_products_service.set_fragment(content_version, html)
+        else:
+            logger.debug("Fragmen halaman utama diambil dari cache.")
+
+        if is_ajax:
             return jsonify(
                 {"success": True, "html": html, "page_title": page_title}
             )
         else:
             return render_template(
-                "public/landing_page.html", **render_args
+                "public/landing_page.html",
+                landing_html=html,
+                content=content,
+                is_homepage=True,
             )
 
-    except mysql.connector.Error as db_err:
+    except (DatabaseException, ServiceLogicError) as service_err:
         logger.error(
-            f"Kesalahan database saat mengambil produk teratas: {db_err}",
+            f"Kesalahan service/DB saat mengambil produk teratas: {service_err}",
             exc_info=True,
         )
         message = "Gagal memuat produk teratas."
@@ -88,16 +87,10 @@ def index() -> str | Response:
         message = "Gagal memuat produk teratas."
         if is_ajax:
             return jsonify({"success": False, "message": message}), 500
-        
-    finally:
-        if cursor:
-            cursor.close()
-        if conn and conn.is_connected():
-            conn.close()
 
     render_args_fallback = {
         "products": [],
-        "content": get_content(),
+        "content": content,
         "is_homepage": True,
     }
 
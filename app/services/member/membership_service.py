@@ -8,6 +8,7 @@ from mysql.connector.connection import MySQLConnection
 from dateutil.relativedelta import relativedelta
 
 from app.core.db import get_db_connection
+from app.core.subscription_cache import get_subscription_cache
 from app.exceptions.api_exceptions import ValidationError
 from app.exceptions.database_exceptions import (
     DatabaseException, RecordNotFoundError
@@ -23,6 +24,9 @@ from app.repository.user_repository import UserRepository, user_repository
 from app.repository.order_status_history_repository import (
     OrderStatusHistoryRepository, order_status_history_repository
 )
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -35,12 +39,14 @@ class MembershipService:
         membership_repo: MembershipRepository = membership_repository,
         order_repo: OrderRepository = order_repository,
         user_repo: UserRepository = user_repository,
-        history_repo: OrderStatusHistoryRepository = order_status_history_repository
+        history_repo: OrderStatusHistoryRepository = order_status_history_repository,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service
     ):
         self.membership_repository = membership_repo
         self.order_repository = order_repo
         self.user_repository = user_repo
         self.history_repository = history_repo
+        self.sales_rollup_service = sales_rollup_svc
 
 
     def _validate_and_prepare_data(
@@ -179,6 +185,7 @@ class MembershipService:
                 raise RecordNotFoundError("Paket membership tidak ditemukan.")
 
             conn.commit()
+            get_subscription_cache().invalidate()
             updated_membership = self.membership_repository.find_membership_by_id(
                 conn, membership_id
             )
@@ -226,6 +233,7 @@ class MembershipService:
                 raise RecordNotFoundError("Paket membership tidak ditemukan.")
 
             conn.commit()
+            get_subscription_cache().invalidate()
             return {"success": True, "message": "Paket membership berhasil dihapus."}
         
         except mysql.connector.IntegrityError as e:
@@ -332,8 +340,13 @@ class MembershipService:
             self.history_repository.create(
                 conn, order_id, "Menunggu Pembayaran", notes
             )
+            rollup_days = self.sales_rollup_service.record_order_created(
+                conn, order_id
+            )
             
             conn.commit()
+            get_subscription_cache().invalidate(user_id)
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
             logger.info(
                 f"Pesanan {order_id} dibuat untuk langganan paket {new_plan['name']} oleh pengguna {user_id}"
                 )
@@ -471,8 +484,13 @@ class MembershipService:
             self.history_repository.create(
                 conn, order_id, "Menunggu Pembayaran", notes
             )
+            rollup_days = self.sales_rollup_service.record_order_created(
+                conn, order_id
+            )
             
             conn.commit()
+            get_subscription_cache().invalidate(user_id)
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
             logger.info(
                 f"Pesanan {order_id} dibuat untuk upgrade ke {new_plan['name']}. Biaya: {prorated_price}"
                 )
@@ -538,6 +556,7 @@ class MembershipService:
             conn, user_id, membership_id, 'new', amount_paid,
             f"Pembelian baru paket {new_plan['name']}"
         )
+        get_subscription_cache().invalidate(user_id)
         logger.info(
             f"Langganan {new_plan['name']} diaktifkan untuk pengguna {user_id}."
             )
@@ -586,6 +605,7 @@ class MembershipService:
         self.membership_repository.create_transaction(
             conn, user_id, new_membership_id, 'upgrade', amount_paid, notes
         )
+        get_subscription_cache().invalidate(user_id)
         logger.info(
             f"Langganan pengguna {user_id} diupgrade ke {new_plan['name']}."
             )
@@ -58,10 +58,13 @@ class CartService:
             subtotal = Decimal("0.0")
             items: List[Dict[str, Any]] = []
 
+            available_map = self.stock_service.get_available_stock_bulk(
+                [(item["id"], item["variant_id"]) for item in cart_items], conn
+            )
+
             for item in cart_items:
-                stock_variant_id = item["variant_id"]
-                item["stock"] = self.stock_service.get_available_stock(
-                    item["id"], stock_variant_id, conn
+                item["stock"] = available_map.get(
+                    (item["id"], item["variant_id"]), 0
                 )
                 
                 price = (
@@ -284,6 +287,7 @@ class CartService:
             conn = get_db_connection()
             conn.start_transaction()
 
+            parsed_items: List[Dict[str, Any]] = []
             for key, data in local_cart.items():
                 try:
                     parts = key.split("-")
@@ -301,20 +305,61 @@ class CartService:
                 if quantity <= 0:
                     continue
 
-                product = self.product_repository.find_minimal_by_id(
-                    conn, product_id
+                parsed_items.append({
+                    "product_id": product_id,
+                    "variant_id": db_variant_id,
+                    "quantity": quantity,
+                })
+
+            if not parsed_items:
+                conn.commit()
+                return {
+                    "success": True,
+                    "message": "Keranjang berhasil disinkronkan.",
+                }
+
+            product_ids = list({item["product_id"] for item in parsed_items})
+            variant_ids = list({
+                item["variant_id"]
+                for item in parsed_items
+                if item["variant_id"] is not None
+            })
+            existing_products = {
+                p["id"]
+                for p in self.product_repository.find_batch_minimal(
+                    conn, product_ids
                 )
-                if not product:
+            }
+            variant_owner = {
+                v["id"]: v["product_id"]
+                for v in self.variant_repository.find_batch_minimal(
+                    conn, variant_ids
+                )
+            }
+            available_map = self.stock_service.get_available_stock_bulk(
+                [
+                    (item["product_id"], item["variant_id"])
+                    for item in parsed_items
+                ],
+                conn,
+            )
+
+            for item in parsed_items:
+                product_id = item["product_id"]
+                db_variant_id = item["variant_id"]
+                quantity = item["quantity"]
+
+                if product_id not in existing_products:
                     continue
 
-                if db_variant_id is not None:
-                    if not self.variant_repository.check_exists(
-                        conn, db_variant_id, product_id
-                    ):
-                        continue
+                if (
+                    db_variant_id is not None
+                    and variant_owner.get(db_variant_id) != product_id
+                ):
+                    continue
 
-                available_stock = self.stock_service.get_available_stock(
-                    product_id, db_variant_id, conn
+                available_stock = available_map.get(
+                    (product_id, db_variant_id), 0
                 )
                 if available_stock <= 0:
                     continue
@@ -422,6 +467,13 @@ class CartService:
                 )
                 variants_map = {v["id"]: v for v in variants_db}
 
+            available_map = self.stock_service.get_available_stock_bulk(
+                [
+                    (parsed_data["product_id"], parsed_data["variant_id"])
+                    for parsed_data in parsed_cart.values()
+                ],
+                conn,
+            )
             detailed_items = []
 
             for key, parsed_data in parsed_cart.items():
@@ -468,8 +520,8 @@ class CartService:
                 final_item["discount_price"] = discount_price
                 final_item["effective_price"] = effective_price
 
-                final_item["stock"] = self.stock_service.get_available_stock(
-                    product_id, db_variant_id, conn
+                final_item["stock"] = available_map.get(
+                    (product_id, db_variant_id), 0
                 )
                 final_item["variant_id"] = db_variant_id
                 final_item["color"] = (
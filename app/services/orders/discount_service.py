@@ -77,6 +77,7 @@ class DiscountService:
             "final_total": float(final_total),
             "message": "Voucher berhasil diterapkan!",
             "code": voucher["code"],
+            "voucher_id": voucher.get("id"),
         }
 
 
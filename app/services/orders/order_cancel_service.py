@@ -15,6 +15,9 @@ from app.repository.order_status_history_repository import (
     OrderStatusHistoryRepository, order_status_history_repository
 )
 from app.services.orders.stock_service import StockService, stock_service
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.utils.logging_utils import get_logger
 from app.utils.template_filters import status_class_filter
 
@@ -31,10 +34,12 @@ class OrderCancelService:
             order_status_history_repository
         ),
         stock_svc: StockService = stock_service,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service,
     ):
         self.order_repository = order_repo
         self.history_repository = history_repo
         self.stock_service = stock_svc
+        self.sales_rollup_service = sales_rollup_svc
 
 
     def cancel_user_order(
@@ -80,6 +85,9 @@ class OrderCancelService:
                 self.stock_service.restock_items_for_order(order_id, conn)
 
             self.order_repository.update_status(conn, order_id, "Dibatalkan")
+            rollup_days = self.sales_rollup_service.record_orders_cancelled(
+                conn, [order_id]
+            )
             self.history_repository.create(
                 conn,
                 order_id,
@@ -87,6 +95,7 @@ class OrderCancelService:
                 "Pesanan dibatalkan oleh pelanggan.",
             )
             conn.commit()
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
 
             logger.info(
                 f"Pesanan {order_id} berhasil dibatalkan oleh pengguna "
@@ -161,6 +170,9 @@ class OrderCancelService:
                 self.stock_service.restock_items_for_order(order_id, conn)
 
             self.order_repository.update_status(conn, order_id, "Dibatalkan")
+            rollup_days = self.sales_rollup_service.record_orders_cancelled(
+                conn, [order_id]
+            )
             self.history_repository.create(
                 conn,
                 order_id,
@@ -168,6 +180,7 @@ class OrderCancelService:
                 "Pesanan dibatalkan oleh admin.",
             )
             conn.commit()
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
             
             logger.info(f"Pesanan {order_id} berhasil dibatalkan oleh admin.")
             return {
@@ -1,16 +1,16 @@
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
 
-from app.core.db import get_db_connection
+from app.core.db import get_db_connection, is_deadlock, retry_on_deadlock
 from app.exceptions.api_exceptions import ValidationError
 from app.exceptions.database_exceptions import (
-    DatabaseException, RecordNotFoundError
+    DatabaseException, DeadlockError, RecordNotFoundError
 )
-from app.exceptions.service_exceptions import OutOfStockError, ServiceLogicError
+from app.exceptions.service_exceptions import OutOfStockError
 from app.repository.cart_repository import CartRepository, cart_repository
 from app.repository.order_item_repository import (
     OrderItemRepository, order_item_repository
@@ -39,6 +39,9 @@ from app.services.orders.voucher_service import (
 from app.services.products.variant_service import (
     VariantService, variant_service
 )
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.services.users.user_service import UserService, user_service
 from app.utils.logging_utils import get_logger
 
@@ -64,7 +67,8 @@ class OrderCreationService:
         variant_svc: VariantService = variant_service,
         voucher_svc: VoucherService = voucher_service,
         user_voucher_repo: UserVoucherRepository = user_voucher_repository,
-        user_svc: UserService = user_service
+        user_svc: UserService = user_service,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service,
     ):
         self.stock_repository = stock_repo
         self.product_repository = product_repo
@@ -79,6 +83,7 @@ class OrderCreationService:
         self.voucher_service = voucher_svc
         self.user_voucher_repository = user_voucher_repo
         self.user_service = user_svc
+        self.sales_rollup_service = sales_rollup_svc
 
 
     def _get_held_items(
@@ -341,11 +346,6 @@ class OrderCreationService:
                     conn, order_id, initial_status, notes
                 )
 
-            if payment_method == "COD":
-                self._deduct_stock_for_cod_order(
-                    conn, order_id, items_for_order
-                )
-
             return order_id
 
         except mysql.connector.Error as db_err:
@@ -362,102 +362,29 @@ class OrderCreationService:
     def _deduct_stock_for_cod_order(
         self,
         conn: MySQLConnection,
-        order_id: int,
         items_for_order: List[Dict[str, Any]],
     ) -> None:
 
-        product_ids_with_variants: Set[int] = set()
-
-        try:
-            for item in items_for_order:
-                if item["variant_id"]:
-                    lock_id = item["variant_id"]
-                    current_stock_row = (
-                        self.variant_service.variant_repository.lock_stock(
-                            conn, lock_id
-                        )
-                    )
-                else:
-                    lock_id = item["id"]
-                    current_stock_row = self.product_repository.lock_stock(
-                        conn, lock_id
-                    )
-
-                if (
-                    not current_stock_row
-                    or current_stock_row["stock"] < item["quantity"]
-                ):
-                    raise OutOfStockError(
-                        f"Stok habis saat mengurangi untuk "
-                        f"{'varian' if item['variant_id'] else 'produk'} "
-                        f"ID {lock_id}"
-                    )
-
-                if item["variant_id"]:
-                    rowcount = (
-                        self.variant_service.variant_repository.decrease_stock(
-                            conn, lock_id, item["quantity"]
-                        )
-                    )
-                    product_ids_with_variants.add(item["id"])
-                else:
-                    rowcount = self.product_repository.decrease_stock(
-                        conn, lock_id, item["quantity"]
-                    )
-
-                if rowcount == 0:
-                    raise ServiceLogicError(
-                        f"Gagal mengurangi stok COD (rowcount 0) "
-                        f"untuk ID {lock_id}"
-                    )
-
-            if product_ids_with_variants:
-                for pid in product_ids_with_variants:
-                    self.variant_service.update_total_stock_from_variants(
-                        pid, conn
-                    )
-            logger.info(
-                f"Stok COD berhasil dikurangi untuk pesanan {order_id}"
-            )
-
-        except mysql.connector.Error as db_err:
-            logger.error(
-                f"Kesalahan database saat mengurangi stok COD "
-                f"untuk pesanan {order_id}: {db_err}",
-                exc_info=True,
-            )
-            raise DatabaseException(
-                f"Kesalahan database saat mengurangi stok COD: {db_err}"
-            )
+        parent_ids = self.stock_service.deduct_stock(
+            conn,
+            [
+                (item["id"], item["variant_id"], item["quantity"])
+                for item in items_for_order
+            ],
+        )
+        logger.info(
+            f"Stok COD berhasil dikurangi untuk {len(items_for_order)} item "
+            f"({len(parent_ids)} produk induk diperbarui)."
+        )
 
 
     def _post_order_cleanup(
         self,
         conn: MySQLConnection,
         user_id: Optional[int],
-        voucher_code: Optional[str],
-        user_voucher_id: Optional[int],
-        order_id: int,
     ) -> None:
 
         try:
-            if voucher_code:
-                self.voucher_repository.increment_use_count(
-                    conn, voucher_code
-                )
-                logger.debug(
-                    f"Jumlah penggunaan voucher '{voucher_code}' ditingkatkan."
-                )
-
-            if user_id and user_voucher_id:
-                self.voucher_service.mark_user_voucher_as_used(
-                    conn, user_voucher_id, order_id
-                )
-                logger.debug(
-                    f"UserVoucherID {user_voucher_id} ditandai "
-                    f"sebagai terpakai."
-                )
-
             if user_id:
                 self.cart_repository.clear_user_cart(conn, user_id)
                 logger.debug(f"Keranjang pengguna ID {user_id} dikosongkan.")
@@ -480,6 +407,40 @@ class OrderCreationService:
         user_voucher_id_str: Optional[str] = None,
         shipping_cost: float = 0.0,
     ) -> Dict[str, Any]:
+        try:
+            return retry_on_deadlock(
+                lambda: self._create_order_once(
+                    user_id,
+                    session_id,
+                    shipping_details,
+                    payment_method,
+                    voucher_code,
+                    user_voucher_id_str,
+                    shipping_cost,
+                )
+            )
+
+        except DeadlockError as e:
+            log_id = f"User {user_id}" if user_id else f"Session {session_id}"
+            logger.error(
+                f"Deadlock berulang saat membuat pesanan untuk {log_id}: {e}"
+            )
+            return {
+                "success": False,
+                "message": "Terjadi kesalahan database saat membuat pesanan.",
+            }
+
+
+    def _create_order_once(
+        self,
+        user_id: Optional[int],
+        session_id: Optional[str],
+        shipping_details: Dict[str, Any],
+        payment_method: str,
+        voucher_code: Optional[str],
+        user_voucher_id_str: Optional[str],
+        shipping_cost: float,
+    ) -> Dict[str, Any]:
 
         log_id = f"User {user_id}" if user_id else f"Session {session_id}"
         logger.info(
@@ -491,6 +452,7 @@ class OrderCreationService:
         conn: Optional[MySQLConnection] = None
         order_id: Optional[int] = None
         user_voucher_id: Optional[int] = None
+        voucher_id: Optional[int] = None
 
         try:
             conn = get_db_connection()
@@ -542,6 +504,7 @@ class OrderCreationService:
                 )
                 final_voucher_code = voucher_result.get("code")
                 user_voucher_id = voucher_result.get("user_voucher_id")
+                voucher_id = voucher_result.get("voucher_id")
 
             elif voucher_code or user_voucher_id:
                 logger.warning(
@@ -569,6 +532,9 @@ class OrderCreationService:
                 if initial_status == "Menunggu Pembayaran"
                 else None
             )
+            if payment_method == "COD":
+                self._deduct_stock_for_cod_order(conn, items_for_order)
+
             order_id = self._insert_order_and_items(
                 conn,
                 user_id,
@@ -583,11 +549,17 @@ class OrderCreationService:
                 shipping_details,
                 items_for_order
             )
-            self._post_order_cleanup(
-                conn, user_id, final_voucher_code, user_voucher_id, order_id
+            if voucher_id:
+                self.voucher_service.redeem_voucher(
+                    conn, voucher_id, order_id, user_voucher_id
+                )
+            rollup_days = self.sales_rollup_service.record_order_created(
+                conn, order_id
             )
+            self._post_order_cleanup(conn, user_id)
             self.stock_service.release_stock_holds(user_id, session_id, conn)
             conn.commit()
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
 
             logger.info(
                 f"Pesanan #{order_id} berhasil dibuat untuk {log_id}."
@@ -606,6 +578,13 @@ class OrderCreationService:
         except (mysql.connector.Error, DatabaseException) as db_err:
             if conn and conn.is_connected():
                 conn.rollback()
+            if is_deadlock(db_err):
+                logger.warning(
+                    f"Deadlock saat membuat pesanan untuk {log_id}, "
+                    "transaksi akan diulang."
+                )
+                raise DeadlockError(str(db_err))
+
             logger.error(
                 f"Kesalahan database saat membuat pesanan untuk {log_id}: "
                 f"{db_err}",
@@ -1,9 +1,12 @@
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import mysql.connector
+from flask import current_app
 from mysql.connector.connection import MySQLConnection
 
 from app.core.db import get_db_connection
+from app.core.ttl_cache import TTLCache
 from app.exceptions.database_exceptions import (
     DatabaseException, RecordNotFoundError
 )
@@ -13,6 +16,7 @@ from app.repository.order_item_repository import (
 )
 from app.repository.order_repository import OrderRepository, order_repository
 from app.utils.logging_utils import get_logger
+from app.utils.pagination_utils import decode_cursor, encode_cursor
 
 
 logger = get_logger(__name__)
@@ -29,28 +33,91 @@ class OrderQueryService:
         self.order_item_repository = item_repo
         
 
-    def get_filtered_admin_orders(
+    def _count_cache(self) -> TTLCache:
+        cache: Optional[TTLCache] = current_app.extensions.get(
+            "admin_order_count_cache"
+        )
+        if cache is None:
+            cache = TTLCache(
+                ttl=current_app.config.get("ADMIN_ORDER_COUNT_CACHE_TTL", 30)
+            )
+            current_app.extensions["admin_order_count_cache"] = cache
+        return cache
+
+
+    def _decode_after(
+        self, cursor: Optional[str]
+    ) -> Optional[Tuple[datetime, int]]:
+        cursor_data = decode_cursor(cursor)
+        if not cursor_data:
+            return None
+
+        try:
+            return (
+                datetime.fromisoformat(cursor_data["date"]),
+                int(cursor_data["id"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Cursor pesanan admin tidak valid diabaikan: {e}")
+            return None
+
+
+    def get_filtered_admin_orders_page(
         self,
         status: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        after = self._decode_after(cursor)
         logger.debug(
-            f"Service: Mengambil pesanan admin difilter - Status: {status}, "
-            f"Awal: {start_date}, Akhir: {end_date}, Pencarian: {search}"
+            f"Service: Mengambil halaman pesanan admin (limit {limit}, "
+            f"cursor: {after}) - Status: {status}, Awal: {start_date}, "
+            f"Akhir: {end_date}, Pencarian: {search}"
         )
         conn: Optional[MySQLConnection] = None
 
         try:
             conn = get_db_connection()
-            orders = self.order_repository.find_filtered_admin(
-                conn, status, start_date, end_date, search
+            rows = self.order_repository.find_filtered_admin(
+                conn, status, start_date, end_date, search,
+                limit=limit + 1, after=after,
             )
-            logger.info(f"Service: Ditemukan {len(orders)} pesanan.")
-            return orders
-        
+            has_more = len(rows) > limit
+            orders = rows[:limit]
+
+            next_cursor = None
+            if has_more and orders:
+                last = orders[-1]
+                next_cursor = encode_cursor(
+                    {"date": last["order_date"], "id": last["id"]}
+                )
+
+            count_key = (
+                status or None, start_date or None, end_date or None,
+                (search or "").strip() or None,
+            )
+            total = self._count_cache().get_or_load(
+                count_key,
+                lambda: self.order_repository.count_filtered_admin(
+                    conn, status, start_date, end_date, search
+                ),
+            )
+
+            logger.info(
+                f"Service: Mengambil {len(orders)} dari {total} pesanan "
+                f"(berikutnya: {'ya' if has_more else 'tidak'})."
+            )
+            return {
+                "orders": orders,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+                "total": total,
+            }
+
         except mysql.connector.Error as db_err:
             logger.error(
                 f"Service: Kesalahan database saat filter pesanan: {db_err}",
@@ -59,7 +126,7 @@ class OrderQueryService:
             raise DatabaseException(
                 f"Kesalahan database saat filter pesanan: {db_err}"
             )
-        
+
         except Exception as e:
             logger.error(
                 f"Service: Kesalahan tak terduga saat filter pesanan: {e}",
@@ -68,13 +135,13 @@ class OrderQueryService:
             raise ServiceLogicError(
                 f"Kesalahan tak terduga saat filter pesanan: {e}"
             )
-        
+
         finally:
             if conn and conn.is_connected():
                 conn.close()
             logger.debug(
                 "Service: Koneksi database ditutup untuk "
-                "get_filtered_admin_orders"
+                "get_filtered_admin_orders_page"
             )
 
 
@@ -17,6 +17,9 @@ from app.repository.order_status_history_repository import (
 from app.services.orders.order_cancel_service import (
     OrderCancelService, order_cancel_service
 )
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.utils.logging_utils import get_logger
 from app.utils.template_filters import status_class_filter
 
@@ -33,10 +36,12 @@ class OrderUpdateService:
             order_status_history_repository
         ),
         cancel_svc: OrderCancelService = order_cancel_service,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service,
     ):
         self.order_repository = order_repo
         self.history_repository = history_repo
         self.order_cancel_service = cancel_svc
+        self.sales_rollup_service = sales_rollup_svc
 
 
     def update_order_status_and_tracking(
@@ -99,6 +104,11 @@ class OrderUpdateService:
             self.order_repository.update_status_and_tracking(
                 conn, order_id, new_status, tracking_number
             )
+            rollup_days = []
+            if status_changed:
+                rollup_days = self.sales_rollup_service.record_status_change(
+                    conn, order_id, original_status, new_status
+                )
             notes = (
                 f'Status diubah dari "{original_status}" menjadi '
                 f'"{new_status}".'
@@ -107,6 +117,7 @@ class OrderUpdateService:
                 notes += f" Nomor resi: {tracking_number}"
             self.history_repository.create(conn, order_id, new_status, notes)
             conn.commit()
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
 
             logger.info(
                 f"Pesanan {order_id} berhasil diperbarui. "
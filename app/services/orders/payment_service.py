@@ -3,9 +3,10 @@ from typing import Any, Dict, Optional
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
 
-from app.core.db import get_db_connection
+from app.core.db import get_db_connection, is_deadlock, retry_on_deadlock
+from app.core.subscription_cache import get_subscription_cache
 from app.exceptions.database_exceptions import (
-    DatabaseException, RecordNotFoundError
+    DatabaseException, DeadlockError, RecordNotFoundError
 )
 from app.exceptions.service_exceptions import (
     InvalidOperationError, OutOfStockError,
@@ -31,6 +32,9 @@ from app.services.products.variant_service import (
 from app.services.member.membership_service import (
     MembershipService, membership_service
 )
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.utils.logging_utils import get_logger
 
 
@@ -50,7 +54,8 @@ class PaymentService:
         variant_repo: VariantRepository = variant_repository,
         stock_svc: StockService = stock_service,
         variant_svc: VariantService = variant_service,
-        membership_svc: MembershipService = membership_service
+        membership_svc: MembershipService = membership_service,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service,
     ):
         self.order_repository = order_repo
         self.item_repository = item_repo
@@ -60,11 +65,31 @@ class PaymentService:
         self.stock_service = stock_svc
         self.variant_service = variant_svc
         self.membership_service = membership_svc
+        self.sales_rollup_service = sales_rollup_svc
 
 
     def process_successful_payment(
         self, transaction_id: str
     ) -> Dict[str, Any]:
+        try:
+            return retry_on_deadlock(
+                lambda: self._process_successful_payment_once(transaction_id)
+            )
+
+        except DeadlockError as e:
+            logger.error(
+                "Deadlock berulang saat memproses pembayaran untuk "
+                f"transaksi {transaction_id}: {e}"
+            )
+            return {
+                "success": False,
+                "message": f"Kesalahan database saat memproses pembayaran: {e}",
+            }
+
+
+    def _process_successful_payment_once(
+        self, transaction_id: str
+    ) -> Dict[str, Any]:
         
         logger.info(
             "Memproses webhook pembayaran sukses untuk "
@@ -76,7 +101,7 @@ class PaymentService:
 
         try:
             conn = get_db_connection()
-            order = self.order_repository.find_by_transaction_id(
+            order = self.order_repository.find_by_transaction_id_for_update(
                 conn, transaction_id
             )
             if not order:
@@ -123,6 +148,7 @@ class PaymentService:
                     conn, order_id, "Selesai", history_notes
                 )
                 conn.commit()
+                get_subscription_cache().invalidate(user_id)
                 
                 logger.info(
                     f"Langganan membership untuk Pesanan #{order_id} berhasil diaktifkan."
@@ -155,6 +181,7 @@ class PaymentService:
                     conn, order_id, "Selesai", history_notes
                 )
                 conn.commit()
+                get_subscription_cache().invalidate(user_id)
                 
                 logger.info(
                     f"Upgrade membership untuk Pesanan #{order_id} berhasil diaktifkan."
@@ -179,10 +206,14 @@ class PaymentService:
                 
                 stock_sufficient = True
                 failed_item_info = ""
+                available_map = self.stock_service.get_available_stock_bulk(
+                    [(item["product_id"], item["variant_id"]) for item in items],
+                    conn,
+                )
 
                 for item in items:
-                    available_stock = self.stock_service.get_available_stock(
-                        item["product_id"], item["variant_id"], conn
+                    available_stock = available_map.get(
+                        (item["product_id"], item["variant_id"]), 0
                     )
                     logger.debug(
                         f"Memeriksa stok untuk item di pesanan {order_id}: "
@@ -228,6 +259,11 @@ class PaymentService:
                     self.order_repository.update_status(
                         conn, order_id, "Dibatalkan"
                     )
+                    rollup_days = (
+                        self.sales_rollup_service.record_orders_cancelled(
+                            conn, [order_id]
+                        )
+                    )
                     self.history_repository.create(
                         conn, order_id, "Dibatalkan", notes
                     )
@@ -239,6 +275,9 @@ class PaymentService:
                         f"pesanan {order_id} karena pembatalan."
                     )
                     conn.commit()
+                    self.sales_rollup_service.invalidate_report_cache(
+                        rollup_days
+                    )
                     return {
                         "success": False,
                         "message": f"Pembayaran gagal karena stok habis "
@@ -246,60 +285,33 @@ class PaymentService:
                     }
 
                 logger.debug(f"Mengurangi stok untuk pesanan {order_id}")
-                product_ids_with_variants = set()
-
-                for item in items:
-                    if item["variant_id"]:
-                        lock_id = item["variant_id"]
-                        current_stock_row = self.variant_repository.lock_stock(
-                            conn, lock_id
-                        )
-                    else:
-                        lock_id = item["product_id"]
-                        current_stock_row = self.product_repository.lock_stock(
-                            conn, lock_id
-                        )
-                    
-                    if (
-                        not current_stock_row
-                        or current_stock_row["stock"] < item["quantity"]
-                    ):
-                        conn.rollback()
-                        failed_item_info = f"item ID {'variant ' + str(lock_id) if item['variant_id'] else str(lock_id)}"
-                        logger.error(
-                            "Stok habis saat mencoba mengurangi untuk "
-                            f"{failed_item_info} di pesanan {order_id}"
-                        )
-                        self._cancel_order_due_to_stock_failure(
-                            order_id, failed_item_info
-                        )
-                        return {
-                            "success": False,
-                            "message": f"Pembayaran gagal karena stok habis "
-                            f"untuk {failed_item_info}.",
-                        }
-
-                    if item["variant_id"]:
-                        rowcount = self.variant_repository.decrease_stock(
-                            conn, lock_id, item["quantity"]
-                        )
-                    else:
-                        rowcount = self.product_repository.decrease_stock(
-                            conn, lock_id, item["quantity"]
-                        )
-                    
-                    if rowcount == 0:
-                        conn.rollback()
-                        err_msg = (
-                            f"Gagal mengurangi stok (rowcount 0) untuk "
-                            f"{'varian' if item['variant_id'] else 'produk'} "
-                            f"ID {lock_id}"
-                        )
-                        logger.error(err_msg)
-                        raise ServiceLogicError(err_msg)
-                    
-                    if item["variant_id"]:
-                        product_ids_with_variants.add(item["product_id"])
+                try:
+                    self.stock_service.deduct_stock(
+                        conn,
+                        [
+                            (
+                                item["product_id"],
+                                item["variant_id"],
+                                item["quantity"],
+                            )
+                            for item in items
+                        ],
+                    )
+                except OutOfStockError as oose:
+                    conn.rollback()
+                    failed_item_info = str(oose)
+                    logger.error(
+                        "Stok habis saat mencoba mengurangi untuk pesanan "
+                        f"{order_id}: {failed_item_info}"
+                    )
+                    self._cancel_order_due_to_stock_failure(
+                        order_id, failed_item_info
+                    )
+                    return {
+                        "success": False,
+                        "message": "Pembayaran gagal karena stok habis. "
+                        f"{failed_item_info}",
+                    }
 
                 logger.info(f"Stok berhasil dikurangi untuk pesanan {order_id}")
                 logger.debug(
@@ -327,10 +339,6 @@ class PaymentService:
                     "Transaksi pemrosesan pembayaran di-commit untuk "
                     f"pesanan {order_id}."
                 )
-                if product_ids_with_variants:
-                    self._update_variant_parent_stock(
-                        product_ids_with_variants, order_id
-                    )
                 logger.info(
                     f"Pembayaran berhasil diproses untuk transaksi {transaction_id}, "
                     f"ID Pesanan {order_id}. Status diatur ke 'Diproses'."
@@ -354,6 +362,13 @@ class PaymentService:
                         exc_info=True,
                     )
 
+            if is_deadlock(e):
+                logger.warning(
+                    "Deadlock saat memproses pembayaran pesanan "
+                    f"{order_id}, transaksi akan diulang."
+                )
+                raise DeadlockError(str(e))
+
             logger.error(
                 "Kesalahan database selama pemrosesan pembayaran untuk "
                 f"transaksi {transaction_id}, ID Pesanan {order_id}: {e}",
@@ -430,6 +445,18 @@ class PaymentService:
         try:
             conn_cancel = get_db_connection()
             conn_cancel.start_transaction()
+            order = self.order_repository.find_by_id_for_update(
+                conn_cancel, order_id
+            )
+            if not order or order["status"] != "Menunggu Pembayaran":
+                conn_cancel.rollback()
+                logger.info(
+                    f"Pembatalan otomatis pesanan {order_id} dilewati, "
+                    "status sudah berubah: "
+                    f"{order['status'] if order else 'tidak ditemukan'}."
+                )
+                return
+
             notes = (
                 f"Dibatalkan otomatis karena stok habis "
                 f"({failed_item_info}) saat konfirmasi pembayaran."
@@ -437,10 +464,14 @@ class PaymentService:
             self.order_repository.update_status(
                 conn_cancel, order_id, "Dibatalkan"
             )
+            rollup_days = self.sales_rollup_service.record_orders_cancelled(
+                conn_cancel, [order_id]
+            )
             self.history_repository.create(
                 conn_cancel, order_id, "Dibatalkan", notes
             )
             conn_cancel.commit()
+            self.sales_rollup_service.invalidate_report_cache(rollup_days)
             logger.warning(
                 f"Pesanan {order_id} dibatalkan karena stok habis "
                 "saat transaksi pengurangan."
@@ -459,40 +490,6 @@ class PaymentService:
                 conn_cancel.close()
 
 
-    def _update_variant_parent_stock(
-        self, product_ids_with_variants: set, order_id: int
-    ):
-        
-        logger.debug(
-            "Memperbarui total stok produk untuk produk dengan varian: "
-            f"{product_ids_with_variants}"
-        )
-        temp_conn_for_variant: Optional[MySQLConnection] = None
-        try:
-            temp_conn_for_variant = get_db_connection()
-            for pid in product_ids_with_variants:
-                self.variant_service.update_total_stock_from_variants(
-                    pid, temp_conn_for_variant
-                )
-                temp_conn_for_variant.commit()
-            logger.info("Total stok produk diperbarui.")
-
-        except Exception as variant_err:
-            logger.error(
-                "Kesalahan saat memperbarui total stok dari varian "
-                f"setelah konfirmasi pembayaran untuk pesanan {order_id}: "
-                f"{variant_err}",
-                exc_info=True,
-            )
-
-        finally:
-            if (
-                temp_conn_for_variant
-                and temp_conn_for_variant.is_connected()
-            ):
-                temp_conn_for_variant.close()
-
-
     def _close_connection(
         self,
         conn: Optional[MySQLConnection],
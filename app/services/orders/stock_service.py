@@ -1,12 +1,14 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
 
-from app.core.db import get_db_connection
+from app.core.db import get_db_connection, is_deadlock
 from app.exceptions.api_exceptions import ValidationError
-from app.exceptions.database_exceptions import DatabaseException
+from app.exceptions.database_exceptions import (
+    DatabaseException, DeadlockError
+)
 from app.exceptions.service_exceptions import OutOfStockError, ServiceLogicError
 from app.repository.order_item_repository import (
     OrderItemRepository, order_item_repository
@@ -64,14 +66,6 @@ class StockService:
             close_conn = True
             
         try:
-            deleted_count = self.stock_repository.delete_expired(conn)
-            if deleted_count > 0:
-                if close_conn or not conn.in_transaction:
-                    conn.commit()
-            else:
-                if close_conn or not conn.in_transaction:
-                    conn.rollback()
-            
             if stock_check_variant_id is not None:
                 product_stock_row = self.variant_repository.get_stock(
                     conn, stock_check_variant_id
@@ -102,6 +96,77 @@ class StockService:
                 conn.close()
 
 
+    def get_available_stock_bulk(
+        self,
+        items: Iterable[Tuple[int, Optional[int]]],
+        conn: Optional[MySQLConnection] = None,
+    ) -> Dict[Tuple[int, Optional[int]], int]:
+
+        keys = list(dict.fromkeys(items))
+        if not keys:
+            return {}
+
+        product_ids = list({product_id for product_id, _ in keys})
+        simple_ids = list({
+            product_id
+            for product_id, variant_id in keys
+            if variant_id is None
+        })
+        variant_ids = list({
+            variant_id for _, variant_id in keys if variant_id is not None
+        })
+
+        close_conn = False
+        if conn is None:
+            conn = get_db_connection()
+            close_conn = True
+
+        try:
+            product_stock = {
+                row["id"]: row["stock"]
+                for row in self.product_repository.get_stock_batch(
+                    conn, simple_ids
+                )
+            }
+            variant_stock = {
+                row["id"]: row["stock"]
+                for row in self.variant_repository.get_stock_batch(
+                    conn, variant_ids
+                )
+            }
+            held_stock = {
+                (row["product_id"], row["variant_id"]): int(row["held"] or 0)
+                for row in self.stock_repository.get_held_stock_sums(
+                    conn, product_ids
+                )
+            }
+
+            available: Dict[Tuple[int, Optional[int]], int] = {}
+            for product_id, variant_id in keys:
+                if variant_id is not None:
+                    stock = variant_stock.get(variant_id)
+                else:
+                    stock = product_stock.get(product_id)
+
+                if stock is None:
+                    available[(product_id, variant_id)] = 0
+                    continue
+
+                held = held_stock.get((product_id, variant_id), 0)
+                available[(product_id, variant_id)] = max(0, stock - held)
+
+            return available
+
+        except mysql.connector.Error as e:
+            raise DatabaseException(
+                f"Kesalahan database saat mengambil stok: {e}"
+            )
+
+        finally:
+            if close_conn and conn and conn.is_connected():
+                conn.close()
+
+
     def hold_stock_for_checkout(
         self,
         user_id: Optional[int],
@@ -129,6 +194,17 @@ class StockService:
             failed_item_info: Optional[str] = None
             holds_to_insert: List[tuple] = []
             expires_at = datetime.now() + timedelta(minutes=10)
+            available_map = self.get_available_stock_bulk(
+                [
+                    (
+                        item.get("id") or item.get("product_id"),
+                        item.get("variant_id"),
+                    )
+                    for item in cart_items
+                    if item.get("quantity") is not None
+                ],
+                conn,
+            )
 
             for item in cart_items:
                 product_id = item.get("id") or item.get("product_id")
@@ -141,8 +217,8 @@ class StockService:
                 item_log_id = f"Produk {product_id}" + (
                     f", Varian {variant_id}" if variant_id is not None else ""
                 )
-                available_stock = self.get_available_stock(
-                    product_id, variant_id, conn
+                available_stock = available_map.get(
+                    (product_id, variant_id), 0
                 )
 
                 if quantity > available_stock:
@@ -230,6 +306,68 @@ class StockService:
             )
         
 
+    def release_expired_holds_for_users(
+        self, user_ids: List[int], conn: MySQLConnection
+    ) -> int:
+
+        try:
+            return self.stock_repository.delete_expired_by_user_ids(
+                conn, user_ids
+            )
+
+        except mysql.connector.Error as e:
+            raise DatabaseException(
+                f"Kesalahan database saat melepaskan penahanan stok: {e}"
+            )
+
+        except Exception as e:
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat melepaskan penahanan stok: {e}"
+            )
+
+
+    def purge_expired_holds(self, batch_size: int = 500) -> int:
+        conn: Optional[MySQLConnection] = None
+        total_deleted = 0
+
+        try:
+            conn = get_db_connection()
+            while True:
+                deleted = self.stock_repository.delete_expired(
+                    conn, batch_size
+                )
+                conn.commit()
+                total_deleted += deleted
+                if deleted < batch_size:
+                    break
+
+            if total_deleted:
+                logger.info(
+                    f"{total_deleted} penahanan stok kedaluwarsa dihapus."
+                )
+            return total_deleted
+
+        except mysql.connector.Error as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            raise DatabaseException(
+                "Kesalahan database saat menghapus penahanan stok "
+                f"kedaluwarsa: {e}"
+            )
+
+        except Exception as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            raise ServiceLogicError(
+                "Kesalahan layanan saat menghapus penahanan stok "
+                f"kedaluwarsa: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+
     def get_held_items_simple(
         self, user_id: Optional[int], session_id: Optional[str]
     ) -> List[Dict[str, Any]]:
@@ -266,6 +404,82 @@ class StockService:
                 conn.close()
 
 
+    def deduct_stock(
+        self,
+        conn: MySQLConnection,
+        lines: Iterable[Tuple[int, Optional[int], int]],
+    ) -> Set[int]:
+
+        variant_quantities: Dict[int, int] = {}
+        product_quantities: Dict[int, int] = {}
+        parent_ids: Set[int] = set()
+
+        for product_id, variant_id, quantity in lines:
+            if quantity <= 0:
+                continue
+            if variant_id is not None:
+                variant_quantities[variant_id] = (
+                    variant_quantities.get(variant_id, 0) + quantity
+                )
+                parent_ids.add(product_id)
+            else:
+                product_quantities[product_id] = (
+                    product_quantities.get(product_id, 0) + quantity
+                )
+
+        try:
+            self._apply_stock_deduction(
+                conn, variant_quantities, product_quantities, parent_ids
+            )
+            return parent_ids
+
+        except mysql.connector.Error as e:
+            if is_deadlock(e):
+                raise DeadlockError(f"Deadlock saat mengurangi stok: {e}")
+            raise DatabaseException(
+                f"Kesalahan database saat mengurangi stok: {e}"
+            )
+
+
+    def _apply_stock_deduction(
+        self,
+        conn: MySQLConnection,
+        variant_quantities: Dict[int, int],
+        product_quantities: Dict[int, int],
+        parent_ids: Set[int],
+    ) -> None:
+
+        for label, repository, quantities in (
+            ("varian", self.variant_repository, variant_quantities),
+            ("produk", self.product_repository, product_quantities),
+        ):
+            if not quantities:
+                continue
+
+            locked_rows = repository.lock_stock_batch(conn, list(quantities))
+            locked_stock = {row["id"]: row["stock"] for row in locked_rows}
+            for item_id in sorted(quantities):
+                stock = locked_stock.get(item_id)
+                if stock is None or stock < quantities[item_id]:
+                    raise OutOfStockError(
+                        f"Stok habis saat mengurangi untuk {label} "
+                        f"ID {item_id} (tersisa {stock or 0}, "
+                        f"diminta {quantities[item_id]})."
+                    )
+
+            updated = repository.decrease_stock_batch(conn, quantities)
+            if updated != len(quantities):
+                raise OutOfStockError(
+                    f"Stok {label} berubah saat pengurangan "
+                    f"({updated}/{len(quantities)} baris diperbarui)."
+                )
+
+        if parent_ids:
+            self.product_repository.sync_stock_from_variants(
+                conn, list(parent_ids)
+            )
+
+
     def restock_items_for_order(
         self, order_id: int, conn: Optional[MySQLConnection]
     ) -> None:
@@ -2,9 +2,11 @@ from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List, Optional
 
 import mysql.connector
+from flask import current_app
 from mysql.connector.connection import MySQLConnection
 
 from app.core.db import get_db_connection
+from app.core.ttl_cache import TTLCache
 from app.exceptions.api_exceptions import ValidationError
 from app.exceptions.database_exceptions import (
     DatabaseException, RecordNotFoundError
@@ -17,6 +19,7 @@ from app.repository.voucher_repository import (
     VoucherRepository, voucher_repository
 )
 from app.utils.logging_utils import get_logger
+from app.utils.voucher_utils import normalize_voucher_code
 
 logger = get_logger(__name__)
 
@@ -32,14 +35,47 @@ class VoucherService:
         self.user_voucher_repository = user_voucher_repo
 
 
+    def _cache(self) -> TTLCache:
+        cache: Optional[TTLCache] = current_app.extensions.get(
+            "voucher_cache"
+        )
+        if cache is None:
+            cache = TTLCache(
+                ttl=current_app.config.get("VOUCHER_CACHE_TTL", 300)
+            )
+            current_app.extensions["voucher_cache"] = cache
+        return cache
+
+
     def get_active_voucher_by_code(
         self, code: str
     ) -> Optional[Dict[str, Any]]:
         
+        normalized_code = normalize_voucher_code(code)
+        if not normalized_code:
+            return None
+
+        cache = self._cache()
+        cached = cache.get(normalized_code)
+
         conn: Optional[MySQLConnection] = None
         try:
             conn = get_db_connection()
-            return self.voucher_repository.find_active_by_code(conn, code)
+            if cached is None:
+                voucher = self.voucher_repository.find_active_by_code(
+                    conn, normalized_code
+                )
+                if voucher:
+                    cache.set(normalized_code, dict(voucher))
+                return voucher
+
+            usage = self.voucher_repository.find_usage_by_id(
+                conn, cached["id"]
+            )
+            if not usage or not usage["is_active"]:
+                cache.invalidate(normalized_code)
+                return None
+            return {**cached, "use_count": usage["use_count"]}
         
         except mysql.connector.Error as e:
             raise DatabaseException(
@@ -87,7 +123,7 @@ class VoucherService:
         max_uses: Optional[str],
     ) -> Dict[str, Any]:
         
-        standardized_code = code.upper().strip()
+        standardized_code = normalize_voucher_code(code)
         if not standardized_code or not voucher_type or not value:
             raise ValidationError("Kode, Tipe, dan Nilai tidak boleh kosong.")
 
@@ -143,6 +179,7 @@ class VoucherService:
                 max_uses_int,
             )
             conn.commit()
+            self._cache().invalidate(standardized_code)
             new_voucher = self.voucher_repository.find_by_id(conn, new_id)
             return {
                 "success": True,
@@ -197,6 +234,7 @@ class VoucherService:
             conn.start_transaction()
             rowcount = self.voucher_repository.delete(conn, voucher_id)
             conn.commit()
+            self._cache().invalidate()
             if rowcount > 0:
                 return {
                     "success": True,
@@ -238,6 +276,9 @@ class VoucherService:
                     conn, voucher_id, new_status
                 )
                 conn.commit()
+                self._cache().invalidate(
+                    normalize_voucher_code(voucher["code"])
+                )
                 status_text = "Aktif" if new_status else "Tidak Aktif"
                 updated_voucher = self.voucher_repository.find_by_id(
                     conn, voucher_id
@@ -383,6 +424,50 @@ class VoucherService:
                 conn.close()
 
 
+    def redeem_voucher(
+        self,
+        conn: MySQLConnection,
+        voucher_id: int,
+        order_id: int,
+        user_voucher_id: Optional[int] = None,
+    ) -> None:
+
+        try:
+            if not self.voucher_repository.redeem(conn, voucher_id):
+                logger.warning(
+                    f"Penukaran voucher ID {voucher_id} ditolak untuk "
+                    f"pesanan #{order_id}: kuota habis."
+                )
+                raise ValidationError("Voucher sudah habis digunakan.")
+
+            if user_voucher_id and not self.mark_user_voucher_as_used(
+                conn, user_voucher_id, order_id
+            ):
+                logger.warning(
+                    f"UserVoucherID {user_voucher_id} tidak lagi tersedia "
+                    f"untuk pesanan #{order_id}."
+                )
+                raise ValidationError("Voucher ini sudah Anda gunakan.")
+
+            logger.debug(
+                f"Voucher ID {voucher_id} ditukarkan untuk pesanan "
+                f"#{order_id}."
+            )
+
+        except (ValidationError, DatabaseException):
+            raise
+
+        except mysql.connector.Error as e:
+            raise DatabaseException(
+                f"Kesalahan database saat menukarkan voucher: {e}"
+            )
+
+        except Exception as e:
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat menukarkan voucher: {e}"
+            )
+
+
     def mark_user_voucher_as_used(
         self,
         conn: MySQLConnection,
@@ -10,6 +10,9 @@ from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.product_repository import (
     ProductRepository, product_repository
 )
+from app.services.products.top_products_service import (
+    TopProductsService, top_products_service
+)
 from app.utils.logging_utils import get_logger
 
 
@@ -18,8 +21,13 @@ logger = get_logger(__name__)
 
 class ProductBulkService:
 
-    def __init__(self, product_repo: ProductRepository = product_repository):
+    def __init__(
+        self,
+        product_repo: ProductRepository = product_repository,
+        top_products_svc: TopProductsService = top_products_service,
+    ):
         self.product_repository = product_repo
+        self.top_products_service = top_products_svc
 
 
     def handle_bulk_product_action(
@@ -74,6 +82,7 @@ class ProductBulkService:
                 raise ValidationError("Aksi tidak valid atau data kurang.")
             
             conn.commit()
+            self.top_products_service.invalidate()
             logger.info(
                 f"Aksi massal '{action}' selesai berhasil. Pesan: {message}"
             )
@@ -113,4 +122,6 @@ class ProductBulkService:
                 "Koneksi database ditutup untuk handle_bulk_product_action"
             )
 
-product_bulk_service = ProductBulkService(product_repository)
\ No newline at end of file
+product_bulk_service = ProductBulkService(
+    product_repository, top_products_service
+)
\ No newline at end of file
@@ -17,8 +17,13 @@ from app.services.orders.stock_service import StockService, stock_service
 from app.services.products.variant_service import (
     VariantService, variant_service
 )
+from app.services.products.view_counter_service import (
+    ViewCounterService, view_counter_service
+)
 from app.services.reports.dashboard_report_service import convert_decimals
 from app.utils.logging_utils import get_logger
+from app.utils.pagination_utils import decode_cursor, encode_cursor
+from app.utils.search_utils import build_fulltext_query
 
 
 logger = get_logger(__name__)
@@ -32,17 +37,23 @@ class ProductQueryService:
         variant_repo: VariantRepository = variant_repository,
         stock_svc: StockService = stock_service,
         variant_svc: VariantService = variant_service,
+        view_counter_svc: ViewCounterService = view_counter_service,
     ):
         self.product_repository = product_repo
         self.variant_repository = variant_repo
         self.stock_service = stock_svc
         self.variant_service = variant_svc
+        self.view_counter_service = view_counter_svc
 
 
     def get_filtered_products(
         self, filters: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
 
+        filters = {
+            **filters,
+            "search_query": build_fulltext_query(filters.get("search")),
+        }
         logger.debug(f"Mengambil produk yang difilter dengan filter: {filters}")
         conn: Optional[MySQLConnection] = None
 
@@ -76,6 +87,82 @@ class ProductQueryService:
             )
 
 
+    def get_filtered_products_page(
+        self,
+        filters: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        search_query = build_fulltext_query(filters.get("search"))
+        sort_by = filters.get("sort") or "popularity"
+        if sort_by not in ("popularity", "price_asc", "price_desc"):
+            sort_by = "popularity"
+        if sort_by == "popularity" and search_query:
+            sort_by = "relevance"
+        filters = {**filters, "sort": sort_by, "search_query": search_query}
+
+        after = None
+        cursor_data = decode_cursor(cursor)
+        if cursor_data and cursor_data.get("sort") == sort_by:
+            after = (cursor_data.get("value"), cursor_data.get("id"))
+
+        logger.debug(
+            f"Mengambil halaman produk (limit {limit}, cursor: {after}) "
+            f"dengan filter: {filters}"
+        )
+        conn: Optional[MySQLConnection] = None
+
+        try:
+            conn = get_db_connection()
+            rows = self.product_repository.find_filtered(
+                conn, filters, limit=limit + 1, after=after
+            )
+            has_more = len(rows) > limit
+            products = rows[:limit]
+
+            next_cursor = None
+            if has_more and products:
+                last = products[-1]
+                if sort_by == "relevance":
+                    sort_value = last["relevance"]
+                elif sort_by == "popularity":
+                    sort_value = last.get("popularity") or 0
+                else:
+                    sort_value = last["min_effective_price"]
+                next_cursor = encode_cursor(
+                    {"sort": sort_by, "value": sort_value, "id": last["id"]}
+                )
+
+            logger.info(
+                f"Mengambil {len(products)} produk untuk halaman katalog "
+                f"(berikutnya: {'ya' if has_more else 'tidak'})."
+            )
+            return {
+                "products": products,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+            }
+
+        except mysql.connector.Error as e:
+            logger.error(
+                f"Kesalahan database saat memfilter produk: {e}", exc_info=True
+            )
+            raise DatabaseException(
+                f"Kesalahan database saat memfilter produk: {e}"
+            )
+
+        except Exception as e:
+            logger.error(f"Kesalahan saat memfilter produk: {e}", exc_info=True)
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat memfilter produk: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+
     def get_all_products_with_category(
         self,
         search: Optional[str] = None,
@@ -122,6 +209,91 @@ class ProductQueryService:
             )
 
 
+    def get_admin_products_page(
+        self,
+        search: Optional[str] = None,
+        category_id: Optional[Any] = None,
+        stock_status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        after_id = None
+        cursor_data = decode_cursor(cursor)
+        if cursor_data and isinstance(cursor_data.get("id"), int):
+            after_id = cursor_data["id"]
+
+        logger.debug(
+            f"Mengambil halaman produk admin (limit {limit}, setelah ID "
+            f"{after_id}). Pencarian: {search}, Kategori: {category_id}, "
+            f"Status Stok: {stock_status}"
+        )
+        conn: Optional[MySQLConnection] = None
+
+        try:
+            conn = get_db_connection()
+            rows = self.product_repository.find_admin_page(
+                conn, search, category_id, stock_status,
+                limit=limit + 1, after_id=after_id,
+            )
+            has_more = len(rows) > limit
+            products = rows[:limit]
+
+            summaries = self.product_repository.find_variant_summaries(
+                conn, [p["id"] for p in products if p.get("has_variants")]
+            )
+            for product in products:
+                summary = summaries.get(product["id"]) or {}
+                product["variant_count"] = summary.get("variant_count", 0)
+                product["variants_in_stock"] = int(
+                    summary.get("variants_in_stock") or 0
+                )
+                product["max_price"] = summary.get("max_effective_price")
+
+            total = None
+            if after_id is None:
+                total = self.product_repository.count_admin(
+                    conn, search, category_id, stock_status
+                )
+
+            next_cursor = None
+            if has_more and products:
+                next_cursor = encode_cursor({"id": products[-1]["id"]})
+
+            logger.info(
+                f"Mengambil {len(products)} produk untuk halaman admin "
+                f"(berikutnya: {'ya' if has_more else 'tidak'})."
+            )
+            return {
+                "products": products,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+                "total": total,
+            }
+
+        except mysql.connector.Error as e:
+            logger.error(
+                f"Kesalahan database saat mengambil halaman produk admin: {e}",
+                exc_info=True,
+            )
+            raise DatabaseException(
+                f"Kesalahan database saat mengambil produk: {e}"
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Kesalahan saat mengambil halaman produk admin: {e}",
+                exc_info=True,
+            )
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat mengambil produk: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+
     def get_product_by_id(self, product_id: Any) -> Optional[Dict[str, Any]]:
 
         logger.debug(f"Mengambil produk berdasarkan ID: {product_id}")
@@ -139,9 +311,9 @@ class ProductQueryService:
                 return None
 
             logger.debug(
-                f"Meningkatkan popularitas untuk ID produk {product_id}"
+                f"Mencatat tayangan untuk ID produk {product_id}"
             )
-            self.product_repository.update_popularity(conn, product_id)
+            self.view_counter_service.record_view(product_id)
             conn.commit()
             try:
                 product["additional_image_urls"] = (
@@ -174,9 +346,12 @@ class ProductQueryService:
             )
 
             if product["has_variants"]:
+                available_map = self.stock_service.get_available_stock_bulk(
+                    [(product_id, v["id"]) for v in product["variants"]], conn
+                )
                 for variant in product["variants"]:
-                    variant["stock"] = self.stock_service.get_available_stock(
-                        product_id, variant["id"], conn
+                    variant["stock"] = available_map.get(
+                        (product_id, variant["id"]), 0
                     )
                     
                     variant['price'] = (
@@ -277,5 +452,6 @@ class ProductQueryService:
             )
 
 product_query_service = ProductQueryService(
-    product_repository, variant_repository, stock_service, variant_service
+    product_repository, variant_repository, stock_service, variant_service,
+    view_counter_service
 )
\ No newline at end of file
@@ -18,6 +18,9 @@ from app.repository.variant_repository import (
     VariantRepository, variant_repository
 )
 from app.services.products.image_service import ImageService, image_service
+from app.services.products.top_products_service import (
+    TopProductsService, top_products_service
+)
 from app.services.products.variant_conversion_service import (
     VariantConversionService, variant_conversion_service
 )
@@ -42,7 +45,8 @@ class ProductService:
             variant_conversion_service
         ),
         variant_svc: VariantService = variant_service,
-        stock_svc: StockService = stock_service
+        stock_svc: StockService = stock_service,
+        top_products_svc: TopProductsService = top_products_service,
     ):
         self.product_repository = product_repo
         self.variant_repository = variant_repo
@@ -50,6 +54,7 @@ class ProductService:
         self.variant_conversion_service = variant_conversion_svc
         self.variant_service = variant_svc
         self.stock_service = stock_svc
+        self.top_products_service = top_products_svc
 
 
     def create_product(
@@ -175,6 +180,7 @@ class ProductService:
                 )
                 product_data["stock"] = total_stock
 
+            self.product_repository.refresh_min_prices(conn, [product_id])
             conn.commit()
             
             new_product_details = (
@@ -401,6 +407,7 @@ class ProductService:
             update_rowcount: int = self.product_repository.update(
                 conn, product_id, update_data
             )
+            self.product_repository.refresh_min_prices(conn, [product_id])
             update_successful = (
                 update_rowcount > 0
                 or conversion_happened
@@ -410,6 +417,7 @@ class ProductService:
 
             if update_successful:
                 conn.commit()
+                self.top_products_service.invalidate()
 
                 if conversion_happened:
                     logger.debug(
@@ -553,6 +561,7 @@ class ProductService:
             deleted_rows = self.product_repository.delete(conn, product_id)
             if deleted_rows > 0:
                 conn.commit()
+                self.top_products_service.invalidate()
                 logger.info(
                     f"Service: Data produk untuk ID {product_id} berhasil dihapus dari DB."
                 )
@@ -604,5 +613,6 @@ class ProductService:
 
 product_service = ProductService(
     product_repository, variant_repository, image_service,
-    variant_conversion_service, variant_service, stock_service
+    variant_conversion_service, variant_service, stock_service,
+    top_products_service
 )
\ No newline at end of file
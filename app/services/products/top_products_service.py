@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional
+
+import mysql.connector
+from flask import Flask, current_app
+from mysql.connector.connection import MySQLConnection
+
+from app.core.db import get_db_connection
+from app.core.periodic import PeriodicTask
+from app.core.ttl_cache import TTLCache
+from app.exceptions.database_exceptions import DatabaseException
+from app.exceptions.service_exceptions import ServiceLogicError
+from app.repository.product_repository import (
+    ProductRepository, product_repository
+)
+from app.utils.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TopProductsService:
+
+    def __init__(
+        self, product_repo: ProductRepository = product_repository
+    ):
+        self.product_repository = product_repo
+
+
+    def _cache(self) -> TTLCache:
+        cache: Optional[TTLCache] = current_app.extensions.get(
+            "top_products_cache"
+        )
+        if cache is None:
+            cache = TTLCache(
+                ttl=current_app.config.get("TOP_PRODUCTS_CACHE_TTL", 60)
+            )
+            current_app.extensions["top_products_cache"] = cache
+        return cache
+
+
+    def get_top_products(self, limit: int = 4) -> List[Dict[str, Any]]:
+        cached = self._cache().get(("products", limit))
+        if cached is not None:
+            logger.debug(f"Produk teratas (limit {limit}) diambil dari cache.")
+            return list(cached)
+        return self.refresh(limit)
+
+
+    def refresh(self, limit: int = 4) -> List[Dict[str, Any]]:
+        logger.debug(f"Memuat ulang produk teratas (limit {limit}).")
+        conn: Optional[MySQLConnection] = None
+
+        try:
+            conn = get_db_connection()
+            products = self.product_repository.find_top_by_popularity(
+                conn, limit
+            )
+            cache = self._cache()
+            if cache.get(("products", limit)) != products:
+                cache.invalidate()
+            cache.set(("products", limit), products)
+            logger.info(
+                f"Berhasil memuat {len(products)} produk teratas ke cache."
+            )
+            return list(products)
+
+        except mysql.connector.Error as e:
+            logger.error(
+                f"Kesalahan database saat memuat produk teratas: {e}",
+                exc_info=True,
+            )
+            raise DatabaseException(
+                f"Kesalahan database saat memuat produk teratas: {e}"
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Kesalahan saat memuat produk teratas: {e}", exc_info=True
+            )
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat memuat produk teratas: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+
+    def get_fragment(self, version: Any) -> Optional[str]:
+        if not current_app.config.get("LANDING_FRAGMENT_CACHE", True):
+            return None
+        return self._cache().get(("fragment", "landing", version))
+
+
+    def set_fragment(self, version: Any, html: str) -> None:
+        if not current_app.config.get("LANDING_FRAGMENT_CACHE", True):
+            return
+        self._cache().set(("fragment", "landing", version), html)
+
+
+    def invalidate(self) -> None:
+        self._cache().invalidate()
+        logger.info("Cache produk teratas dan fragmen halaman utama dihapus.")
+
+top_products_service = TopProductsService(product_repository)
+
+
+def start_top_products_refresher(app: Flask) -> Optional[PeriodicTask]:
+    interval = app.config.get("TOP_PRODUCTS_REFRESH_INTERVAL", 0)
+    if not interval or app.config.get("TESTING"):
+        return None
+
+    task = PeriodicTask(
+        "top-products-refresher", interval, top_products_service.refresh, app
+    )
+    task.start()
+    app.extensions["top_products_refresher"] = task
+    return task
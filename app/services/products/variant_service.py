@@ -135,6 +135,7 @@ class VariantService:
                 upper_sku
             )
             self.update_total_stock_from_variants(product_id, conn)
+            self.product_repository.refresh_min_prices(conn, [product_id])
             conn.commit()
             new_variant = self.variant_repository.find_by_id(conn, new_id)
             return {
@@ -222,6 +223,7 @@ class VariantService:
             )
             if rowcount > 0:
                 self.update_total_stock_from_variants(product_id, conn)
+                self.product_repository.refresh_min_prices(conn, [product_id])
                 conn.commit()
                 return {
                     "success": True,
@@ -293,6 +295,7 @@ class VariantService:
 
             if rowcount > 0:
                 self.update_total_stock_from_variants(product_id, conn)
+                self.product_repository.refresh_min_prices(conn, [product_id])
                 conn.commit()
                 return {"success": True, "message": "Varian berhasil dihapus."}
             else:
@@ -0,0 +1,177 @@
+import atexit
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional
+
+import mysql.connector
+from flask import Flask, current_app, has_app_context
+from mysql.connector.connection import MySQLConnection
+
+from app.core.db import get_pool
+from app.core.periodic import PeriodicTask
+from app.exceptions.database_exceptions import DatabaseException
+from app.exceptions.service_exceptions import ServiceLogicError
+from app.repository.product_repository import (
+    ProductRepository, product_repository
+)
+from app.utils.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ViewCounterService:
+
+    def __init__(
+        self, product_repo: ProductRepository = product_repository
+    ):
+        self.product_repository = product_repo
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self.flushed_views = 0
+        self.flush_count = 0
+        self.failed_flushes = 0
+        self.flusher: Optional[PeriodicTask] = None
+
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(self._pending.values())
+
+
+    def record_view(self, product_id: Any) -> None:
+        with self._lock:
+            self._pending[int(product_id)] += 1
+            pending = sum(self._pending.values())
+
+        threshold = 0
+        if has_app_context():
+            threshold = current_app.config.get(
+                "VIEW_COUNTER_FLUSH_THRESHOLD", 0
+            )
+        if not threshold or pending < threshold:
+            return
+
+        flusher = self.flusher
+        if flusher is not None and flusher.is_running:
+            logger.debug(
+                f"Ambang penghitung tayangan tercapai ({pending}), "
+                "membangunkan flusher."
+            )
+            flusher.trigger()
+            return
+
+        logger.debug(
+            f"Ambang penghitung tayangan tercapai ({pending}), "
+            "melakukan flush."
+        )
+        try:
+            self.flush()
+        except (DatabaseException, ServiceLogicError):
+            pass
+
+
+    def flush(self) -> int:
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            with self._lock:
+                increments: Dict[int, int] = dict(self._pending)
+                self._pending.clear()
+            if not increments:
+                return 0
+            return self._write(increments)
+        finally:
+            self._flush_lock.release()
+
+
+    def _write(self, increments: Dict[int, int]) -> int:
+        total = sum(increments.values())
+        conn: Optional[MySQLConnection] = None
+
+        try:
+            conn = get_pool().acquire()
+            conn.start_transaction()
+            self.product_repository.increment_popularity_batch(
+                conn, increments
+            )
+            conn.commit()
+            self.flushed_views += total
+            self.flush_count += 1
+            logger.info(
+                f"Flush {total} tayangan untuk {len(increments)} produk."
+            )
+            return total
+
+        except mysql.connector.Error as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            self._restore(increments)
+            logger.error(
+                f"Kesalahan database saat flush penghitung tayangan: {e}",
+                exc_info=True,
+            )
+            raise DatabaseException(
+                f"Kesalahan database saat flush penghitung tayangan: {e}"
+            )
+
+        except Exception as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            self._restore(increments)
+            logger.error(
+                f"Kesalahan saat flush penghitung tayangan: {e}",
+                exc_info=True,
+            )
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat flush penghitung tayangan: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+
+    def _restore(self, increments: Dict[int, int]) -> None:
+        self.failed_flushes += 1
+        with self._lock:
+            self._pending.update(increments)
+
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending_views = sum(self._pending.values())
+            pending_products = len(self._pending)
+        return {
+            "pending_views": pending_views,
+            "pending_products": pending_products,
+            "flushed_views": self.flushed_views,
+            "flush_count": self.flush_count,
+            "failed_flushes": self.failed_flushes,
+        }
+
+view_counter_service = ViewCounterService(product_repository)
+
+
+def start_view_counter_flusher(app: Flask) -> Optional[PeriodicTask]:
+    interval = app.config.get("VIEW_COUNTER_FLUSH_INTERVAL", 0)
+    if not interval or app.config.get("TESTING"):
+        return None
+
+    task = PeriodicTask(
+        "view-counter-flusher", interval, view_counter_service.flush, app
+    )
+    task.start()
+    app.extensions["view_counter_flusher"] = task
+    view_counter_service.flusher = task
+
+    def final_flush() -> None:
+        task.stop()
+        task.run_once()
+        logger.info("Flush akhir penghitung tayangan selesai.")
+
+    atexit.register(final_flush)
+    return task
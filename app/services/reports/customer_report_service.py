@@ -1,5 +1,4 @@
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
@@ -10,6 +9,9 @@ from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.report_repository import (
     ReportRepository, report_repository
 )
+from app.utils.export_utils import (
+    get_export_fetch_size, stream_export_rows
+)
 
 
 class CustomerReportService:
@@ -108,37 +110,30 @@ class CustomerReportService:
 
     def get_full_customers_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         conn: Optional[MySQLConnection] = None
         try:
             conn = get_db_connection()
-            data = self.report_repository.get_full_customers_data_for_export(
-                conn, start_date, end_date
+            rows = self.report_repository.get_full_customers_data_for_export(
+                conn, start_date, end_date, chunk_size=get_export_fetch_size()
             )
-            processed_data: List[List[Any]] = [
-                [
-                    float(col) if isinstance(col, Decimal) else col
-                    for col in row.values()
-                ]
-                for row in data
-            ]
-            return processed_data
+            return stream_export_rows(rows, conn)
         
         except mysql.connector.Error as db_err:
+            if conn and conn.is_connected():
+                conn.close()
             raise DatabaseException(
                 "Kesalahan database saat mengambil data pelanggan untuk "
                 f"ekspor: {db_err}"
             )
         
         except Exception as e:
+            if conn and conn.is_connected():
+                conn.close()
             raise ServiceLogicError(
                 "Kesalahan layanan saat mengambil data pelanggan untuk "
                 f"ekspor: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 customer_report_service = CustomerReportService(report_repository)
\ No newline at end of file
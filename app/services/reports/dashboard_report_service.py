@@ -2,19 +2,22 @@ from decimal import Decimal
 from typing import Any, Dict, Optional
 
 import mysql.connector
-from mysql.connector.connection import MySQLConnection
 
 from app.core.db import get_db_connection
+from app.core.report_executor import ReportExecutor, get_report_executor
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.report_repository import (
     ReportRepository, report_repository
 )
+from app.utils.logging_utils import get_logger
 
 from .inventory_report_service import inventory_report_service
 from .product_report_service import product_report_service
 from .sales_report_service import sales_report_service
 
+logger = get_logger(__name__)
+
 
 def convert_decimals(obj: Any) -> Any:
     if isinstance(obj, list):
@@ -26,56 +29,80 @@ def convert_decimals(obj: Any) -> Any:
     return obj
 
 
+DASHBOARD_DEFAULTS: Dict[str, Any] = {
+    "total_sales": Decimal("0"),
+    "order_count": 0,
+    "new_user_count": 0,
+    "product_count": 0,
+    "sales_chart_data": {"labels": [], "data": []},
+    "top_products_chart": {"labels": [], "data": []},
+    "low_stock_chart": {"labels": [], "data": []},
+}
+
+
 class DashboardReportService:
 
-    def __init__(self, report_repo: ReportRepository = report_repository):
+    def __init__(
+        self,
+        report_repo: ReportRepository = report_repository,
+        executor: Optional[ReportExecutor] = None,
+    ):
         self.report_repository = report_repo
+        self.report_executor = executor
+
+
+    def _executor(self) -> ReportExecutor:
+        return self.report_executor or get_report_executor()
 
 
     def get_dashboard_stats(
         self, start_date_str: str, end_date_str: str
     ) -> Dict[str, Any]:
         
-        conn: Optional[MySQLConnection] = None
-        try:
-            conn = get_db_connection()
-            total_sales = self.report_repository.get_dashboard_sales(
+        repo = self.report_repository
+        tasks = {
+            "total_sales": lambda conn: repo.get_dashboard_sales(
                 conn, start_date_str, end_date_str
-            )
-            order_count = self.report_repository.get_dashboard_order_count(
+            ),
+            "order_count": lambda conn: repo.get_dashboard_order_count(
                 conn, start_date_str, end_date_str
-            )
-            new_user_count = (
-                self.report_repository.get_dashboard_new_user_count(
-                    conn, start_date_str, end_date_str
+            ),
+            "new_user_count": lambda conn: repo.get_dashboard_new_user_count(
+                conn, start_date_str, end_date_str
+            ),
+            "product_count": lambda conn: repo.get_dashboard_product_count(
+                conn
+            ),
+            "sales_chart_data": lambda conn: (
+                sales_report_service.get_sales_chart_data(
+                    start_date_str, end_date_str, conn
                 )
-            )
-            product_count = (
-                self.report_repository.get_dashboard_product_count(conn)
-            )
-            sales_chart_data = sales_report_service.get_sales_chart_data(
-                start_date_str, end_date_str, conn
-            )
-            top_products_chart = (
+            ),
+            "top_products_chart": lambda conn: (
                 product_report_service.get_top_products_chart_data(
                     start_date_str, end_date_str, conn
                 )
-            )
-            low_stock_chart = (
+            ),
+            "low_stock_chart": lambda conn: (
                 inventory_report_service.get_low_stock_chart_data(conn)
+            ),
+        }
+        try:
+            stats, errors = self._executor().run(
+                tasks, get_db_connection, DASHBOARD_DEFAULTS
             )
-            stats = {
-                "total_sales": total_sales,
-                "order_count": order_count,
-                "new_user_count": new_user_count,
-                "product_count": product_count,
-                "sales_chart_data": sales_chart_data,
-                "top_products_chart": top_products_chart,
-                "low_stock_chart": low_stock_chart,
-            }
+            if len(errors) == len(tasks):
+                raise next(iter(errors.values()))
+
+            stats["failed_sections"] = sorted(errors)
+            if errors:
+                logger.warning(
+                    "Statistik dasbor dimuat sebagian, bagian gagal: "
+                    f"{', '.join(sorted(errors))}"
+                )
             return stats
         
-        except mysql.connector.Error as db_err:
+        except (mysql.connector.Error, DatabaseException) as db_err:
             raise DatabaseException(
                 "Kesalahan database saat mengambil statistik dasbor: "
                 f"{db_err}"
@@ -85,9 +112,5 @@ class DashboardReportService:
             raise ServiceLogicError(
                 f"Kesalahan layanan saat mengambil statistik dasbor: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 dashboard_report_service = DashboardReportService(report_repository)
\ No newline at end of file
@@ -1,21 +1,45 @@
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursorDict
 
 from app.core.db import get_db_connection
+from app.core.report_executor import ReportExecutor, get_report_executor
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.report_repository import (
     ReportRepository, report_repository
 )
+from app.utils.export_utils import (
+    get_export_fetch_size, stream_export_rows
+)
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+INVENTORY_REPORT_DEFAULTS: Dict[str, Any] = {
+    "total_value": Decimal("0"),
+    "slow_moving": [],
+    "low_stock": [],
+}
 
 
 class InventoryReportService:
 
-    def __init__(self, report_repo: ReportRepository = report_repository):
+    def __init__(
+        self,
+        report_repo: ReportRepository = report_repository,
+        executor: Optional[ReportExecutor] = None,
+    ):
         self.report_repository = report_repo
+        self.report_executor = executor
+
+
+    def _executor(self) -> ReportExecutor:
+        return self.report_executor or get_report_executor()
 
     def _get_date_filter_clause(
         self,
@@ -39,23 +63,30 @@ class InventoryReportService:
         self, start_date: Optional[str], end_date: Optional[str]
     ) -> Dict[str, Any]:
         
-        conn: Optional[MySQLConnection] = None
-        try:
-            conn = get_db_connection()
-            total_value = self.report_repository.get_inventory_total_value(
-                conn
-            )
-            slow_moving = self.report_repository.get_inventory_slow_moving(
+        repo = self.report_repository
+        tasks = {
+            "total_value": lambda conn: repo.get_inventory_total_value(conn),
+            "slow_moving": lambda conn: repo.get_inventory_slow_moving(
                 conn, start_date, end_date
+            ),
+            "low_stock": lambda conn: repo.get_inventory_low_stock(conn),
+        }
+        try:
+            report, errors = self._executor().run(
+                tasks, get_db_connection, INVENTORY_REPORT_DEFAULTS
             )
-            low_stock = self.report_repository.get_inventory_low_stock(conn)
-            return {
-                "total_value": total_value,
-                "slow_moving": slow_moving,
-                "low_stock": low_stock,
-            }
+            if len(errors) == len(tasks):
+                raise next(iter(errors.values()))
+
+            report["failed_sections"] = sorted(errors)
+            if errors:
+                logger.warning(
+                    "Laporan inventaris dimuat sebagian, bagian gagal: "
+                    f"{', '.join(sorted(errors))}"
+                )
+            return report
         
-        except mysql.connector.Error as db_err:
+        except (mysql.connector.Error, DatabaseException) as db_err:
             raise DatabaseException(
                 "Kesalahan database saat membuat laporan inventaris: "
                 f"{db_err}"
@@ -65,10 +96,6 @@ class InventoryReportService:
             raise ServiceLogicError(
                 f"Kesalahan layanan saat membuat laporan inventaris: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 
     def get_low_stock_chart_data(
@@ -102,66 +129,58 @@ class InventoryReportService:
                 cursor.close()
 
 
-    def get_inventory_low_stock_for_export(self) -> List[List[Any]]:
+    def get_inventory_low_stock_for_export(self) -> Iterator[List[Any]]:
         conn: Optional[MySQLConnection] = None
         try:
             conn = get_db_connection()
-            data = self.report_repository.get_inventory_low_stock_for_export(
-                conn
+            rows = self.report_repository.get_inventory_low_stock_for_export(
+                conn, chunk_size=get_export_fetch_size()
             )
-            processed_data: List[List[Any]] = [
-                [col for col in row.values()] for row in data
-            ]
-            return processed_data
+            return stream_export_rows(rows, conn)
         
         except mysql.connector.Error as db_err:
+            if conn and conn.is_connected():
+                conn.close()
             raise DatabaseException(
                 "Kesalahan database saat mengambil data stok rendah untuk "
                 f"ekspor: {db_err}"
             )
         
         except Exception as e:
+            if conn and conn.is_connected():
+                conn.close()
             raise ServiceLogicError(
                 "Kesalahan layanan saat mengambil data stok rendah untuk "
                 f"ekspor: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 
     def get_inventory_slow_moving_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         conn: Optional[MySQLConnection] = None
         try:
             conn = get_db_connection()
-            data = (
-                self.report_repository.get_inventory_slow_moving_for_export(
-                    conn, start_date, end_date
-                )
+            rows = self.report_repository.get_inventory_slow_moving_for_export(
+                conn, start_date, end_date, chunk_size=get_export_fetch_size()
             )
-            processed_data: List[List[Any]] = [
-                [col for col in row.values()] for row in data
-            ]
-            return processed_data
+            return stream_export_rows(rows, conn)
         
         except mysql.connector.Error as db_err:
+            if conn and conn.is_connected():
+                conn.close()
             raise DatabaseException(
                 "Kesalahan database saat mengambil data produk lambat "
                 f"terjual untuk ekspor: {db_err}"
             )
         
         except Exception as e:
+            if conn and conn.is_connected():
+                conn.close()
             raise ServiceLogicError(
                 "Kesalahan layanan saat mengambil data produk lambat "
                 f"terjual untuk ekspor: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 inventory_report_service = InventoryReportService(report_repository)
\ No newline at end of file
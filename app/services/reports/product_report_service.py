@@ -1,22 +1,37 @@
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursorDict
 
 from app.core.db import get_db_connection
+from app.core.report_executor import ReportExecutor, get_report_executor
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.report_repository import (
     ReportRepository, report_repository
 )
+from app.utils.export_utils import (
+    get_export_fetch_size, stream_export_rows
+)
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 
 class ProductReportService:
 
-    def __init__(self, report_repo: ReportRepository = report_repository):
+    def __init__(
+        self,
+        report_repo: ReportRepository = report_repository,
+        executor: Optional[ReportExecutor] = None,
+    ):
         self.report_repository = report_repo
+        self.report_executor = executor
+
+
+    def _executor(self) -> ReportExecutor:
+        return self.report_executor or get_report_executor()
 
         
     def _get_date_filter_clause(
@@ -39,20 +54,31 @@ class ProductReportService:
 
     def get_product_reports(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, Any]:
         
-        conn: Optional[MySQLConnection] = None
-        try:
-            conn = get_db_connection()
-            top_selling = self.report_repository.get_top_selling_products(
+        repo = self.report_repository
+        tasks = {
+            "top_selling": lambda conn: repo.get_top_selling_products(
                 conn, start_date, end_date
+            ),
+            "most_viewed": lambda conn: repo.get_most_viewed_products(conn),
+        }
+        try:
+            report, errors = self._executor().run(
+                tasks, get_db_connection, {"top_selling": [], "most_viewed": []}
             )
-            most_viewed = self.report_repository.get_most_viewed_products(
-                conn
-            )
-            return {"top_selling": top_selling, "most_viewed": most_viewed}
+            if len(errors) == len(tasks):
+                raise next(iter(errors.values()))
+
+            report["failed_sections"] = sorted(errors)
+            if errors:
+                logger.warning(
+                    "Laporan produk dimuat sebagian, bagian gagal: "
+                    f"{', '.join(sorted(errors))}"
+                )
+            return report
         
-        except mysql.connector.Error as db_err:
+        except (mysql.connector.Error, DatabaseException) as db_err:
             raise DatabaseException(
                 f"Kesalahan database saat membuat laporan produk: {db_err}"
             )
@@ -61,10 +87,6 @@ class ProductReportService:
             raise ServiceLogicError(
                 f"Kesalahan layanan saat membuat laporan produk: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 
     def get_top_products_chart_data(
@@ -100,37 +122,30 @@ class ProductReportService:
 
     def get_full_products_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         conn: Optional[MySQLConnection] = None
         try:
             conn = get_db_connection()
-            data = self.report_repository.get_full_products_data_for_export(
-                conn, start_date, end_date
+            rows = self.report_repository.get_full_products_data_for_export(
+                conn, start_date, end_date, chunk_size=get_export_fetch_size()
             )
-            processed_data: List[List[Any]] = [
-                [
-                    float(col) if isinstance(col, Decimal) else col
-                    for col in row.values()
-                ]
-                for row in data
-            ]
-            return processed_data
+            return stream_export_rows(rows, conn)
         
         except mysql.connector.Error as db_err:
+            if conn and conn.is_connected():
+                conn.close()
             raise DatabaseException(
                 "Kesalahan database saat mengambil data produk untuk "
                 f"ekspor: {db_err}"
             )
         
         except Exception as e:
+            if conn and conn.is_connected():
+                conn.close()
             raise ServiceLogicError(
                 "Kesalahan layanan saat mengambil data produk untuk "
                 f"ekspor: {e}"
             )
-        
-        finally:
-            if conn and conn.is_connected():
-                conn.close()
 
 product_report_service = ProductReportService(report_repository)
\ No newline at end of file
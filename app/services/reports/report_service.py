@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from app.core.report_cache import get_report_cache
 from app.exceptions.service_exceptions import ServiceLogicError
 
 from .customer_report_service import customer_report_service
@@ -32,7 +33,12 @@ class ReportService:
     ) -> Dict[str, Any]:
         
         try:
-            return sales_report_service.get_sales_summary(start_date, end_date)
+            return get_report_cache().get_or_load(
+                "sales_summary", start_date, end_date,
+                lambda: sales_report_service.get_sales_summary(
+                    start_date, end_date
+                ),
+            )
         
         except Exception as e:
             raise ServiceLogicError(f"Gagal mengambil ringkasan penjualan: {e}")
@@ -43,8 +49,11 @@ class ReportService:
     ) -> List[Dict[str, Any]]:
         
         try:
-            return sales_report_service.get_voucher_effectiveness(
-                start_date, end_date
+            return get_report_cache().get_or_load(
+                "voucher_effectiveness", start_date, end_date,
+                lambda: sales_report_service.get_voucher_effectiveness(
+                    start_date, end_date
+                ),
             )
         
         except Exception as e:
@@ -55,7 +64,7 @@ class ReportService:
 
     def get_full_sales_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         try:
             return sales_report_service.get_full_sales_data_for_export(
@@ -70,7 +79,7 @@ class ReportService:
 
     def get_full_vouchers_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         try:
             return sales_report_service.get_full_vouchers_data_for_export(
@@ -85,7 +94,7 @@ class ReportService:
 
     def get_product_reports(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, Any]:
         
         try:
             return product_report_service.get_product_reports(
@@ -98,7 +107,7 @@ class ReportService:
 
     def get_full_products_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         try:
             return product_report_service.get_full_products_data_for_export(
@@ -116,8 +125,11 @@ class ReportService:
     ) -> Dict[str, List[Dict[str, Any]]]:
         
         try:
-            return customer_report_service.get_customer_reports(
-                start_date, end_date
+            return get_report_cache().get_or_load(
+                "customer_reports", start_date, end_date,
+                lambda: customer_report_service.get_customer_reports(
+                    start_date, end_date
+                ),
             )
         
         except Exception as e:
@@ -129,8 +141,12 @@ class ReportService:
     ) -> Dict[str, Any]:
         
         try:
-            return customer_report_service.get_cart_analytics(
-                start_date, end_date
+            return get_report_cache().get_or_load(
+                "cart_analytics", start_date, end_date,
+                lambda: customer_report_service.get_cart_analytics(
+                    start_date, end_date
+                ),
+                live=True,
             )
         
         except Exception as e:
@@ -139,7 +155,7 @@ class ReportService:
 
     def get_full_customers_data_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         try:
             return (
@@ -159,15 +175,19 @@ class ReportService:
     ) -> Dict[str, Any]:
         
         try:
-            return inventory_report_service.get_inventory_reports(
-                start_date, end_date
+            return get_report_cache().get_or_load(
+                "inventory_reports", start_date, end_date,
+                lambda: inventory_report_service.get_inventory_reports(
+                    start_date, end_date
+                ),
+                live=True,
             )
         
         except Exception as e:
             raise ServiceLogicError(f"Gagal mengambil laporan inventaris: {e}")
 
 
-    def get_inventory_low_stock_for_export(self) -> List[List[Any]]:
+    def get_inventory_low_stock_for_export(self) -> Iterator[List[Any]]:
 
         try:
             return (
@@ -182,7 +202,7 @@ class ReportService:
 
     def get_inventory_slow_moving_for_export(
         self, start_date: Optional[str], end_date: Optional[str]
-    ) -> List[List[Any]]:
+    ) -> Iterator[List[Any]]:
         
         try:
             return (
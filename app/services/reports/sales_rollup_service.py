@@ -0,0 +1,186 @@
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import mysql.connector
+from flask import current_app, has_app_context
+from mysql.connector.connection import MySQLConnection
+
+from app.core.db import get_db_connection
+from app.core.report_cache import get_report_cache
+from app.exceptions.database_exceptions import DatabaseException
+from app.exceptions.service_exceptions import ServiceLogicError
+from app.repository.sales_rollup_repository import (
+    SalesRollupRepository, sales_rollup_repository
+)
+from app.utils.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+CANCELLED_STATUS = "Dibatalkan"
+
+
+class SalesRollupService:
+
+    def __init__(
+        self, rollup_repo: SalesRollupRepository = sales_rollup_repository
+    ):
+        self.rollup_repository = rollup_repo
+
+
+    def _apply(
+        self, conn: MySQLConnection,
+        order_ids: List[int],
+        placed: int,
+        cancelled: int,
+        sign: int,
+    ) -> List[date]:
+        self.rollup_repository.upsert_daily_sales(
+            conn, order_ids, placed, cancelled, sign
+        )
+        self.rollup_repository.upsert_daily_product_sales(
+            conn, order_ids, sign
+        )
+        self.rollup_repository.upsert_daily_voucher_usage(
+            conn, order_ids, sign
+        )
+        return self.rollup_repository.find_order_dates(conn, order_ids)
+
+
+    def invalidate_report_cache(self, order_days: Iterable[date]) -> None:
+        if not has_app_context():
+            return
+        get_report_cache().invalidate_dates(order_days)
+
+
+    def record_order_created(
+        self, conn: MySQLConnection, order_id: int
+    ) -> List[date]:
+        logger.debug(f"Menambahkan pesanan {order_id} ke rollup penjualan.")
+        return self._apply(conn, [order_id], placed=1, cancelled=0, sign=1)
+
+
+    def record_orders_cancelled(
+        self, conn: MySQLConnection, order_ids: List[int]
+    ) -> List[date]:
+        if not order_ids:
+            return []
+        logger.debug(
+            f"Mengurangi {len(order_ids)} pesanan batal dari rollup penjualan."
+        )
+        return self._apply(
+            conn, list(order_ids), placed=0, cancelled=1, sign=-1
+        )
+
+
+    def record_status_change(
+        self, conn: MySQLConnection,
+        order_id: int,
+        old_status: str,
+        new_status: str,
+    ) -> List[date]:
+        was_cancelled = old_status == CANCELLED_STATUS
+        is_cancelled = new_status == CANCELLED_STATUS
+        if was_cancelled == is_cancelled:
+            return []
+
+        if is_cancelled:
+            return self.record_orders_cancelled(conn, [order_id])
+        logger.debug(
+            f"Mengembalikan pesanan {order_id} ke rollup penjualan."
+        )
+        return self._apply(
+            conn, [order_id], placed=0, cancelled=-1, sign=1
+        )
+
+
+    def _chunk_days(self) -> int:
+        if has_app_context():
+            return max(
+                1, current_app.config.get("SALES_ROLLUP_BACKFILL_CHUNK_DAYS", 31)
+            )
+        return 31
+
+
+    def rebuild(
+        self,
+        conn: MySQLConnection,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        bounds = self.rollup_repository.find_order_date_bounds(conn)
+        if not bounds or not bounds["first_date"]:
+            logger.info("Tidak ada pesanan untuk di-backfill ke rollup.")
+            return {"success": True, "days": 0, "chunks": 0}
+
+        start = start_date or bounds["first_date"]
+        end = end_date or bounds["last_date"]
+        if start > end:
+            return {"success": True, "days": 0, "chunks": 0}
+
+        chunk_days = self._chunk_days()
+        days = 0
+        chunks = 0
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(
+                chunk_start + timedelta(days=chunk_days - 1), end
+            )
+            if not conn.in_transaction:
+                conn.start_transaction()
+            self.rollup_repository.delete_range(conn, chunk_start, chunk_end)
+            days += self.rollup_repository.rebuild_range(
+                conn, chunk_start, chunk_end
+            )
+            conn.commit()
+            chunks += 1
+            logger.debug(
+                f"Rollup penjualan {chunk_start} s/d {chunk_end} "
+                "dibangun ulang."
+            )
+            chunk_start = chunk_end + timedelta(days=1)
+
+        logger.info(
+            f"Backfill rollup penjualan selesai: {days} hari dalam "
+            f"{chunks} bagian ({start} s/d {end})."
+        )
+        return {"success": True, "days": days, "chunks": chunks}
+
+
+    def backfill(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        conn: Optional[MySQLConnection] = None
+
+        try:
+            conn = get_db_connection()
+            return self.rebuild(conn, start_date, end_date)
+
+        except mysql.connector.Error as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            logger.error(
+                f"Kesalahan database saat backfill rollup penjualan: {e}",
+                exc_info=True,
+            )
+            raise DatabaseException(
+                f"Kesalahan database saat backfill rollup penjualan: {e}"
+            )
+
+        except Exception as e:
+            if conn and conn.is_connected():
+                conn.rollback()
+            logger.error(
+                f"Kesalahan saat backfill rollup penjualan: {e}", exc_info=True
+            )
+            raise ServiceLogicError(
+                f"Kesalahan layanan saat backfill rollup penjualan: {e}"
+            )
+
+        finally:
+            if conn and conn.is_connected():
+                conn.close()
+
+sales_rollup_service = SalesRollupService(sales_rollup_repository)
\ No newline at end of file
@@ -5,6 +5,7 @@ from mysql.connector.connection import MySQLConnection
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.core.db import get_db_connection
+from app.core.subscription_cache import get_subscription_cache
 from app.exceptions.api_exceptions import AuthError, ValidationError
 from app.exceptions.database_exceptions import (
     DatabaseException, RecordNotFoundError
@@ -273,6 +274,14 @@ class UserService:
     ) -> Optional[Dict[str, Any]]:
         
         logger.debug(f"Mengecek langganan aktif untuk pengguna ID: {user_id}")
+        return get_subscription_cache().get_or_load(
+            user_id, lambda: self._load_active_subscription(user_id, conn)
+        )
+
+
+    def _load_active_subscription(
+        self, user_id: int, conn: Optional[MySQLConnection] = None
+    ) -> Optional[Dict[str, Any]]:
         close_conn: bool = False
         if conn is None:
             conn = get_db_connection()
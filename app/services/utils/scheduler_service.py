@@ -1,15 +1,21 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import mysql.connector
+from flask import Flask, current_app
 from mysql.connector.connection import MySQLConnection
 
 from app.core.db import get_db_connection
+from app.core.periodic import PeriodicTask
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 from app.repository.order_repository import (
     OrderRepository, order_repository
 )
+from app.repository.order_status_history_repository import (
+    OrderStatusHistoryRepository, order_status_history_repository
+)
 from app.repository.report_repository import (
     ReportRepository, report_repository
 )
@@ -19,10 +25,31 @@ from app.repository.user_voucher_repository import (
 from app.repository.voucher_repository import (
     VoucherRepository, voucher_repository
 )
+from app.services.orders.stock_service import StockService, stock_service
+from app.services.reports.sales_rollup_service import (
+    SalesRollupService, sales_rollup_service
+)
 from app.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+EXPIRED_ORDER_NOTE = "Dibatalkan otomatis karena batas waktu pembayaran habis."
+
+SegmentFinder = Callable[[MySQLConnection, datetime], List[int]]
+
+
+class VoucherSegment:
+
+    def __init__(
+        self,
+        name: str,
+        find_user_ids: SegmentFinder,
+        voucher_code: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.find_user_ids = find_user_ids
+        self.voucher_code = voucher_code or name
+
 
 class SchedulerService:
 
@@ -31,38 +58,120 @@ class SchedulerService:
         order_repo: OrderRepository = order_repository,
         report_repo: ReportRepository = report_repository,
         voucher_repo: VoucherRepository = voucher_repository,
-        user_voucher_repo: UserVoucherRepository = user_voucher_repository
+        user_voucher_repo: UserVoucherRepository = user_voucher_repository,
+        stock_svc: StockService = stock_service,
+        sales_rollup_svc: SalesRollupService = sales_rollup_service,
+        history_repo: OrderStatusHistoryRepository = (
+            order_status_history_repository
+        ),
     ):
         self.order_repository = order_repo
         self.report_repository = report_repo
         self.voucher_repository = voucher_repo
         self.user_voucher_repository = user_voucher_repo
+        self.stock_service = stock_svc
+        self.sales_rollup_service = sales_rollup_svc
+        self.history_repository = history_repo
+        self.segments: Dict[str, VoucherSegment] = {}
+        self.register_segment(
+            VoucherSegment("TOP_SPENDER", self._find_top_spenders)
+        )
+        self.register_segment(
+            VoucherSegment("INACTIVE", self._find_inactive_users)
+        )
+        self.register_segment(
+            VoucherSegment("FIRST_TIME_BUYER", self._find_first_time_buyers)
+        )
 
         
-    def cancel_expired_pending_orders(self) -> Dict[str, Any]:
+    def _cancel_expired_chunk(
+        self, conn: MySQLConnection, orders: List[Dict[str, Any]]
+    ) -> List[date]:
+        order_ids: List[int] = [order["id"] for order in orders]
+        self.order_repository.bulk_update_status(
+            conn, order_ids, "Dibatalkan"
+        )
+        self.history_repository.create_batch(
+            conn,
+            [
+                (order_id, "Dibatalkan", EXPIRED_ORDER_NOTE)
+                for order_id in order_ids
+            ],
+        )
+        rollup_days = self.sales_rollup_service.record_orders_cancelled(
+            conn, order_ids
+        )
+        user_ids = sorted(
+            {order["user_id"] for order in orders if order.get("user_id")}
+        )
+        if user_ids:
+            self.stock_service.release_expired_holds_for_users(
+                user_ids, conn
+            )
+        return rollup_days
+
+
+    def cancel_expired_pending_orders(
+        self,
+        batch_size: Optional[int] = None,
+        max_chunks: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        if batch_size is None:
+            batch_size = current_app.config.get(
+                "EXPIRED_ORDER_CANCEL_BATCH_SIZE", 500
+            )
 
         conn: Optional[MySQLConnection] = None
+        cancelled_count = 0
+        chunks = 0
+        last_id = 0
+        has_more = False
+        started = time.monotonic()
+
         try:
             conn = get_db_connection()
-            conn.start_transaction()
             expiration_time: datetime = datetime.now() - timedelta(hours=24)
-            expired_orders: List[Dict[str, Any]] = (
-                self.order_repository.find_expired_pending_orders(
-                    conn, expiration_time
+            while True:
+                if max_chunks is not None and chunks >= max_chunks:
+                    has_more = True
+                    break
+
+                conn.start_transaction()
+                expired_orders: List[Dict[str, Any]] = (
+                    self.order_repository.find_expired_pending_orders(
+                        conn, expiration_time, batch_size, last_id
+                    )
                 )
-            )
-            if not expired_orders:
+                if not expired_orders:
+                    conn.commit()
+                    break
+
+                rollup_days = self._cancel_expired_chunk(conn, expired_orders)
                 conn.commit()
-                return {"success": True, "cancelled_count": 0}
+                self.sales_rollup_service.invalidate_report_cache(rollup_days)
+                chunks += 1
+                cancelled_count += len(expired_orders)
+                last_id = expired_orders[-1]["id"]
+                if len(expired_orders) < batch_size:
+                    break
 
-            cancelled_ids: List[int] = [
-                order["id"] for order in expired_orders
-            ]
-            self.order_repository.bulk_update_status(
-                conn, cancelled_ids, "Dibatalkan"
-            )
-            conn.commit()
-            return {"success": True, "cancelled_count": len(cancelled_ids)}
+            elapsed = time.monotonic() - started
+            if cancelled_count:
+                logger.info(
+                    f"Scheduler: {cancelled_count} pesanan kedaluwarsa "
+                    f"dibatalkan dalam {chunks} batch ({elapsed:.2f} detik)."
+                )
+            return {
+                "success": True,
+                "cancelled_count": cancelled_count,
+                "chunks": chunks,
+                "has_more": has_more,
+                "last_order_id": last_id,
+                "elapsed_seconds": round(elapsed, 3),
+                "orders_per_second": (
+                    round(cancelled_count / elapsed, 1) if elapsed else 0.0
+                ),
+            }
 
         except mysql.connector.Error as db_err:
             if conn and conn.is_connected():
@@ -85,61 +194,175 @@ class SchedulerService:
                 conn.close()
 
 
-    def grant_segmented_vouchers(self) -> Dict[str, Any]:
-        conn: Optional[MySQLConnection] = None
-        granted_count = 0
-        
+    def purge_expired_stock_holds(
+        self, batch_size: int = 500
+    ) -> Dict[str, Any]:
         try:
-            conn = get_db_connection()
-            conn.start_transaction()
-            
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            
-            top_user_ids = (
-                self.report_repository.get_top_spenders_user_ids_by_percentile(
-                    conn,
-                    0.05,
-                    start_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    end_date.strftime('%Y-%m-%d %H:%M:%S')
-                )
+            purged_count = self.stock_service.purge_expired_holds(batch_size)
+            return {"success": True, "purged_count": purged_count}
+
+        except (DatabaseException, ServiceLogicError):
+            raise
+
+        except mysql.connector.Error as db_err:
+            raise DatabaseException(
+                "Kesalahan database saat menghapus penahanan stok "
+                f"kedaluwarsa: {db_err}"
             )
-            
-            if not top_user_ids:
-                logger.info("Scheduler: Tidak ada top spender yang ditemukan.")
-                conn.commit()
-                return {"success": True, "granted_count": 0}
 
-            voucher = self.voucher_repository.find_by_code(
-                conn, "TOP_SPENDER"
+        except Exception as e:
+            raise ServiceLogicError(
+                "Terjadi kesalahan internal saat menghapus penahanan "
+                f"stok kedaluwarsa: {e}"
             )
-            
-            if not voucher:
-                logger.warning(
-                    "Scheduler: Voucher 'TOP_SPENDER' tidak ditemukan."
+
+
+    def run_daily_jobs(self) -> Dict[str, Any]:
+        jobs: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "cancel": self.cancel_expired_pending_orders,
+            "segments": self.grant_segmented_vouchers,
+            "purge": self.purge_expired_stock_holds,
+        }
+        results: Dict[str, Dict[str, Any]] = {}
+        failed: List[str] = []
+        for name, job in jobs.items():
+            try:
+                results[name] = job()
+            except (DatabaseException, ServiceLogicError) as e:
+                logger.error(
+                    f"Tugas scheduler '{name}' gagal: {e}", exc_info=True
                 )
-                conn.commit()
-                return {"success": False, "granted_count": 0}
-                
-            voucher_id = voucher["id"]
-
-            for user_id in top_user_ids:
-                try:
-                    self.user_voucher_repository.create(
-                        conn, user_id, voucher_id
+                results[name] = {"success": False, "message": str(e)}
+
+            if not results[name].get("success"):
+                failed.append(name)
+
+        return {"success": not failed, "failed": failed, "results": results}
+
+
+    def _find_top_spenders(
+        self, conn: MySQLConnection, now: datetime
+    ) -> List[int]:
+        return self.report_repository.get_top_spenders_user_ids_by_percentile(
+            conn,
+            0.05,
+            (now - timedelta(days=30)).strftime('%Y-%m-%d %H:%M:%S'),
+            now.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+
+    def _find_inactive_users(
+        self, conn: MySQLConnection, now: datetime
+    ) -> List[int]:
+        return self.report_repository.get_inactive_user_ids(
+            conn, (now - timedelta(days=90)).strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+
+    def _find_first_time_buyers(
+        self, conn: MySQLConnection, now: datetime
+    ) -> List[int]:
+        return self.report_repository.get_first_time_buyer_user_ids(
+            conn,
+            (now - timedelta(days=30)).strftime('%Y-%m-%d %H:%M:%S'),
+            now.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+
+    def register_segment(self, segment: VoucherSegment) -> VoucherSegment:
+        self.segments[segment.name] = segment
+        return segment
+
+
+    def grant_voucher_to_users(
+        self,
+        conn: MySQLConnection,
+        voucher_id: int,
+        user_ids: Sequence[int],
+        batch_size: int = 1000,
+    ) -> Dict[str, int]:
+        unique_ids = list(dict.fromkeys(user_ids))
+        inserted = 0
+        for start in range(0, len(unique_ids), batch_size):
+            inserted += self.user_voucher_repository.bulk_create(
+                conn, unique_ids[start:start + batch_size], voucher_id
+            )
+            conn.commit()
+        return {"inserted": inserted, "skipped": len(unique_ids) - inserted}
+
+
+    def grant_segmented_vouchers(
+        self,
+        segment_names: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        if segment_names is None:
+            segment_names = [
+                name.strip()
+                for name in current_app.config.get(
+                    "VOUCHER_GRANT_SEGMENTS", "TOP_SPENDER"
+                ).split(",")
+                if name.strip()
+            ]
+        batch_size = batch_size or current_app.config.get(
+            "VOUCHER_GRANT_BATCH_SIZE", 1000
+        )
+
+        conn: Optional[MySQLConnection] = None
+        success = True
+        results: Dict[str, Dict[str, int]] = {}
+        
+        try:
+            conn = get_db_connection()
+            now = datetime.now()
+
+            for name in segment_names:
+                results[name] = {"granted": 0, "skipped": 0}
+                segment = self.segments.get(name)
+                if segment is None:
+                    logger.warning(
+                        f"Scheduler: Segmen '{name}' tidak dikenal."
                     )
-                    granted_count += 1
-                except mysql.connector.IntegrityError:
-                    logger.debug(
-                        f"User {user_id} sudah memiliki voucher TOP_SPENDER."
+                    success = False
+                    continue
+
+                user_ids = segment.find_user_ids(conn, now)
+                if not user_ids:
+                    logger.info(
+                        f"Scheduler: Tidak ada pengguna di segmen '{name}'."
                     )
-                    pass
-            
-            conn.commit()
-            logger.info(
-                f"Scheduler: {granted_count} voucher TOP_SPENDER diberikan."
-            )
-            return {"success": True, "granted_count": granted_count}
+                    continue
+
+                voucher = self.voucher_repository.find_by_code(
+                    conn, segment.voucher_code
+                )
+                if not voucher:
+                    logger.warning(
+                        f"Scheduler: Voucher '{segment.voucher_code}' "
+                        "tidak ditemukan."
+                    )
+                    success = False
+                    continue
+
+                counts = self.grant_voucher_to_users(
+                    conn, voucher["id"], user_ids, batch_size
+                )
+                results[name] = {
+                    "granted": counts["inserted"],
+                    "skipped": counts["skipped"],
+                }
+                logger.info(
+                    f"Scheduler: {counts['inserted']} voucher "
+                    f"{segment.voucher_code} diberikan, "
+                    f"{counts['skipped']} sudah dimiliki."
+                )
+
+            return {
+                "success": success,
+                "granted_count": sum(r["granted"] for r in results.values()),
+                "skipped_count": sum(r["skipped"] for r in results.values()),
+                "segments": results,
+            }
 
         except mysql.connector.Error as db_err:
             if conn and conn.is_connected():
@@ -163,5 +386,39 @@ class SchedulerService:
 
 scheduler_service = SchedulerService(
     order_repository, report_repository,
-    voucher_repository, user_voucher_repository
-)
\ No newline at end of file
+    voucher_repository, user_voucher_repository, stock_service
+)
+
+
+def start_stock_hold_reaper(app: Flask) -> Optional[PeriodicTask]:
+    interval = app.config.get("STOCK_HOLD_REAPER_INTERVAL", 0)
+    if not interval or app.config.get("TESTING"):
+        return None
+
+    batch_size = app.config.get("STOCK_HOLD_REAPER_BATCH_SIZE", 500)
+    task = PeriodicTask(
+        "stock-hold-reaper",
+        interval,
+        lambda: scheduler_service.purge_expired_stock_holds(batch_size),
+        app,
+    )
+    task.start()
+    app.extensions["stock_hold_reaper"] = task
+    return task
+
+
+def start_expired_order_reaper(app: Flask) -> Optional[PeriodicTask]:
+    interval = app.config.get("EXPIRED_ORDER_REAPER_INTERVAL", 0)
+    if not interval or app.config.get("TESTING"):
+        return None
+
+    batch_size = app.config.get("EXPIRED_ORDER_CANCEL_BATCH_SIZE", 500)
+    task = PeriodicTask(
+        "expired-order-reaper",
+        interval,
+        lambda: scheduler_service.cancel_expired_pending_orders(batch_size),
+        app,
+    )
+    task.start()
+    app.extensions["expired_order_reaper"] = task
+    return task
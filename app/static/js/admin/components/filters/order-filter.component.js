@@ -14,9 +14,56 @@ export function initAdminOrderFilter() {
     const statusSelect = filterForm.querySelector('select[name="status"]');
     const startDate = filterForm.querySelector('input[name="start_date"]');
     const endDate = filterForm.querySelector('input[name="end_date"]');
+    const loadMoreWrapper = document.getElementById('orders-load-more');
+    const loadMoreBtn = document.getElementById('orders-load-more-btn');
+    const totalCount = document.getElementById('orders-total-count');
 
     if (!filterForm || !tableBody || !searchInput || !statusSelect || !startDate || !endDate) return;
 
+    let currentParams = new URLSearchParams(window.location.search);
+    let isLoadingMore = false;
+
+    const setNextCursor = (cursor) => {
+        if (!loadMoreWrapper) return;
+        loadMoreWrapper.dataset.nextCursor = cursor || '';
+        loadMoreWrapper.hidden = !cursor;
+    };
+
+    const loadNextPage = async () => {
+        const nextCursor = loadMoreWrapper ? loadMoreWrapper.dataset.nextCursor : '';
+        if (!nextCursor || isLoadingMore) return;
+        isLoadingMore = true;
+        if (loadMoreBtn) loadMoreBtn.disabled = true;
+
+        const params = new URLSearchParams(currentParams);
+        params.delete('is_filter_request');
+        params.set('cursor', nextCursor);
+
+        try {
+            const response = await fetch(`${filterForm.action}?${params.toString()}`, {
+                headers: { 'X-Requested-With': 'XMLHttpRequest' }
+            });
+            const result = await response.json();
+
+            if (response.ok && result.success) {
+                tableBody.insertAdjacentHTML('beforeend', result.html);
+                setNextCursor(result.has_more ? result.next_cursor : '');
+            } else {
+                showNotification('Gagal memuat pesanan berikutnya.', true);
+            }
+        } catch (error) {
+            console.error('Load more error:', error);
+            showNotification('Error koneksi saat memuat pesanan.', true);
+        } finally {
+            isLoadingMore = false;
+            if (loadMoreBtn) loadMoreBtn.disabled = false;
+        }
+    };
+
+    if (loadMoreBtn) {
+        loadMoreBtn.addEventListener('click', loadNextPage);
+    }
+
     const handleFilterRequest = async (form, isReset = false) => {
         const params = isReset ? new URLSearchParams() : new URLSearchParams(new FormData(form));
         if (!isReset) {
@@ -38,9 +85,12 @@ export function initAdminOrderFilter() {
 
             if (response.ok && result.success) {
                 params.delete('is_filter_request');
+                currentParams = params;
                 const newUrl = `${window.location.pathname}?${params.toString()}`;
                 history.pushState({ path: newUrl }, '', newUrl);
                 tableBody.innerHTML = result.html;
+                setNextCursor(result.has_more ? result.next_cursor : '');
+                if (totalCount) totalCount.textContent = `(${result.total})`;
             } else {
                 showNotification('Gagal memfilter pesanan.', true);
             }
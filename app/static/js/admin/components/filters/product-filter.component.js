@@ -13,8 +13,57 @@ export function initAdminProductFilter() {
     const resetBtn = document.getElementById('reset-filter-btn');
     const searchInput = filterForm ? filterForm.querySelector('input[name="search"]') : null;
 
+    const loadMoreWrapper = document.getElementById('products-load-more');
+    const loadMoreBtn = document.getElementById('products-load-more-btn');
+    const totalCount = document.getElementById('products-total-count');
+
     if (!filterForm || !tableBody || !searchInput) return;
 
+    let currentParams = new URLSearchParams(window.location.search);
+    let isLoadingMore = false;
+
+    const setNextCursor = (cursor) => {
+        if (!loadMoreWrapper) return;
+        loadMoreWrapper.dataset.nextCursor = cursor || '';
+        loadMoreWrapper.hidden = !cursor;
+    };
+
+    const loadNextPage = async () => {
+        const nextCursor = loadMoreWrapper ? loadMoreWrapper.dataset.nextCursor : '';
+        if (!nextCursor || isLoadingMore) return;
+        isLoadingMore = true;
+        if (loadMoreBtn) loadMoreBtn.disabled = true;
+
+        const params = new URLSearchParams(currentParams);
+        params.delete('is_filter_request');
+        params.set('cursor', nextCursor);
+
+        try {
+            const response = await fetch(`${filterForm.action}?${params.toString()}`, {
+                headers: { 'X-Requested-With': 'XMLHttpRequest' }
+            });
+            const result = await response.json();
+
+            if (response.ok && result.success) {
+                tableBody.insertAdjacentHTML('beforeend', result.html);
+                setNextCursor(result.has_more ? result.next_cursor : '');
+                initAnimations();
+            } else {
+                showNotification('Gagal memuat produk berikutnya.', true);
+            }
+        } catch (error) {
+            console.error('Load more error:', error);
+            showNotification('Error koneksi saat memuat produk.', true);
+        } finally {
+            isLoadingMore = false;
+            if (loadMoreBtn) loadMoreBtn.disabled = false;
+        }
+    };
+
+    if (loadMoreBtn) {
+        loadMoreBtn.addEventListener('click', loadNextPage);
+    }
+
     const handleFilterRequest = async (isReset = false) => {
         const params = isReset ? new URLSearchParams() : new URLSearchParams(new FormData(filterForm));
         params.set('is_filter_request', 'true');
@@ -29,10 +78,14 @@ export function initAdminProductFilter() {
             const result = await response.json();
 
             if (response.ok && result.success) {
+                params.delete('is_filter_request');
+                currentParams = params;
                 const newUrl = `${window.location.pathname}?${params.toString()}`;
                 window.history.pushState({ path: newUrl }, '', newUrl);
 
                 tableBody.innerHTML = result.html;
+                setNextCursor(result.has_more ? result.next_cursor : '');
+                if (totalCount && result.total !== null) totalCount.textContent = `(${result.total})`;
                 initAnimations();
             } else {
                 showNotification('Gagal memfilter produk.', true);
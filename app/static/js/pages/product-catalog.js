@@ -6,6 +6,8 @@ function initProductFiltering() {
     const container = document.getElementById('product-grid-container');
     const resetBtnDesktop = formDesktop ? formDesktop.querySelector('.reset-filter-btn') : null;
     const resetBtnMobile = formMobile ? formMobile.querySelector('.cta-button-secondary') : null;
+    const loadMoreWrapper = document.getElementById('catalog-load-more');
+    const loadMoreBtn = document.getElementById('catalog-load-more-btn');
     const noProductsTemplate = `<p class="no-products-found animated-element is-visible">Tidak ada produk yang cocok dengan pencarian atau filter Anda.</p>`;
 
     if (!container) {
@@ -23,6 +25,56 @@ function initProductFiltering() {
         </div>
     `;
 
+    let currentParams = new URLSearchParams(window.location.search);
+    let nextCursor = container.dataset.nextCursor || '';
+    let isLoadingMore = false;
+
+    const setNextCursor = (cursor) => {
+        nextCursor = cursor || '';
+        container.dataset.nextCursor = nextCursor;
+        if (loadMoreWrapper) {
+            loadMoreWrapper.hidden = !nextCursor;
+        }
+    };
+
+    const loadNextPage = async () => {
+        if (!nextCursor || isLoadingMore) return;
+        isLoadingMore = true;
+        if (loadMoreBtn) loadMoreBtn.disabled = true;
+
+        const params = new URLSearchParams(currentParams);
+        params.set('cursor', nextCursor);
+
+        try {
+            const response = await fetch(`/api/products?${params.toString()}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const data = await response.json();
+            container.insertAdjacentHTML('beforeend', data.html);
+            setNextCursor(data.has_more ? data.next_cursor : '');
+            initAnimations();
+        } catch (error) {
+            console.error('Gagal memuat produk berikutnya:', error);
+        } finally {
+            isLoadingMore = false;
+            if (loadMoreBtn) loadMoreBtn.disabled = false;
+        }
+    };
+
+    if (loadMoreBtn) {
+        loadMoreBtn.addEventListener('click', loadNextPage);
+    }
+
+    if (loadMoreWrapper && 'IntersectionObserver' in window) {
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                loadNextPage();
+            }
+        }, { rootMargin: '400px 0px' });
+        observer.observe(loadMoreWrapper);
+    }
+
     const showLoadingState = () => {
         let skeletons = '';
         for (let i = 0; i < 8; i++) {
@@ -40,6 +92,8 @@ function initProductFiltering() {
         }
         const url = `/api/products?${params.toString()}`;
 
+        currentParams = params;
+        setNextCursor('');
         showLoadingState();
 
         try {
@@ -53,6 +107,7 @@ function initProductFiltering() {
             history.pushState({ path: newUrl }, '', newUrl);
 
             container.innerHTML = data.html.trim() !== '' ? data.html : noProductsTemplate;
+            setNextCursor(data.has_more ? data.next_cursor : '');
 
             initAnimations();
 
@@ -1,42 +1,114 @@
 import csv
+import zlib
 from datetime import datetime
+from decimal import Decimal
 from io import StringIO
-from typing import Any, Iterable, List
+from typing import Any, Iterable, Iterator, List, Optional
 
-from flask import Response
+from flask import Response, current_app, has_app_context
+from flask import has_request_context, stream_with_context
+from mysql.connector.connection import MySQLConnection
 
 from app.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+CSV_FLUSH_BYTES = 64 * 1024
+
+
+def get_export_fetch_size() -> int:
+    if has_app_context():
+        return current_app.config.get("EXPORT_FETCH_SIZE", 1000)
+    return 1000
+
+
+def stream_export_rows(
+    rows: Iterable[Iterable[Any]], conn: Optional[MySQLConnection] = None
+) -> Iterator[List[Any]]:
+    try:
+        for row in rows:
+            yield [
+                float(col) if isinstance(col, Decimal) else col
+                for col in row
+            ]
+    finally:
+        if conn and conn.is_connected():
+            conn.close()
+
+
+def iter_csv(
+    data: Optional[Iterable[Iterable[Any]]],
+    headers: List[str],
+    flush_bytes: int = CSV_FLUSH_BYTES,
+) -> Iterator[str]:
+    buffer = StringIO()
+    csv_writer = csv.writer(buffer)
+    csv_writer.writerow(headers)
+
+    for row in data or ():
+        csv_writer.writerow(row)
+        if buffer.tell() >= flush_bytes:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    remainder = buffer.getvalue()
+    if remainder:
+        yield remainder
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode("utf-8"))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
 
 def generate_csv_response(
-    data: Iterable[Iterable[Any]], headers: List[str], report_name: str
+    data: Optional[Iterable[Iterable[Any]]],
+    headers: List[str],
+    report_name: str,
+    compress: bool = False,
 ) -> Response:
     logger.debug(
-        f"Membuat respons CSV untuk laporan: {report_name}, "
-        f"Headers: {headers}, Baris data: {len(list(data)) if data else 0}"
+        f"Membuat respons CSV streaming untuk laporan: {report_name}, "
+        f"Headers: {headers}, gzip: {compress}"
     )
 
-    si: StringIO = StringIO()
-    csv_writer = csv.writer(si)
-    csv_writer.writerow(headers)
-
-    if data:
-        for row in data:
-            csv_writer.writerow(row)
-
-    output: str = si.getvalue()
     filename: str = (
         f"{report_name}_report_{datetime.now().strftime('%Y%m%d')}.csv"
     )
 
-    logger.info(
-        f"CSV berhasil dibuat untuk {report_name}. Nama file: {filename}"
-    )
+    def generate() -> Iterator[Any]:
+        rows_written = 0
+
+        def counted(rows: Iterable[Iterable[Any]]) -> Iterator[Iterable[Any]]:
+            nonlocal rows_written
+            for row in rows:
+                rows_written += 1
+                yield row
+
+        chunks = iter_csv(counted(data or ()), headers)
+        try:
+            yield from (gzip_stream(chunks) if compress else chunks)
+        finally:
+            close = getattr(data, "close", None)
+            if close is not None:
+                close()
+            logger.info(
+                f"CSV {report_name} selesai dialirkan: {rows_written} baris. "
+                f"Nama file: {filename}"
+            )
+
+    body = generate()
+    if has_request_context():
+        body = stream_with_context(body)
+
+    response_headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    if compress:
+        response_headers["Content-Encoding"] = "gzip"
+        response_headers["Vary"] = "Accept-Encoding"
 
-    return Response(
-        output,
-        mimetype="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
\ No newline at end of file
+    return Response(body, mimetype="text/csv", headers=response_headers)
\ No newline at end of file
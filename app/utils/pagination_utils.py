@@ -0,0 +1,50 @@
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Tipe {type(value).__name__} tidak dapat diserialisasi.")
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not token:
+        return None
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        logger.warning(f"Cursor paginasi tidak valid diabaikan: {e}")
+        return None
+
+    if not isinstance(payload, dict):
+        logger.warning("Cursor paginasi bukan objek, diabaikan.")
+        return None
+    return payload
+
+
+def parse_page_size(
+    value: Optional[str], default: int, maximum: int = 100
+) -> int:
+    try:
+        size = int(value) if value else default
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, maximum))
@@ -0,0 +1,71 @@
+import re
+import unicodedata
+from typing import FrozenSet, List, Optional
+
+from app.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+MIN_TOKEN_LENGTH: int = 3
+MAX_QUERY_TOKENS: int = 8
+
+INDONESIAN_STOPWORDS: FrozenSet[str] = frozenset({
+    "ada", "adalah", "agar", "akan", "aku", "anda", "atau", "bagi",
+    "bahwa", "bisa", "buat", "dan", "dari", "dengan", "dia", "hanya",
+    "ini", "itu", "juga", "kami", "kamu", "karena", "ke", "kita", "lagi",
+    "lebih", "maka", "mau", "namun", "oleh", "pada", "para",
+    "saja", "sama", "sangat", "saya", "seperti", "serta", "sudah",
+    "tanpa", "tapi", "telah", "tentang", "untuk", "yang",
+})
+
+INNODB_STOPWORDS: FrozenSet[str] = frozenset({
+    "about", "are", "com", "for", "from", "how", "that", "the", "this",
+    "was", "what", "when", "where", "who", "will", "with", "und", "www",
+})
+
+_CLITIC_SUFFIXES = ("nya", "lah", "kah", "pun")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _strip_accents(text: str) -> str:
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
+def _strip_clitic(token: str) -> str:
+    for suffix in _CLITIC_SUFFIXES:
+        if (
+            token.endswith(suffix)
+            and len(token) - len(suffix) >= MIN_TOKEN_LENGTH + 1
+        ):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize_search(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+
+    raw_tokens = _TOKEN_PATTERN.findall(_strip_accents(text).lower())
+    tokens: List[str] = []
+    for raw in raw_tokens:
+        token = _strip_clitic(raw)
+        if (
+            len(token) < MIN_TOKEN_LENGTH
+            or token in INDONESIAN_STOPWORDS
+            or token in INNODB_STOPWORDS
+            or token in tokens
+        ):
+            continue
+        tokens.append(token)
+    return tokens[:MAX_QUERY_TOKENS]
+
+
+def build_fulltext_query(text: Optional[str]) -> Optional[str]:
+    tokens = tokenize_search(text)
+    if not tokens:
+        return None
+
+    query = " ".join(f"+{token}*" for token in tokens)
+    logger.debug(f"Kueri full-text untuk '{text}': {query}")
+    return query
@@ -0,0 +1,5 @@
+from typing import Optional
+
+
+def normalize_voucher_code(code: Optional[str]) -> str:
+    return (code or "").strip().upper()
@@ -0,0 +1,232 @@
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from app.repository.report_repository import ReportRepository
+from app.repository.sales_rollup_repository import SalesRollupRepository
+from seed_test import execute_sql_script
+
+load_dotenv()
+
+MYSQL_HOST = os.environ.get("MYSQL_HOST")
+MYSQL_USER = os.environ.get("MYSQL_USER")
+MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD")
+MYSQL_PORT = os.environ.get("MYSQL_PORT")
+
+BENCH_DB_NAME = "ecommerce_db_bench"
+BATCH_SIZE = 5000
+
+LEGACY_SOLD_SUBQUERY = """
+    (
+        SELECT COALESCE(SUM(oi.quantity), 0)
+        FROM order_items oi
+        JOIN orders o ON oi.order_id = o.id
+        WHERE oi.product_id = p.id
+        AND o.status != 'Dibatalkan'
+        AND o.order_date >= %s
+    )
+"""
+
+LEGACY_QUERIES = {
+    "inventory_slow_moving": f"""
+        SELECT p.name, p.stock, {LEGACY_SOLD_SUBQUERY} AS total_sold
+        FROM products p
+        GROUP BY p.id
+        ORDER BY total_sold ASC, p.stock DESC
+        LIMIT 10
+    """,
+    "inventory_slow_moving_export": f"""
+        SELECT p.name, p.stock, {LEGACY_SOLD_SUBQUERY} AS total_sold
+        FROM products p
+        GROUP BY p.id
+        ORDER BY total_sold ASC, p.stock DESC
+        LIMIT 20
+    """,
+    "products_export": f"""
+        SELECT
+            p.id, p.name, c.name AS category_name, p.sku, p.price,
+            p.discount_price, p.stock, {LEGACY_SOLD_SUBQUERY} AS total_sold,
+            p.popularity
+        FROM products p
+        LEFT JOIN categories c ON p.category_id = c.id
+        GROUP BY p.id
+        ORDER BY total_sold DESC
+    """,
+}
+
+
+def insert_batches(cursor, query, rows):
+    for i in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(query, rows[i:i + BATCH_SIZE])
+
+
+def build_dataset(connection, products, orders, items_per_order):
+    rng = random.Random(42)
+    cursor = connection.cursor()
+    now = datetime.now()
+
+    print(f"Membuat {products} produk, {orders} pesanan...")
+    cursor.execute("INSERT INTO categories (name) VALUES ('Benchmark')")
+    category_id = cursor.lastrowid
+    insert_batches(
+        cursor,
+        "INSERT INTO products (name, price, description, category_id, "
+        "stock, sku, popularity) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        [
+            (f"Produk {i}", 100000, "-", category_id,
+             rng.randint(0, 500), f"BENCH-{i}", rng.randint(0, 1000))
+            for i in range(1, products + 1)
+        ],
+    )
+
+    statuses = ["Selesai"] * 6 + ["Dikirim", "Diproses", "Dibatalkan"]
+    insert_batches(
+        cursor,
+        "INSERT INTO orders (order_date, subtotal, total_amount, status) "
+        "VALUES (%s, %s, %s, %s)",
+        [
+            (now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+             100000, 100000, rng.choice(statuses))
+            for _ in range(orders)
+        ],
+    )
+
+    print(f"Membuat {orders * items_per_order} item pesanan...")
+    insert_batches(
+        cursor,
+        "INSERT INTO order_items (order_id, product_id, quantity, price) "
+        "VALUES (%s, %s, %s, %s)",
+        [
+            (order_id, rng.randint(1, products), rng.randint(1, 5), 100000)
+            for order_id in range(1, orders + 1)
+            for _ in range(items_per_order)
+        ],
+    )
+
+    print("Membangun rollup penjualan harian...")
+    SalesRollupRepository().rebuild_range(connection, None, None)
+    connection.commit()
+    cursor.close()
+
+
+def time_call(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def run_legacy(connection, name, start_date):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(LEGACY_QUERIES[name], (start_date,))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def run_current(connection, repository, name, start_date):
+    if name == "inventory_slow_moving":
+        return [
+            tuple(row.values())
+            for row in repository.get_inventory_slow_moving(
+                connection, start_date, None
+            )
+        ]
+    if name == "inventory_slow_moving_export":
+        return list(repository.get_inventory_slow_moving_for_export(
+            connection, start_date, None
+        ))
+    return list(repository.get_full_products_data_for_export(
+        connection, start_date, None
+    ))
+
+
+def sold_by_product(rows, name_index, sold_index):
+    return {row[name_index]: int(row[sold_index]) for row in rows}
+
+
+def run_benchmark(args):
+    connection = None
+    try:
+        connection = mysql.connector.connect(
+            host=MYSQL_HOST,
+            user=MYSQL_USER,
+            password=MYSQL_PASSWORD,
+            port=MYSQL_PORT,
+        )
+        cursor = connection.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS {BENCH_DB_NAME}")
+        cursor.execute(f"CREATE DATABASE {BENCH_DB_NAME}")
+        cursor.execute(f"USE {BENCH_DB_NAME}")
+
+        schema_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "database", "seed", "schema.sql",
+        )
+        with open(schema_file, "r") as f:
+            execute_sql_script(cursor, f.read())
+        cursor.close()
+
+        build_dataset(
+            connection, args.products, args.orders, args.items_per_order
+        )
+
+        repository = ReportRepository()
+        start_date = (
+            datetime.now() - timedelta(days=180)
+        ).strftime("%Y-%m-%d")
+
+        print(f"\n{'Laporan':<30}{'Lama (s)':>12}{'Baru (s)':>12}"
+              f"{'Percepatan':>12}")
+        for name in LEGACY_QUERIES:
+            legacy_time, legacy_rows = time_call(
+                lambda: run_legacy(connection, name, start_date), args.repeat
+            )
+            current_time, current_rows = time_call(
+                lambda: run_current(connection, repository, name, start_date),
+                args.repeat,
+            )
+
+            if name == "products_export":
+                if sold_by_product(legacy_rows, 0, 7) != sold_by_product(
+                    current_rows, 0, 7
+                ):
+                    raise AssertionError(
+                        "Hasil ekspor produk berbeda antara kueri lama "
+                        "dan baru."
+                    )
+
+            speedup = legacy_time / current_time if current_time else 0
+            print(f"{name:<30}{legacy_time:>12.3f}{current_time:>12.3f}"
+                  f"{speedup:>11.1f}x")
+
+    finally:
+        if connection and connection.is_connected():
+            if not args.keep:
+                cursor = connection.cursor()
+                cursor.execute(f"DROP DATABASE IF EXISTS {BENCH_DB_NAME}")
+                cursor.close()
+            connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark laporan produk lambat terjual dan ekspor produk."
+        )
+    )
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--items-per-order", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", action="store_true")
+    run_benchmark(parser.parse_args())
@@ -0,0 +1,7 @@
+CREATE INDEX idx_orders_status_date ON orders (status, order_date);
+CREATE INDEX idx_orders_user_status ON orders (user_id, status, order_date);
+CREATE INDEX idx_orders_payment_transaction ON orders (payment_transaction_id);
+CREATE INDEX idx_order_items_product ON order_items (product_id, order_id);
+CREATE INDEX idx_reviews_product_created ON reviews (product_id, created_at);
+CREATE INDEX idx_products_category_popularity ON products (category_id, popularity);
+CREATE INDEX idx_stock_holds_product_variant ON stock_holds (product_id, variant_id, expires_at);
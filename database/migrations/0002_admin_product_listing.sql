@@ -0,0 +1 @@
+CREATE INDEX idx_products_stock ON products (stock, id);
@@ -0,0 +1,2 @@
+UPDATE vouchers SET code = UPPER(TRIM(code))
+WHERE BINARY code <> BINARY UPPER(TRIM(code));
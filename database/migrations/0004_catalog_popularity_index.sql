@@ -0,0 +1 @@
+CREATE INDEX idx_products_popularity ON products (popularity, id);
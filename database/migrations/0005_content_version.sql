@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS content_version (
+    id TINYINT PRIMARY KEY,
+    version INT UNSIGNED NOT NULL DEFAULT 0
+);
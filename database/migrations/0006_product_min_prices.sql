@@ -0,0 +1,3 @@
+ALTER TABLE products ADD COLUMN min_price DECIMAL(10, 2);
+ALTER TABLE products ADD COLUMN min_effective_price DECIMAL(10, 2);
+CREATE INDEX idx_products_min_effective_price ON products (min_effective_price, id);
@@ -0,0 +1,7 @@
+from mysql.connector.connection import MySQLConnection
+
+from app.repository.product_repository import product_repository
+
+
+def upgrade(conn: MySQLConnection) -> None:
+    product_repository.refresh_min_prices(conn)
@@ -0,0 +1 @@
+ALTER TABLE products ADD FULLTEXT KEY ft_products_search (name, description, colors);
@@ -0,0 +1,31 @@
+CREATE TABLE IF NOT EXISTS daily_sales (
+    sale_date DATE PRIMARY KEY,
+    order_count INT NOT NULL DEFAULT 0,
+    cancelled_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    subtotal_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    discount_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    shipping_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    items_sold INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS daily_product_sales (
+    sale_date DATE NOT NULL,
+    product_id INT NOT NULL,
+    units_sold INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (sale_date, product_id),
+    KEY idx_daily_product_sales_product (product_id, sale_date),
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS daily_voucher_usage (
+    sale_date DATE NOT NULL,
+    voucher_code VARCHAR(50) NOT NULL,
+    usage_count INT NOT NULL DEFAULT 0,
+    discount_total DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (sale_date, voucher_code)
+);
+
+CREATE INDEX idx_orders_order_date ON orders (order_date);
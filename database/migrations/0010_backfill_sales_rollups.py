@@ -0,0 +1,7 @@
+from mysql.connector.connection import MySQLConnection
+
+from app.services.reports.sales_rollup_service import sales_rollup_service
+
+
+def upgrade(conn: MySQLConnection) -> None:
+    sales_rollup_service.rebuild(conn)
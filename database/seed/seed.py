@@ -67,6 +67,12 @@ def seed_database():
             sql_script = f.read()
         execute_sql_script(cursor, sql_script)
 
+        sys.path.insert(0, project_root)
+        from app.core.migrations import migration_runner
+
+        for migration in migration_runner.migrate(connection):
+            print(f"Migrasi {migration.version}_{migration.name} diterapkan.")
+
         with open(data_file, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -174,6 +180,11 @@ def seed_database():
                 variants_data,
             )
 
+        if "products" in data:
+            from app.repository.product_repository import product_repository
+
+            product_repository.refresh_min_prices(connection)
+
         if "orders" in data:
             orders_data = [
                 (
@@ -242,6 +253,13 @@ def seed_database():
                 order_items_data,
             )
 
+        if "orders" in data:
+            from app.repository.sales_rollup_repository import (
+                sales_rollup_repository
+            )
+
+            sales_rollup_repository.rebuild_range(connection, None, None)
+
         if "reviews" in data:
             reviews_data = [
                 (
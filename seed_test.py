@@ -2,6 +2,8 @@ import os
 import mysql.connector
 from dotenv import load_dotenv
 
+from app.core.migrations import migration_runner
+
 load_dotenv()
 
 MYSQL_HOST = os.environ.get("MYSQL_HOST")
@@ -57,6 +59,9 @@ def seed_test_database():
         
         execute_sql_script(cursor, sql_script)
         print("Skema tabel berhasil dibuat untuk database TES.")
+
+        for migration in migration_runner.migrate(connection):
+            print(f"Migrasi {migration.version}_{migration.name} diterapkan.")
         
         print("\nSetup database TES selesai.")
 
@@ -1,7 +1,8 @@
 import unittest
 import os
+import mysql.connector
 from app import create_app
-from app.core.db import get_db_connection
+from app.core.db import get_pool
 from unittest.mock import patch, MagicMock
 
 class BaseTestCase(unittest.TestCase):
@@ -17,7 +18,7 @@ class BaseTestCase(unittest.TestCase):
         self.app_context = self.app.app_context()
         self.app_context.push()
         self.client = self.app.test_client()
-        self.db_conn = get_db_connection()
+        self.db_conn = mysql.connector.connect(**get_pool().connect_args)
         self.cursor = self.db_conn.cursor(dictionary=True)
         self.mock_get_db = patch('app.core.db.get_db_connection').start()
         self.mock_get_db.return_value = self.db_conn
@@ -41,12 +42,15 @@ class BaseTestCase(unittest.TestCase):
         self.patch_service_db_calls('app.services.products.product_query_service.get_db_connection')
         self.patch_service_db_calls('app.services.products.product_service.get_db_connection')
         self.patch_service_db_calls('app.services.products.review_service.get_db_connection')
+        self.patch_service_db_calls('app.services.products.top_products_service.get_db_connection')
+        self.patch_service_db_calls('app.services.products.view_counter_service.get_db_connection')
         self.patch_service_db_calls('app.services.products.variant_service.get_db_connection')
         self.patch_service_db_calls('app.services.reports.customer_report_service.get_db_connection')
         self.patch_service_db_calls('app.services.reports.dashboard_report_service.get_db_connection')
         self.patch_service_db_calls('app.services.reports.inventory_report_service.get_db_connection')
         self.patch_service_db_calls('app.services.reports.product_report_service.get_db_connection')
         self.patch_service_db_calls('app.services.reports.sales_report_service.get_db_connection')
+        self.patch_service_db_calls('app.services.reports.sales_rollup_service.get_db_connection')
         self.patch_service_db_calls('app.services.users.user_profile_service.get_db_connection')
         self.patch_service_db_calls('app.services.users.user_service.get_db_connection')
         self.patch_service_db_calls('app.services.utils.scheduler_service.get_db_connection')
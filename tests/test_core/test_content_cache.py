@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock, patch
+
+import mysql.connector
+
+from app.core.content_cache import SiteContentCache
+from app.core.db import get_content, get_content_cache
+from tests.base_test_case import BaseTestCase
+
+
+class TestSiteContentCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cursor = MagicMock()
+        self.version_row = {"version": 3}
+        self.cursor.fetchone.side_effect = lambda: self.version_row
+        self.cursor.fetchall.return_value = [
+            {"key": "app_name", "value": "Toko"},
+            {"key": "tagline", "value": "Gaya"},
+        ]
+        self.cache = SiteContentCache(ttl=60)
+
+    def _executed(self):
+        return [c.args[0] for c in self.cursor.execute.call_args_list]
+
+    def test_first_get_loads_snapshot(self):
+        content = self.cache.get(self.cursor)
+
+        self.assertEqual(content, {"app_name": "Toko", "tagline": "Gaya"})
+        self.assertEqual(self.cache.version, 3)
+        self.assertEqual(self.cache.reload_count, 1)
+
+    def test_get_within_ttl_skips_database(self):
+        self.cache.get(self.cursor)
+        self.cursor.execute.reset_mock()
+
+        self.cache.get(self.cursor)
+
+        self.cursor.execute.assert_not_called()
+
+    def test_returned_dict_is_a_copy(self):
+        content = self.cache.get(self.cursor)
+        content["app_name"] = "Diubah"
+
+        self.assertEqual(self.cache.get(self.cursor)["app_name"], "Toko")
+
+    @patch("app.core.content_cache.time.monotonic")
+    def test_expired_ttl_with_same_version_only_checks_version(
+        self, mock_monotonic
+    ):
+        mock_monotonic.return_value = 100.0
+        self.cache.get(self.cursor)
+        self.cursor.execute.reset_mock()
+
+        mock_monotonic.return_value = 200.0
+        content = self.cache.get(self.cursor)
+
+        self.assertEqual(
+            self._executed(),
+            ["SELECT version FROM content_version WHERE id = 1"],
+        )
+        self.assertEqual(content["app_name"], "Toko")
+        self.assertEqual(self.cache.reload_count, 1)
+
+    @patch("app.core.content_cache.time.monotonic")
+    def test_expired_ttl_with_new_version_reloads(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        self.cache.get(self.cursor)
+
+        self.version_row = {"version": 4}
+        self.cursor.fetchall.return_value = [
+            {"key": "app_name", "value": "Toko Baru"}
+        ]
+        mock_monotonic.return_value = 200.0
+        content = self.cache.get(self.cursor)
+
+        self.assertEqual(content, {"app_name": "Toko Baru"})
+        self.assertEqual(self.cache.version, 4)
+        self.assertEqual(self.cache.reload_count, 2)
+
+    def test_invalidate_forces_reload(self):
+        self.cache.get(self.cursor)
+
+        self.cache.invalidate()
+        self.cache.get(self.cursor)
+
+        self.assertEqual(self.cache.reload_count, 2)
+
+    def test_missing_version_row_keeps_snapshot(self):
+        self.version_row = None
+        cache = SiteContentCache(ttl=0)
+
+        cache.get(self.cursor)
+        cache.get(self.cursor)
+
+        self.assertIsNone(cache.version)
+        self.assertEqual(cache.reload_count, 1)
+
+    def test_version_read_error_falls_back_to_full_reload(self):
+        cache = SiteContentCache(ttl=0)
+
+        def execute(sql, *args):
+            if "content_version" in sql:
+                raise mysql.connector.Error("Table doesn't exist")
+
+        self.cursor.execute.side_effect = execute
+
+        cache.get(self.cursor)
+        cache.get(self.cursor)
+
+        self.assertEqual(cache.reload_count, 2)
+
+    def test_bump_version_upserts_version_row(self):
+        self.cache.bump_version(self.cursor)
+
+        sql = self.cursor.execute.call_args[0][0]
+        self.assertIn("INSERT INTO content_version", sql)
+        self.assertIn("ON DUPLICATE KEY UPDATE version = version + 1", sql)
+
+    def test_get_content_uses_app_cache(self):
+        cache = get_content_cache()
+
+        self.assertIs(self.app.extensions["content_cache"], cache)
+        with patch.object(
+            cache, "get", return_value={"app_name": "Toko"}
+        ) as mock_get:
+            self.assertEqual(get_content(), {"app_name": "Toko"})
+        mock_get.assert_called_once()
@@ -0,0 +1,141 @@
+from unittest.mock import MagicMock, patch
+
+from app.core.db_pool import ConnectionPool, PooledConnection
+from app.exceptions.database_exceptions import DatabaseConnectionError
+from tests.base_test_case import BaseTestCase
+
+
+class TestConnectionPool(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_connector = MagicMock(side_effect=self._new_raw_conn)
+        self.pool = ConnectionPool(
+            connect_args={"host": "localhost"},
+            pool_size=2,
+            max_overflow=1,
+            timeout=0.05,
+            recycle=3600,
+            pre_ping=True,
+            connector=self.mock_connector,
+        )
+
+    def _new_raw_conn(self, **kwargs):
+        raw_conn = MagicMock()
+        raw_conn.is_connected.return_value = True
+        raw_conn.in_transaction = False
+        return raw_conn
+
+    def test_acquire_creates_connection(self):
+        conn = self.pool.acquire()
+
+        self.assertIsInstance(conn, PooledConnection)
+        self.mock_connector.assert_called_once_with(host="localhost")
+        self.assertEqual(self.pool.get_stats()["checked_out"], 1)
+
+    def test_close_returns_connection_to_pool(self):
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+
+        conn.close()
+        self.assertFalse(conn.is_connected())
+        raw_conn.close.assert_not_called()
+
+        reused = self.pool.acquire()
+        self.assertIs(reused._conn, raw_conn)
+        self.assertEqual(self.mock_connector.call_count, 1)
+
+    def test_close_is_idempotent(self):
+        conn = self.pool.acquire()
+        conn.close()
+        conn.close()
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["checked_out"], 0)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_release_rolls_back_open_transaction(self):
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+        raw_conn.in_transaction = True
+
+        conn.close()
+
+        raw_conn.rollback.assert_called_once()
+
+    def test_release_discards_connection_when_rollback_fails(self):
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+        raw_conn.in_transaction = True
+        raw_conn.rollback.side_effect = Exception("Broken pipe")
+
+        conn.close()
+
+        raw_conn.close.assert_called_once()
+        self.assertEqual(self.pool.get_stats()["idle"], 0)
+
+    def test_overflow_connection_closed_on_release(self):
+        conns = [self.pool.acquire() for _ in range(3)]
+        raw_overflow = conns[2]._conn
+        self.assertEqual(self.pool.get_stats()["overflow_in_use"], 1)
+
+        for conn in conns:
+            conn.close()
+
+        raw_overflow.close.assert_called_once()
+        self.assertEqual(self.pool.get_stats()["idle"], 2)
+
+    def test_acquire_times_out_when_exhausted(self):
+        conns = [self.pool.acquire() for _ in range(3)]
+
+        with self.assertRaises(DatabaseConnectionError):
+            self.pool.acquire()
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["exhausted_count"], 1)
+        self.assertEqual(stats["timeout_count"], 1)
+        for conn in conns:
+            conn.close()
+
+    def test_acquire_replaces_dead_connection(self):
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+        conn.close()
+        raw_conn.is_connected.return_value = False
+
+        fresh = self.pool.acquire()
+
+        self.assertIsNot(fresh._conn, raw_conn)
+        self.assertEqual(self.pool.get_stats()["ping_failure_count"], 1)
+
+    @patch("app.core.db_pool.time")
+    def test_acquire_recycles_stale_connection(self, mock_time):
+        mock_time.monotonic.return_value = 1000.0
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+        conn.close()
+
+        mock_time.monotonic.return_value = 1000.0 + 3601
+        fresh = self.pool.acquire()
+
+        self.assertIsNot(fresh._conn, raw_conn)
+        raw_conn.close.assert_called_once()
+        self.assertEqual(self.pool.get_stats()["recycled_count"], 1)
+
+    def test_failed_create_frees_slot(self):
+        self.mock_connector.side_effect = DatabaseConnectionError("down")
+
+        with self.assertRaises(DatabaseConnectionError):
+            self.pool.acquire()
+
+        self.assertEqual(self.pool.get_stats()["checked_out"], 0)
+
+    def test_dispose_closes_idle_connections(self):
+        conn = self.pool.acquire()
+        raw_conn = conn._conn
+        conn.close()
+
+        self.pool.dispose()
+
+        raw_conn.close.assert_called_once()
+        self.assertEqual(self.pool.get_stats()["idle"], 0)
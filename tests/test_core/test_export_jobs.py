@@ -0,0 +1,147 @@
+import gzip
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from app.core.export_jobs import ExportJobManager, get_export_job_manager
+from tests.base_test_case import BaseTestCase
+
+
+class TestExportJobManager(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.export_dir = tempfile.mkdtemp()
+        self.manager = ExportJobManager(self.export_dir, max_workers=2)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        shutil.rmtree(self.export_dir, ignore_errors=True)
+        super().tearDown()
+
+    def _wait(self, job, timeout=2):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            saved = self.manager._load(job.id)
+            if saved is not None and saved.finished_at is not None:
+                break
+            time.sleep(0.01)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_job_writes_csv_and_counts_rows(self):
+        job, created = self.manager.submit(
+            "sales", "2025-01-01", "2025-01-31", ["id", "total"],
+            lambda: iter([[1, 10.5], [2, 20.0]]),
+        )
+        self._wait(job)
+
+        self.assertTrue(created)
+        self.assertEqual(job.status, "done")
+        self.assertEqual(job.rows_processed, 2)
+        with open(job.path, encoding="utf-8", newline="") as f:
+            self.assertEqual(f.read(), "id,total\r\n1,10.5\r\n2,20.0\r\n")
+        self.assertFalse(os.path.exists(f"{job.path}.part"))
+
+    def test_compressed_job_writes_gzip(self):
+        job, _ = self.manager.submit(
+            "vouchers", None, None, ["kode"], lambda: [["HEMAT"]],
+            compress=True,
+        )
+        self._wait(job)
+
+        self.assertTrue(job.path.endswith(".csv.gz"))
+        self.assertTrue(job.filename.endswith(".csv.gz"))
+        with open(job.path, "rb") as f:
+            self.assertEqual(gzip.decompress(f.read()), b"kode\r\nHEMAT\r\n")
+
+    def test_identical_exports_are_deduplicated_while_running(self):
+        release = threading.Event()
+
+        def slow_rows():
+            release.wait(2)
+            yield [1]
+
+        try:
+            first, first_created = self.manager.submit(
+                "sales", "2025-01-01", "", ["id"], slow_rows
+            )
+            second, second_created = self.manager.submit(
+                "sales", "2025-01-01", None, ["id"], slow_rows
+            )
+            other, other_created = self.manager.submit(
+                "sales", "2025-02-01", None, ["id"], slow_rows
+            )
+        finally:
+            release.set()
+
+        self.assertIs(first, second)
+        self.assertTrue(first_created)
+        self.assertFalse(second_created)
+        self.assertTrue(other_created)
+        self.assertEqual(self.manager.deduplicated, 1)
+
+        self._wait(first)
+        third, third_created = self.manager.submit(
+            "sales", "2025-01-01", None, ["id"], lambda: []
+        )
+        self.assertTrue(third_created)
+        self.assertIsNot(third, first)
+
+    def test_failed_job_records_error_and_closes_rows(self):
+        closed = []
+
+        def broken_rows():
+            try:
+                yield [1]
+                raise RuntimeError("boom")
+            finally:
+                closed.append(True)
+
+        job, _ = self.manager.submit("sales", None, None, ["id"], broken_rows)
+        self._wait(job)
+
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, "Gagal mengekspor laporan.")
+        self.assertIsNone(job.path)
+        self.assertEqual(closed, [True])
+        self.assertEqual(os.listdir(self.export_dir), [f"{job.id}.json"])
+
+    def test_purge_expired_removes_finished_jobs_and_files(self):
+        job, _ = self.manager.submit("sales", None, None, ["id"], lambda: [])
+        self._wait(job)
+        job.finished_at -= self.manager.retention + 1
+        self.manager._save(job)
+
+        self.assertEqual(self.manager.purge_expired(), 1)
+        self.assertIsNone(self.manager.get(job.id))
+        self.assertEqual(os.listdir(self.export_dir), [])
+
+    def test_job_is_visible_to_another_manager(self):
+        job, _ = self.manager.submit(
+            "sales", None, None, ["id"], lambda: [[1]]
+        )
+        self._wait(job)
+        other = ExportJobManager(self.export_dir, max_workers=1)
+        self.addCleanup(other.shutdown)
+
+        loaded = other.get(job.id)
+
+        self.assertIsNot(loaded, job)
+        self.assertEqual(loaded.to_dict(), job.to_dict())
+        self.assertEqual(loaded.path, job.path)
+        self.assertIsNone(other.get("../../etc/passwd"))
+        self.assertIsNone(other.get("0" * 32))
+
+    def test_get_export_job_manager_uses_app_config(self):
+        self.app.config["EXPORT_JOB_DIR"] = self.export_dir
+        self.app.config["EXPORT_JOB_WORKERS"] = 3
+        self.app.extensions.pop("export_jobs", None)
+
+        manager = get_export_job_manager()
+
+        self.assertIs(self.app.extensions["export_jobs"], manager)
+        self.assertEqual(manager.export_dir, self.export_dir)
+        self.assertEqual(manager.max_workers, 3)
+        manager.shutdown()
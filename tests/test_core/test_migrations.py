@@ -0,0 +1,205 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import mysql.connector
+
+from app.core.migrations import (
+    MIGRATIONS_DIR, MigrationRunner, discover_migrations
+)
+from app.exceptions.database_exceptions import MigrationError
+from tests.base_test_case import BaseTestCase
+
+
+class TestMigrationRunner(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self._write("0002_second.sql", "CREATE INDEX b ON t (b);")
+        self._write(
+            "0001_first.sql",
+            "CREATE INDEX a ON t (a);\nCREATE INDEX c ON t (c);",
+        )
+        self._write("README.md", "bukan migrasi")
+        self.runner = MigrationRunner(self.directory)
+
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+        self.cursor.fetchall.return_value = []
+        self.conn.cursor.return_value = self.cursor
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        super().tearDown()
+
+    def _write(self, filename, sql):
+        with open(os.path.join(self.directory, filename), "w") as f:
+            f.write(sql)
+
+    def _executed(self):
+        return [c.args[0] for c in self.cursor.execute.call_args_list]
+
+    def test_discover_orders_by_version(self):
+        migrations = discover_migrations(self.directory)
+
+        self.assertEqual([m.version for m in migrations], [1, 2])
+        self.assertEqual(migrations[0].name, "first")
+        self.assertEqual(len(migrations[0].statements), 2)
+
+    def test_duplicate_versions_are_rejected(self):
+        self._write("0001_again.sql", "SELECT 1;")
+
+        with self.assertRaises(MigrationError):
+            discover_migrations(self.directory)
+
+    def test_migrate_applies_pending_in_order_and_records_them(self):
+        applied = self.runner.migrate(self.conn)
+
+        self.assertEqual([m.version for m in applied], [1, 2])
+        executed = self._executed()
+        self.assertIn(
+            "CREATE TABLE IF NOT EXISTS schema_migrations", executed[0]
+        )
+        self.assertEqual(executed[2:4], [
+            "CREATE INDEX a ON t (a)", "CREATE INDEX c ON t (c)"
+        ])
+        inserts = [
+            c.args[1] for c in self.cursor.execute.call_args_list
+            if c.args[0].startswith("INSERT INTO schema_migrations")
+        ]
+        self.assertEqual([params[0] for params in inserts], [1, 2])
+        self.assertEqual(self.conn.commit.call_count, 2)
+
+    def test_applied_migrations_are_skipped_and_target_respected(self):
+        first = discover_migrations(self.directory)[0]
+        self.cursor.fetchall.return_value = [
+            {"version": 1, "checksum": first.checksum}
+        ]
+
+        self.assertEqual(self.runner.pending(self.conn, target=1), [])
+        self.assertEqual(
+            [m.version for m in self.runner.pending(self.conn)], [2]
+        )
+
+    def test_changed_applied_migration_is_rejected(self):
+        self.cursor.fetchall.return_value = [
+            {"version": 1, "checksum": "0" * 64}
+        ]
+
+        with self.assertRaises(MigrationError):
+            self.runner.migrate(self.conn)
+
+    def test_existing_index_is_tolerated(self):
+        def execute(query, params=None):
+            if query == "CREATE INDEX a ON t (a)":
+                raise mysql.connector.Error(
+                    msg="Duplicate key name 'a'", errno=1061
+                )
+
+        self.cursor.execute.side_effect = execute
+
+        applied = self.runner.migrate(self.conn, target=1)
+
+        self.assertEqual([m.version for m in applied], [1])
+        self.conn.commit.assert_called_once()
+
+    def test_existing_column_and_table_are_tolerated(self):
+        self._write("0003_columns.sql", "ALTER TABLE t ADD COLUMN d INT;")
+
+        def execute(query, params=None):
+            if query.startswith("ALTER TABLE"):
+                raise mysql.connector.Error(
+                    msg="Duplicate column name 'd'", errno=1060
+                )
+
+        self.cursor.execute.side_effect = execute
+
+        applied = self.runner.migrate(self.conn)
+
+        self.assertEqual([m.version for m in applied], [1, 2, 3])
+
+    def test_python_migration_runs_upgrade(self):
+        self._write(
+            "0003_backfill.py",
+            "def upgrade(conn):\n"
+            "    conn.cursor().execute('UPDATE t SET d = 1')\n",
+        )
+
+        applied = self.runner.migrate(self.conn)
+
+        self.assertEqual([m.version for m in applied], [1, 2, 3])
+        self.assertIn("UPDATE t SET d = 1", self._executed())
+        self.assertEqual(self.conn.commit.call_count, 3)
+
+    def test_python_migration_without_upgrade_is_rejected(self):
+        self._write("0003_broken.py", "VALUE = 1\n")
+
+        with self.assertRaises(MigrationError):
+            self.runner.migrate(self.conn)
+
+        self.conn.rollback.assert_called_once()
+
+    def test_failed_statement_rolls_back_and_stops(self):
+        def execute(query, params=None):
+            if query == "CREATE INDEX c ON t (c)":
+                raise mysql.connector.Error(msg="boom", errno=1064)
+
+        self.cursor.execute.side_effect = execute
+
+        with self.assertRaises(MigrationError):
+            self.runner.migrate(self.conn)
+
+        self.conn.rollback.assert_called_once()
+        self.conn.commit.assert_not_called()
+        self.assertNotIn("CREATE INDEX b ON t (b)", self._executed())
+
+    def test_shipped_migrations_create_hot_path_indexes(self):
+        migrations = discover_migrations(MIGRATIONS_DIR)
+
+        self.assertEqual(migrations[0].version, 1)
+        sql = migrations[0].sql
+        for index in (
+            "idx_orders_status_date",
+            "idx_orders_user_status",
+            "idx_orders_payment_transaction",
+            "idx_order_items_product",
+            "idx_reviews_product_created",
+            "idx_products_category_popularity",
+            "idx_stock_holds_product_variant",
+        ):
+            self.assertIn(index, sql)
+        self.assertIn("idx_products_stock", migrations[1].sql)
+        shipped = " ".join(m.sql for m in migrations)
+        for name in (
+            "idx_products_popularity", "content_version", "min_price",
+            "idx_products_min_effective_price", "ft_products_search",
+            "daily_sales", "daily_product_sales", "daily_voucher_usage",
+            "idx_orders_order_date",
+        ):
+            self.assertIn(name, shipped)
+
+    @patch("app.repository.product_repository.product_repository")
+    def test_min_price_backfill_migration_refreshes_products(self, mock_repo):
+        migration = next(
+            m for m in discover_migrations(MIGRATIONS_DIR)
+            if m.name == "backfill_min_prices"
+        )
+
+        migration.load_module().upgrade(self.conn)
+
+        mock_repo.refresh_min_prices.assert_called_once_with(self.conn)
+
+    @patch(
+        "app.services.reports.sales_rollup_service.sales_rollup_service"
+    )
+    def test_rollup_backfill_migration_rebuilds_rollups(self, mock_service):
+        migration = next(
+            m for m in discover_migrations(MIGRATIONS_DIR)
+            if m.name == "backfill_sales_rollups"
+        )
+
+        migration.load_module().upgrade(self.conn)
+
+        mock_service.rebuild.assert_called_once_with(self.conn)
@@ -0,0 +1,60 @@
+import threading
+from unittest.mock import MagicMock
+
+from flask import current_app
+
+from app.core.periodic import PeriodicTask
+from tests.base_test_case import BaseTestCase
+
+
+class TestPeriodicTask(BaseTestCase):
+
+    def test_run_once_returns_result(self):
+        func = MagicMock(return_value=5)
+        task = PeriodicTask("job", 60, func)
+
+        self.assertEqual(task.run_once(), 5)
+        self.assertEqual(task.run_count, 1)
+
+    def test_run_once_pushes_app_context(self):
+        seen = {}
+
+        def func():
+            seen["app"] = current_app._get_current_object()
+
+        task = PeriodicTask("job", 60, func, self.app)
+        thread = threading.Thread(target=task.run_once)
+        thread.start()
+        thread.join()
+
+        self.assertIs(seen["app"], self.app)
+
+    def test_run_once_swallows_errors(self):
+        task = PeriodicTask("job", 60, MagicMock(side_effect=Exception("x")))
+
+        self.assertIsNone(task.run_once())
+        self.assertEqual(task.failure_count, 1)
+
+    def test_start_runs_until_stopped(self):
+        ran = threading.Event()
+        task = PeriodicTask("job", 0.01, ran.set)
+
+        task.start()
+        self.assertTrue(task.is_running)
+        self.assertTrue(ran.wait(1))
+        task.stop()
+
+        self.assertFalse(task.is_running)
+        self.assertGreaterEqual(task.run_count, 1)
+
+    def test_trigger_runs_before_interval_elapses(self):
+        ran = threading.Event()
+        task = PeriodicTask("job", 60, ran.set)
+
+        task.start()
+        task.trigger()
+        self.assertTrue(ran.wait(1))
+        task.stop()
+
+        self.assertFalse(task.is_running)
+        self.assertEqual(task.run_count, 1)
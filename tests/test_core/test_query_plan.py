@@ -0,0 +1,140 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.core.query_plan import (
+    HOT_QUERIES, HotQuery, check_query_plans, find_plan_problems
+)
+from app.repository.order_repository import order_repository
+from tests.base_test_case import BaseTestCase
+
+
+class TestQueryPlanChecker(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.query = HotQuery(
+            "orders_by_status",
+            "SELECT id FROM orders WHERE status = %s",
+            ("Selesai",),
+            expected_index="idx_orders_status_date",
+        )
+
+    def test_indexed_plan_passes(self):
+        plan = [{
+            "table": "orders", "type": "ref",
+            "possible_keys": "idx_orders_status_date",
+            "key": "idx_orders_status_date",
+        }]
+
+        self.assertEqual(find_plan_problems(self.query, plan), [])
+
+    def test_small_table_full_scan_with_usable_index_passes(self):
+        plan = [{
+            "table": "orders", "type": "ALL",
+            "possible_keys": "user_id,idx_orders_status_date", "key": None,
+        }]
+
+        self.assertEqual(find_plan_problems(self.query, plan), [])
+
+    def test_full_scan_without_index_fails(self):
+        plan = [{
+            "table": "orders", "type": "ALL",
+            "possible_keys": None, "key": None,
+        }]
+
+        problems = find_plan_problems(self.query, plan)
+
+        self.assertEqual(len(problems), 2)
+        self.assertIn("full scan pada tabel 'orders'", problems[0])
+        self.assertIn("idx_orders_status_date", problems[1])
+
+    def test_allowed_and_derived_tables_are_ignored(self):
+        query = HotQuery(
+            "report", "SELECT 1", allow_full_scan=["categories"]
+        )
+        plan = [
+            {"table": "categories", "type": "ALL", "possible_keys": None},
+            {"table": "<derived2>", "type": "ALL", "possible_keys": None},
+        ]
+
+        self.assertEqual(find_plan_problems(query, plan), [])
+
+    def test_check_query_plans_explains_registered_queries(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [{
+            "table": "orders", "type": "ALL",
+            "possible_keys": None, "key": None,
+        }]
+
+        results = check_query_plans(conn, ["order_by_transaction_id"])
+
+        sql, params = cursor.execute.call_args[0]
+        self.assertTrue(sql.startswith("EXPLAIN SELECT * FROM orders"))
+        self.assertEqual(params, ("TX-1",))
+        self.assertEqual(len(results["order_by_transaction_id"]), 2)
+        cursor.close.assert_called_once()
+
+    def test_every_hot_query_expects_an_index(self):
+        self.assertGreaterEqual(len(HOT_QUERIES), 7)
+        for query in HOT_QUERIES.values():
+            self.assertTrue(query.expected_index, query.name)
+
+    @patch("app.core.commands.get_db_connection")
+    def test_cli_fails_when_plan_regresses(self, mock_get_conn):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [{
+            "table": "stock_holds", "type": "ALL",
+            "possible_keys": None, "key": None,
+        }]
+        mock_get_conn.return_value = conn
+
+        result = self.app.test_cli_runner().invoke(
+            args=["check-query-plans", "--query", "held_stock_for_variant"]
+        )
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("GAGAL", result.output)
+        conn.close.assert_called_once()
+
+    @patch("app.core.commands.get_db_connection")
+    def test_cli_passes_with_indexes(self, mock_get_conn):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [{
+            "table": "stock_holds", "type": "ref",
+            "possible_keys": "idx_stock_holds_product_variant",
+            "key": "idx_stock_holds_product_variant",
+        }]
+        mock_get_conn.return_value = conn
+
+        result = self.app.test_cli_runner().invoke(
+            args=["check-query-plans", "--query", "held_stock_for_variant"]
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("OK     held_stock_for_variant", result.output)
+
+    def test_hot_queries_match_repository_sql(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        order_repository.find_expired_pending_orders(
+            conn, datetime(2025, 1, 1), 500
+        )
+        order_repository.find_filtered_admin(
+            conn, None, None, None, None, 51, (datetime(2025, 1, 1), 1000)
+        )
+
+        executed = [c.args for c in cursor.execute.call_args_list]
+        self.assertEqual(executed, [
+            (HOT_QUERIES["expired_pending_orders"].sql,
+             HOT_QUERIES["expired_pending_orders"].params),
+            (HOT_QUERIES["admin_orders_page"].sql,
+             HOT_QUERIES["admin_orders_page"].params),
+        ])
+        self.assertIn(
+            "FOR UPDATE SKIP LOCKED",
+            HOT_QUERIES["expired_pending_orders"].sql
+        )
+        self.assertIn(
+            "LEFT JOIN users u", HOT_QUERIES["admin_orders_page"].sql
+        )
@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from app.core.report_cache import (
+    ReportCache, get_report_cache, normalize_report_date
+)
+from tests.base_test_case import BaseTestCase
+
+
+class TestReportCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = ReportCache(live_ttl=30, historical_ttl=3600)
+
+    def test_normalize_report_date(self):
+        self.assertIsNone(normalize_report_date(""))
+        self.assertIsNone(normalize_report_date(None))
+        self.assertEqual(
+            normalize_report_date("2025-01-31 23:59:59"), date(2025, 1, 31)
+        )
+        with self.assertRaises(ValueError):
+            normalize_report_date("kemarin")
+
+    def test_hits_and_misses_are_counted_per_report(self):
+        loader = MagicMock(return_value={"total": 1})
+
+        self.cache.get_or_load("sales", "2025-01-01", "2025-01-31", loader)
+        self.cache.get_or_load("sales", "2025-01-01", "2025-01-31", loader)
+        self.cache.get_or_load("vouchers", "2025-01-01", "2025-01-31", loader)
+
+        self.assertEqual(loader.call_count, 2)
+        stats = self.cache.get_stats()["reports"]
+        self.assertEqual(stats["sales"], {"hits": 1, "misses": 1})
+        self.assertEqual(stats["vouchers"], {"hits": 0, "misses": 1})
+
+    def test_cached_value_is_copied(self):
+        self.cache.get_or_load(
+            "sales", "2025-01-01", "2025-01-31", lambda: {"items": []}
+        )
+
+        cached = self.cache.get_or_load(
+            "sales", "2025-01-01", "2025-01-31", MagicMock()
+        )
+        cached["items"].append("x")
+
+        self.assertEqual(
+            self.cache.get_or_load(
+                "sales", "2025-01-01", "2025-01-31", MagicMock()
+            ),
+            {"items": []},
+        )
+
+    def test_ranges_including_today_use_live_ttl(self):
+        today = date.today()
+
+        self.assertEqual(self.cache.ttl_for(None), 30)
+        self.assertEqual(self.cache.ttl_for(today), 30)
+        self.assertEqual(self.cache.ttl_for(today - timedelta(days=1)), 3600)
+        self.assertEqual(
+            self.cache.ttl_for(today - timedelta(days=1), live=True), 30
+        )
+
+    def test_unparseable_dates_bypass_cache(self):
+        loader = MagicMock(return_value=1)
+
+        self.cache.get_or_load("sales", "bukan-tanggal", None, loader)
+        self.cache.get_or_load("sales", "bukan-tanggal", None, loader)
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(len(self.cache.get_stats()["reports"]), 1)
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_invalidate_dates_only_drops_overlapping_ranges(self):
+        for start, end in [
+            ("2025-01-01", "2025-01-31"),
+            ("2025-02-01", "2025-02-28"),
+            ("2025-01-15", None),
+        ]:
+            self.cache.get_or_load("sales", start, end, lambda: 1)
+
+        removed = self.cache.invalidate_dates([date(2025, 1, 20)])
+
+        self.assertEqual(removed, 2)
+        loader = MagicMock(return_value=2)
+        self.cache.get_or_load("sales", "2025-02-01", "2025-02-28", loader)
+        self.cache.get_or_load("sales", "2025-01-01", "2025-01-31", loader)
+        self.assertEqual(loader.call_count, 1)
+
+    def test_invalidation_during_load_skips_store(self):
+        def loader():
+            self.cache.invalidate_dates([date(2025, 1, 10)])
+            return "stale"
+
+        self.cache.get_or_load("sales", "2025-01-01", "2025-01-31", loader)
+
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_partial_results_are_not_cached(self):
+        loader = MagicMock(
+            return_value={"low_stock": [], "failed_sections": ["low_stock"]}
+        )
+
+        self.cache.get_or_load("inventory", "2025-01-01", "2025-01-31", loader)
+        self.cache.get_or_load("inventory", "2025-01-01", "2025-01-31", loader)
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_get_report_cache_uses_app_config(self):
+        self.app.config["REPORT_CACHE_LIVE_TTL"] = 5
+        self.app.config["REPORT_CACHE_HISTORICAL_TTL"] = 60
+        self.app.extensions.pop("report_cache", None)
+
+        cache = get_report_cache()
+
+        self.assertIs(self.app.extensions["report_cache"], cache)
+        self.assertEqual(cache.live_ttl, 5)
+        self.assertEqual(cache.historical_ttl, 60)
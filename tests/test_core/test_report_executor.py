@@ -0,0 +1,158 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import mysql.connector
+
+from flask import current_app
+
+from app.core.report_executor import ReportExecutor, get_report_executor
+from app.exceptions.database_exceptions import QueryTimeoutError
+from tests.base_test_case import BaseTestCase
+
+
+class TestReportExecutor(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.executor = ReportExecutor(max_workers=4, timeout=2.0)
+        self.connections = []
+        self.connect = MagicMock(side_effect=self._new_connection)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        super().tearDown()
+
+    def _new_connection(self):
+        conn = MagicMock()
+        self.connections.append(conn)
+        return conn
+
+    def test_runs_each_task_on_its_own_connection(self):
+        results, errors = self.executor.run(
+            {"a": lambda conn: 1, "b": lambda conn: 2}, self.connect
+        )
+
+        self.assertEqual(results, {"a": 1, "b": 2})
+        self.assertEqual(errors, {})
+        self.assertEqual(self.connect.call_count, 2)
+        for conn in self.connections:
+            conn.close.assert_called_once()
+
+    def test_tasks_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=1)
+
+        def task(conn):
+            barrier.wait()
+            return threading.get_ident()
+
+        started = time.monotonic()
+        results, errors = self.executor.run(
+            {"a": task, "b": task, "c": task}, self.connect
+        )
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(set(results.values())), 3)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_failed_task_falls_back_to_default(self):
+        def broken(conn):
+            raise RuntimeError("boom")
+
+        results, errors = self.executor.run(
+            {"ok": lambda conn: 5, "broken": broken},
+            self.connect,
+            defaults={"broken": []},
+        )
+
+        self.assertEqual(results, {"ok": 5, "broken": []})
+        self.assertIsInstance(errors["broken"], RuntimeError)
+        self.assertEqual(self.executor.failures, 1)
+
+    def test_slow_task_times_out_with_default(self):
+        release = threading.Event()
+
+        def slow(conn):
+            release.wait(2)
+            return "late"
+
+        try:
+            results, errors = self.executor.run(
+                {"fast": lambda conn: "ok", "slow": slow},
+                self.connect,
+                defaults={"slow": {"labels": []}},
+                timeout=0.1,
+            )
+        finally:
+            release.set()
+
+        self.assertEqual(results["fast"], "ok")
+        self.assertEqual(results["slow"], {"labels": []})
+        self.assertIsInstance(errors["slow"], QueryTimeoutError)
+        self.assertEqual(self.executor.timeouts, 1)
+
+    def test_server_side_limit_is_set_and_reset(self):
+        self.executor.run({"a": lambda conn: 1}, self.connect, timeout=1.5)
+
+        executed = [
+            c.args[0] for c in
+            self.connections[0].cursor.return_value.execute.call_args_list
+        ]
+        self.assertEqual(executed, [
+            "SET SESSION MAX_EXECUTION_TIME = 1500",
+            "SET SESSION MAX_EXECUTION_TIME = DEFAULT",
+        ])
+
+    def test_no_server_side_limit_without_timeout(self):
+        self.executor.run({"a": lambda conn: 1}, self.connect, timeout=0)
+
+        self.connections[0].cursor.assert_not_called()
+
+    def test_query_killed_by_server_counts_as_timeout(self):
+        def killed(conn):
+            raise mysql.connector.Error(
+                msg="maximum statement execution time exceeded",
+                errno=3024,
+            )
+
+        results, errors = self.executor.run(
+            {"killed": killed}, self.connect, defaults={"killed": 0}
+        )
+
+        self.assertEqual(results["killed"], 0)
+        self.assertIsInstance(errors["killed"], QueryTimeoutError)
+        self.assertEqual(self.executor.timeouts, 1)
+        self.assertEqual(self.executor.failures, 0)
+        self.connections[0].close.assert_called_once()
+
+    def test_defaults_are_copied(self):
+        defaults = {"broken": {"labels": []}}
+
+        def broken(conn):
+            raise RuntimeError("boom")
+
+        results, _ = self.executor.run(
+            {"broken": broken}, self.connect, defaults=defaults
+        )
+        results["broken"]["labels"].append("x")
+
+        self.assertEqual(defaults["broken"], {"labels": []})
+
+    def test_tasks_run_inside_app_context(self):
+        results, _ = self.executor.run(
+            {"app": lambda conn: current_app.name}, self.connect
+        )
+
+        self.assertEqual(results["app"], self.app.name)
+
+    def test_get_report_executor_uses_app_config(self):
+        self.app.config["REPORT_EXECUTOR_MAX_WORKERS"] = 2
+        self.app.config["REPORT_QUERY_TIMEOUT"] = 1.5
+        self.app.extensions.pop("report_executor", None)
+
+        executor = get_report_executor()
+
+        self.assertIs(self.app.extensions["report_executor"], executor)
+        self.assertEqual(executor.max_workers, 2)
+        self.assertEqual(executor.timeout, 1.5)
+        executor.shutdown()
\ No newline at end of file
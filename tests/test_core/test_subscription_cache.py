@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.core.subscription_cache import (
+    SubscriptionCache, get_subscription_cache
+)
+from tests.base_test_case import BaseTestCase
+
+
+class TestSubscriptionCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = SubscriptionCache(
+            max_entries=2, max_ttl=3600, negative_ttl=60
+        )
+
+    def _subscription(self, hours_left):
+        return {
+            "name": "Gold",
+            "end_date": datetime.now() + timedelta(hours=hours_left),
+        }
+
+    def test_positive_and_negative_results_are_cached(self):
+        loader = MagicMock(side_effect=[self._subscription(5), None])
+
+        self.cache.get_or_load(1, loader)
+        self.cache.get_or_load(1, loader)
+        self.cache.get_or_load(2, loader)
+        self.assertIsNone(self.cache.get_or_load(2, loader))
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(self.cache.get_stats()["hits"], 2)
+
+    def test_ttl_follows_subscription_end_date(self):
+        self.assertEqual(self.cache.ttl_for(None), 60)
+        self.assertEqual(self.cache.ttl_for(self._subscription(48)), 3600)
+        self.assertAlmostEqual(
+            self.cache.ttl_for(self._subscription(0.5)), 1800, delta=5
+        )
+        self.assertEqual(self.cache.ttl_for(self._subscription(-1)), 0)
+
+    @patch("app.core.subscription_cache.time.monotonic")
+    def test_entry_expires_at_end_date(self, mock_monotonic):
+        mock_monotonic.return_value = 1000.0
+        loader = MagicMock(return_value=self._subscription(0.25))
+
+        self.cache.get_or_load(1, loader)
+        mock_monotonic.return_value = 1000.0 + 899
+        self.cache.get_or_load(1, loader)
+        mock_monotonic.return_value = 1000.0 + 901
+        self.cache.get_or_load(1, loader)
+
+        self.assertEqual(loader.call_count, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        for user_id in (1, 2):
+            self.cache.get_or_load(user_id, lambda: None)
+        self.cache.get(1)
+        self.cache.get_or_load(3, lambda: None)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get(2, "kosong"), "kosong")
+        self.assertIsNone(self.cache.get(1, "kosong"))
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+
+    def test_cached_value_is_copied(self):
+        self.cache.get_or_load(1, lambda: {"name": "Gold", "end_date": None})
+
+        cached = self.cache.get(1)
+        cached["name"] = "Diubah"
+
+        self.assertEqual(self.cache.get(1)["name"], "Gold")
+
+    def test_invalidation_during_load_skips_store(self):
+        def loader():
+            self.cache.invalidate(1)
+            return None
+
+        self.cache.get_or_load(1, loader)
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate_single_user_and_all(self):
+        for user_id in (1, 2):
+            self.cache.get_or_load(user_id, lambda: None)
+
+        self.cache.invalidate(1)
+        self.assertEqual(len(self.cache), 1)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_get_subscription_cache_uses_app_config(self):
+        self.app.config["SUBSCRIPTION_CACHE_MAX_ENTRIES"] = 5
+        self.app.config["SUBSCRIPTION_CACHE_NEGATIVE_TTL"] = 10
+        self.app.extensions.pop("subscription_cache", None)
+
+        cache = get_subscription_cache()
+
+        self.assertIs(self.app.extensions["subscription_cache"], cache)
+        self.assertEqual(cache.max_entries, 5)
+        self.assertEqual(cache.negative_ttl, 10)
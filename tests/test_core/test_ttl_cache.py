@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock, patch
+
+from app.core.ttl_cache import TTLCache
+from tests.base_test_case import BaseTestCase
+
+
+class TestTTLCache(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = TTLCache(ttl=10)
+
+    def test_get_missing_returns_default(self):
+        self.assertIsNone(self.cache.get("x"))
+        self.assertEqual(self.cache.get("x", 5), 5)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_set_and_get(self):
+        self.cache.set("x", [1, 2])
+
+        self.assertEqual(self.cache.get("x"), [1, 2])
+        self.assertEqual(self.cache.hits, 1)
+
+    @patch("app.core.ttl_cache.time.monotonic")
+    def test_entry_expires(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        self.cache.set("x", 1)
+
+        mock_monotonic.return_value = 109.9
+        self.assertEqual(self.cache.get("x"), 1)
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(self.cache.get("x"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_zero_ttl_does_not_store(self):
+        self.cache.set("x", 1, ttl=0)
+
+        self.assertIsNone(self.cache.get("x"))
+
+    def test_get_or_load_calls_loader_once(self):
+        loader = MagicMock(return_value="nilai")
+
+        self.assertEqual(self.cache.get_or_load("x", loader), "nilai")
+        self.assertEqual(self.cache.get_or_load("x", loader), "nilai")
+        loader.assert_called_once()
+
+    def test_get_or_load_caches_falsy_values(self):
+        loader = MagicMock(return_value=[])
+
+        self.cache.get_or_load("x", loader)
+        self.cache.get_or_load("x", loader)
+
+        loader.assert_called_once()
+
+    def test_invalidate_single_key_and_all(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+
+        self.cache.invalidate("a")
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("b"), 2)
+
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+
+    @patch("app.core.ttl_cache.time.monotonic")
+    def test_keys_skips_expired_entries(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        self.cache.set("a", 1)
+        self.cache.set("b", 2, ttl=1)
+
+        mock_monotonic.return_value = 101.0
+        self.assertEqual(self.cache.keys(), ["a"])
\ No newline at end of file
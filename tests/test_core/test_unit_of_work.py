@@ -0,0 +1,164 @@
+from unittest.mock import MagicMock, call
+
+from flask import g
+
+from app.core.db import current_unit_of_work, get_db_connection, unit_of_work
+from app.core.unit_of_work import UnitOfWork, UnitOfWorkConnection
+from app.exceptions.database_exceptions import DatabaseConnectionError
+from tests.base_test_case import BaseTestCase
+
+
+class TestUnitOfWork(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.raw_conn = MagicMock()
+        self.raw_conn.in_transaction = False
+        self.raw_conn.is_connected.return_value = True
+        self.mock_cursor = MagicMock()
+        self.raw_conn.cursor.return_value = self.mock_cursor
+        self.mock_pool = MagicMock()
+        self.mock_pool.acquire.return_value = self.raw_conn
+        self.uow = UnitOfWork(self.mock_pool)
+
+    def _executed(self):
+        return [c.args[0] for c in self.mock_cursor.execute.call_args_list]
+
+    def test_connection_is_acquired_once(self):
+        first = self.uow.connection()
+        first.cursor()
+        first.close()
+        second = self.uow.connection()
+        second.cursor()
+        second.close()
+
+        self.mock_pool.acquire.assert_called_once()
+        self.assertIsInstance(first, UnitOfWorkConnection)
+
+    def test_outer_transaction_commits_on_raw_connection(self):
+        conn = self.uow.connection()
+        conn.start_transaction()
+        conn.commit()
+
+        self.raw_conn.start_transaction.assert_called_once()
+        self.raw_conn.commit.assert_called_once()
+        self.assertIsNone(self.uow.owner)
+
+    def test_nested_transaction_uses_savepoint(self):
+        outer = self.uow.connection()
+        outer.start_transaction()
+
+        inner = self.uow.connection()
+        inner.start_transaction()
+        inner.commit()
+        inner.close()
+
+        self.assertEqual(
+            self._executed(),
+            ["SAVEPOINT uow_sp_1", "RELEASE SAVEPOINT uow_sp_1"],
+        )
+        self.raw_conn.commit.assert_not_called()
+        self.assertIs(self.uow.owner, outer)
+
+    def test_nested_rollback_only_undoes_savepoint(self):
+        outer = self.uow.connection()
+        outer.start_transaction()
+
+        inner = self.uow.connection()
+        inner.rollback()
+        inner.close()
+
+        self.assertEqual(
+            self._executed(),
+            [
+                "SAVEPOINT uow_sp_1",
+                "ROLLBACK TO SAVEPOINT uow_sp_1",
+                "RELEASE SAVEPOINT uow_sp_1",
+            ],
+        )
+        self.raw_conn.rollback.assert_not_called()
+        self.assertIs(self.uow.owner, outer)
+
+    def test_nested_close_without_commit_discards_work(self):
+        outer = self.uow.connection()
+        outer.start_transaction()
+
+        inner = self.uow.connection()
+        inner.close()
+
+        self.assertIn("ROLLBACK TO SAVEPOINT uow_sp_1", self._executed())
+
+    def test_owner_close_rolls_back_open_transaction(self):
+        conn = self.uow.connection()
+        conn.start_transaction()
+        conn.close()
+
+        self.raw_conn.rollback.assert_called_once()
+        self.assertIsNone(self.uow.owner)
+        self.assertFalse(conn.is_connected())
+
+    def test_begin_rolls_back_implicit_transaction_first(self):
+        self.raw_conn.in_transaction = True
+        conn = self.uow.connection()
+
+        with self.assertLogs("app.core.unit_of_work", "WARNING"):
+            conn.start_transaction()
+
+        self.assertEqual(
+            self.raw_conn.method_calls[:2],
+            [call.rollback(), call.start_transaction()],
+        )
+        self.raw_conn.commit.assert_not_called()
+
+    def test_last_handle_close_ends_implicit_transaction(self):
+        conn = self.uow.connection()
+        conn.cursor()
+        self.raw_conn.in_transaction = True
+        conn.close()
+
+        self.raw_conn.rollback.assert_called_once()
+
+    def test_closed_handle_rejects_use(self):
+        conn = self.uow.connection()
+        conn.close()
+
+        with self.assertRaises(DatabaseConnectionError):
+            conn.cursor()
+
+    def test_transaction_context_manager_rolls_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.uow.transaction():
+                raise ValueError("boom")
+
+        self.raw_conn.rollback.assert_called_once()
+        self.raw_conn.commit.assert_not_called()
+
+    def test_close_returns_connection_to_pool(self):
+        conn = self.uow.connection()
+        conn.cursor()
+        conn.close()
+        self.uow.close()
+
+        self.raw_conn.close.assert_called_once()
+
+    def test_request_shares_unit_of_work(self):
+        with self.app.test_request_context("/"):
+            uow = current_unit_of_work()
+            self.assertIsNotNone(uow)
+            self.assertIs(current_unit_of_work(), uow)
+            self.assertIs(g.uow, uow)
+
+    def test_no_unit_of_work_outside_request(self):
+        self.assertIsNone(current_unit_of_work())
+
+    def test_explicit_unit_of_work_outside_request(self):
+        with unit_of_work() as uow:
+            self.assertIs(current_unit_of_work(), uow)
+        self.assertIsNone(current_unit_of_work())
+
+    def test_get_db_connection_joins_request_unit_of_work(self):
+        with self.app.test_request_context("/"):
+            g.uow = self.uow
+            conn = get_db_connection()
+            self.assertIsInstance(conn, UnitOfWorkConnection)
+            conn.close()
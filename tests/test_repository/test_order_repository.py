@@ -38,17 +38,19 @@ class TestOrderRepository(BaseTestCase):
         self.assertEqual(result, mock_result)
         self.mock_cursor.close.assert_called_once()
 
-    def test_find_by_transaction_id(self):
+    def test_find_by_transaction_id_for_update(self):
         mock_result = {"id": 100, "status": "Menunggu Pembayaran"}
         self.mock_cursor.fetchone.return_value = mock_result
         
-        result = self.repository.find_by_transaction_id(
+        result = self.repository.find_by_transaction_id_for_update(
             self.db_conn, "TRANS123"
         )
 
-        self.mock_cursor.execute.assert_called_once()
-        self.assertIn("payment_transaction_id = %s",
-                      self.mock_cursor.execute.call_args[0][0])
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT * FROM orders "
+            "WHERE payment_transaction_id = %s FOR UPDATE",
+            ("TRANS123",)
+        )
         self.assertEqual(result, mock_result)
         self.mock_cursor.close.assert_called_once()
 
@@ -117,13 +119,15 @@ class TestOrderRepository(BaseTestCase):
         self.mock_cursor.execute.assert_called_once()
         query, params = self.mock_cursor.execute.call_args[0]
         self.assertIn("o.status = %s", query)
-        self.assertIn("DATE(o.order_date) >= %s", query)
-        self.assertIn("DATE(o.order_date) <= %s", query)
+        self.assertIn("o.order_date >= %s", query)
+        self.assertIn("o.order_date < DATE_ADD(%s, INTERVAL 1 DAY)", query)
+        self.assertNotIn("DATE(o.order_date)", query)
         self.assertIn("o.shipping_name LIKE %s", query)
+        self.assertNotIn("CAST(o.id AS CHAR)", query)
         self.assertEqual(
             params,
             ("Dikirim", "2025-01-01", "2025-01-31",
-             "%TestUser%", "%TestUser%", "%TestUser%")
+             "%TestUser%", "%TestUser%")
         )
         self.mock_cursor.close.assert_called_once()
 
@@ -134,12 +138,59 @@ class TestOrderRepository(BaseTestCase):
 
         self.mock_cursor.execute.assert_called_once()
         query, params = self.mock_cursor.execute.call_args[0]
-        self.assertNotIn("status", query)
+        self.assertNotIn("WHERE", query)
         self.assertNotIn("LIKE", query)
-        self.assertIn("ORDER BY o.order_date DESC", query) 
+        self.assertNotIn("LIMIT", query)
+        self.assertIn("ORDER BY o.order_date DESC, o.id DESC", query)
         self.assertEqual(params, ())
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_filtered_admin_numeric_search_matches_id_exactly(self):
+        self.repository.find_filtered_admin(
+            self.db_conn, None, None, None, " #123 "
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("o.id = %s", query)
+        self.assertNotIn("LIKE", query)
+        self.assertEqual(params, (123,))
+
+    def test_find_filtered_admin_keyset_page(self):
+        after = (datetime(2025, 1, 5, 10, 0), 42)
+
+        self.repository.find_filtered_admin(
+            self.db_conn, "Selesai", None, None, None, limit=51, after=after
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn(
+            "(o.order_date < %s OR (o.order_date = %s AND o.id < %s))", query
+        )
+        self.assertTrue(query.endswith("LIMIT %s"))
+        self.assertEqual(
+            params, ("Selesai", after[0], after[0], 42, 51)
+        )
+
+    def test_count_filtered_admin_joins_users_only_for_name_search(self):
+        self.mock_cursor.fetchone.return_value = (7,)
+
+        total = self.repository.count_filtered_admin(
+            self.db_conn, "Dikirim", None, None, "12"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertEqual(total, 7)
+        self.assertNotIn("JOIN users", query)
+        self.assertEqual(params, ("Dikirim", 12))
+
+        self.repository.count_filtered_admin(
+            self.db_conn, None, None, None, "Budi"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("LEFT JOIN users u", query)
+        self.assertEqual(params, ("%Budi%", "%Budi%"))
+
     def test_create(self):
         shipping_details = {
             "name": "Test User", "phone": "123", "address1": "Jalan 1",
@@ -167,13 +218,26 @@ class TestOrderRepository(BaseTestCase):
         )
 
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT id FROM orders "
+            "SELECT id, user_id FROM orders "
             "WHERE status = 'Menunggu Pembayaran' AND order_date < %s",
             (expiration_time,)
         )
         self.assertEqual(result, mock_result)
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_expired_pending_orders_chunk(self):
+        expiration_time = datetime(2025, 1, 1, 12, 0, 0)
+
+        self.repository.find_expired_pending_orders(
+            self.db_conn, expiration_time, 100, 42
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn(
+            "AND id > %s ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED", query
+        )
+        self.assertEqual(params, (expiration_time, 42, 100))
+
     def test_bulk_update_status(self):
         self.mock_cursor.rowcount = 2
         order_ids = [1, 2]
@@ -56,4 +56,17 @@ class TestOrderStatusHistoryRepository(BaseTestCase):
             (101, "Selesai", None)
         )
         self.assertEqual(result, 2)
-        self.mock_cursor.close.assert_called_once()
\ No newline at end of file
+        self.mock_cursor.close.assert_called_once()
+
+    def test_create_batch(self):
+        self.mock_cursor.rowcount = 2
+        rows = [(1, "Dibatalkan", "Kedaluwarsa"), (2, "Dibatalkan", None)]
+
+        result = self.repository.create_batch(self.db_conn, rows)
+
+        self.mock_cursor.executemany.assert_called_once()
+        query, params = self.mock_cursor.executemany.call_args[0]
+        self.assertIn("INSERT INTO order_status_history", query)
+        self.assertEqual(params, rows)
+        self.assertEqual(result, 2)
+        self.mock_cursor.close.assert_called_once()
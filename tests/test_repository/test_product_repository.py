@@ -87,23 +87,87 @@ class TestProductRepository(BaseTestCase):
         
         self.mock_cursor.execute.assert_called_once()
         query = self.mock_cursor.execute.call_args[0][0]
-        self.assertIn("ORDER BY COALESCE(", query)
-        self.assertIn("MIN(COALESCE(pv.discount_price, p.discount_price))", query)
-        self.assertIn(") ASC", query)
+        self.assertIn("ORDER BY p.min_effective_price ASC, p.id ASC", query)
+        self.assertNotIn("product_variants", query)
+        self.assertNotIn("GROUP BY", query)
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_filtered_popularity_keyset_with_limit(self):
+        self.repository.find_filtered(
+            self.db_conn, {"sort": "popularity"}, limit=25, after=(7, 40)
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn(
+            "(p.popularity < %s OR (p.popularity = %s AND p.id < %s))", query
+        )
+        self.assertIn("ORDER BY p.popularity DESC, p.id DESC", query)
+        self.assertIn("LIMIT %s", query)
+        self.assertNotIn("OFFSET", query)
+        self.assertEqual(params, (7, 7, 40, 25))
+
+    def test_find_filtered_price_desc_keyset(self):
+        self.repository.find_filtered(
+            self.db_conn,
+            {"sort": "price_desc", "category": 2},
+            limit=10,
+            after=("150000.00", 9),
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn(
+            "(p.min_effective_price < %s OR "
+            "(p.min_effective_price = %s AND p.id < %s))",
+            query,
+        )
+        self.assertIn("ORDER BY p.min_effective_price DESC, p.id DESC", query)
+        self.assertNotIn("HAVING", query)
+        self.assertEqual(params, (2, "150000.00", "150000.00", 9, 10))
+
     def test_find_filtered_search_and_category(self):
-        filters = {"search": "test", "category": 5}
+        filters = {
+            "search": "kemeja", "search_query": "+kemeja*", "category": 5
+        }
         
         self.repository.find_filtered(self.db_conn, filters)
 
         self.mock_cursor.execute.assert_called_once()
         query, params = self.mock_cursor.execute.call_args[0]
-        self.assertIn("p.name LIKE %s", query)
+        self.assertIn(
+            "MATCH(p.name, p.description, p.colors) "
+            "AGAINST (%s IN BOOLEAN MODE) AS relevance",
+            query,
+        )
+        self.assertNotIn("LIKE", query)
         self.assertIn("p.category_id = %s", query)
-        self.assertEqual(params, ("%test%", "%test%", "%test%", "%test%", 5))
+        self.assertEqual(params, ("+kemeja*", "+kemeja*", 5))
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_filtered_relevance_keyset(self):
+        filters = {"search_query": "+sepatu*", "sort": "relevance"}
+
+        self.repository.find_filtered(
+            self.db_conn, filters, limit=5, after=(1.5, 12)
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("ORDER BY relevance DESC, p.id DESC", query)
+        self.assertEqual(
+            params,
+            ("+sepatu*", "+sepatu*", "+sepatu*", 1.5,
+             "+sepatu*", 1.5, 12, 5),
+        )
+
+    def test_find_filtered_search_without_fulltext_query(self):
+        self.repository.find_filtered(
+            self.db_conn, {"search": "xl", "search_query": None}
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("(p.name LIKE %s OR p.colors LIKE %s)", query)
+        self.assertNotIn("MATCH(", query)
+        self.assertEqual(params, ("%xl%", "%xl%"))
+
     def test_find_all_with_category_stock_status(self):
         self.repository.find_all_with_category(
             self.db_conn, None, None, "low_stock"
@@ -114,6 +178,55 @@ class TestProductRepository(BaseTestCase):
         self.assertIn("p.stock > 0 AND p.stock <= 5", query)
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_admin_page_uses_narrow_projection_and_keyset(self):
+        self.repository.find_admin_page(
+            self.db_conn, "kaos", 3, "out_of_stock", limit=51, after_id=90
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertNotIn("description", query)
+        self.assertNotIn("additional_image_urls", query)
+        self.assertNotIn("GROUP BY", query)
+        self.assertIn("p.stock <= 0", query)
+        self.assertIn("p.id < %s", query)
+        self.assertIn("ORDER BY p.id DESC LIMIT %s", query)
+        self.assertEqual(params, ("%kaos%", "%kaos%", 3, 90, 51))
+        self.mock_cursor.close.assert_called_once()
+
+    def test_count_admin(self):
+        self.mock_cursor.fetchone.return_value = (14,)
+
+        total = self.repository.count_admin(
+            self.db_conn, None, None, "in_stock"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertEqual(total, 14)
+        self.assertEqual(
+            query, "SELECT COUNT(*) FROM products p WHERE p.stock > 5"
+        )
+        self.assertEqual(params, ())
+
+    def test_find_variant_summaries_single_query(self):
+        self.mock_cursor.fetchall.return_value = [
+            {"product_id": 4, "variant_count": 3}
+        ]
+
+        result = self.repository.find_variant_summaries(self.db_conn, [4, 7])
+
+        self.mock_cursor.execute.assert_called_once()
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("WHERE pv.product_id IN (%s, %s)", query)
+        self.assertIn("GROUP BY pv.product_id", query)
+        self.assertEqual(params, (4, 7))
+        self.assertEqual(result, {4: {"product_id": 4, "variant_count": 3}})
+
+    def test_find_variant_summaries_empty(self):
+        self.assertEqual(
+            self.repository.find_variant_summaries(self.db_conn, []), {}
+        )
+        self.mock_cursor.execute.assert_not_called()
+
     def test_delete_batch(self):
         self.mock_cursor.rowcount = 2
         
@@ -139,6 +252,24 @@ class TestProductRepository(BaseTestCase):
         self.assertEqual(result, 2)
         self.mock_cursor.close.assert_called_once()
 
+    def test_get_stock_batch(self):
+        mock_result = [{"id": 1, "stock": 5}, {"id": 2, "stock": 0}]
+        self.mock_cursor.fetchall.return_value = mock_result
+        
+        result = self.repository.get_stock_batch(self.db_conn, [1, 2])
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT id, stock FROM products WHERE id IN (%s, %s)",
+            (1, 2)
+        )
+        self.assertEqual(result, mock_result)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_get_stock_batch_empty_list(self):
+        result = self.repository.get_stock_batch(self.db_conn, [])
+        self.assertEqual(result, [])
+        self.mock_cursor.execute.assert_not_called()
+
     def test_lock_stock(self):
         self.repository.lock_stock(self.db_conn, 1)
         
@@ -148,6 +279,46 @@ class TestProductRepository(BaseTestCase):
         )
         self.mock_cursor.close.assert_called_once()
 
+    def test_lock_stock_batch_sorted(self):
+        self.repository.lock_stock_batch(self.db_conn, [3, 1])
+        
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT id, stock FROM products "
+            "WHERE id IN (%s, %s) ORDER BY id FOR UPDATE",
+            (1, 3)
+        )
+        self.mock_cursor.close.assert_called_once()
+
+    def test_decrease_stock_batch(self):
+        self.mock_cursor.rowcount = 2
+        
+        result = self.repository.decrease_stock_batch(
+            self.db_conn, {3: 1, 1: 2}
+        )
+        
+        self.mock_cursor.execute.assert_called_once_with(
+            "UPDATE products SET stock = stock - CASE id "
+            "WHEN %s THEN %s WHEN %s THEN %s END "
+            "WHERE id IN (%s, %s) "
+            "AND stock >= CASE id WHEN %s THEN %s WHEN %s THEN %s END",
+            (1, 2, 3, 1, 1, 3, 1, 2, 3, 1)
+        )
+        self.assertEqual(result, 2)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_sync_stock_from_variants(self):
+        self.mock_cursor.rowcount = 2
+        
+        result = self.repository.sync_stock_from_variants(
+            self.db_conn, [5, 2]
+        )
+        
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("SUM(stock) AS total", query)
+        self.assertIn("GROUP BY product_id", query)
+        self.assertEqual(params, (2, 5))
+        self.assertEqual(result, 2)
+
     def test_decrease_stock(self):
         self.mock_cursor.rowcount = 1
         
@@ -158,4 +329,65 @@ class TestProductRepository(BaseTestCase):
             (2, 1)
         )
         self.assertEqual(result, 1)
-        self.mock_cursor.close.assert_called_once()
\ No newline at end of file
+        self.mock_cursor.close.assert_called_once()
+
+    def test_refresh_min_prices_for_products(self):
+        self.mock_cursor.rowcount = 2
+
+        result = self.repository.refresh_min_prices(self.db_conn, [5, 3, 5])
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("WHERE pv.product_id IN (%s, %s)", query)
+        self.assertIn("WHERE p.id IN (%s, %s)", query)
+        self.assertIn("p.min_effective_price = IF(", query)
+        self.assertEqual(params, (3, 5, 3, 5))
+        self.assertEqual(result, 2)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_refresh_min_prices_all_products(self):
+        self.repository.refresh_min_prices(self.db_conn)
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertNotIn("WHERE p.id IN", query)
+        self.assertNotIn("WHERE pv.product_id IN", query)
+        self.assertEqual(params, ())
+
+    def test_refresh_min_prices_empty_list(self):
+        result = self.repository.refresh_min_prices(self.db_conn, [])
+
+        self.assertEqual(result, 0)
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_find_top_by_popularity(self):
+        self.mock_cursor.fetchall.return_value = [{"id": 1}]
+
+        result = self.repository.find_top_by_popularity(self.db_conn, 4)
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("ORDER BY p.popularity DESC, p.id DESC", query)
+        self.assertEqual(params, (4,))
+        self.assertEqual(result, [{"id": 1}])
+        self.mock_cursor.close.assert_called_once()
+
+    def test_increment_popularity_batch(self):
+        self.mock_cursor.rowcount = 2
+
+        result = self.repository.increment_popularity_batch(
+            self.db_conn, {7: 3, 2: 1}
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn(
+            "popularity + CASE id WHEN %s THEN %s WHEN %s THEN %s ELSE 0 END",
+            query,
+        )
+        self.assertIn("WHERE id IN (%s, %s)", query)
+        self.assertEqual(params, (2, 1, 7, 3, 2, 7))
+        self.assertEqual(result, 2)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_increment_popularity_batch_empty(self):
+        result = self.repository.increment_popularity_batch(self.db_conn, {})
+
+        self.assertEqual(result, 0)
+        self.mock_cursor.execute.assert_not_called()
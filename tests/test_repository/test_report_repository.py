@@ -1,6 +1,8 @@
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import mysql.connector
+
 from tests.base_test_case import BaseTestCase
 from app.repository.report_repository import (
     ReportRepository, report_repository
@@ -46,6 +48,13 @@ class TestReportRepository(BaseTestCase):
         self.assertEqual(clause, expected_clause)
         self.assertEqual(params, ["2025-01-01", "2025-01-31"])
 
+    def test_get_rollup_date_filter_clause(self):
+        clause, params = self.repository._get_rollup_date_filter_clause(
+            "2025-01-01", None
+        )
+        self.assertEqual(clause, " WHERE 1=1 AND d.sale_date >= DATE(%s)")
+        self.assertEqual(params, ["2025-01-01"])
+
     def test_get_top_spenders(self):
         self.repository.get_top_spenders(
             self.db_conn, "2025-01-01", "2025-01-31"
@@ -78,6 +87,33 @@ class TestReportRepository(BaseTestCase):
         self.assertEqual(result, [1, 2])
         self.mock_cursor.close.assert_called_once()
 
+    def test_get_inactive_user_ids(self):
+        self.mock_cursor.fetchall.return_value = [{"user_id": 4}]
+
+        result = self.repository.get_inactive_user_ids(
+            self.db_conn, "2025-01-01 00:00:00"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("HAVING MAX(order_date) < %s", query)
+        self.assertEqual(params, ("2025-01-01 00:00:00",))
+        self.assertEqual(result, [4])
+        self.mock_cursor.close.assert_called_once()
+
+    def test_get_first_time_buyer_user_ids(self):
+        self.mock_cursor.fetchall.return_value = [{"user_id": 5}]
+
+        result = self.repository.get_first_time_buyer_user_ids(
+            self.db_conn, "2025-01-01 00:00:00", "2025-01-31 00:00:00"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("COUNT(*) = 1", query)
+        self.assertEqual(
+            params, ("2025-01-01 00:00:00", "2025-01-31 00:00:00")
+        )
+        self.assertEqual(result, [5])
+
     def test_get_dashboard_sales(self):
         mock_result = {"total": Decimal("1000.50")}
         self.mock_cursor.fetchone.return_value = mock_result
@@ -87,10 +123,9 @@ class TestReportRepository(BaseTestCase):
         )
 
         self.mock_cursor.execute.assert_called_once_with(
-            "\n                SELECT SUM(total_amount) AS total\n"
-            "                FROM orders\n"
-            "                WHERE status != 'Dibatalkan'\n"
-            "                AND order_date BETWEEN %s AND %s\n"
+            "\n                SELECT SUM(revenue) AS total\n"
+            "                FROM daily_sales\n"
+            "                WHERE sale_date BETWEEN DATE(%s) AND DATE(%s)\n"
             "            ",
             ("2025-01-01", "2025-01-31")
         )
@@ -138,8 +173,10 @@ class TestReportRepository(BaseTestCase):
 
         self.mock_cursor.execute.assert_called_once()
         query, params = self.mock_cursor.execute.call_args[0]
-        self.assertIn("SUM(oi.quantity) AS total_sold", query)
-        self.assertIn("o.status != 'Dibatalkan'", query)
+        self.assertIn("SUM(d.units_sold) AS total_sold", query)
+        self.assertIn("FROM daily_product_sales d", query)
+        self.assertIn("d.sale_date >= DATE(%s)", query)
+        self.assertNotIn("order_items", query)
         self.assertEqual(params, ("2025-01-01", "2025-01-31"))
         self.mock_cursor.close.assert_called_once()
 
@@ -150,22 +187,122 @@ class TestReportRepository(BaseTestCase):
         
         self.mock_cursor.execute.assert_called_once()
         query, params = self.mock_cursor.execute.call_args[0]
-        self.assertIn("COALESCE(SUM(o.total_amount), 0)", query)
-        self.assertIn("COUNT(o.id)", query)
-        self.assertIn("COALESCE(SUM(oi.quantity), 0)", query)
+        self.assertIn("COALESCE(SUM(d.revenue), 0)", query)
+        self.assertIn("SUM(d.order_count - d.cancelled_count)", query)
+        self.assertIn("COALESCE(SUM(d.items_sold), 0)", query)
+        self.assertIn("FROM daily_sales d", query)
         self.assertEqual(params, ("2025-01-01", "2025-01-31"))
         self.mock_cursor.close.assert_called_once()
 
-    def test_get_full_vouchers_data_for_export(self):
-        self.repository.get_full_vouchers_data_for_export(
+    def test_get_dashboard_order_count_reads_rollup(self):
+        self.mock_cursor.fetchone.return_value = {"count": Decimal("7")}
+
+        result = self.repository.get_dashboard_order_count(
+            self.db_conn, "2025-01-01 00:00:00", "2025-01-31 23:59:59"
+        )
+
+        query = self.mock_cursor.execute.call_args[0][0]
+        self.assertIn("SUM(order_count)", query)
+        self.assertIn("FROM daily_sales", query)
+        self.assertEqual(result, 7)
+
+    def test_get_sales_chart_data_reads_rollup(self):
+        self.repository.get_sales_chart_data(
+            self.db_conn, "2025-01-01 00:00:00", "2025-01-31 23:59:59"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("revenue AS daily_total", query)
+        self.assertNotIn("GROUP BY", query)
+        self.assertEqual(
+            params, ("2025-01-01 00:00:00", "2025-01-31 23:59:59")
+        )
+
+    def test_get_inventory_slow_moving_joins_rollup_once(self):
+        self.repository.get_inventory_slow_moving(
             self.db_conn, "2025-01-01", "2025-01-31"
         )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("LEFT JOIN (", query)
+        self.assertIn("FROM daily_product_sales d", query)
+        self.assertIn("GROUP BY d.product_id", query)
+        self.assertIn("s.product_id = p.id", query)
+        self.assertNotIn("order_items", query)
+        self.assertNotIn("WHERE oi.product_id = p.id", query)
+        self.assertEqual(params, ("2025-01-01", "2025-01-31"))
+
+    def test_slow_moving_and_products_exports_join_rollup(self):
+        self.mock_cursor.fetchmany.return_value = []
+
+        list(self.repository.get_inventory_slow_moving_for_export(
+            self.db_conn, None, "2025-01-31"
+        ))
+        list(self.repository.get_full_products_data_for_export(
+            self.db_conn, "2025-01-01", None
+        ))
+
+        calls = self.mock_cursor.execute.call_args_list
+        for call, expected_params in zip(
+            calls, [("2025-01-31",), ("2025-01-01",)]
+        ):
+            query, params = call.args
+            self.assertIn("COALESCE(s.units_sold, 0) AS total_sold", query)
+            self.assertNotIn("order_items", query)
+            self.assertEqual(params, expected_params)
+
+    def test_get_voucher_effectiveness_reads_rollup(self):
+        self.repository.get_voucher_effectiveness(
+            self.db_conn, "2025-01-01", "2025-01-31"
+        )
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("FROM daily_voucher_usage d", query)
+        self.assertIn("HAVING usage_count > 0", query)
+        self.assertEqual(params, ("2025-01-01", "2025-01-31"))
+
+    def test_get_full_vouchers_data_for_export(self):
+        self.mock_cursor.fetchmany.side_effect = [
+            [("HEMAT", "percentage", 10, 3, 5000)], []
+        ]
+
+        rows = self.repository.get_full_vouchers_data_for_export(
+            self.db_conn, "2025-01-01", "2025-01-31", chunk_size=500
+        )
         
+        self.db_conn.cursor.assert_called_once_with(buffered=False)
         self.mock_cursor.execute.assert_called_once()
+        self.mock_cursor.close.assert_not_called()
+        self.assertEqual(list(rows), [("HEMAT", "percentage", 10, 3, 5000)])
+        self.mock_cursor.fetchmany.assert_called_with(500)
         query, params = self.mock_cursor.execute.call_args[0]
         self.assertIn("SELECT COUNT(o.id)", query)
         self.assertIn("SELECT COALESCE(SUM(o.discount_amount), 0)", query)
         self.assertEqual(params, (
             "2025-01-01", "2025-01-31", "2025-01-01", "2025-01-31"
         ))
+        self.mock_cursor.close.assert_called_once()
+
+    def test_abandoned_export_stream_drains_cursor(self):
+        self.mock_cursor.fetchmany.side_effect = [
+            [(1,), (2,)], [(3,)], []
+        ]
+
+        rows = self.repository.get_full_sales_data_for_export(
+            self.db_conn, None, None, chunk_size=2
+        )
+        self.assertEqual(next(rows), (1,))
+        rows.close()
+
+        self.assertEqual(self.mock_cursor.fetchmany.call_count, 3)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_export_stream_closes_cursor_when_execute_fails(self):
+        self.mock_cursor.execute.side_effect = mysql.connector.Error("boom")
+
+        with self.assertRaises(mysql.connector.Error):
+            self.repository.get_full_products_data_for_export(
+                self.db_conn, None, None
+            )
+
         self.mock_cursor.close.assert_called_once()
\ No newline at end of file
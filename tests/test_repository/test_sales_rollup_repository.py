@@ -0,0 +1,124 @@
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from tests.base_test_case import BaseTestCase
+from app.repository.sales_rollup_repository import (
+    SalesRollupRepository, sales_rollup_repository
+)
+
+
+class TestSalesRollupRepository(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_cursor = MagicMock()
+        self.cursor_patch = patch.object(
+            self.db_conn, 'cursor', return_value=self.mock_cursor
+        )
+        self.cursor_patch.start()
+        self.repository = SalesRollupRepository()
+
+    def tearDown(self):
+        self.cursor_patch.stop()
+        super().tearDown()
+
+    def test_singleton_instance(self):
+        self.assertIsInstance(sales_rollup_repository, SalesRollupRepository)
+
+    def test_upsert_daily_sales_applies_signed_deltas(self):
+        self.repository.upsert_daily_sales(
+            self.db_conn, [5, 6], placed=0, cancelled=1, sign=-1
+        )
+
+        self.mock_cursor.execute.assert_called_once()
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("INSERT INTO daily_sales", query)
+        self.assertIn("GROUP BY DATE(o.order_date)", query)
+        self.assertIn(
+            "revenue = revenue + VALUES(revenue)", query
+        )
+        self.assertEqual(params, (0, 1, -1, -1, -1, -1, -1, 5, 6, 5, 6))
+        self.mock_cursor.close.assert_called_once()
+
+    def test_upsert_daily_product_sales(self):
+        self.repository.upsert_daily_product_sales(self.db_conn, [5], 1)
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("INSERT INTO daily_product_sales", query)
+        self.assertIn("GROUP BY DATE(o.order_date), oi.product_id", query)
+        self.assertIn("units_sold = units_sold + VALUES(units_sold)", query)
+        self.assertEqual(params, (1, 1, 5))
+
+    def test_upsert_daily_voucher_usage_skips_orders_without_voucher(self):
+        self.repository.upsert_daily_voucher_usage(self.db_conn, [5], 1)
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("INSERT INTO daily_voucher_usage", query)
+        self.assertIn("o.voucher_code IS NOT NULL", query)
+        self.assertEqual(params, (1, 1, 5))
+
+    def test_upserts_with_no_orders_do_nothing(self):
+        self.assertEqual(
+            self.repository.upsert_daily_sales(self.db_conn, [], 1, 0, 1), 0
+        )
+        self.assertEqual(
+            self.repository.upsert_daily_product_sales(self.db_conn, [], 1), 0
+        )
+        self.assertEqual(
+            self.repository.upsert_daily_voucher_usage(self.db_conn, [], 1), 0
+        )
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_delete_range_clears_all_rollup_tables(self):
+        self.mock_cursor.rowcount = 2
+        start, end = date(2025, 1, 1), date(2025, 1, 31)
+
+        deleted = self.repository.delete_range(self.db_conn, start, end)
+
+        queries = [c.args[0] for c in self.mock_cursor.execute.call_args_list]
+        self.assertEqual(len(queries), 3)
+        self.assertIn("DELETE FROM daily_sales", queries[0])
+        self.assertIn("DELETE FROM daily_product_sales", queries[1])
+        self.assertIn("DELETE FROM daily_voucher_usage", queries[2])
+        self.assertEqual(
+            self.mock_cursor.execute.call_args[0][1], (start, end)
+        )
+        self.assertEqual(deleted, 6)
+
+    def test_rebuild_range_excludes_cancelled_orders(self):
+        self.mock_cursor.rowcount = 4
+        start, end = date(2025, 1, 1), date(2025, 1, 31)
+
+        rebuilt = self.repository.rebuild_range(self.db_conn, start, end)
+
+        calls = self.mock_cursor.execute.call_args_list
+        self.assertEqual(len(calls), 3)
+        sales_query, sales_params = calls[0].args
+        self.assertIn("SUM(o.status = 'Dibatalkan')", sales_query)
+        self.assertIn("o.order_date < %s + INTERVAL 1 DAY", sales_query)
+        self.assertEqual(sales_params, (start, end, start, end))
+        self.assertIn("o.status != 'Dibatalkan'", calls[1].args[0])
+        self.assertIn("o.status != 'Dibatalkan'", calls[2].args[0])
+        self.assertEqual(calls[1].args[1], (start, end))
+        self.assertEqual(rebuilt, 4)
+
+    def test_rebuild_range_without_bounds(self):
+        self.repository.rebuild_range(self.db_conn, None, None)
+
+        for call in self.mock_cursor.execute.call_args_list:
+            self.assertEqual(call.args[1], ())
+
+    def test_find_order_dates(self):
+        self.mock_cursor.fetchall.return_value = [
+            {"order_day": date(2025, 1, 2)}
+        ]
+
+        days = self.repository.find_order_dates(self.db_conn, [5, 6])
+
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("SELECT DISTINCT DATE(order_date)", query)
+        self.assertEqual(params, (5, 6))
+        self.assertEqual(days, [date(2025, 1, 2)])
+        self.assertEqual(
+            self.repository.find_order_dates(self.db_conn, []), []
+        )
\ No newline at end of file
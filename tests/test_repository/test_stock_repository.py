@@ -30,6 +30,19 @@ class TestStockRepository(BaseTestCase):
         self.assertEqual(result, 2)
         self.mock_cursor.close.assert_called_once()
 
+    def test_delete_expired_with_limit(self):
+        self.mock_cursor.rowcount = 100
+        
+        result = self.repository.delete_expired(self.db_conn, 100)
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "DELETE FROM stock_holds WHERE expires_at < CURRENT_TIMESTAMP "
+            "ORDER BY expires_at LIMIT %s",
+            (100,)
+        )
+        self.assertEqual(result, 100)
+        self.mock_cursor.close.assert_called_once()
+
     def test_get_held_stock_sum_with_variant(self):
         self.mock_cursor.fetchone.return_value = {"held": 5}
         
@@ -37,7 +50,8 @@ class TestStockRepository(BaseTestCase):
 
         self.mock_cursor.execute.assert_called_once_with(
             "SELECT SUM(quantity) as held FROM stock_holds "
-            "WHERE product_id = %s AND variant_id = %s",
+            "WHERE product_id = %s AND variant_id = %s "
+            "AND expires_at > CURRENT_TIMESTAMP",
             (1, 10)
         )
         self.assertEqual(result, 5)
@@ -50,7 +64,8 @@ class TestStockRepository(BaseTestCase):
 
         self.mock_cursor.execute.assert_called_once_with(
             "SELECT SUM(quantity) as held FROM stock_holds "
-            "WHERE product_id = %s AND variant_id IS NULL",
+            "WHERE product_id = %s AND variant_id IS NULL "
+            "AND expires_at > CURRENT_TIMESTAMP",
             (1,)
         )
         self.assertEqual(result, 3)
@@ -64,6 +79,27 @@ class TestStockRepository(BaseTestCase):
         self.assertEqual(result, 0)
         self.mock_cursor.close.assert_called_once()
 
+    def test_get_held_stock_sums(self):
+        mock_rows = [{"product_id": 1, "variant_id": None, "held": 2}]
+        self.mock_cursor.fetchall.return_value = mock_rows
+        
+        result = self.repository.get_held_stock_sums(self.db_conn, [1, 2])
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT product_id, variant_id, SUM(quantity) AS held "
+            "FROM stock_holds WHERE product_id IN (%s, %s) "
+            "AND expires_at > CURRENT_TIMESTAMP "
+            "GROUP BY product_id, variant_id",
+            (1, 2)
+        )
+        self.assertEqual(result, mock_rows)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_get_held_stock_sums_empty_list(self):
+        result = self.repository.get_held_stock_sums(self.db_conn, [])
+        self.assertEqual(result, [])
+        self.mock_cursor.execute.assert_not_called()
+
     def test_delete_by_user_id(self):
         self.mock_cursor.rowcount = 2
         
@@ -75,6 +111,26 @@ class TestStockRepository(BaseTestCase):
         self.assertEqual(result, 2)
         self.mock_cursor.close.assert_called_once()
 
+    def test_delete_expired_by_user_ids(self):
+        self.mock_cursor.rowcount = 3
+
+        result = self.repository.delete_expired_by_user_ids(
+            self.db_conn, [1, 2]
+        )
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "DELETE FROM stock_holds WHERE user_id IN (%s, %s) "
+            "AND expires_at < CURRENT_TIMESTAMP",
+            (1, 2)
+        )
+        self.assertEqual(result, 3)
+
+    def test_delete_expired_by_user_ids_empty(self):
+        self.assertEqual(
+            self.repository.delete_expired_by_user_ids(self.db_conn, []), 0
+        )
+        self.mock_cursor.execute.assert_not_called()
+
     def test_delete_by_session_id(self):
         self.mock_cursor.rowcount = 1
         
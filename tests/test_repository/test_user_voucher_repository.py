@@ -33,6 +33,24 @@ class TestUserVoucherRepository(BaseTestCase):
         self.assertEqual(result, 5)
         self.mock_cursor.close.assert_called_once()
 
+    def test_bulk_create_uses_one_insert_ignore(self):
+        self.mock_cursor.rowcount = 2
+
+        result = self.repository.bulk_create(self.db_conn, [1, 2, 3], 10)
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "INSERT IGNORE INTO user_vouchers (user_id, voucher_id, status) "
+            "VALUES (%s, %s, 'available'), (%s, %s, 'available'), "
+            "(%s, %s, 'available')",
+            (1, 10, 2, 10, 3, 10)
+        )
+        self.assertEqual(result, 2)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_bulk_create_empty(self):
+        self.assertEqual(self.repository.bulk_create(self.db_conn, [], 10), 0)
+        self.mock_cursor.execute.assert_not_called()
+
     def test_find_available_by_user_id(self):
         self.repository.find_available_by_user_id(self.db_conn, 1)
 
@@ -157,4 +157,33 @@ class TestVariantRepository(BaseTestCase):
             (2, 10)
         )
         self.assertEqual(result, 1)
-        self.mock_cursor.close.assert_called_once()
\ No newline at end of file
+        self.mock_cursor.close.assert_called_once()
+
+    def test_get_stock_batch(self):
+        mock_result = [{"id": 10, "stock": 3}]
+        self.mock_cursor.fetchall.return_value = mock_result
+        
+        result = self.repository.get_stock_batch(self.db_conn, [10, 11])
+        
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT id, stock FROM product_variants WHERE id IN (%s, %s)",
+            (10, 11)
+        )
+        self.assertEqual(result, mock_result)
+        self.mock_cursor.close.assert_called_once()
+
+    def test_lock_stock_batch_sorted(self):
+        self.repository.lock_stock_batch(self.db_conn, [12, 10])
+        
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT id, stock FROM product_variants "
+            "WHERE id IN (%s, %s) ORDER BY id FOR UPDATE",
+            (10, 12)
+        )
+        self.mock_cursor.close.assert_called_once()
+
+    def test_decrease_stock_batch_empty(self):
+        result = self.repository.decrease_stock_batch(self.db_conn, {})
+        
+        self.assertEqual(result, 0)
+        self.mock_cursor.execute.assert_not_called()
@@ -27,8 +27,7 @@ class TestVoucherRepository(BaseTestCase):
         result = self.repository.find_active_by_code(self.db_conn, " test ")
 
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT * FROM vouchers WHERE UPPER(code) = %s "
-            "AND is_active = 1",
+            "SELECT * FROM vouchers WHERE code = %s AND is_active = 1",
             ("TEST",)
         )
         self.assertEqual(result, mock_result)
@@ -38,11 +37,24 @@ class TestVoucherRepository(BaseTestCase):
         self.repository.find_by_code(self.db_conn, " test ")
 
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT id FROM vouchers WHERE UPPER(code) = %s",
+            "SELECT id FROM vouchers WHERE code = %s",
             ("TEST",)
         )
         self.mock_cursor.close.assert_called_once()
 
+    def test_find_usage_by_id(self):
+        self.mock_cursor.fetchone.return_value = {
+            "use_count": 3, "is_active": 1
+        }
+
+        result = self.repository.find_usage_by_id(self.db_conn, 7)
+
+        self.mock_cursor.execute.assert_called_once_with(
+            "SELECT use_count, is_active FROM vouchers WHERE id = %s", (7,)
+        )
+        self.assertEqual(result["use_count"], 3)
+        self.mock_cursor.close.assert_called_once()
+
     def test_find_all(self):
         self.repository.find_all(self.db_conn)
 
@@ -63,7 +75,7 @@ class TestVoucherRepository(BaseTestCase):
         self.mock_cursor.lastrowid = 5
         
         result = self.repository.create(
-            self.db_conn, "NEW", "PERCENTAGE", Decimal("10"),
+            self.db_conn, " new ", "PERCENTAGE", Decimal("10"),
             Decimal("50000"), 100
         )
 
@@ -101,14 +113,17 @@ class TestVoucherRepository(BaseTestCase):
         self.assertEqual(result, 1)
         self.mock_cursor.close.assert_called_once()
 
-    def test_increment_use_count(self):
-        self.mock_cursor.rowcount = 1
-        
-        result = self.repository.increment_use_count(self.db_conn, "test")
+    def test_redeem_guards_max_uses_in_one_statement(self):
+        self.mock_cursor.rowcount = 0
 
-        self.mock_cursor.execute.assert_called_once_with(
-            "UPDATE vouchers SET use_count = use_count + 1 WHERE code = %s",
-            ("TEST",)
+        result = self.repository.redeem(self.db_conn, 7)
+
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("use_count = use_count + 1", sql)
+        self.assertIn(
+            "WHERE id = %s AND (max_uses IS NULL OR use_count < max_uses)",
+            sql
         )
-        self.assertEqual(result, 1)
+        self.assertEqual(params, (7,))
+        self.assertEqual(result, 0)
         self.mock_cursor.close.assert_called_once()
\ No newline at end of file
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from flask import url_for
 
+from app.core.report_cache import get_report_cache
 from app.exceptions.database_exceptions import DatabaseException
 from tests.base_test_case import BaseTestCase
 
@@ -87,13 +88,16 @@ class TestAdminDashboardRoutes(BaseTestCase):
 
 
     def test_run_scheduler_post_success(self):
-        self.mock_scheduler_service.cancel_expired_pending_orders.return_value = {
+        self.mock_scheduler_service.run_daily_jobs.return_value = {
             "success": True,
-            "cancelled_count": 2,
-        }
-        self.mock_scheduler_service.grant_segmented_vouchers.return_value = {
-            "success": True,
-            "granted_count": 1,
+            "failed": [],
+            "results": {
+                "cancel": {"success": True, "cancelled_count": 2},
+                "segments": {
+                    "success": True, "granted_count": 1, "skipped_count": 4
+                },
+                "purge": {"success": True, "purged_count": 3},
+            },
         }
 
         with self.client.session_transaction() as sess:
@@ -106,4 +110,52 @@ class TestAdminDashboardRoutes(BaseTestCase):
         data = json.loads(response.data)
         self.assertTrue(data["success"])
         self.assertIn("2 pesanan kedaluwarsa", data["message"])
-        self.assertIn("1 voucher top spender", data["message"])
\ No newline at end of file
+        self.assertIn("1 voucher segmen diberikan (4 sudah dimiliki)", data["message"])
+        self.assertIn("3 penahanan stok kedaluwarsa", data["message"])
+
+    @patch("app.routes.admin.dashboard_routes.get_pool_stats")
+    def test_db_pool_stats_success(self, mock_get_pool_stats):
+        mock_get_pool_stats.return_value = {
+            "pool_size": 5, "checked_out": 1, "exhausted_count": 0
+        }
+
+        response = self.client.get(url_for("admin.db_pool_stats"))
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["stats"]["pool_size"], 5)
+
+    @patch("app.routes.admin.dashboard_routes.view_counter_service")
+    def test_view_counter_stats_success(self, mock_view_counter):
+        mock_view_counter.get_stats.return_value = {
+            "pending_views": 12, "pending_products": 3
+        }
+
+        response = self.client.get(url_for("admin.view_counter_stats"))
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["stats"]["pending_views"], 12)
+
+    def test_report_cache_stats_success(self):
+        get_report_cache().get_or_load(
+            "sales_summary", "2025-01-01", "2025-01-31", lambda: {}
+        )
+
+        response = self.client.get(url_for("admin.report_cache_stats"))
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertTrue(data["success"])
+        self.assertEqual(
+            data["stats"]["reports"]["sales_summary"],
+            {"hits": 0, "misses": 1},
+        )
+
+    @patch("app.routes.admin.dashboard_routes.get_pool_stats")
+    def test_db_pool_stats_error(self, mock_get_pool_stats):
+        mock_get_pool_stats.side_effect = Exception("Pool error")
+
+        response = self.client.get(url_for("admin.db_pool_stats"))
+        self.assertEqual(response.status_code, 500)
+        data = json.loads(response.data)
+        self.assertFalse(data["success"])
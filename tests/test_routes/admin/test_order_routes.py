@@ -33,9 +33,14 @@ class TestAdminOrderRoutes(BaseTestCase):
         super().tearDown()
 
     def test_admin_orders_get_success(self):
-        self.mock_order_query_service.get_filtered_admin_orders.return_value = [
-            {"id": 1, "shipping_name": "Test User", "order_date": MagicMock(), "total_amount": 1000, "status": "Dikirim"}
-        ]
+        self.mock_order_query_service.get_filtered_admin_orders_page.return_value = {
+            "orders": [
+                {"id": 1, "shipping_name": "Test User", "order_date": MagicMock(), "total_amount": 1000, "status": "Dikirim"}
+            ],
+            "next_cursor": "abc",
+            "has_more": True,
+            "total": 75,
+        }
         
         with self.client.session_transaction() as sess:
             sess["user_id"] = 1
@@ -44,6 +49,35 @@ class TestAdminOrderRoutes(BaseTestCase):
         response = self.client.get(url_for("admin.admin_orders"))
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Test User", response.data)
+        self.assertIn(b'data-next-cursor="abc"', response.data)
+        self.assertIn(b"(75)", response.data)
+        self.mock_order_query_service.get_filtered_admin_orders_page.assert_called_once_with(
+            status=None, start_date=None, end_date=None, search=None,
+            limit=self.app.config["ADMIN_ORDERS_PAGE_SIZE"], cursor=None,
+        )
+
+    def test_admin_orders_ajax_load_more_returns_rows_only(self):
+        self.mock_order_query_service.get_filtered_admin_orders_page.return_value = {
+            "orders": [], "next_cursor": None, "has_more": False, "total": 75,
+        }
+
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["is_admin"] = True
+
+        response = self.client.get(
+            url_for("admin.admin_orders", cursor="abc", limit="500"),
+            headers={"X-Requested-With": "XMLHttpRequest"},
+        )
+
+        data = json.loads(response.data)
+        self.assertTrue(data["success"])
+        self.assertFalse(data["has_more"])
+        self.assertEqual(data["total"], 75)
+        self.assertNotIn("Tidak ada pesanan", data["html"])
+        _, kwargs = self.mock_order_query_service.get_filtered_admin_orders_page.call_args
+        self.assertEqual(kwargs["cursor"], "abc")
+        self.assertEqual(kwargs["limit"], 200)
 
     def test_admin_order_detail_get_success(self):
         self.mock_order_query_service.get_order_details_for_admin.return_value = (
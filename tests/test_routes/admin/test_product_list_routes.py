@@ -44,13 +44,44 @@ class TestAdminProductListRoutes(BaseTestCase):
 
     def test_admin_products_get_success(self):
         self.mock_category_service.get_all_categories.return_value = []
-        self.mock_query_service.get_all_products_with_category.return_value = [
-            {"id": 1, "name": "Test Product"}
-        ]
+        self.mock_query_service.get_admin_products_page.return_value = {
+            "products": [{"id": 1, "name": "Test Product"}],
+            "next_cursor": "abc",
+            "has_more": True,
+            "total": 120,
+        }
 
         response = self.client.get(url_for("admin.admin_products"))
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Test Product", response.data)
+        self.assertIn(b'data-next-cursor="abc"', response.data)
+        self.assertIn(b"(120)", response.data)
+
+    def test_admin_products_ajax_load_more(self):
+        self.mock_category_service.get_all_categories.return_value = []
+        self.mock_query_service.get_admin_products_page.return_value = {
+            "products": [], "next_cursor": None, "has_more": False,
+            "total": None,
+        }
+
+        response = self.client.get(
+            url_for(
+                "admin.admin_products", cursor="abc", stock_status="low_stock"
+            ),
+            headers={"X-Requested-With": "XMLHttpRequest"},
+        )
+
+        data = response.get_json()
+        self.assertTrue(data["success"])
+        self.assertFalse(data["has_more"])
+        self.assertNotIn("Tidak ada produk", data["html"])
+        self.mock_query_service.get_admin_products_page.assert_called_once_with(
+            search="",
+            category_id=None,
+            stock_status="low_stock",
+            limit=self.app.config["ADMIN_PRODUCTS_PAGE_SIZE"],
+            cursor="abc",
+        )
 
     def test_admin_products_post_add_product_success(self):
         mock_new_product = {
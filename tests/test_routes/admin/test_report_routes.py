@@ -1,9 +1,14 @@
 import json
+import shutil
+import tempfile
+import threading
+import time
 from unittest.mock import patch
 from decimal import Decimal
 
 from flask import url_for, Response
 
+from app.core.export_jobs import ExportJobManager
 from app.exceptions.database_exceptions import DatabaseException
 from tests.base_test_case import BaseTestCase
 
@@ -110,8 +115,100 @@ class TestAdminReportRoutes(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, b"csv,data")
 
+    def test_export_report_compresses_when_client_accepts_gzip(self):
+        self.mock_csv_util.return_value = Response(b"", mimetype="text/csv")
+
+        self.client.get(
+            url_for("admin.export_report", report_name="vouchers"),
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        self.assertTrue(self.mock_csv_util.call_args.kwargs["compress"])
+
+        self.client.get(url_for("admin.export_report", report_name="vouchers"))
+        self.assertFalse(self.mock_csv_util.call_args.kwargs["compress"])
+
     def test_export_report_invalid_name(self):
         response = self.client.get(
             url_for("admin.export_report", report_name="invalid")
         )
+        self.assertEqual(response.status_code, 404)
+
+    def _install_export_jobs(self):
+        export_dir = tempfile.mkdtemp()
+        manager = ExportJobManager(export_dir, max_workers=1)
+        self.app.extensions["export_jobs"] = manager
+        self.addCleanup(shutil.rmtree, export_dir, True)
+        self.addCleanup(self.app.extensions.pop, "export_jobs", None)
+        self.addCleanup(manager.shutdown)
+        return manager
+
+    def _wait_for_job(self, manager, job_id, timeout=2):
+        deadline = time.monotonic() + timeout
+        job = manager.get(job_id)
+        while job.finished_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return job
+
+    def test_export_job_lifecycle(self):
+        manager = self._install_export_jobs()
+        self.mock_report_service.get_full_sales_data_for_export.return_value = (
+            iter([[1, "2025-01-01"], [2, "2025-01-02"]])
+        )
+
+        response = self.client.post(
+            url_for("admin.create_export_job", report_name="sales"),
+            data={"start_date": "2025-01-01", "compress": "0"},
+        )
+        self.assertEqual(response.status_code, 202)
+        payload = response.get_json()
+        self.assertTrue(payload["created"])
+        job_id = payload["job"]["id"]
+
+        job = self._wait_for_job(manager, job_id)
+        self.assertEqual(job.status, "done")
+        self.mock_report_service.get_full_sales_data_for_export\
+            .assert_called_once_with("2025-01-01", None)
+
+        status = self.client.get(payload["status_url"]).get_json()
+        self.assertEqual(status["job"]["rows_processed"], 2)
+        self.assertIn("download_url", status)
+
+        download = self.client.get(status["download_url"])
+        self.assertEqual(download.status_code, 200)
+        self.assertTrue(download.data.startswith("ID Pesanan".encode()))
+        self.assertIn("attachment", download.headers["Content-Disposition"])
+        download.close()
+
+        partial = self.client.get(
+            status["download_url"], headers={"Range": "bytes=0-9"}
+        )
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial.data, b"ID Pesanan")
+        partial.close()
+
+    def test_export_job_not_ready_or_unknown(self):
+        manager = self._install_export_jobs()
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_rows():
+            release.wait(2)
+            return iter(())
+
+        job, _ = manager.submit("sales", None, None, ["id"], slow_rows)
+
+        response = self.client.get(
+            url_for("admin.download_export_job", job_id=job.id)
+        )
+        self.assertEqual(response.status_code, 409)
+
+        response = self.client.get(
+            url_for("admin.export_job_status", job_id="missing")
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_create_export_job_invalid_name(self):
+        response = self.client.post(
+            url_for("admin.create_export_job", report_name="invalid")
+        )
         self.assertEqual(response.status_code, 404)
\ No newline at end of file
@@ -57,6 +57,26 @@ class TestAdminSettingRoutes(BaseTestCase):
         self.assertTrue(data["success"])
         self.assertIn("berhasil diperbarui", data["message"])
         self.db_conn.commit.assert_called_once()
+        self.mock_cursor.execute.assert_any_call(
+            "UPDATE content SET value = %s WHERE `key` = %s",
+            ("New Name", "app_name"),
+        )
+        version_sql = self.mock_cursor.execute.call_args_list[-1][0][0]
+        self.assertIn("content_version", version_sql)
+
+    def test_admin_settings_post_invalidates_content_cache(self):
+        cache = MagicMock()
+        with patch(
+            "app.routes.admin.setting_routes.get_content_cache",
+            return_value=cache,
+        ):
+            response = self.client.post(
+                url_for("admin.admin_settings"),
+                data={"app_name": "New Name"},
+            )
+        self.assertEqual(response.status_code, 200)
+        cache.bump_version.assert_called_once_with(self.mock_cursor)
+        cache.invalidate.assert_called_once()
 
     def test_admin_settings_post_db_error(self):
         self.mock_cursor.execute.side_effect = mysql.connector.Error("DB Error")
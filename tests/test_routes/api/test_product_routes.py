@@ -26,9 +26,11 @@ class TestApiProductRoutes(BaseTestCase):
         super().tearDown()
 
     def test_filter_products_success(self):
-        self.mock_query_service.get_filtered_products.return_value = [
-            {"id": 1}
-        ]
+        self.mock_query_service.get_filtered_products_page.return_value = {
+            "products": [{"id": 1}],
+            "next_cursor": "abc",
+            "has_more": True,
+        }
         self.mock_render.return_value = "<div>Product</div>"
         response = self.client.get(
             url_for("api.filter_products"), query_string={"search": "test"}
@@ -37,12 +39,35 @@ class TestApiProductRoutes(BaseTestCase):
         data = json.loads(response.data)
         self.assertTrue(data["success"])
         self.assertEqual(data["html"], "<div>Product</div>")
-        self.mock_query_service.get_filtered_products.assert_called_once_with(
-            {"search": "test", "category": None, "sort": "popularity"}
+        self.assertEqual(data["next_cursor"], "abc")
+        self.assertTrue(data["has_more"])
+        self.mock_query_service.get_filtered_products_page.assert_called_once_with(
+            {"search": "test", "category": None, "sort": "popularity"},
+            self.app.config["CATALOG_PAGE_SIZE"],
+            None,
+        )
+
+    def test_filter_products_passes_cursor_and_clamped_limit(self):
+        self.mock_query_service.get_filtered_products_page.return_value = {
+            "products": [],
+            "next_cursor": None,
+            "has_more": False,
+        }
+        self.mock_render.return_value = ""
+        response = self.client.get(
+            url_for("api.filter_products"),
+            query_string={"sort": "price_asc", "cursor": "xyz", "limit": "500"},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertFalse(data["has_more"])
+        self.assertIsNone(data["next_cursor"])
+        self.mock_query_service.get_filtered_products_page.assert_called_once_with(
+            {"search": None, "category": None, "sort": "price_asc"}, 100, "xyz"
         )
 
     def test_filter_products_service_error(self):
-        self.mock_query_service.get_filtered_products.side_effect = (
+        self.mock_query_service.get_filtered_products_page.side_effect = (
             DatabaseException("DB Error")
         )
         response = self.client.get(
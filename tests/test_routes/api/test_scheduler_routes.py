@@ -22,13 +22,14 @@ class TestApiSchedulerRoutes(BaseTestCase):
         super().tearDown()
 
     def test_run_scheduler_jobs_success(self):
-        self.mock_scheduler_service.cancel_expired_pending_orders.return_value = {
+        self.mock_scheduler_service.run_daily_jobs.return_value = {
             "success": True,
-            "cancelled_count": 2,
-        }
-        self.mock_scheduler_service.grant_segmented_vouchers.return_value = {
-            "success": True,
-            "granted_count": 1,
+            "failed": [],
+            "results": {
+                "cancel": {"success": True, "cancelled_count": 2},
+                "segments": {"success": True, "granted_count": 1},
+                "purge": {"success": True, "purged_count": 3},
+            },
         }
         response = self.client.post(
             url_for("api.run_scheduler_jobs"),
@@ -38,16 +39,18 @@ class TestApiSchedulerRoutes(BaseTestCase):
         data = json.loads(response.data)
         self.assertTrue(data["success"])
         self.assertIn("2 pesanan dibatalkan", data["message"])
-        self.assertIn("1 voucher top spender diberikan", data["message"])
+        self.assertIn("1 voucher segmen diberikan", data["message"])
+        self.assertIn("3 penahanan stok kedaluwarsa", data["message"])
 
     def test_run_scheduler_jobs_partial_fail(self):
-        self.mock_scheduler_service.cancel_expired_pending_orders.return_value = {
-            "success": True,
-            "cancelled_count": 2,
-        }
-        self.mock_scheduler_service.grant_segmented_vouchers.return_value = {
+        self.mock_scheduler_service.run_daily_jobs.return_value = {
             "success": False,
-            "granted_count": 0,
+            "failed": ["purge"],
+            "results": {
+                "cancel": {"success": True, "cancelled_count": 2},
+                "segments": {"success": True, "granted_count": 1},
+                "purge": {"success": False, "message": "DB Error"},
+            },
         }
         response = self.client.post(
             url_for("api.run_scheduler_jobs"),
@@ -56,6 +59,8 @@ class TestApiSchedulerRoutes(BaseTestCase):
         self.assertEqual(response.status_code, 500)
         data = json.loads(response.data)
         self.assertFalse(data["success"])
+        self.assertIn("2 pesanan dibatalkan", data["message"])
+        self.assertIn("Tugas gagal: purge", data["message"])
 
     def test_run_scheduler_jobs_unauthorized(self):
         response = self.client.post(
@@ -66,7 +71,7 @@ class TestApiSchedulerRoutes(BaseTestCase):
         self.assertIn(b"Tidak diizinkan", response.data)
 
     def test_run_scheduler_jobs_service_error(self):
-        self.mock_scheduler_service.cancel_expired_pending_orders.side_effect = (
+        self.mock_scheduler_service.run_daily_jobs.side_effect = (
             DatabaseException("DB Error")
         )
         response = self.client.post(
@@ -43,9 +43,11 @@ class TestProductCatalogRoutes(BaseTestCase):
             "sizes": "M, L",
             "has_variants": False
         }
-        self.mock_query_service.get_filtered_products.return_value = [
-            mock_product
-        ]
+        self.mock_query_service.get_filtered_products_page.return_value = {
+            "products": [mock_product],
+            "next_cursor": "next-token",
+            "has_more": True,
+        }
         self.mock_category_service.get_all_categories.return_value = [
             {"id": 1, "name": "Test Category"}
         ]
@@ -53,9 +55,14 @@ class TestProductCatalogRoutes(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Test Product", response.data)
         self.assertIn(b"Test Category", response.data)
+        self.assertIn(b'data-next-cursor="next-token"', response.data)
 
     def test_products_page_get_ajax_success(self):
-        self.mock_query_service.get_filtered_products.return_value = []
+        self.mock_query_service.get_filtered_products_page.return_value = {
+            "products": [],
+            "next_cursor": None,
+            "has_more": False,
+        }
         self.mock_category_service.get_all_categories.return_value = []
         response = self.client.get(
             url_for("product.products_page"),
@@ -67,7 +74,7 @@ class TestProductCatalogRoutes(BaseTestCase):
         self.assertIn("html", data)
 
     def test_products_page_get_db_error(self):
-        self.mock_query_service.get_filtered_products.side_effect = (
+        self.mock_query_service.get_filtered_products_page.side_effect = (
             DatabaseException("DB Error")
         )
         response = self.client.get(url_for("product.products_page"))
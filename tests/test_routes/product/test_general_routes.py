@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 
 from flask import url_for
 
+from app.exceptions.database_exceptions import DatabaseException
 from tests.base_test_case import BaseTestCase
 
 
@@ -32,6 +33,39 @@ class TestProductGeneralRoutes(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Top Product", response.data)
 
+    def test_index_serves_cached_fragment(self):
+        self.mock_cursor.fetchall.return_value = [
+            {"id": 1, "name": "Top Product", "price": 10000, 
+             "discount_price": 0, "image_url": "test.jpg", "category": "Test",
+             "stock": 10, "has_variants": False}
+        ]
+        self.client.get(url_for("product.index"))
+        self.mock_cursor.fetchall.return_value = []
+
+        response = self.client.get(
+            url_for("product.index"),
+            headers={"X-Requested-With": "XMLHttpRequest"},
+        )
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertTrue(data["success"])
+        self.assertIn("Top Product", data["html"])
+        self.mock_cursor.execute.assert_called_once()
+
+    @patch("app.routes.product.general_routes.top_products_service")
+    def test_index_service_error(self, mock_top_products):
+        mock_top_products.get_fragment.return_value = None
+        mock_top_products.get_top_products.side_effect = DatabaseException(
+            "DB Error"
+        )
+        response = self.client.get(
+            url_for("product.index"),
+            headers={"X-Requested-With": "XMLHttpRequest"},
+        )
+        self.assertEqual(response.status_code, 500)
+        data = json.loads(response.data)
+        self.assertFalse(data["success"])
+
     def test_index_get_logged_in(self):
         with self.client.session_transaction() as sess:
             sess["user_id"] = 1
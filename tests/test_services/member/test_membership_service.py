@@ -5,6 +5,7 @@ from datetime import datetime
 
 import mysql.connector
 
+from app.core.subscription_cache import get_subscription_cache
 from app.services.member.membership_service import MembershipService
 from app.exceptions.api_exceptions import ValidationError
 
@@ -241,4 +242,52 @@ class TestMembershipService(BaseTestCase):
         self.mock_membership_repo.update_subscription.assert_called_once_with(
             self.db_conn, 1, 2, datetime(2025, 1, 1), datetime(2026, 1, 1), 'active'
         )
-        self.mock_membership_repo.create_transaction.assert_called_once()
\ No newline at end of file
+        self.mock_membership_repo.create_transaction.assert_called_once()
+
+    def _prime_subscription_cache(self, user_id=1):
+        cache = get_subscription_cache()
+        cache.get_or_load(user_id, lambda: None)
+        self.assertEqual(len(cache), 1)
+        return cache
+
+    def test_subscribe_to_plan_invalidates_subscription_cache(self):
+        cache = self._prime_subscription_cache()
+        self.mock_membership_repo.find_active_subscription_by_user_id.return_value = None
+        self.mock_membership_repo.find_membership_by_id.return_value = self.mock_plan
+        self.mock_user_repo.find_by_id.return_value = self.mock_user
+        self.mock_order_repo.create.return_value = 101
+
+        self.membership_service.subscribe_to_plan(1, 1)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_activate_subscription_invalidates_subscription_cache(self):
+        cache = self._prime_subscription_cache()
+        self.mock_membership_repo.find_membership_by_id.return_value = self.mock_plan
+
+        self.membership_service.activate_subscription_from_order(
+            self.db_conn, 1, 1, Decimal("100000")
+        )
+
+        self.assertEqual(len(cache), 0)
+
+    def test_activate_upgrade_invalidates_subscription_cache(self):
+        cache = self._prime_subscription_cache()
+        self.mock_membership_repo.find_active_subscription_by_user_id.return_value = self.mock_subscription
+        self.mock_membership_repo.find_membership_by_id.return_value = {
+            "id": 2, "name": "Platinum", "period": "yearly"
+        }
+
+        self.membership_service.activate_upgrade_from_order(
+            self.db_conn, 1, 2, 1, Decimal("950000")
+        )
+
+        self.assertEqual(len(cache), 0)
+
+    def test_update_membership_clears_subscription_cache(self):
+        cache = self._prime_subscription_cache(7)
+        self.mock_membership_repo.update_membership.return_value = 1
+
+        self.membership_service.update_membership(1, self.form_data)
+
+        self.assertEqual(len(cache), 0)
\ No newline at end of file
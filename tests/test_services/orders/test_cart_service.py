@@ -29,12 +29,14 @@ class TestCartService(BaseTestCase):
             "quantity": 2, "variant_id": None
         }]
         self.mock_cart_repo.get_user_cart_items.return_value = mock_items
-        self.mock_stock_svc.get_available_stock.return_value = 10
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (1, None): 10
+        }
         
         result = self.cart_service.get_cart_details(1)
         
-        self.mock_stock_svc.get_available_stock.assert_called_once_with(
-            1, None, self.db_conn
+        self.mock_stock_svc.get_available_stock_bulk.assert_called_once_with(
+            [(1, None)], self.db_conn
         )
         self.assertEqual(result["subtotal"], 200.0)
         self.assertEqual(result["items"][0]["stock"], 10)
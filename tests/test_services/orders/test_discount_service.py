@@ -53,6 +53,7 @@ class TestDiscountService(BaseTestCase):
         self.assertEqual(result["discount_amount"], 10000.0)
         self.assertEqual(result["final_total"], 90000.0)
         self.assertEqual(result["code"], "TENOFF")
+        self.assertEqual(result["voucher_id"], 1)
 
     def test_validate_and_calculate_by_id_success(self):
         mock_user_voucher = {
@@ -1,3 +1,5 @@
+from datetime import date
+
 from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock
 
@@ -12,11 +14,13 @@ class TestOrderCancelService(BaseTestCase):
         self.mock_order_repo = MagicMock()
         self.mock_history_repo = MagicMock()
         self.mock_stock_svc = MagicMock()
+        self.mock_sales_rollup_svc = MagicMock()
         
         self.order_cancel_service = OrderCancelService(
             order_repo=self.mock_order_repo,
             history_repo=self.mock_history_repo,
-            stock_svc=self.mock_stock_svc
+            stock_svc=self.mock_stock_svc,
+            sales_rollup_svc=self.mock_sales_rollup_svc
         )
 
     def tearDown(self):
@@ -36,8 +40,27 @@ class TestOrderCancelService(BaseTestCase):
         )
         self.mock_history_repo.create.assert_called_once()
         self.mock_stock_svc.restock_items_for_order.assert_not_called()
+        (
+            self.mock_sales_rollup_svc.record_orders_cancelled.
+            assert_called_once_with(self.db_conn, [1])
+        )
         self.assertTrue(result["success"])
 
+    def test_cancel_user_order_invalidates_reports_after_commit(self):
+        (
+            self.mock_order_repo.
+            find_by_id_and_user_id_for_update.return_value
+        ) = {"id": 1, "status": "Menunggu Pembayaran"}
+        days = [date(2025, 1, 15)]
+        self.mock_sales_rollup_svc.record_orders_cancelled.return_value = days
+        invalidate = self.mock_sales_rollup_svc.invalidate_report_cache
+        self.db_conn.commit.side_effect = invalidate.assert_not_called
+
+        self.order_cancel_service.cancel_user_order(1, 1)
+
+        self.db_conn.commit.assert_called_once()
+        invalidate.assert_called_once_with(days)
+
     def test_cancel_user_order_success_processed(self):
         mock_order = {"id": 1, "status": "Diproses"}
         (
@@ -2,6 +2,9 @@ from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock, patch, ANY
 from decimal import Decimal
 
+from app.exceptions.api_exceptions import ValidationError
+from app.exceptions.database_exceptions import DeadlockError
+from app.exceptions.service_exceptions import OutOfStockError
 from app.services.orders.order_creation_service import OrderCreationService
 
 
@@ -21,6 +24,7 @@ class TestOrderCreationService(BaseTestCase):
         self.mock_variant_svc = MagicMock()
         self.mock_voucher_svc = MagicMock()
         self.mock_user_voucher_repo = MagicMock()
+        self.mock_sales_rollup_svc = MagicMock()
         
         self.patch_uuid = patch(
             'app.services.orders.order_creation_service.uuid.uuid4'
@@ -41,7 +45,8 @@ class TestOrderCreationService(BaseTestCase):
             stock_svc=self.mock_stock_svc,
             variant_svc=self.mock_variant_svc,
             voucher_svc=self.mock_voucher_svc,
-            user_voucher_repo=self.mock_user_voucher_repo
+            user_voucher_repo=self.mock_user_voucher_repo,
+            sales_rollup_svc=self.mock_sales_rollup_svc
         )
         
         self.shipping_details = {
@@ -100,6 +105,15 @@ class TestOrderCreationService(BaseTestCase):
         self.mock_order_repo.update_status.assert_called_once_with(
             self.db_conn, 1, "Menunggu Pembayaran"
         )
+        self.mock_sales_rollup_svc.record_order_created.assert_called_once_with(
+            self.db_conn, 1
+        )
+        (
+            self.mock_sales_rollup_svc.invalidate_report_cache.
+            assert_called_once_with(
+                self.mock_sales_rollup_svc.record_order_created.return_value
+            )
+        )
         self.mock_cart_repo.clear_user_cart.assert_called_once()
         self.mock_stock_svc.release_stock_holds.assert_called_once()
         self.assertEqual(result, {"success": True, "order_id": 1})
@@ -112,20 +126,11 @@ class TestOrderCreationService(BaseTestCase):
             self.products_db
         )
         self.mock_discount_svc.validate_and_calculate_by_code.return_value = (
-            {"success": True, "discount_amount": 10.0, "code": "DISKON10"}
+            {"success": True, "discount_amount": 10.0, "code": "DISKON10",
+             "voucher_id": 9}
         )
         self.mock_order_repo.create.return_value = 2
-        self.mock_product_repo.lock_stock.return_value = {"stock": 10}
-        self.mock_product_repo.decrease_stock.return_value = 1
-        self.mock_variant_svc.variant_repository = MagicMock()
-        (
-            self.mock_variant_svc.variant_repository.
-            lock_stock.return_value
-        ) = {"stock": 10}
-        (
-            self.mock_variant_svc.variant_repository.
-            decrease_stock.return_value
-        ) = 1
+        self.mock_stock_svc.deduct_stock.return_value = set()
         
         result = self.order_creation_service.create_order(
             user_id=None, session_id="sess_id",
@@ -145,11 +150,71 @@ class TestOrderCreationService(BaseTestCase):
         self.mock_order_repo.update_status.assert_called_once_with(
             self.db_conn, 2, "Diproses"
         )
-        self.mock_voucher_repo.increment_use_count.assert_called_once()
-        self.mock_voucher_svc.mark_user_voucher_as_used.assert_not_called()
+        self.mock_stock_svc.deduct_stock.assert_called_once_with(
+            self.db_conn, [(1, None, 1)]
+        )
+        self.mock_voucher_svc.redeem_voucher.assert_called_once_with(
+            self.db_conn, 9, 2, None
+        )
         self.mock_cart_repo.clear_user_cart.assert_not_called()
         self.assertEqual(result, {"success": True, "order_id": 2})
 
+    def test_create_order_cod_out_of_stock(self):
+        self.mock_stock_repo.find_detailed_by_session_id.return_value = (
+            self.held_items
+        )
+        self.mock_product_repo.find_batch_for_order.return_value = (
+            self.products_db
+        )
+        self.mock_discount_svc.validate_and_calculate_by_code.return_value = (
+            {"success": False}
+        )
+        self.mock_stock_svc.deduct_stock.side_effect = OutOfStockError(
+            "Stok habis saat mengurangi untuk produk ID 1."
+        )
+        
+        result = self.order_creation_service.create_order(
+            user_id=None, session_id="sess_id",
+            shipping_details=self.shipping_details, payment_method="COD"
+        )
+        
+        self.mock_order_repo.create.assert_not_called()
+        self.db_conn.rollback.assert_called()
+        self.assertFalse(result["success"])
+        self.assertIn("Stok habis", result["message"])
+
+    @patch('app.core.db.time.sleep')
+    def test_create_order_cod_retries_whole_transaction_on_deadlock(
+        self, mock_sleep
+    ):
+        self.mock_stock_repo.find_detailed_by_session_id.return_value = (
+            self.held_items
+        )
+        self.mock_product_repo.find_batch_for_order.return_value = (
+            self.products_db
+        )
+        self.mock_discount_svc.validate_and_calculate_by_code.return_value = (
+            {"success": False}
+        )
+        self.mock_order_repo.create.return_value = 3
+        self.mock_stock_svc.deduct_stock.side_effect = [
+            DeadlockError("Deadlock found"), set()
+        ]
+        
+        result = self.order_creation_service.create_order(
+            user_id=None, session_id="sess_id",
+            shipping_details=self.shipping_details, payment_method="COD"
+        )
+        
+        self.assertEqual(result, {"success": True, "order_id": 3})
+        self.assertEqual(
+            self.mock_stock_repo.find_detailed_by_session_id.call_count, 2
+        )
+        self.assertEqual(self.db_conn.start_transaction.call_count, 2)
+        self.db_conn.rollback.assert_called_once()
+        self.mock_order_repo.create.assert_called_once()
+        mock_sleep.assert_called_once()
+
     def test_create_order_success_user_with_user_voucher(self):
         self.mock_stock_repo.find_detailed_by_user_id.return_value = (
             self.held_items
@@ -159,7 +224,7 @@ class TestOrderCreationService(BaseTestCase):
         )
         self.mock_discount_svc.validate_and_calculate_by_id.return_value = {
             "success": True, "discount_amount": 10.0,
-            "user_voucher_id": 5, "code": "DISKON10"
+            "user_voucher_id": 5, "code": "DISKON10", "voucher_id": 9
         }
         self.mock_order_repo.create.return_value = 3
         
@@ -176,11 +241,8 @@ class TestOrderCreationService(BaseTestCase):
                 1, 5, 100.0
             )
         )
-        self.mock_voucher_svc.mark_user_voucher_as_used.assert_called_once_with(
-            self.db_conn, 5, 3
-        )
-        self.mock_voucher_repo.increment_use_count.assert_called_once_with(
-            self.db_conn, "DISKON10"
+        self.mock_voucher_svc.redeem_voucher.assert_called_once_with(
+            self.db_conn, 9, 3, 5
         )
         self.mock_order_repo.create.assert_called_once_with(
             self.db_conn, 1, Decimal("100"), Decimal("10.0"),
@@ -189,6 +251,34 @@ class TestOrderCreationService(BaseTestCase):
         )
         self.assertEqual(result, {"success": True, "order_id": 3})
 
+    def test_create_order_rolls_back_when_voucher_quota_runs_out(self):
+        self.mock_stock_repo.find_detailed_by_session_id.return_value = (
+            self.held_items
+        )
+        self.mock_product_repo.find_batch_for_order.return_value = (
+            self.products_db
+        )
+        self.mock_discount_svc.validate_and_calculate_by_code.return_value = {
+            "success": True, "discount_amount": 10.0, "code": "FLASH",
+            "voucher_id": 9
+        }
+        self.mock_order_repo.create.return_value = 4
+        self.mock_voucher_svc.redeem_voucher.side_effect = ValidationError(
+            "Voucher sudah habis digunakan."
+        )
+
+        result = self.order_creation_service.create_order(
+            user_id=None, session_id="sess_id",
+            shipping_details=self.shipping_details,
+            payment_method="BANK_TRANSFER", voucher_code="FLASH"
+        )
+
+        self.assertFalse(result["success"])
+        self.assertIn("habis", result["message"])
+        self.db_conn.rollback.assert_called()
+        self.db_conn.commit.assert_not_called()
+        self.mock_stock_svc.release_stock_holds.assert_not_called()
+
     def test_create_order_no_held_items(self):
         self.mock_stock_repo.find_detailed_by_user_id.return_value = []
         
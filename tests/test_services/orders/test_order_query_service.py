@@ -1,3 +1,4 @@
+from datetime import datetime
 from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock
 
@@ -7,6 +8,7 @@ from app.services.orders.order_query_service import OrderQueryService
 from app.exceptions.database_exceptions import (
     DatabaseException, RecordNotFoundError
 )
+from app.utils.pagination_utils import decode_cursor, encode_cursor
 
 
 class TestOrderQueryService(BaseTestCase):
@@ -20,33 +22,83 @@ class TestOrderQueryService(BaseTestCase):
             order_repo=self.mock_order_repo,
             item_repo=self.mock_item_repo
         )
-        
-        self.filters = {"status": "Dikirim", "search": "Test"}
 
     def tearDown(self):
         super().tearDown()
 
-    def test_get_filtered_admin_orders_success(self):
-        mock_orders = [{"id": 1, "status": "Dikirim"}]
-        self.mock_order_repo.find_filtered_admin.return_value = mock_orders
-        
-        result = self.order_query_service.get_filtered_admin_orders(
-            **self.filters
+    def test_get_filtered_admin_orders_page_builds_cursor_and_count(self):
+        rows = [
+            {"id": 9, "order_date": datetime(2025, 1, 3, 8, 0)},
+            {"id": 8, "order_date": datetime(2025, 1, 2, 8, 0)},
+            {"id": 7, "order_date": datetime(2025, 1, 1, 8, 0)},
+        ]
+        self.mock_order_repo.find_filtered_admin.return_value = rows
+        self.mock_order_repo.count_filtered_admin.return_value = 40
+
+        page = self.order_query_service.get_filtered_admin_orders_page(
+            status="Dikirim", limit=2
         )
 
         self.mock_order_repo.find_filtered_admin.assert_called_once_with(
-            self.db_conn, self.filters["status"], None, None,
-            self.filters["search"]
+            self.db_conn, "Dikirim", None, None, None, limit=3, after=None
+        )
+        self.assertEqual(page["orders"], rows[:2])
+        self.assertTrue(page["has_more"])
+        self.assertEqual(page["total"], 40)
+        self.assertEqual(
+            decode_cursor(page["next_cursor"]),
+            {"date": "2025-01-02T08:00:00", "id": 8},
+        )
+
+    def test_get_filtered_admin_orders_page_follows_cursor(self):
+        self.mock_order_repo.find_filtered_admin.return_value = []
+        self.mock_order_repo.count_filtered_admin.return_value = 0
+        cursor = encode_cursor({"date": "2025-01-02T08:00:00", "id": 8})
+
+        page = self.order_query_service.get_filtered_admin_orders_page(
+            limit=2, cursor=cursor
         )
-        self.assertEqual(result, mock_orders)
 
-    def test_get_filtered_admin_orders_db_error(self):
+        _, kwargs = self.mock_order_repo.find_filtered_admin.call_args
+        self.assertEqual(kwargs["after"], (datetime(2025, 1, 2, 8, 0), 8))
+        self.assertFalse(page["has_more"])
+        self.assertIsNone(page["next_cursor"])
+
+    def test_get_filtered_admin_orders_page_ignores_bad_cursor(self):
+        self.mock_order_repo.find_filtered_admin.return_value = []
+        self.mock_order_repo.count_filtered_admin.return_value = 0
+
+        self.order_query_service.get_filtered_admin_orders_page(
+            cursor=encode_cursor({"date": "kemarin", "id": 1})
+        )
+
+        _, kwargs = self.mock_order_repo.find_filtered_admin.call_args
+        self.assertIsNone(kwargs["after"])
+
+    def test_get_filtered_admin_orders_page_caches_count(self):
+        self.mock_order_repo.find_filtered_admin.return_value = []
+        self.mock_order_repo.count_filtered_admin.return_value = 12
+
+        for cursor in (None, encode_cursor({"date": "2025-01-02", "id": 1})):
+            page = self.order_query_service.get_filtered_admin_orders_page(
+                status="Selesai", cursor=cursor
+            )
+            self.assertEqual(page["total"], 12)
+        self.order_query_service.get_filtered_admin_orders_page(
+            status="Dikirim"
+        )
+
+        self.assertEqual(
+            self.mock_order_repo.count_filtered_admin.call_count, 2
+        )
+
+    def test_get_filtered_admin_orders_page_db_error(self):
         self.mock_order_repo.find_filtered_admin.side_effect = (
             mysql.connector.Error("DB Error")
         )
-        
+
         with self.assertRaises(DatabaseException):
-            self.order_query_service.get_filtered_admin_orders(**self.filters)
+            self.order_query_service.get_filtered_admin_orders_page()
 
     def test_get_order_details_for_admin_success(self):
         mock_order = {"id": 1, "status": "Diproses"}
@@ -13,11 +13,13 @@ class TestOrderUpdateService(BaseTestCase):
         self.mock_order_repo = MagicMock()
         self.mock_history_repo = MagicMock()
         self.mock_cancel_svc = MagicMock()
+        self.mock_sales_rollup_svc = MagicMock()
         
         self.order_update_service = OrderUpdateService(
             order_repo=self.mock_order_repo,
             history_repo=self.mock_history_repo,
-            cancel_svc=self.mock_cancel_svc
+            cancel_svc=self.mock_cancel_svc,
+            sales_rollup_svc=self.mock_sales_rollup_svc
         )
         
         self.order_id = 1
@@ -38,6 +40,10 @@ class TestOrderUpdateService(BaseTestCase):
         self.mock_order_repo.update_status_and_tracking.assert_called_once_with(
             self.db_conn, 1, "Dikirim", "TRACK123"
         )
+        (
+            self.mock_sales_rollup_svc.record_status_change.
+            assert_called_once_with(self.db_conn, 1, "Diproses", "Dikirim")
+        )
         self.mock_history_repo.create.assert_called_once()
         self.assertTrue(result["success"])
         self.assertEqual(result["data"]["status"], "Dikirim")
@@ -56,6 +62,7 @@ class TestOrderUpdateService(BaseTestCase):
         self.mock_order_repo.update_status_and_tracking.assert_called_once_with(
             self.db_conn, 1, "Dikirim", "NEWTRACK"
         )
+        self.mock_sales_rollup_svc.record_status_change.assert_not_called()
         self.assertTrue(result["success"])
         self.assertEqual(result["data"]["tracking_number"], "NEWTRACK")
 
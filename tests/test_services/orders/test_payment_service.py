@@ -1,6 +1,8 @@
 from tests.base_test_case import BaseTestCase
-from unittest.mock import MagicMock, ANY
+from unittest.mock import MagicMock, ANY, patch
 
+from app.exceptions.database_exceptions import DeadlockError
+from app.exceptions.service_exceptions import OutOfStockError
 from app.services.orders.payment_service import PaymentService
 
 
@@ -41,37 +43,40 @@ class TestPaymentService(BaseTestCase):
         super().tearDown()
 
     def test_process_successful_payment_success(self):
-        self.mock_order_repo.find_by_transaction_id.return_value = (
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
             self.mock_order
         )
         self.mock_item_repo.find_by_order_id.return_value = self.mock_items
-        self.mock_stock_svc.get_available_stock.return_value = 10
-        self.mock_product_repo.lock_stock.return_value = {"stock": 10}
-        self.mock_variant_repo.lock_stock.return_value = {"stock": 10}
-        self.mock_product_repo.decrease_stock.return_value = 1
-        self.mock_variant_repo.decrease_stock.return_value = 1
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 10
+        }
+        self.mock_stock_svc.deduct_stock.return_value = {11}
         
         result = self.payment_service.process_successful_payment(
             self.transaction_id
         )
         
-        self.mock_order_repo.find_by_transaction_id.assert_called_once()
+        self.mock_order_repo.find_by_transaction_id_for_update.assert_called_once()
         self.mock_item_repo.find_by_order_id.assert_called_once()
-        self.assertEqual(self.mock_stock_svc.get_available_stock.call_count, 2)
-        self.mock_product_repo.lock_stock.assert_called_once()
-        self.mock_variant_repo.lock_stock.assert_called_once()
-        self.mock_product_repo.decrease_stock.assert_called_once()
-        self.mock_variant_repo.decrease_stock.assert_called_once()
+        self.mock_stock_svc.get_available_stock_bulk.assert_called_once_with(
+            [(10, None), (11, 20)], self.db_conn
+        )
+        self.mock_stock_svc.get_available_stock.assert_not_called()
+        self.mock_stock_svc.deduct_stock.assert_called_once_with(
+            self.db_conn, [(10, None, 1), (11, 20, 2)]
+        )
+        self.mock_product_repo.lock_stock.assert_not_called()
+        self.mock_variant_repo.lock_stock.assert_not_called()
         self.mock_order_repo.update_status.assert_called_once_with(
             self.db_conn, self.order_id, "Diproses"
         )
         self.mock_history_repo.create.assert_called_once()
         self.mock_stock_svc.release_stock_holds.assert_called_once()
-        self.mock_variant_svc.update_total_stock_from_variants.assert_called_once()
+        self.mock_variant_svc.update_total_stock_from_variants.assert_not_called()
         self.assertTrue(result["success"])
 
     def test_process_successful_payment_order_not_found(self):
-        self.mock_order_repo.find_by_transaction_id.return_value = None
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = None
         
         result = self.payment_service.process_successful_payment(
             self.transaction_id
@@ -83,7 +88,7 @@ class TestPaymentService(BaseTestCase):
     def test_process_successful_payment_already_processed(self):
         order_processed = self.mock_order.copy()
         order_processed["status"] = "Diproses"
-        self.mock_order_repo.find_by_transaction_id.return_value = (
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
             order_processed
         )
         
@@ -95,11 +100,13 @@ class TestPaymentService(BaseTestCase):
         self.assertIn("sudah diproses", result["message"])
 
     def test_process_successful_payment_out_of_stock_check(self):
-        self.mock_order_repo.find_by_transaction_id.return_value = (
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
             self.mock_order
         )
         self.mock_item_repo.find_by_order_id.return_value = self.mock_items
-        self.mock_stock_svc.get_available_stock.side_effect = [10, 1]
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 1
+        }
         self.mock_product_repo.find_minimal_by_id.return_value = {"name": "Prod B"}
         self.mock_variant_repo.find_by_id.return_value = {"size": "L", "color": "Blue"}
         
@@ -118,18 +125,27 @@ class TestPaymentService(BaseTestCase):
         self.assertIn("stok habis", result["message"])
 
     def test_process_successful_payment_out_of_stock_deduct(self):
-        self.mock_order_repo.find_by_transaction_id.return_value = (
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
             self.mock_order
         )
         self.mock_item_repo.find_by_order_id.return_value = self.mock_items
-        self.mock_stock_svc.get_available_stock.return_value = 10
-        self.mock_product_repo.lock_stock.return_value = {"stock": 10}
-        self.mock_variant_repo.lock_stock.return_value = {"stock": 1}
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 10
+        }
+        self.mock_stock_svc.deduct_stock.side_effect = OutOfStockError(
+            "Stok habis saat mengurangi untuk varian ID 20."
+        )
+        self.mock_order_repo.find_by_id_for_update.return_value = {
+            "status": "Menunggu Pembayaran", "tracking_number": None
+        }
         
         result = self.payment_service.process_successful_payment(
             self.transaction_id
         )
         
+        self.mock_order_repo.find_by_id_for_update.assert_called_once_with(
+            ANY, self.order_id
+        )
         self.mock_order_repo.update_status.assert_called_once_with(
             ANY, self.order_id, "Dibatalkan"
         )
@@ -137,4 +153,103 @@ class TestPaymentService(BaseTestCase):
             ANY, self.order_id, "Dibatalkan", ANY
         )
         self.assertFalse(result["success"])
-        self.assertIn("stok habis", result["message"])
\ No newline at end of file
+        self.assertIn("stok habis", result["message"])
+
+    def test_cancel_due_to_stock_failure_skips_order_already_moved_on(self):
+        self.mock_order_repo.find_by_id_for_update.return_value = {
+            "status": "Dibatalkan", "tracking_number": None
+        }
+        self.payment_service.sales_rollup_service = MagicMock()
+        
+        self.payment_service._cancel_order_due_to_stock_failure(
+            self.order_id, "varian ID 20"
+        )
+        
+        self.mock_order_repo.find_by_id_for_update.assert_called_once_with(
+            self.db_conn, self.order_id
+        )
+        self.mock_order_repo.update_status.assert_not_called()
+        self.mock_history_repo.create.assert_not_called()
+        rollup = self.payment_service.sales_rollup_service
+        rollup.record_orders_cancelled.assert_not_called()
+        rollup.invalidate_report_cache.assert_not_called()
+        self.db_conn.rollback.assert_called_once()
+    @patch('app.core.db.time.sleep')
+    def test_process_successful_payment_retries_whole_unit_on_deadlock(
+        self, mock_sleep
+    ):
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
+            self.mock_order
+        )
+        self.mock_item_repo.find_by_order_id.return_value = self.mock_items
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 10
+        }
+        self.mock_stock_svc.deduct_stock.side_effect = [
+            DeadlockError("Deadlock found"), {11}
+        ]
+        
+        result = self.payment_service.process_successful_payment(
+            self.transaction_id
+        )
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            self.mock_order_repo.find_by_transaction_id_for_update.call_count,
+            2,
+        )
+        self.assertEqual(self.mock_stock_svc.deduct_stock.call_count, 2)
+        self.db_conn.rollback.assert_called()
+        self.mock_order_repo.update_status.assert_called_once_with(
+            self.db_conn, self.order_id, "Diproses"
+        )
+        mock_sleep.assert_called_once()
+
+    @patch('app.core.db.time.sleep')
+    def test_process_successful_payment_rechecks_status_after_deadlock(
+        self, mock_sleep
+    ):
+        order_processed = self.mock_order.copy()
+        order_processed["status"] = "Diproses"
+        self.mock_order_repo.find_by_transaction_id_for_update.side_effect = [
+            self.mock_order, order_processed
+        ]
+        self.mock_item_repo.find_by_order_id.return_value = self.mock_items
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 10
+        }
+        self.mock_stock_svc.deduct_stock.side_effect = DeadlockError(
+            "Deadlock found"
+        )
+        
+        result = self.payment_service.process_successful_payment(
+            self.transaction_id
+        )
+        
+        self.assertTrue(result["success"])
+        self.assertIn("sudah diproses", result["message"])
+        self.mock_stock_svc.deduct_stock.assert_called_once()
+        self.mock_order_repo.update_status.assert_not_called()
+
+    @patch('app.core.db.time.sleep')
+    def test_process_successful_payment_gives_up_after_repeated_deadlocks(
+        self, mock_sleep
+    ):
+        self.mock_order_repo.find_by_transaction_id_for_update.return_value = (
+            self.mock_order
+        )
+        self.mock_item_repo.find_by_order_id.return_value = self.mock_items
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (10, None): 10, (11, 20): 10
+        }
+        self.mock_stock_svc.deduct_stock.side_effect = DeadlockError(
+            "Deadlock found"
+        )
+        
+        result = self.payment_service.process_successful_payment(
+            self.transaction_id
+        )
+        
+        self.assertFalse(result["success"])
+        self.assertEqual(self.mock_stock_svc.deduct_stock.call_count, 4)
+        self.mock_order_repo.update_status.assert_not_called()
@@ -2,6 +2,12 @@ from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
+import mysql.connector
+
+from app.exceptions.database_exceptions import (
+    DatabaseException, DeadlockError
+)
+from app.exceptions.service_exceptions import OutOfStockError
 from app.services.orders.stock_service import StockService
 
 class TestStockService(BaseTestCase):
@@ -40,13 +46,13 @@ class TestStockService(BaseTestCase):
         super().tearDown()
 
     def test_get_available_stock_no_variant(self):
-        self.mock_stock_repo.delete_expired.return_value = 0
         self.mock_product_repo.get_stock.return_value = {"stock": 10}
         self.mock_stock_repo.get_held_stock_sum.return_value = 2
         
         stock = self.stock_service.get_available_stock(product_id=1)
         
-        self.mock_stock_repo.delete_expired.assert_called_once()
+        self.mock_stock_repo.delete_expired.assert_not_called()
+        self.db_conn.commit.assert_not_called()
         self.mock_product_repo.get_stock.assert_called_once_with(
             self.db_conn, 1
         )
@@ -56,7 +62,6 @@ class TestStockService(BaseTestCase):
         self.assertEqual(stock, 8)
 
     def test_get_available_stock_with_variant(self):
-        self.mock_stock_repo.delete_expired.return_value = 1
         self.mock_variant_repo.get_stock.return_value = {"stock": 5}
         self.mock_stock_repo.get_held_stock_sum.return_value = 1
         
@@ -72,9 +77,46 @@ class TestStockService(BaseTestCase):
         )
         self.assertEqual(stock, 4)
 
+    def test_get_available_stock_bulk(self):
+        self.mock_product_repo.get_stock_batch.return_value = [
+            {"id": 1, "stock": 10}
+        ]
+        self.mock_variant_repo.get_stock_batch.return_value = [
+            {"id": 10, "stock": 5}
+        ]
+        self.mock_stock_repo.get_held_stock_sums.return_value = [
+            {"product_id": 1, "variant_id": None, "held": 3},
+            {"product_id": 2, "variant_id": 10, "held": 7},
+        ]
+        
+        result = self.stock_service.get_available_stock_bulk(
+            [(1, None), (2, 10), (1, None), (3, None)]
+        )
+        
+        self.mock_product_repo.get_stock_batch.assert_called_once()
+        self.assertCountEqual(
+            self.mock_product_repo.get_stock_batch.call_args[0][1], [1, 3]
+        )
+        self.mock_variant_repo.get_stock_batch.assert_called_once_with(
+            self.db_conn, [10]
+        )
+        self.mock_stock_repo.get_held_stock_sums.assert_called_once()
+        self.assertEqual(
+            result, {(1, None): 7, (2, 10): 0, (3, None): 0}
+        )
+        self.mock_product_repo.get_stock.assert_not_called()
+
+    def test_get_available_stock_bulk_empty(self):
+        result = self.stock_service.get_available_stock_bulk([])
+        
+        self.assertEqual(result, {})
+        self.mock_product_repo.get_stock_batch.assert_not_called()
+
     def test_hold_stock_for_checkout_success(self):
         self.mock_stock_repo.delete_by_user_id.return_value = 0
-        self.stock_service.get_available_stock = MagicMock(return_value=10)
+        self.stock_service.get_available_stock_bulk = MagicMock(
+            return_value={(1, None): 10, (2, 10): 10}
+        )
         self.mock_stock_repo.create_batch.return_value = 2
         
         result = self.stock_service.hold_stock_for_checkout(
@@ -84,22 +126,24 @@ class TestStockService(BaseTestCase):
         self.mock_stock_repo.delete_by_user_id.assert_called_once_with(
             self.db_conn, 1
         )
-        self.assertEqual(self.stock_service.get_available_stock.call_count, 2)
+        self.stock_service.get_available_stock_bulk.assert_called_once_with(
+            [(1, None), (2, 10)], self.db_conn
+        )
         self.mock_stock_repo.create_batch.assert_called_once()
         self.assertTrue(result["success"])
         self.assertIn("expires_at", result)
 
     def test_hold_stock_for_checkout_out_of_stock(self):
         self.mock_stock_repo.delete_by_user_id.return_value = 0
-        self.stock_service.get_available_stock = MagicMock(
-            side_effect=[10, 1]
+        self.stock_service.get_available_stock_bulk = MagicMock(
+            return_value={(1, None): 10, (2, 10): 1}
         )
         
         result = self.stock_service.hold_stock_for_checkout(
             user_id=1, session_id=None, cart_items=self.cart_items
         )
         
-        self.assertEqual(self.stock_service.get_available_stock.call_count, 2)
+        self.stock_service.get_available_stock_bulk.assert_called_once()
         self.mock_stock_repo.create_batch.assert_not_called()
         self.assertFalse(result["success"])
         self.assertIn("tidak mencukupi", result["message"])
@@ -111,6 +155,50 @@ class TestStockService(BaseTestCase):
         )
         self.mock_stock_repo.delete_by_session_id.assert_not_called()
 
+    def test_release_expired_holds_for_users(self):
+        self.mock_stock_repo.delete_expired_by_user_ids.return_value = 2
+
+        result = self.stock_service.release_expired_holds_for_users(
+            [1, 2], self.db_conn
+        )
+
+        (
+            self.mock_stock_repo.delete_expired_by_user_ids.
+            assert_called_once_with(self.db_conn, [1, 2])
+        )
+        self.assertEqual(result, 2)
+
+    def test_purge_expired_holds_in_batches(self):
+        self.mock_stock_repo.delete_expired.side_effect = [2, 2, 1]
+        
+        result = self.stock_service.purge_expired_holds(batch_size=2)
+        
+        self.assertEqual(result, 5)
+        self.assertEqual(self.mock_stock_repo.delete_expired.call_count, 3)
+        self.mock_stock_repo.delete_expired.assert_called_with(
+            self.db_conn, 2
+        )
+        self.assertEqual(self.db_conn.commit.call_count, 3)
+
+    def test_purge_expired_holds_nothing_expired(self):
+        self.mock_stock_repo.delete_expired.return_value = 0
+        
+        result = self.stock_service.purge_expired_holds()
+        
+        self.assertEqual(result, 0)
+        self.mock_stock_repo.delete_expired.assert_called_once_with(
+            self.db_conn, 500
+        )
+
+    def test_purge_expired_holds_db_error(self):
+        self.mock_stock_repo.delete_expired.side_effect = (
+            mysql.connector.Error("DB Error")
+        )
+        
+        with self.assertRaises(DatabaseException):
+            self.stock_service.purge_expired_holds()
+        self.db_conn.rollback.assert_called_once()
+
     def test_get_held_items_simple_user(self):
         mock_held = [{"product_id": 1, "quantity": 1}]
         self.mock_stock_repo.find_simple_by_user_id.return_value = mock_held
@@ -141,4 +229,76 @@ class TestStockService(BaseTestCase):
         )
         self.mock_variant_svc.update_total_stock_from_variants.assert_called_once_with(
             2, self.db_conn
-        )
\ No newline at end of file
+        )
+
+    def test_deduct_stock_success(self):
+        self.mock_variant_repo.lock_stock_batch.return_value = [
+            {"id": 10, "stock": 5}
+        ]
+        self.mock_product_repo.lock_stock_batch.return_value = [
+            {"id": 1, "stock": 4}
+        ]
+        self.mock_variant_repo.decrease_stock_batch.return_value = 1
+        self.mock_product_repo.decrease_stock_batch.return_value = 1
+        
+        parents = self.stock_service.deduct_stock(
+            self.db_conn, [(1, None, 1), (2, 10, 2), (2, 10, 1), (1, None, 2)]
+        )
+        
+        self.assertEqual(parents, {2})
+        self.mock_variant_repo.decrease_stock_batch.assert_called_once_with(
+            self.db_conn, {10: 3}
+        )
+        self.mock_product_repo.decrease_stock_batch.assert_called_once_with(
+            self.db_conn, {1: 3}
+        )
+        self.mock_product_repo.sync_stock_from_variants.assert_called_once_with(
+            self.db_conn, [2]
+        )
+        self.mock_variant_repo.lock_stock.assert_not_called()
+        self.mock_product_repo.lock_stock.assert_not_called()
+
+    def test_deduct_stock_insufficient_stock(self):
+        self.mock_variant_repo.lock_stock_batch.return_value = [
+            {"id": 10, "stock": 1}
+        ]
+        
+        with self.assertRaises(OutOfStockError) as ctx:
+            self.stock_service.deduct_stock(self.db_conn, [(2, 10, 2)])
+        
+        self.assertIn("varian ID 10", str(ctx.exception))
+        self.mock_variant_repo.decrease_stock_batch.assert_not_called()
+        self.mock_product_repo.sync_stock_from_variants.assert_not_called()
+
+    def test_deduct_stock_conditional_update_mismatch(self):
+        self.mock_product_repo.lock_stock_batch.return_value = [
+            {"id": 1, "stock": 5}, {"id": 3, "stock": 5}
+        ]
+        self.mock_product_repo.decrease_stock_batch.return_value = 1
+        
+        with self.assertRaises(OutOfStockError):
+            self.stock_service.deduct_stock(
+                self.db_conn, [(1, None, 1), (3, None, 1)]
+            )
+
+    def test_deduct_stock_raises_deadlock_without_retrying(self):
+        self.mock_product_repo.lock_stock_batch.side_effect = (
+            mysql.connector.Error("Deadlock", errno=1213)
+        )
+        
+        with self.assertRaises(DeadlockError):
+            self.stock_service.deduct_stock(self.db_conn, [(1, None, 1)])
+        
+        self.mock_product_repo.lock_stock_batch.assert_called_once()
+        self.mock_product_repo.decrease_stock_batch.assert_not_called()
+
+    def test_deduct_stock_other_db_error_not_retried(self):
+        self.mock_product_repo.lock_stock_batch.side_effect = (
+            mysql.connector.Error("Gone away", errno=2006)
+        )
+        
+        with self.assertRaises(DatabaseException) as ctx:
+            self.stock_service.deduct_stock(self.db_conn, [(1, None, 1)])
+        
+        self.assertNotIsInstance(ctx.exception, DeadlockError)
+        self.mock_product_repo.lock_stock_batch.assert_called_once()
@@ -1,12 +1,18 @@
 from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock
 from decimal import Decimal
+import threading
+import uuid
 
 import mysql.connector
 
+from app.core.db import get_pool
+from app.repository.voucher_repository import voucher_repository
 from app.services.orders.voucher_service import VoucherService
 from app.exceptions.api_exceptions import ValidationError
-from app.exceptions.database_exceptions import RecordNotFoundError
+from app.exceptions.database_exceptions import (
+    DatabaseException, RecordNotFoundError
+)
 
 
 class TestVoucherService(BaseTestCase):
@@ -42,6 +48,89 @@ class TestVoucherService(BaseTestCase):
         )
         self.assertEqual(result, self.mock_voucher)
 
+    def test_get_active_voucher_by_code_normalizes_and_caches(self):
+        self.mock_voucher_repo.find_active_by_code.return_value = {
+            "id": 1, "code": "TEST10", "use_count": 0
+        }
+        self.mock_voucher_repo.find_usage_by_id.return_value = {
+            "use_count": 5, "is_active": 1
+        }
+
+        self.voucher_service.get_active_voucher_by_code(" test10 ")
+        result = self.voucher_service.get_active_voucher_by_code("Test10")
+
+        self.mock_voucher_repo.find_active_by_code.assert_called_once_with(
+            self.db_conn, "TEST10"
+        )
+        self.mock_voucher_repo.find_usage_by_id.assert_called_once_with(
+            self.db_conn, 1
+        )
+        self.assertEqual(result["use_count"], 5)
+
+    def test_get_active_voucher_by_code_does_not_cache_unknown_code(self):
+        self.mock_voucher_repo.find_active_by_code.side_effect = [
+            None, self.mock_voucher
+        ]
+
+        self.assertIsNone(
+            self.voucher_service.get_active_voucher_by_code("NOPE")
+        )
+        self.assertEqual(
+            self.voucher_service.get_active_voucher_by_code("nope"),
+            self.mock_voucher
+        )
+
+        self.assertEqual(
+            self.mock_voucher_repo.find_active_by_code.call_count, 2
+        )
+        self.assertEqual(len(self.app.extensions["voucher_cache"]), 1)
+        self.assertIsNone(self.voucher_service.get_active_voucher_by_code(""))
+
+    def test_get_active_voucher_by_code_drops_deactivated_voucher(self):
+        self.mock_voucher_repo.find_active_by_code.return_value = (
+            self.mock_voucher
+        )
+        self.mock_voucher_repo.find_usage_by_id.return_value = {
+            "use_count": 0, "is_active": 0
+        }
+
+        self.voucher_service.get_active_voucher_by_code("TEST10")
+        result = self.voucher_service.get_active_voucher_by_code("TEST10")
+
+        self.assertIsNone(result)
+        self.voucher_service.get_active_voucher_by_code("TEST10")
+        self.assertEqual(
+            self.mock_voucher_repo.find_active_by_code.call_count, 2
+        )
+
+    def test_admin_changes_invalidate_voucher_cache(self):
+        self.mock_voucher_repo.find_active_by_code.return_value = (
+            self.mock_voucher
+        )
+        self.mock_voucher_repo.find_usage_by_id.return_value = {
+            "use_count": 0, "is_active": 1
+        }
+        self.mock_voucher_repo.find_by_code.return_value = None
+        self.mock_voucher_repo.find_by_id.return_value = {
+            "id": 1, "code": "TEST10", "is_active": True
+        }
+        self.mock_voucher_repo.delete.return_value = 1
+
+        for change in (
+            lambda: self.voucher_service.add_voucher(
+                "test10", "PERCENTAGE", "10", None, None
+            ),
+            lambda: self.voucher_service.toggle_voucher_status(1),
+            lambda: self.voucher_service.delete_voucher_by_id(1),
+        ):
+            self.voucher_service.get_active_voucher_by_code("TEST10")
+            change()
+            self.voucher_service.get_active_voucher_by_code("TEST10")
+
+        self.assertEqual(
+            self.mock_voucher_repo.find_active_by_code.call_count, 4
+        )
+
     def test_get_all_vouchers_success(self):
         mock_vouchers = [{"id": 1, "code": "TEST10"}]
         self.mock_voucher_repo.find_all.return_value = mock_vouchers
@@ -191,6 +280,38 @@ class TestVoucherService(BaseTestCase):
         )
         self.assertEqual(result, mock_list)
 
+    def test_redeem_voucher_marks_user_voucher_in_same_connection(self):
+        self.mock_voucher_repo.redeem.return_value = 1
+        self.mock_user_voucher_repo.mark_as_used.return_value = 1
+
+        self.voucher_service.redeem_voucher(self.db_conn, 1, 100, 5)
+
+        self.mock_voucher_repo.redeem.assert_called_once_with(self.db_conn, 1)
+        self.mock_user_voucher_repo.mark_as_used.assert_called_once_with(
+            self.db_conn, 5, 100
+        )
+
+    def test_redeem_voucher_rejects_exhausted_quota(self):
+        self.mock_voucher_repo.redeem.return_value = 0
+
+        with self.assertRaises(ValidationError):
+            self.voucher_service.redeem_voucher(self.db_conn, 1, 100, 5)
+
+        self.mock_user_voucher_repo.mark_as_used.assert_not_called()
+
+    def test_redeem_voucher_rejects_used_user_voucher(self):
+        self.mock_voucher_repo.redeem.return_value = 1
+        self.mock_user_voucher_repo.mark_as_used.return_value = 0
+
+        with self.assertRaises(ValidationError):
+            self.voucher_service.redeem_voucher(self.db_conn, 1, 100, 5)
+
+    def test_redeem_voucher_db_error(self):
+        self.mock_voucher_repo.redeem.side_effect = mysql.connector.Error()
+
+        with self.assertRaises(DatabaseException):
+            self.voucher_service.redeem_voucher(self.db_conn, 1, 100)
+
     def test_mark_user_voucher_as_used(self):
         self.mock_user_voucher_repo.mark_as_used.return_value = 1
         
@@ -241,4 +362,85 @@ class TestVoucherService(BaseTestCase):
         
         result = self.voucher_service.grant_welcome_voucher(self.db_conn, 1)
         
-        self.assertFalse(result)
\ No newline at end of file
+        self.assertFalse(result)
+
+
+class TestVoucherRedemptionConcurrency(BaseTestCase):
+
+    THREADS = 12
+    MAX_USES = 5
+
+    def setUp(self):
+        super().setUp()
+        self.voucher_service = VoucherService(voucher_repo=voucher_repository)
+        self.admin_conn = self._connect(autocommit=True)
+        self.admin_cursor = self.admin_conn.cursor(dictionary=True)
+        
+        self.admin_cursor.execute(
+            "INSERT INTO vouchers (code, type, value, max_uses, use_count) "
+            "VALUES (%s, 'FIXED_AMOUNT', 1000, %s, 0)",
+            (f"STRESS{uuid.uuid4().hex[:8].upper()}", self.MAX_USES)
+        )
+        self.voucher_id = self.admin_cursor.lastrowid
+
+    def tearDown(self):
+        self.admin_cursor.execute(
+            "DELETE FROM vouchers WHERE id = %s", (self.voucher_id,)
+        )
+        self.admin_cursor.close()
+        self.admin_conn.close()
+        super().tearDown()
+
+    def _connect(self, **overrides):
+        return mysql.connector.connect(
+            **{**get_pool().connect_args, **overrides}
+        )
+
+    def _redeem_on_own_connection(self, order_id, barrier, outcomes):
+        conn = self._connect()
+        try:
+            barrier.wait()
+            conn.start_transaction()
+            try:
+                self.voucher_service.redeem_voucher(
+                    conn, self.voucher_id, order_id
+                )
+                conn.commit()
+                outcomes.append("redeemed")
+            except ValidationError:
+                conn.rollback()
+                outcomes.append("rejected")
+        except Exception as e:
+            outcomes.append(e)
+        finally:
+            conn.close()
+
+    def test_concurrent_redemptions_never_exceed_max_uses(self):
+        barrier = threading.Barrier(self.THREADS, timeout=10)
+        outcomes = []
+        threads = [
+            threading.Thread(
+                target=self._redeem_on_own_connection,
+                args=(order_id, barrier, outcomes)
+            )
+            for order_id in range(1, self.THREADS + 1)
+        ]
+        
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        
+        self.assertEqual(len(outcomes), self.THREADS)
+        self.assertEqual(
+            [o for o in outcomes if o not in ("redeemed", "rejected")], []
+        )
+        self.assertEqual(outcomes.count("redeemed"), self.MAX_USES)
+        
+        self.admin_cursor.execute(
+            "SELECT use_count FROM vouchers WHERE id = %s",
+            (self.voucher_id,)
+        )
+        self.assertEqual(
+            self.admin_cursor.fetchone()["use_count"], self.MAX_USES
+        )
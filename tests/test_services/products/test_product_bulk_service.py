@@ -13,9 +13,11 @@ class TestProductBulkService(BaseTestCase):
     def setUp(self):
         super().setUp()
         self.mock_product_repo = MagicMock()
+        self.mock_top_products_svc = MagicMock()
         
         self.product_bulk_service = ProductBulkService(
-            product_repo=self.mock_product_repo
+            product_repo=self.mock_product_repo,
+            top_products_svc=self.mock_top_products_svc,
         )
 
     def tearDown(self):
@@ -36,6 +38,7 @@ class TestProductBulkService(BaseTestCase):
             "success": True,
             "message": "3 produk berhasil dihapus."
         })
+        self.mock_top_products_svc.invalidate.assert_called_once()
 
     def test_handle_bulk_set_category_success(self):
         selected_ids = [1, 2]
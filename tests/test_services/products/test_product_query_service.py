@@ -1,7 +1,12 @@
+import json
+
 from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock, patch
 
 from app.services.products.product_query_service import ProductQueryService
+from app.utils.pagination_utils import decode_cursor, encode_cursor
+
+_real_json_loads = json.loads
 
 
 class TestProductQueryService(BaseTestCase):
@@ -12,6 +17,7 @@ class TestProductQueryService(BaseTestCase):
         self.mock_variant_repo = MagicMock()
         self.mock_stock_svc = MagicMock()
         self.mock_variant_svc = MagicMock()
+        self.mock_view_counter_svc = MagicMock()
         
         self.patch_json_loads = patch(
             'app.services.products.product_query_service.json.loads'
@@ -23,7 +29,8 @@ class TestProductQueryService(BaseTestCase):
             product_repo=self.mock_product_repo,
             variant_repo=self.mock_variant_repo,
             stock_svc=self.mock_stock_svc,
-            variant_svc=self.mock_variant_svc
+            variant_svc=self.mock_variant_svc,
+            view_counter_svc=self.mock_view_counter_svc,
         )
 
     def tearDown(self):
@@ -38,10 +45,157 @@ class TestProductQueryService(BaseTestCase):
         result = self.product_query_service.get_filtered_products(filters)
         
         self.mock_product_repo.find_filtered.assert_called_once_with(
-            self.db_conn, filters
+            self.db_conn, {"search": "Product", "search_query": "+product*"}
         )
         self.assertEqual(result, mock_products)
 
+    def test_get_filtered_products_page_has_more(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        rows = [
+            {"id": 3, "popularity": 9, "price": 100, "discount_price": None},
+            {"id": 2, "popularity": 5, "price": 80, "discount_price": None},
+            {"id": 1, "popularity": 5, "price": 90, "discount_price": None},
+        ]
+        self.mock_product_repo.find_filtered.return_value = rows
+
+        result = self.product_query_service.get_filtered_products_page(
+            {"sort": "popularity"}, 2
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn, {"sort": "popularity", "search_query": None},
+            limit=3, after=None
+        )
+        self.assertEqual(result["products"], rows[:2])
+        self.assertTrue(result["has_more"])
+        self.assertEqual(
+            decode_cursor(result["next_cursor"]),
+            {"sort": "popularity", "value": 5, "id": 2},
+        )
+
+    def test_get_filtered_products_page_last_page(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_filtered.return_value = [
+            {"id": 1, "popularity": 1, "price": 10, "discount_price": None}
+        ]
+
+        result = self.product_query_service.get_filtered_products_page(
+            {"sort": "popularity"}, 2
+        )
+
+        self.assertFalse(result["has_more"])
+        self.assertIsNone(result["next_cursor"])
+
+    def test_get_filtered_products_page_price_cursor(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        cursor = encode_cursor({"sort": "price_asc", "value": "50", "id": 4})
+        self.mock_product_repo.find_filtered.return_value = [
+            {"id": 5, "price": 70, "discount_price": 60,
+             "min_effective_price": 60},
+            {"id": 6, "price": 80, "discount_price": None,
+             "min_effective_price": 80},
+        ]
+
+        result = self.product_query_service.get_filtered_products_page(
+            {"sort": "price_asc"}, 1, cursor
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn, {"sort": "price_asc", "search_query": None},
+            limit=2, after=("50", 4)
+        )
+        self.assertEqual(
+            decode_cursor(result["next_cursor"]),
+            {"sort": "price_asc", "value": 60, "id": 5},
+        )
+
+    def test_get_filtered_products_page_ignores_cursor_of_other_sort(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        cursor = encode_cursor({"sort": "price_desc", "value": "50", "id": 4})
+        self.mock_product_repo.find_filtered.return_value = []
+
+        self.product_query_service.get_filtered_products_page(
+            {"sort": "popularity"}, 5, cursor
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn, {"sort": "popularity", "search_query": None},
+            limit=6, after=None
+        )
+
+    def test_get_filtered_products_page_invalid_cursor(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_filtered.return_value = []
+
+        self.product_query_service.get_filtered_products_page(
+            {"sort": "bogus"}, 5, "%%%not-base64"
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn, {"sort": "popularity", "search_query": None},
+            limit=6, after=None
+        )
+
+    def test_get_filtered_products_page_search_ranks_by_relevance(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_filtered.return_value = [
+            {"id": 9, "relevance": 2.5},
+            {"id": 4, "relevance": 1.0},
+        ]
+
+        result = self.product_query_service.get_filtered_products_page(
+            {"search": "Sepatunya yang hitam", "sort": "popularity"}, 1
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn,
+            {
+                "search": "Sepatunya yang hitam",
+                "sort": "relevance",
+                "search_query": "+sepatu* +hitam*",
+            },
+            limit=2,
+            after=None,
+        )
+        self.assertEqual(
+            decode_cursor(result["next_cursor"]),
+            {"sort": "relevance", "value": 2.5, "id": 9},
+        )
+
+    def test_get_filtered_products_page_search_keeps_price_sort(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_filtered.return_value = []
+
+        self.product_query_service.get_filtered_products_page(
+            {"search": "kemeja-kemeja", "sort": "price_desc"}, 5
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn,
+            {
+                "search": "kemeja-kemeja",
+                "sort": "price_desc",
+                "search_query": "+kemeja*",
+            },
+            limit=6,
+            after=None,
+        )
+
+    def test_get_filtered_products_page_short_search_has_no_query(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_filtered.return_value = []
+
+        self.product_query_service.get_filtered_products_page(
+            {"search": "XL di", "sort": "popularity"}, 5
+        )
+
+        self.mock_product_repo.find_filtered.assert_called_once_with(
+            self.db_conn,
+            {"search": "XL di", "sort": "popularity", "search_query": None},
+            limit=6,
+            after=None,
+        )
+
     def test_get_all_products_with_category_success(self):
         mock_products = [{"id": 1, "name": "Product"}]
         self.mock_product_repo.find_all_with_category.return_value = (
@@ -60,6 +214,53 @@ class TestProductQueryService(BaseTestCase):
         )
         self.assertEqual(result, mock_products)
 
+    def test_get_admin_products_page_merges_variant_summary(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_admin_page.return_value = [
+            {"id": 9, "has_variants": True},
+            {"id": 8, "has_variants": False},
+            {"id": 7, "has_variants": True},
+        ]
+        self.mock_product_repo.find_variant_summaries.return_value = {
+            9: {
+                "variant_count": 4, "variants_in_stock": 2,
+                "max_effective_price": 150000,
+            }
+        }
+        self.mock_product_repo.count_admin.return_value = 30
+
+        page = self.product_query_service.get_admin_products_page(
+            stock_status="low_stock", limit=2
+        )
+
+        self.mock_product_repo.find_admin_page.assert_called_once_with(
+            self.db_conn, None, None, "low_stock", limit=3, after_id=None
+        )
+        self.mock_product_repo.find_variant_summaries.assert_called_once_with(
+            self.db_conn, [9]
+        )
+        self.assertEqual(page["total"], 30)
+        self.assertTrue(page["has_more"])
+        self.assertEqual(decode_cursor(page["next_cursor"]), {"id": 8})
+        self.assertEqual(page["products"][0]["variant_count"], 4)
+        self.assertEqual(page["products"][0]["max_price"], 150000)
+        self.assertEqual(page["products"][1]["variant_count"], 0)
+
+    def test_get_admin_products_page_next_page_skips_count(self):
+        self.mock_json_loads.side_effect = _real_json_loads
+        self.mock_product_repo.find_admin_page.return_value = []
+        self.mock_product_repo.find_variant_summaries.return_value = {}
+
+        page = self.product_query_service.get_admin_products_page(
+            cursor=encode_cursor({"id": 8})
+        )
+
+        _, kwargs = self.mock_product_repo.find_admin_page.call_args
+        self.assertEqual(kwargs["after_id"], 8)
+        self.mock_product_repo.count_admin.assert_not_called()
+        self.assertIsNone(page["total"])
+        self.assertIsNone(page["next_cursor"])
+
     def test_get_product_by_id_success_no_variants(self):
         mock_product = {
             "id": 1, "name": "Test", "has_variants": False,
@@ -72,9 +273,7 @@ class TestProductQueryService(BaseTestCase):
         
         result = self.product_query_service.get_product_by_id(1)
         
-        self.mock_product_repo.update_popularity.assert_called_once_with(
-            self.db_conn, 1
-        )
+        self.mock_view_counter_svc.record_view.assert_called_once_with(1)
         self.mock_json_loads.assert_called_once_with('["add.jpg"]')
         self.mock_stock_svc.get_available_stock.assert_called_once_with(
             1, None, self.db_conn
@@ -97,12 +296,14 @@ class TestProductQueryService(BaseTestCase):
         self.mock_variant_svc.get_variants_for_product.return_value = (
             mock_variants
         )
-        self.mock_stock_svc.get_available_stock.side_effect = [5, 8]
+        self.mock_stock_svc.get_available_stock_bulk.return_value = {
+            (1, 10): 5, (1, 11): 8
+        }
         
         result = self.product_query_service.get_product_by_id(1)
         
-        self.assertEqual(
-            self.mock_stock_svc.get_available_stock.call_count, 2
+        self.mock_stock_svc.get_available_stock_bulk.assert_called_once_with(
+            [(1, 10), (1, 11)], self.db_conn
         )
         self.assertEqual(result["variants"][0]["stock"], 5)
         self.assertEqual(result["variants"][1]["stock"], 8)
@@ -15,6 +15,7 @@ class TestProductService(BaseTestCase):
         self.mock_image_svc = MagicMock()
         self.mock_variant_conv_svc = MagicMock()
         self.mock_variant_svc = MagicMock()
+        self.mock_top_products_svc = MagicMock()
         self.mock_stock_svc = MagicMock()
         
         self.patch_get_db_extra = patch(
@@ -29,7 +30,8 @@ class TestProductService(BaseTestCase):
             image_svc=self.mock_image_svc,
             variant_conversion_svc=self.mock_variant_conv_svc,
             variant_svc=self.mock_variant_svc,
-            stock_svc=self.mock_stock_svc
+            stock_svc=self.mock_stock_svc,
+            top_products_svc=self.mock_top_products_svc,
         )
         
         self.mock_form = {
@@ -63,6 +65,9 @@ class TestProductService(BaseTestCase):
         
         self.mock_image_svc.handle_image_upload.assert_called_once()
         self.mock_product_repo.create.assert_called_once()
+        self.mock_product_repo.refresh_min_prices.assert_called_once_with(
+            self.db_conn, [1]
+        )
         self.mock_stock_svc.get_available_stock.assert_called_once_with(1, None, self.db_conn)
         self.assertEqual(result["success"], True)
         self.assertIn("all_images", result["product"])
@@ -128,6 +133,10 @@ class TestProductService(BaseTestCase):
             self.db_conn, 1
         )
         self.mock_product_repo.update.assert_called_once()
+        self.mock_product_repo.refresh_min_prices.assert_called_once_with(
+            self.db_conn, [1]
+        )
+        self.mock_top_products_svc.invalidate.assert_called_once()
         self.assertEqual(result["success"], True)
 
     def test_update_product_to_variant(self):
@@ -176,4 +185,5 @@ class TestProductService(BaseTestCase):
         self.mock_image_svc.delete_all_product_images.assert_called_once_with(
                 mock_product
             )
+        self.mock_top_products_svc.invalidate.assert_called_once()
         self.assertEqual(result["success"], True)
\ No newline at end of file
@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+import mysql.connector
+
+from app.exceptions.database_exceptions import DatabaseException
+from app.services.products.top_products_service import (
+    TopProductsService, start_top_products_refresher
+)
+from tests.base_test_case import BaseTestCase
+
+
+class TestTopProductsService(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_product_repo = MagicMock()
+        self.products = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        self.mock_product_repo.find_top_by_popularity.return_value = (
+            self.products
+        )
+        self.service = TopProductsService(product_repo=self.mock_product_repo)
+
+    def test_get_top_products_loads_once(self):
+        first = self.service.get_top_products(4)
+        second = self.service.get_top_products(4)
+
+        self.assertEqual(first, self.products)
+        self.assertEqual(second, self.products)
+        (
+            self.mock_product_repo.find_top_by_popularity
+            .assert_called_once_with(self.db_conn, 4)
+        )
+
+    def test_cache_is_kept_per_app(self):
+        self.service.get_top_products(4)
+
+        self.assertIn("top_products_cache", self.app.extensions)
+
+    def test_invalidate_forces_reload(self):
+        self.service.get_top_products(4)
+        self.service.invalidate()
+        self.service.get_top_products(4)
+
+        self.assertEqual(
+            self.mock_product_repo.find_top_by_popularity.call_count, 2
+        )
+
+    def test_fragment_round_trip(self):
+        self.service.set_fragment(3, "<section>top</section>")
+
+        self.assertEqual(self.service.get_fragment(3), "<section>top</section>")
+        self.assertIsNone(self.service.get_fragment(4))
+
+    def test_fragment_disabled_by_config(self):
+        self.app.config["LANDING_FRAGMENT_CACHE"] = False
+        self.service.set_fragment(3, "<section>top</section>")
+
+        self.assertIsNone(self.service.get_fragment(3))
+
+    def test_refresh_with_changed_products_drops_fragment(self):
+        self.service.get_top_products(4)
+        self.service.set_fragment(1, "<section>lama</section>")
+
+        self.mock_product_repo.find_top_by_popularity.return_value = [
+            {"id": 2, "name": "B"}
+        ]
+        self.service.refresh(4)
+
+        self.assertIsNone(self.service.get_fragment(1))
+
+    def test_refresh_with_same_products_keeps_fragment(self):
+        self.service.get_top_products(4)
+        self.service.set_fragment(1, "<section>tetap</section>")
+
+        self.service.refresh(4)
+
+        self.assertEqual(
+            self.service.get_fragment(1), "<section>tetap</section>"
+        )
+
+    def test_refresh_db_error(self):
+        self.mock_product_repo.find_top_by_popularity.side_effect = (
+            mysql.connector.Error("DB Error")
+        )
+
+        with self.assertRaises(DatabaseException):
+            self.service.refresh(4)
+
+    def test_refresher_not_started_in_testing(self):
+        self.assertIsNone(start_top_products_refresher(self.app))
@@ -55,6 +55,9 @@ class TestVariantService(BaseTestCase):
         self.mock_product_repo.update_stock.assert_called_once_with(
             self.db_conn, 1, 10
         )
+        self.mock_product_repo.refresh_min_prices.assert_called_once_with(
+            self.db_conn, [1]
+        )
         self.assertEqual(result["success"], True)
         self.assertEqual(result["data"], new_variant)
 
@@ -96,6 +99,9 @@ class TestVariantService(BaseTestCase):
         self.mock_product_repo.update_stock.assert_called_once_with(
             self.db_conn, 1, 20
         )
+        self.mock_product_repo.refresh_min_prices.assert_called_once_with(
+            self.db_conn, [1]
+        )
         self.assertEqual(result["success"], True)
 
     def test_update_variant_not_found(self):
@@ -118,4 +124,7 @@ class TestVariantService(BaseTestCase):
         self.mock_product_repo.update_stock.assert_called_once_with(
             self.db_conn, 1, 0
         )
+        self.mock_product_repo.refresh_min_prices.assert_called_once_with(
+            self.db_conn, [1]
+        )
         self.assertEqual(result["success"], True)
\ No newline at end of file
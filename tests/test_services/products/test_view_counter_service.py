@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock, patch
+
+import mysql.connector
+
+from app.exceptions.database_exceptions import DatabaseException
+from app.services.products.view_counter_service import (
+    ViewCounterService, start_view_counter_flusher, view_counter_service
+)
+from tests.base_test_case import BaseTestCase
+
+
+class TestViewCounterService(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_product_repo = MagicMock()
+        self.service = ViewCounterService(product_repo=self.mock_product_repo)
+        self.app.config["VIEW_COUNTER_FLUSH_THRESHOLD"] = 0
+        self.mock_get_pool = patch(
+            "app.services.products.view_counter_service.get_pool"
+        ).start()
+        self.mock_get_pool.return_value.acquire.return_value = self.db_conn
+
+    def test_record_view_buffers_in_memory(self):
+        self.service.record_view(1)
+        self.service.record_view("1")
+        self.service.record_view(2)
+
+        self.assertEqual(self.service.pending_count, 3)
+        self.mock_product_repo.increment_popularity_batch.assert_not_called()
+
+    def test_flush_writes_one_batch(self):
+        self.service.record_view(1)
+        self.service.record_view(1)
+        self.service.record_view(2)
+
+        flushed = self.service.flush()
+
+        self.assertEqual(flushed, 3)
+        (
+            self.mock_product_repo.increment_popularity_batch
+            .assert_called_once_with(self.db_conn, {1: 2, 2: 1})
+        )
+        self.db_conn.commit.assert_called_once()
+        self.mock_get_pool.return_value.acquire.assert_called_once()
+        self.mock_get_db.assert_not_called()
+        self.assertEqual(self.service.pending_count, 0)
+        self.assertEqual(self.service.get_stats()["flushed_views"], 3)
+
+    def test_flush_without_pending_views_skips_database(self):
+        self.assertEqual(self.service.flush(), 0)
+        self.mock_product_repo.increment_popularity_batch.assert_not_called()
+
+    def test_threshold_triggers_flush(self):
+        self.app.config["VIEW_COUNTER_FLUSH_THRESHOLD"] = 2
+
+        self.service.record_view(5)
+        self.mock_product_repo.increment_popularity_batch.assert_not_called()
+        self.service.record_view(5)
+
+        (
+            self.mock_product_repo.increment_popularity_batch
+            .assert_called_once_with(self.db_conn, {5: 2})
+        )
+
+    def test_threshold_wakes_running_flusher_instead_of_writing(self):
+        self.app.config["VIEW_COUNTER_FLUSH_THRESHOLD"] = 1
+        self.service.flusher = MagicMock(is_running=True)
+
+        self.service.record_view(5)
+
+        self.service.flusher.trigger.assert_called_once()
+        self.mock_product_repo.increment_popularity_batch.assert_not_called()
+        self.mock_get_pool.return_value.acquire.assert_not_called()
+        self.assertEqual(self.service.pending_count, 1)
+
+    def test_failed_flush_keeps_pending_views(self):
+        self.mock_product_repo.increment_popularity_batch.side_effect = (
+            mysql.connector.Error("Lock wait timeout")
+        )
+        self.service.record_view(1)
+        self.service.record_view(2)
+
+        with self.assertRaises(DatabaseException):
+            self.service.flush()
+
+        self.db_conn.rollback.assert_called_once()
+        stats = self.service.get_stats()
+        self.assertEqual(stats["pending_views"], 2)
+        self.assertEqual(stats["pending_products"], 2)
+        self.assertEqual(stats["failed_flushes"], 1)
+
+    def test_failed_threshold_flush_does_not_fail_the_view(self):
+        self.app.config["VIEW_COUNTER_FLUSH_THRESHOLD"] = 1
+        self.mock_product_repo.increment_popularity_batch.side_effect = (
+            mysql.connector.Error("Lock wait timeout")
+        )
+
+        self.service.record_view(1)
+
+        self.assertEqual(self.service.pending_count, 1)
+
+    def test_flusher_not_started_in_testing(self):
+        self.assertIsNone(start_view_counter_flusher(self.app))
+
+    @patch("app.services.products.view_counter_service.atexit.register")
+    @patch("app.services.products.view_counter_service.PeriodicTask")
+    def test_flusher_registers_final_flush(self, mock_task_cls, mock_register):
+        self.app.config["TESTING"] = False
+        self.app.config["VIEW_COUNTER_FLUSH_INTERVAL"] = 10
+        mock_task = mock_task_cls.return_value
+        self.addCleanup(setattr, view_counter_service, "flusher", None)
+
+        task = start_view_counter_flusher(self.app)
+
+        self.assertIs(task, mock_task)
+        self.assertIs(view_counter_service.flusher, mock_task)
+        mock_task.start.assert_called_once()
+        final_flush = mock_register.call_args[0][0]
+        final_flush()
+        mock_task.stop.assert_called_once()
+        mock_task.run_once.assert_called_once()
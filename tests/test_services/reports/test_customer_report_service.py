@@ -74,7 +74,7 @@ class TestCustomerReportService(BaseTestCase):
 
     def test_get_full_customers_data_for_export_success(self):
         mock_data = [
-            {"id": 1, "username": "test", "total_spent": Decimal("100.50")}
+            (1, "test", Decimal("100.50"))
         ]
         self.mock_report_repo.get_full_customers_data_for_export.return_value = (
             mock_data
@@ -85,8 +85,15 @@ class TestCustomerReportService(BaseTestCase):
                 "2025-01-01", "2025-01-31"
             )
         )
+        self.db_conn.close.assert_not_called()
         
-        self.assertEqual(result, [[1, "test", 100.50]])
+        self.assertEqual(list(result), [[1, "test", 100.50]])
+        self.db_conn.close.assert_called_once()
+        self.assertEqual(
+            self.mock_report_repo.get_full_customers_data_for_export
+            .call_args.kwargs,
+            {"chunk_size": 1000},
+        )
 
     def test_get_full_customers_data_for_export_db_error(self):
         self.mock_report_repo.get_full_customers_data_for_export.side_effect = (
@@ -77,13 +77,34 @@ class TestDashboardReportService(BaseTestCase):
             "sales_chart_data": {"labels": ["a"], "data": [1]},
             "top_products_chart": {"labels": ["b"], "data": [2]},
             "low_stock_chart": {"labels": ["c"], "data": [3]},
+            "failed_sections": [],
         }
         self.assertEqual(result, expected_stats)
 
-    def test_get_dashboard_stats_db_error(self):
+    def test_get_dashboard_stats_partial_failure(self):
         self.mock_report_repo.get_dashboard_sales.side_effect = (
             mysql.connector.Error("DB Error")
         )
+        self.mock_report_repo.get_dashboard_order_count.return_value = 10
+
+        result = self.dashboard_report_service.get_dashboard_stats(
+            self.start_date, self.end_date
+        )
+
+        self.assertEqual(result["total_sales"], Decimal("0"))
+        self.assertEqual(result["order_count"], 10)
+        self.assertEqual(result["failed_sections"], ["total_sales"])
+
+    def test_get_dashboard_stats_db_error(self):
+        db_error = mysql.connector.Error("DB Error")
+        for method in (
+            "get_dashboard_sales", "get_dashboard_order_count",
+            "get_dashboard_new_user_count", "get_dashboard_product_count",
+        ):
+            getattr(self.mock_report_repo, method).side_effect = db_error
+        self.mock_sales_svc.get_sales_chart_data.side_effect = db_error
+        self.mock_product_svc.get_top_products_chart_data.side_effect = db_error
+        self.mock_inventory_svc.get_low_stock_chart_data.side_effect = db_error
         
         with self.assertRaises(DatabaseException):
             self.dashboard_report_service.get_dashboard_stats(
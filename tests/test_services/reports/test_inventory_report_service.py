@@ -2,6 +2,8 @@ from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock
 from decimal import Decimal
 
+import mysql.connector
+
 from app.services.reports.inventory_report_service import (
     InventoryReportService
 )
@@ -52,9 +54,27 @@ class TestInventoryReportService(BaseTestCase):
             "total_value": Decimal("5000"),
             "slow_moving": [{"name": "slow", "stock": 100}],
             "low_stock": [{"name": "low", "stock": 1}],
+            "failed_sections": [],
         }
         self.assertEqual(result, expected)
 
+    def test_get_inventory_reports_reports_failed_sections(self):
+        self.mock_report_repo.get_inventory_total_value.return_value = (
+            Decimal("5000")
+        )
+        self.mock_report_repo.get_inventory_slow_moving.side_effect = (
+            mysql.connector.Error("Query execution was interrupted")
+        )
+        self.mock_report_repo.get_inventory_low_stock.return_value = []
+        
+        result = self.inventory_report_service.get_inventory_reports(
+            self.start_date, self.end_date
+        )
+        
+        self.assertEqual(result["slow_moving"], [])
+        self.assertEqual(result["total_value"], Decimal("5000"))
+        self.assertEqual(result["failed_sections"], ["slow_moving"])
+
     def test_get_low_stock_chart_data_success(self):
         mock_data = [
             {"name": "Product A", "stock": 2},
@@ -77,7 +97,7 @@ class TestInventoryReportService(BaseTestCase):
 
     def test_get_inventory_low_stock_for_export_success(self):
         mock_data = [
-            {"name": "Product A", "stock": 1, "type": "Varian"}
+            ("Product A", 1, "Varian")
         ]
         self.mock_report_repo.get_inventory_low_stock_for_export.return_value = (
             mock_data
@@ -87,11 +107,11 @@ class TestInventoryReportService(BaseTestCase):
             self.inventory_report_service.get_inventory_low_stock_for_export()
         )
         
-        self.assertEqual(result, [["Product A", 1, "Varian"]])
+        self.assertEqual(list(result), [["Product A", 1, "Varian"]])
 
     def test_get_inventory_slow_moving_for_export_success(self):
         mock_data = [
-            {"name": "Product C", "stock": 50, "total_sold": 0}
+            ("Product C", 50, 0)
         ]
         (
             self.mock_report_repo.
@@ -105,4 +125,4 @@ class TestInventoryReportService(BaseTestCase):
             )
         )
         
-        self.assertEqual(result, [["Product C", 50, 0]])
\ No newline at end of file
+        self.assertEqual(list(result), [["Product C", 50, 0]])
\ No newline at end of file
@@ -46,13 +46,36 @@ class TestProductReportService(BaseTestCase):
             self.db_conn
         )
         
-        expected = {"top_selling": mock_selling, "most_viewed": mock_viewed}
+        expected = {
+            "top_selling": mock_selling,
+            "most_viewed": mock_viewed,
+            "failed_sections": [],
+        }
         self.assertEqual(result, expected)
 
+    def test_get_product_reports_partial_failure_uses_default(self):
+        self.mock_report_repo.get_top_selling_products.side_effect = (
+            mysql.connector.Error("DB Error")
+        )
+        self.mock_report_repo.get_most_viewed_products.return_value = [
+            {"name": "B", "popularity": 100}
+        ]
+
+        result = self.product_report_service.get_product_reports(
+            self.start_date, self.end_date
+        )
+
+        self.assertEqual(result["top_selling"], [])
+        self.assertEqual(result["most_viewed"][0]["name"], "B")
+        self.assertEqual(result["failed_sections"], ["top_selling"])
+
     def test_get_product_reports_db_error(self):
         self.mock_report_repo.get_top_selling_products.side_effect = (
             mysql.connector.Error("DB Error")
         )
+        self.mock_report_repo.get_most_viewed_products.side_effect = (
+            mysql.connector.Error("DB Error")
+        )
         
         with self.assertRaises(DatabaseException):
             self.product_report_service.get_product_reports(
@@ -84,7 +107,7 @@ class TestProductReportService(BaseTestCase):
 
     def test_get_full_products_data_for_export_success(self):
         mock_data = [
-            {"id": 1, "name": "A", "price": Decimal("100.50"), "stock": 10}
+            (1, "A", Decimal("100.50"), 10)
         ]
         self.mock_report_repo.get_full_products_data_for_export.return_value = (
             mock_data
@@ -96,4 +119,4 @@ class TestProductReportService(BaseTestCase):
             )
         )
         
-        self.assertEqual(result, [[1, "A", 100.50, 10]])
\ No newline at end of file
+        self.assertEqual(list(result), [[1, "A", 100.50, 10]])
\ No newline at end of file
@@ -125,4 +125,22 @@ class TestReportService(BaseTestCase):
         mock_inv.get_inventory_reports.assert_called_once_with(
             self.start_date, self.end_date
         )
-        self.assertEqual(result, mock_report)
\ No newline at end of file
+        self.assertEqual(result, mock_report)
+
+    def test_sales_summary_is_cached_per_date_range(
+        self, mock_convert, mock_inv, mock_cust, mock_prod,
+        mock_sales, mock_dash
+    ):
+        mock_sales.get_sales_summary.return_value = {"total_revenue": 100}
+
+        first = self.report_service.get_sales_summary(
+            "2025-01-01", "2025-01-31"
+        )
+        first["total_revenue"] = 0
+        second = self.report_service.get_sales_summary(
+            "2025-01-01 00:00:00", "2025-01-31"
+        )
+        self.report_service.get_sales_summary("2025-02-01", "2025-02-28")
+
+        self.assertEqual(second, {"total_revenue": 100})
+        self.assertEqual(mock_sales.get_sales_summary.call_count, 2)
@@ -90,7 +90,7 @@ class TestSalesReportService(BaseTestCase):
 
     def test_get_full_sales_data_for_export_success(self):
         mock_data = [
-            {"id": 1, "total_amount": Decimal("100.50"), "status": "Selesai"}
+            (1, Decimal("100.50"), "Selesai")
         ]
         self.mock_report_repo.get_full_sales_data_for_export.return_value = (
             mock_data
@@ -100,4 +100,4 @@ class TestSalesReportService(BaseTestCase):
             self.start_date, self.end_date
         )
         
-        self.assertEqual(result, [[1, 100.50, "Selesai"]])
\ No newline at end of file
+        self.assertEqual(list(result), [[1, 100.50, "Selesai"]])
\ No newline at end of file
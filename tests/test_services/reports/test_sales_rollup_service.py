@@ -0,0 +1,169 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import mysql.connector
+
+from app.core.report_cache import get_report_cache
+from app.exceptions.database_exceptions import DatabaseException
+from app.services.reports.sales_rollup_service import SalesRollupService
+from tests.base_test_case import BaseTestCase
+
+
+class TestSalesRollupService(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_rollup_repo = MagicMock()
+        self.mock_rollup_repo.rebuild_range.return_value = 3
+        self.service = SalesRollupService(
+            rollup_repo=self.mock_rollup_repo
+        )
+
+    def test_record_order_created_adds_order(self):
+        self.service.record_order_created(self.db_conn, 10)
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_called_once_with(
+            self.db_conn, [10], 1, 0, 1
+        )
+        self.mock_rollup_repo.upsert_daily_product_sales.assert_called_once_with(
+            self.db_conn, [10], 1
+        )
+        self.mock_rollup_repo.upsert_daily_voucher_usage.assert_called_once_with(
+            self.db_conn, [10], 1
+        )
+
+    def test_record_orders_cancelled_subtracts_orders(self):
+        self.service.record_orders_cancelled(self.db_conn, [10, 11])
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_called_once_with(
+            self.db_conn, [10, 11], 0, 1, -1
+        )
+        self.mock_rollup_repo.upsert_daily_product_sales.assert_called_once_with(
+            self.db_conn, [10, 11], -1
+        )
+
+    def test_record_orders_cancelled_empty_is_noop(self):
+        self.service.record_orders_cancelled(self.db_conn, [])
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_not_called()
+
+    def test_record_status_change_between_active_statuses_is_noop(self):
+        self.service.record_status_change(
+            self.db_conn, 10, "Diproses", "Dikirim"
+        )
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_not_called()
+
+    def test_record_status_change_to_cancelled(self):
+        self.service.record_status_change(
+            self.db_conn, 10, "Dikirim", "Dibatalkan"
+        )
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_called_once_with(
+            self.db_conn, [10], 0, 1, -1
+        )
+
+    def test_record_status_change_out_of_cancelled_restores_order(self):
+        self.service.record_status_change(
+            self.db_conn, 10, "Dibatalkan", "Diproses"
+        )
+
+        self.mock_rollup_repo.upsert_daily_sales.assert_called_once_with(
+            self.db_conn, [10], 0, -1, 1
+        )
+        self.mock_rollup_repo.upsert_daily_voucher_usage.assert_called_once_with(
+            self.db_conn, [10], 1
+        )
+
+    def test_backfill_rebuilds_in_chunks(self):
+        self.app.config["SALES_ROLLUP_BACKFILL_CHUNK_DAYS"] = 10
+        self.mock_rollup_repo.find_order_date_bounds.return_value = {
+            "first_date": date(2025, 1, 1),
+            "last_date": date(2025, 1, 25),
+        }
+
+        result = self.service.backfill()
+
+        ranges = [
+            c.args[1:] for c in self.mock_rollup_repo.rebuild_range.call_args_list
+        ]
+        self.assertEqual(ranges, [
+            (date(2025, 1, 1), date(2025, 1, 10)),
+            (date(2025, 1, 11), date(2025, 1, 20)),
+            (date(2025, 1, 21), date(2025, 1, 25)),
+        ])
+        self.assertEqual(self.mock_rollup_repo.delete_range.call_count, 3)
+        self.assertEqual(self.db_conn.commit.call_count, 3)
+        self.assertEqual(result, {"success": True, "days": 9, "chunks": 3})
+
+    def test_backfill_respects_explicit_range(self):
+        self.mock_rollup_repo.find_order_date_bounds.return_value = {
+            "first_date": date(2024, 1, 1),
+            "last_date": date(2025, 6, 1),
+        }
+
+        self.service.backfill(date(2025, 2, 1), date(2025, 2, 3))
+
+        self.mock_rollup_repo.rebuild_range.assert_called_once_with(
+            self.db_conn, date(2025, 2, 1), date(2025, 2, 3)
+        )
+
+    def test_backfill_without_orders(self):
+        self.mock_rollup_repo.find_order_date_bounds.return_value = {
+            "first_date": None, "last_date": None
+        }
+
+        result = self.service.backfill()
+
+        self.assertEqual(result["days"], 0)
+        self.mock_rollup_repo.rebuild_range.assert_not_called()
+
+    def test_backfill_db_error_rolls_back(self):
+        self.mock_rollup_repo.find_order_date_bounds.return_value = {
+            "first_date": date(2025, 1, 1),
+            "last_date": date(2025, 1, 2),
+        }
+        self.mock_rollup_repo.rebuild_range.side_effect = (
+            mysql.connector.Error("lock wait timeout")
+        )
+
+        with self.assertRaises(DatabaseException):
+            self.service.backfill()
+
+        self.db_conn.rollback.assert_called_once()
+
+    def test_rebuild_uses_given_connection(self):
+        conn = MagicMock()
+        conn.in_transaction = False
+        self.mock_rollup_repo.find_order_date_bounds.return_value = {
+            "first_date": date(2025, 1, 1),
+            "last_date": date(2025, 1, 1),
+        }
+        self.mock_rollup_repo.rebuild_range.return_value = 1
+
+        result = self.service.rebuild(conn)
+
+        conn.start_transaction.assert_called_once()
+        conn.commit.assert_called_once()
+        conn.close.assert_not_called()
+        self.assertEqual(result["days"], 1)
+
+    def test_rollup_changes_invalidate_cached_reports(self):
+        cache = get_report_cache()
+        cache.get_or_load("sales_summary", "2025-01-01", "2025-01-31", dict)
+        cache.get_or_load("sales_summary", "2025-02-01", "2025-02-28", dict)
+        self.mock_rollup_repo.find_order_dates.return_value = [
+            date(2025, 1, 15)
+        ]
+
+        days = self.service.record_orders_cancelled(self.db_conn, [10])
+
+        self.mock_rollup_repo.find_order_dates.assert_called_once_with(
+            self.db_conn, [10]
+        )
+        self.assertEqual(days, [date(2025, 1, 15)])
+        self.assertEqual(cache.get_stats()["entries"], 2)
+
+        self.service.invalidate_report_cache(days)
+
+        self.assertEqual(cache.get_stats()["entries"], 1)
@@ -1,8 +1,10 @@
+from datetime import datetime, timedelta
 from tests.base_test_case import BaseTestCase
 from unittest.mock import MagicMock, patch
 
 import mysql.connector
 
+from app.core.subscription_cache import get_subscription_cache
 from app.services.users.user_service import UserService
 from app.exceptions.api_exceptions import AuthError, ValidationError
 from app.exceptions.database_exceptions import (
@@ -150,4 +152,62 @@ class TestUserService(BaseTestCase):
         )
         
         with self.assertRaises(DatabaseException):
-            self.user_service.update_user_address(1, address_data)
\ No newline at end of file
+            self.user_service.update_user_address(1, address_data)
+
+
+class TestUserServiceSubscription(BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mock_user_repo = MagicMock()
+        self.mock_member_repo = MagicMock()
+        self.user_service = UserService(
+            user_repo=self.mock_user_repo,
+            member_repo=self.mock_member_repo,
+        )
+        self.subscription = {
+            "name": "Gold", "discount_percent": 10,
+            "end_date": datetime.now() + timedelta(days=20),
+        }
+
+    def test_active_subscription_is_served_from_cache(self):
+        find = self.mock_member_repo.find_active_subscription_by_user_id
+        find.return_value = self.subscription
+
+        first = self.user_service.get_active_subscription(1)
+        second = self.user_service.get_active_subscription(1, self.db_conn)
+
+        find.assert_called_once_with(self.db_conn, 1)
+        self.assertEqual(first, self.subscription)
+        self.assertEqual(second, self.subscription)
+        self.db_conn.close.assert_called_once()
+
+    def test_missing_subscription_is_cached(self):
+        find = self.mock_member_repo.find_active_subscription_by_user_id
+        find.return_value = None
+
+        self.assertIsNone(self.user_service.get_active_subscription(2))
+        self.assertIsNone(self.user_service.get_active_subscription(2))
+
+        find.assert_called_once()
+
+    def test_invalidation_reloads_subscription(self):
+        find = self.mock_member_repo.find_active_subscription_by_user_id
+        find.side_effect = [None, self.subscription]
+
+        self.assertIsNone(self.user_service.get_active_subscription(3))
+        get_subscription_cache().invalidate(3)
+
+        self.assertEqual(
+            self.user_service.get_active_subscription(3), self.subscription
+        )
+
+    def test_database_error_is_wrapped_and_not_cached(self):
+        find = self.mock_member_repo.find_active_subscription_by_user_id
+        find.side_effect = [mysql.connector.Error("DB Error"), None]
+
+        with self.assertRaises(DatabaseException):
+            self.user_service.get_active_subscription(4)
+
+        self.assertIsNone(self.user_service.get_active_subscription(4))
+        self.assertEqual(find.call_count, 2)
\ No newline at end of file
@@ -1,9 +1,12 @@
 from tests.base_test_case import BaseTestCase
-from unittest.mock import MagicMock, ANY
+from unittest.mock import MagicMock, ANY, patch
 
 import mysql.connector
 
-from app.services.utils.scheduler_service import SchedulerService
+from app.services.utils.scheduler_service import (
+    SchedulerService, VoucherSegment, start_expired_order_reaper,
+    start_stock_hold_reaper
+)
 from app.exceptions.database_exceptions import DatabaseException
 from app.exceptions.service_exceptions import ServiceLogicError
 
@@ -16,19 +19,27 @@ class TestSchedulerService(BaseTestCase):
         self.mock_report_repo = MagicMock()
         self.mock_voucher_repo = MagicMock()
         self.mock_user_voucher_repo = MagicMock()
+        self.mock_stock_svc = MagicMock()
+        self.mock_sales_rollup_svc = MagicMock()
+        self.mock_history_repo = MagicMock()
         
         self.scheduler_service = SchedulerService(
             order_repo=self.mock_order_repo,
             report_repo=self.mock_report_repo,
             voucher_repo=self.mock_voucher_repo,
-            user_voucher_repo=self.mock_user_voucher_repo
+            user_voucher_repo=self.mock_user_voucher_repo,
+            stock_svc=self.mock_stock_svc,
+            sales_rollup_svc=self.mock_sales_rollup_svc,
+            history_repo=self.mock_history_repo
         )
 
     def tearDown(self):
         super().tearDown()
         
     def test_cancel_expired_pending_orders_success(self):
-        expired_orders = [{"id": 1}, {"id": 2}]
+        expired_orders = [
+            {"id": 1, "user_id": 5}, {"id": 2, "user_id": None}
+        ]
         self.mock_order_repo.find_expired_pending_orders.return_value = (
             expired_orders
         )
@@ -36,13 +47,77 @@ class TestSchedulerService(BaseTestCase):
         result = self.scheduler_service.cancel_expired_pending_orders()
         
         self.mock_order_repo.find_expired_pending_orders.assert_called_with(
-            self.db_conn, ANY
+            self.db_conn, ANY, 500, 0
         )
         self.mock_order_repo.bulk_update_status.assert_called_once_with(
             self.db_conn, [1, 2], "Dibatalkan"
         )
+        self.mock_history_repo.create_batch.assert_called_once_with(
+            self.db_conn,
+            [(1, "Dibatalkan", ANY), (2, "Dibatalkan", ANY)],
+        )
+        (
+            self.mock_sales_rollup_svc.record_orders_cancelled.
+            assert_called_once_with(self.db_conn, [1, 2])
+        )
+        (
+            self.mock_stock_svc.release_expired_holds_for_users.
+            assert_called_once_with([5], self.db_conn)
+        )
         self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": True, "cancelled_count": 2})
+        self.assertTrue(result["success"])
+        self.assertEqual(result["cancelled_count"], 2)
+        self.assertEqual(result["chunks"], 1)
+        self.assertFalse(result["has_more"])
+        self.assertIn("orders_per_second", result)
+
+    def test_cancel_expired_pending_orders_commits_each_chunk(self):
+        self.mock_order_repo.find_expired_pending_orders.side_effect = [
+            [{"id": 1, "user_id": 1}, {"id": 3, "user_id": 1}],
+            [{"id": 4, "user_id": 2}],
+        ]
+
+        result = self.scheduler_service.cancel_expired_pending_orders(
+            batch_size=2
+        )
+
+        after_ids = [
+            c.args[3]
+            for c in self.mock_order_repo.find_expired_pending_orders.call_args_list
+        ]
+        self.assertEqual(after_ids, [0, 3])
+        self.assertEqual(self.db_conn.start_transaction.call_count, 2)
+        self.assertEqual(self.db_conn.commit.call_count, 2)
+        self.assertEqual(result["cancelled_count"], 3)
+        self.assertEqual(result["last_order_id"], 4)
+
+    def test_cancel_expired_pending_orders_stops_at_max_chunks(self):
+        self.mock_order_repo.find_expired_pending_orders.return_value = [
+            {"id": 1, "user_id": None}, {"id": 2, "user_id": None}
+        ]
+
+        result = self.scheduler_service.cancel_expired_pending_orders(
+            batch_size=2, max_chunks=1
+        )
+
+        self.mock_order_repo.find_expired_pending_orders.assert_called_once()
+        self.mock_stock_svc.release_expired_holds_for_users.assert_not_called()
+        self.assertTrue(result["has_more"])
+        self.assertEqual(result["last_order_id"], 2)
+
+    def test_cancel_expired_pending_orders_keeps_committed_chunks(self):
+        self.mock_order_repo.find_expired_pending_orders.side_effect = [
+            [{"id": 1, "user_id": None}],
+            mysql.connector.Error("DB Error"),
+        ]
+
+        with self.assertRaises(DatabaseException):
+            self.scheduler_service.cancel_expired_pending_orders(
+                batch_size=1
+            )
+
+        self.db_conn.commit.assert_called_once()
+        self.db_conn.rollback.assert_called_once()
 
     def test_cancel_expired_pending_orders_no_orders_found(self):
         self.mock_order_repo.find_expired_pending_orders.return_value = []
@@ -50,11 +125,12 @@ class TestSchedulerService(BaseTestCase):
         result = self.scheduler_service.cancel_expired_pending_orders()
         
         self.mock_order_repo.find_expired_pending_orders.assert_called_with(
-            self.db_conn, ANY
+            self.db_conn, ANY, 500, 0
         )
         self.mock_order_repo.bulk_update_status.assert_not_called()
         self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": True, "cancelled_count": 0})
+        self.assertTrue(result["success"])
+        self.assertEqual(result["cancelled_count"], 0)
 
     def test_cancel_expired_pending_orders_db_error(self):
         self.mock_order_repo.find_expired_pending_orders.side_effect = (
@@ -75,6 +151,7 @@ class TestSchedulerService(BaseTestCase):
     def test_grant_segmented_vouchers_success(self):
         self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = [1, 2]
         self.mock_voucher_repo.find_by_code.return_value = {"id": 10}
+        self.mock_user_voucher_repo.bulk_create.return_value = 2
         
         result = self.scheduler_service.grant_segmented_vouchers()
         
@@ -84,9 +161,15 @@ class TestSchedulerService(BaseTestCase):
         self.mock_voucher_repo.find_by_code.assert_called_once_with(
             self.db_conn, "TOP_SPENDER"
         )
-        self.assertEqual(self.mock_user_voucher_repo.create.call_count, 2)
+        self.mock_user_voucher_repo.bulk_create.assert_called_once_with(
+            self.db_conn, [1, 2], 10
+        )
+        self.mock_user_voucher_repo.create.assert_not_called()
         self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": True, "granted_count": 2})
+        self.assertEqual(result, {
+            "success": True, "granted_count": 2, "skipped_count": 0,
+            "segments": {"TOP_SPENDER": {"granted": 2, "skipped": 0}},
+        })
 
     def test_grant_segmented_vouchers_no_spenders(self):
         self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = []
@@ -94,9 +177,9 @@ class TestSchedulerService(BaseTestCase):
         result = self.scheduler_service.grant_segmented_vouchers()
         
         self.mock_voucher_repo.find_by_code.assert_not_called()
-        self.mock_user_voucher_repo.create.assert_not_called()
-        self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": True, "granted_count": 0})
+        self.mock_user_voucher_repo.bulk_create.assert_not_called()
+        self.assertTrue(result["success"])
+        self.assertEqual(result["granted_count"], 0)
 
     def test_grant_segmented_vouchers_no_voucher_found(self):
         self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = [1]
@@ -104,19 +187,148 @@ class TestSchedulerService(BaseTestCase):
         
         result = self.scheduler_service.grant_segmented_vouchers()
         
-        self.mock_user_voucher_repo.create.assert_not_called()
-        self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": False, "granted_count": 0})
+        self.mock_user_voucher_repo.bulk_create.assert_not_called()
+        self.assertFalse(result["success"])
+        self.assertEqual(result["granted_count"], 0)
 
-    def test_grant_segmented_vouchers_handles_integrity_error(self):
-        self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = [1, 2]
+    def test_grant_segmented_vouchers_reports_skipped_in_chunks(self):
+        self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = [
+            1, 2, 2, 3, 4, 5
+        ]
         self.mock_voucher_repo.find_by_code.return_value = {"id": 10}
-        self.mock_user_voucher_repo.create.side_effect = [
-            mysql.connector.IntegrityError(), None
+        self.mock_user_voucher_repo.bulk_create.side_effect = [1, 2, 0]
+
+        result = self.scheduler_service.grant_segmented_vouchers(
+            batch_size=2
+        )
+
+        chunks = [
+            c.args[1]
+            for c in self.mock_user_voucher_repo.bulk_create.call_args_list
         ]
+        self.assertEqual(chunks, [[1, 2], [3, 4], [5]])
+        self.assertEqual(self.db_conn.commit.call_count, 3)
+        self.assertEqual(result["granted_count"], 3)
+        self.assertEqual(result["skipped_count"], 2)
+
+    def test_grant_segmented_vouchers_runs_selected_segments(self):
+        self.mock_report_repo.get_inactive_user_ids.return_value = [7]
+        self.mock_report_repo.get_first_time_buyer_user_ids.return_value = [
+            8, 9
+        ]
+        self.mock_voucher_repo.find_by_code.side_effect = [
+            {"id": 20}, {"id": 30}
+        ]
+        self.mock_user_voucher_repo.bulk_create.side_effect = [1, 1]
+
+        result = self.scheduler_service.grant_segmented_vouchers(
+            ["INACTIVE", "FIRST_TIME_BUYER"]
+        )
+
+        self.mock_report_repo.get_top_spenders_user_ids_by_percentile.assert_not_called()
+        self.mock_voucher_repo.find_by_code.assert_any_call(
+            self.db_conn, "INACTIVE"
+        )
+        self.mock_user_voucher_repo.bulk_create.assert_any_call(
+            self.db_conn, [8, 9], 30
+        )
+        self.assertEqual(result["segments"], {
+            "INACTIVE": {"granted": 1, "skipped": 0},
+            "FIRST_TIME_BUYER": {"granted": 1, "skipped": 1},
+        })
+
+    def test_grant_segmented_vouchers_custom_and_unknown_segments(self):
+        finder = MagicMock(return_value=[3])
+        self.scheduler_service.register_segment(
+            VoucherSegment("VIP", finder, voucher_code="VIP_ONLY")
+        )
+        self.mock_voucher_repo.find_by_code.return_value = {"id": 40}
+        self.mock_user_voucher_repo.bulk_create.return_value = 1
+
+        result = self.scheduler_service.grant_segmented_vouchers(
+            ["VIP", "MISSING"]
+        )
+
+        finder.assert_called_once_with(self.db_conn, ANY)
+        self.mock_voucher_repo.find_by_code.assert_called_once_with(
+            self.db_conn, "VIP_ONLY"
+        )
+        self.assertFalse(result["success"])
+        self.assertEqual(result["granted_count"], 1)
+
+    def test_grant_segmented_vouchers_db_error_rolls_back(self):
+        self.mock_report_repo.get_top_spenders_user_ids_by_percentile.return_value = [1]
+        self.mock_voucher_repo.find_by_code.return_value = {"id": 10}
+        self.mock_user_voucher_repo.bulk_create.side_effect = (
+            mysql.connector.Error()
+        )
+
+        with self.assertRaises(DatabaseException):
+            self.scheduler_service.grant_segmented_vouchers()
+
+        self.db_conn.rollback.assert_called_once()
+
+    def test_purge_expired_stock_holds(self):
+        self.mock_stock_svc.purge_expired_holds.return_value = 7
         
-        result = self.scheduler_service.grant_segmented_vouchers()
+        result = self.scheduler_service.purge_expired_stock_holds(100)
         
-        self.assertEqual(self.mock_user_voucher_repo.create.call_count, 2)
-        self.db_conn.commit.assert_called_once()
-        self.assertEqual(result, {"success": True, "granted_count": 1})
\ No newline at end of file
+        self.mock_stock_svc.purge_expired_holds.assert_called_once_with(100)
+        self.assertEqual(result, {"success": True, "purged_count": 7})
+
+    def test_purge_expired_stock_holds_wraps_unexpected_error(self):
+        self.mock_stock_svc.purge_expired_holds.side_effect = KeyError("x")
+
+        with self.assertRaises(ServiceLogicError):
+            self.scheduler_service.purge_expired_stock_holds()
+
+    @patch.object(SchedulerService, "purge_expired_stock_holds")
+    @patch.object(SchedulerService, "grant_segmented_vouchers")
+    @patch.object(SchedulerService, "cancel_expired_pending_orders")
+    def test_run_daily_jobs_keeps_results_when_a_job_fails(
+        self, mock_cancel, mock_grant, mock_purge
+    ):
+        mock_cancel.return_value = {"success": True, "cancelled_count": 2}
+        mock_grant.return_value = {"success": True, "granted_count": 1}
+        mock_purge.side_effect = DatabaseException("DB Error")
+
+        result = self.scheduler_service.run_daily_jobs()
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["failed"], ["purge"])
+        self.assertEqual(result["results"]["cancel"]["cancelled_count"], 2)
+        self.assertEqual(result["results"]["segments"]["granted_count"], 1)
+        self.assertEqual(
+            result["results"]["purge"],
+            {"success": False, "message": "DB Error"},
+        )
+
+    @patch("app.services.utils.scheduler_service.PeriodicTask")
+    def test_start_stock_hold_reaper_starts_task(self, mock_task_cls):
+        self.app.config["TESTING"] = False
+        self.app.config["STOCK_HOLD_REAPER_INTERVAL"] = 30
+        
+        task = start_stock_hold_reaper(self.app)
+        
+        self.assertIs(task, mock_task_cls.return_value)
+        task.start.assert_called_once()
+        self.assertIs(self.app.extensions["stock_hold_reaper"], task)
+
+    def test_start_stock_hold_reaper_disabled_in_testing(self):
+        self.assertIsNone(start_stock_hold_reaper(self.app))
+
+    @patch("app.services.utils.scheduler_service.PeriodicTask")
+    def test_start_expired_order_reaper_starts_task(self, mock_task_cls):
+        self.app.config["TESTING"] = False
+        self.app.config["EXPIRED_ORDER_REAPER_INTERVAL"] = 300
+
+        task = start_expired_order_reaper(self.app)
+
+        self.assertIs(task, mock_task_cls.return_value)
+        task.start.assert_called_once()
+        self.assertIs(self.app.extensions["expired_order_reaper"], task)
+
+    def test_start_expired_order_reaper_disabled_by_default(self):
+        self.app.config["TESTING"] = False
+
+        self.assertIsNone(start_expired_order_reaper(self.app))
@@ -0,0 +1,72 @@
+import gzip
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from app.utils.export_utils import (
+    generate_csv_response, iter_csv, stream_export_rows
+)
+from tests.base_test_case import BaseTestCase
+
+
+class TestExportUtils(BaseTestCase):
+
+    def test_stream_export_rows_converts_decimals_and_closes_conn(self):
+        conn = MagicMock()
+        rows = stream_export_rows(
+            iter([(1, Decimal("10.50")), (2, None)]), conn
+        )
+
+        self.assertEqual(list(rows), [[1, 10.5], [2, None]])
+        conn.close.assert_called_once()
+
+    def test_stream_export_rows_closes_conn_when_abandoned(self):
+        conn = MagicMock()
+        rows = stream_export_rows(iter([(1,), (2,)]), conn)
+
+        next(rows)
+        rows.close()
+
+        conn.close.assert_called_once()
+
+    def test_iter_csv_flushes_in_chunks(self):
+        rows = ([i, "x" * 10] for i in range(100))
+
+        chunks = list(iter_csv(rows, ["id", "value"], flush_bytes=256))
+
+        self.assertGreater(len(chunks), 1)
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(lines[0], "id,value")
+        self.assertEqual(len(lines), 101)
+
+    def test_generate_csv_response_streams_generator(self):
+        closed = []
+
+        def rows():
+            try:
+                yield [1, "a"]
+                yield [2, "b"]
+            finally:
+                closed.append(True)
+
+        response = generate_csv_response(rows(), ["id", "name"], "sales")
+
+        self.assertTrue(response.is_streamed)
+        self.assertIn(
+            "sales_report_", response.headers["Content-Disposition"]
+        )
+        self.assertEqual(
+            response.get_data(as_text=True).splitlines(),
+            ["id,name", "1,a", "2,b"],
+        )
+        self.assertEqual(closed, [True])
+
+    def test_generate_csv_response_gzip(self):
+        response = generate_csv_response(
+            [[1, "a"]], ["id", "name"], "vouchers", compress=True
+        )
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(response.get_data()).decode("utf-8"),
+            "id,name\r\n1,a\r\n",
+        )